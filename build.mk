@@ -20,7 +20,7 @@ INCLUDED_FILES := $(shell grep -ohRE '^\.\. include:: +.+' $(SOURCEDIR) | sed -r
 help:
 	@$(SPHINXBUILD) -M help "$(SOURCEDIR)" "$(BUILDDIR)" $(SPHINXOPTS) $(O)
 
-.PHONY: help incfiles clean Makefile $(SPHINX_PREDEFINED_TARGETS)
+.PHONY: help incfiles clean watch Makefile $(SPHINX_PREDEFINED_TARGETS)
 
 incfiles.mk:
 	@${YAML2RST} incfiles.mk 
@@ -40,6 +40,10 @@ $(BUILDDIR)/.all-rst:
 	@mkdir -p $(BUILDDIR)
 	@touch $@
 
+# Regenerate the RST files affected by each change of the data or templates
+watch:
+	@$(YAML2RST) --watch
+
 clean:
 	@$(SPHINXBUILD) -M $@ "$(SOURCEDIR)" "$(BUILDDIR)" $(SPHINXOPTS) $(O)
 	@$(RM) -rf $(SOURCEDIR)/inc $(SOURCEDIR)/faq incfiles.mk
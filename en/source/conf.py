@@ -51,7 +51,8 @@ copyright = '2020-{pubYear}, freee K.K'.format(
 # ones.
 extensions = [
         'sphinxcontrib.trimblank',
-        'sphinx_rtd_theme'
+        'sphinx_rtd_theme',
+        'freee_a11y_gl.sphinx_labels'
 ]
 
 # Add any paths that contain templates here, relative to this directory.
@@ -54,7 +54,8 @@ copyright = '2020-{pubYear}, フリー株式会社'.format(
 # ones.
 extensions = [
         'sphinxcontrib.trimblank',
-        'sphinx_rtd_theme'
+        'sphinx_rtd_theme',
+        'freee_a11y_gl.sphinx_labels'
 ]
 
 # Add any paths that contain templates here, relative to this directory.
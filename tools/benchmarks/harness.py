@@ -0,0 +1,197 @@
+"""Timing, result files and comparison of the benchmarks."""
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+# Root of the a11y-guidelines repository
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+RESULT_FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.1
+# Benchmarks faster than this are repeated within a round to get a measurable time
+MIN_ROUND_TIME = 0.05
+
+
+class SkipBenchmark(Exception):
+    """Raised when preparing a benchmark which cannot run on a corpus."""
+
+
+class Case(NamedTuple):
+    """Benchmark prepared for a corpus.
+
+    run() is timed; setup() is called before each timed call, and its
+    result is passed to run().
+    """
+    run: Callable[[Any], Any]
+    setup: Optional[Callable[[], Any]] = None
+
+
+class Comparison(NamedTuple):
+    """Comparison of a benchmark result with its baseline."""
+    benchmark: str
+    corpus: str
+    baseline: Optional[float]
+    current: Optional[float]
+    status: str  # regression, improvement, unchanged, new or missing
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change of the time from the baseline."""
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+
+def time_case(case: Case, rounds: int) -> Dict[str, Any]:
+    """Time a benchmark case.
+
+    The case is run once untimed to warm up and to find how many calls a
+    round needs to take at least MIN_ROUND_TIME; cases with a setup function
+    are called once per round.
+
+    Returns:
+        Statistics of the time per call in seconds
+    """
+    setup = case.setup or (lambda: None)
+
+    def timed(number: int) -> float:
+        args = setup()
+        gc.collect()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                case.run(args)
+            return time.perf_counter() - start
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    warmup = timed(1)
+    number = 1
+    if case.setup is None and warmup < MIN_ROUND_TIME:
+        number = min(10000, math.ceil(MIN_ROUND_TIME / max(warmup, 1e-7)))
+    times = [timed(number) / number for _ in range(rounds)]
+    return {
+        'rounds': rounds,
+        'number': number,
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'stdev': statistics.stdev(times) if rounds > 1 else 0.0,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the machine and the source tree the benchmarks ran on."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, check=True,
+                                capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'commit': commit,
+    }
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Load a result file.
+
+    Raises:
+        ValueError: If the file is not a result file of a supported version
+    """
+    with open(path, encoding='utf-8') as f:
+        results = json.load(f)
+    if not isinstance(results, dict) or results.get('version') != RESULT_FORMAT_VERSION:
+        raise ValueError(f'{path} is not a benchmark result file of version {RESULT_FORMAT_VERSION}')
+    return results
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD, stat: str = 'min') -> List[Comparison]:
+    """Compare the times of two result sets.
+
+    A benchmark regressed if its time grew by more than threshold relative to
+    the baseline, and improved if it shrank by more than threshold. Skipped
+    benchmarks count as missing.
+
+    Returns:
+        Comparisons in the order of the current results, followed by the
+        benchmarks only in the baseline
+    """
+    def times(results):
+        return {(record['benchmark'], record['corpus']): record.get(stat)
+                for record in results['benchmarks'] if 'skipped' not in record}
+
+    baseline_times = times(baseline)
+    current_times = times(current)
+    comparisons = []
+    for key, value in current_times.items():
+        base = baseline_times.get(key)
+        if base is None:
+            status = 'new'
+        elif value > base * (1 + threshold):
+            status = 'regression'
+        elif value < base * (1 - threshold):
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+        comparisons.append(Comparison(*key, base, value, status))
+    comparisons.extend(Comparison(*key, value, None, 'missing')
+                       for key, value in baseline_times.items() if key not in current_times)
+    return comparisons
+
+
+def format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return '-'
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3g} {unit}'
+    return f'{seconds / 1e-9:.3g} ns'
+
+
+def format_comparisons(comparisons: List[Comparison]) -> str:
+    rows = [('benchmark', 'corpus', 'baseline', 'current', 'change', 'status')]
+    for c in comparisons:
+        change = '-' if c.change is None else f'{c.change:+.1%}'
+        rows.append((c.benchmark, c.corpus, format_time(c.baseline), format_time(c.current),
+                     change, c.status.upper() if c.status == 'regression' else c.status))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return '\n'.join('  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+                     for row in rows)
+
+
+def report_comparison(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float,
+                      stat: str) -> int:
+    """Print the comparison of two result sets.
+
+    Returns:
+        Exit code, 1 if any benchmark regressed
+    """
+    comparisons = compare_results(baseline, current, threshold, stat)
+    print(format_comparisons(comparisons))
+    regressions = [c for c in comparisons if c.status == 'regression']
+    if regressions:
+        print(f'\n{len(regressions)} benchmark(s) regressed by more than {threshold:.0%}')
+        return 1
+    return 0
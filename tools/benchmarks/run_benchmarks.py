@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Run the performance benchmarks of the guideline tools.
+
+The benchmarks in suites.py time the stages of the toolchain - loading the
+model, YAML validation, process_yaml_data(), the yaml2rst generators and the
+yaml2sheet request generation - on the data of the repository and on
+synthetic data sets of increasing size. The results are written as JSON, and
+two result files can be compared to find regressions.
+
+Example:
+    Run all benchmarks on the repository data and data sets of 2 and 8 times
+    its size:
+    $ python tools/benchmarks/run_benchmarks.py run --corpus real synthetic:2 synthetic:8
+
+    Run the yaml2rst benchmarks only and compare with earlier results:
+    $ python tools/benchmarks/run_benchmarks.py run -k 'yaml2rst.*' --baseline base.json
+
+    Compare two result files:
+    $ python tools/benchmarks/run_benchmarks.py compare base.json new.json --threshold 0.2
+"""
+import argparse
+import datetime
+import fnmatch
+import logging
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import suites
+from harness import (
+    DEFAULT_THRESHOLD, REPO_ROOT, RESULT_FORMAT_VERSION, SkipBenchmark, environment,
+    format_time, load_results, report_comparison, save_results, time_case
+)
+
+DEFAULT_CORPORA = ['real', 'synthetic:2', 'synthetic:8']
+DEFAULT_ROUNDS = 5
+
+
+def run_benchmarks(corpora: Iterable[str], patterns: Optional[List[str]] = None,
+                   rounds: int = DEFAULT_ROUNDS,
+                   report: Callable[[str], None] = print) -> Dict[str, Any]:
+    """Run the benchmarks on each corpus.
+
+    Args:
+        corpora: Corpus specifications, see suites.parse_corpus()
+        patterns: Shell patterns of the benchmark names to run; all if empty
+        rounds: Number of timed rounds of each benchmark
+        report: Function called with a line of progress for each result
+
+    Returns:
+        Results in the format written by save_results()
+    """
+    corpora = list(corpora)
+    for spec in corpora:
+        suites.parse_corpus(spec)
+    results = {
+        'version': RESULT_FORMAT_VERSION,
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'environment': environment(),
+        'corpora': {},
+        'benchmarks': [],
+    }
+    for spec in corpora:
+        with suites.open_corpus(spec) as corpus:
+            results['corpora'][corpus.name] = corpus.sizes
+            for name, prepare in suites.benchmark_cases(corpus):
+                if patterns and not any(fnmatch.fnmatchcase(name, p) for p in patterns):
+                    continue
+                record = {'benchmark': name, 'corpus': corpus.name}
+                try:
+                    record.update(time_case(prepare(), rounds))
+                    report(f'{corpus.name:<14} {name:<40} {format_time(record["min"])}')
+                except SkipBenchmark as e:
+                    record['skipped'] = str(e)
+                    report(f'{corpus.name:<14} {name:<40} skipped: {e}')
+                results['benchmarks'].append(record)
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Run or compare the benchmarks of the guideline tools',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help='Run the benchmarks',
+                                formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    run.add_argument('--corpus', nargs='+', default=DEFAULT_CORPORA,
+                     help="Data sets: 'real' for the repository data, or 'synthetic:SCALE' "
+                          "for a synthetic data set SCALE times its size")
+    run.add_argument('-k', '--benchmark', dest='patterns', action='append',
+                     help='Shell pattern of the benchmarks to run; may be repeated')
+    run.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS,
+                     help='Number of timed rounds of each benchmark')
+    run.add_argument('-o', '--output',
+                     help='Result file (default: build/benchmarks/<timestamp>.json)')
+    run.add_argument('--baseline', help='Result file to compare the results with')
+
+    compare = subparsers.add_parser('compare', help='Compare two result files',
+                                    formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    compare.add_argument('baseline', help='Result file of the baseline')
+    compare.add_argument('current', help='Result file to compare with the baseline')
+
+    for subparser in (run, compare):
+        subparser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                               help='Relative slowdown reported as a regression')
+        subparser.add_argument('--stat', choices=['min', 'median', 'mean'], default='min',
+                               help='Statistic compared')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    for name in ('freee_a11y_gl', 'yaml2rst', 'yaml2sheet'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    try:
+        if args.command == 'compare':
+            return report_comparison(load_results(args.baseline), load_results(args.current),
+                                     args.threshold, args.stat)
+
+        baseline = load_results(args.baseline) if args.baseline else None
+        results = run_benchmarks(args.corpus, args.patterns, args.rounds)
+        output = args.output or str(
+            REPO_ROOT / 'build' / 'benchmarks' /
+            f'{datetime.datetime.now().strftime("%Y%m%d-%H%M%S")}.json')
+        save_results(results, output)
+        print(f'Results written to {output}')
+        if baseline is not None:
+            print()
+            return report_comparison(baseline, results, args.threshold, args.stat)
+        return 0
+    except (OSError, ValueError) as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,387 @@
+"""Benchmarks of the guideline tools.
+
+Each benchmark is prepared for a corpus, the repository data or a synthetic
+data set, and timed by run_benchmarks.py. The files generated by the
+benchmarks are written to a temporary directory, never to the corpus.
+"""
+import copy
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from unittest.mock import patch
+
+from freee_a11y_gl import clear_instances, setup_instances
+from freee_a11y_gl.models.check import Check
+from freee_a11y_gl.models.content import Guideline
+from freee_a11y_gl.models.faq.article import Faq
+from freee_a11y_gl.models.reference import InfoRef
+
+from harness import REPO_ROOT, Case, SkipBenchmark
+
+SCHEMA_DIR = REPO_ROOT / 'data' / 'json' / 'schemas'
+LANG = 'ja'
+
+
+class BenchmarkCorpus:
+    """Corpus the benchmarks run on, with the model loaded from it."""
+
+    def __init__(self, name: str, basedir: str, workdir: str):
+        self.name = name
+        self.basedir = basedir
+        self.workdir = workdir
+        # Data prepared once and shared by several benchmarks
+        self.cache: Dict[str, Any] = {}
+        clear_instances()
+        # Memory still allocated after loading is the memory of the model
+        tracemalloc.start()
+        try:
+            setup_instances(basedir, use_cache=False)
+            model_bytes = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        self.sizes = {
+            'checks': len(Check._instances),
+            'guidelines': len(Guideline._instances),
+            'faqs': len(Faq._instances),
+            'model_bytes': model_bytes,
+        }
+
+    def cached(self, key: str, factory: Callable[[], Any]) -> Any:
+        if key not in self.cache:
+            self.cache[key] = factory()
+        return self.cache[key]
+
+
+def parse_corpus(spec: str) -> Optional[float]:
+    """Parse a corpus specification.
+
+    Args:
+        spec: 'real' for the data of the repository, or 'synthetic:SCALE'
+            for a synthetic data set of SCALE times the size of the
+            repository data
+
+    Returns:
+        Scale of the synthetic data set, or None for the repository data
+
+    Raises:
+        ValueError: If spec is invalid
+    """
+    if spec == 'real':
+        return None
+    kind, _, scale = spec.partition(':')
+    try:
+        if kind == 'synthetic' and float(scale) > 0:
+            return float(scale)
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid corpus: {spec} (expected 'real' or 'synthetic:SCALE')")
+
+
+@contextmanager
+def open_corpus(spec: str) -> Iterator[BenchmarkCorpus]:
+    """Load a corpus for the benchmarks.
+
+    Args:
+        spec: Corpus specification, see parse_corpus()
+    """
+    scale = parse_corpus(spec)
+    workdir = tempfile.mkdtemp(prefix='a11y-benchmarks-')
+    try:
+        if scale is None:
+            basedir = str(REPO_ROOT)
+        else:
+            from freee_a11y_gl.synthetic_corpus import generate_corpus
+            basedir = os.path.join(workdir, 'corpus')
+            generate_corpus(basedir, scale=scale, schema_dir=str(SCHEMA_DIR))
+        yield BenchmarkCorpus(spec, basedir, os.path.join(workdir, 'output'))
+    finally:
+        clear_instances()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def benchmark_cases(corpus: BenchmarkCorpus) -> Iterator[Tuple[str, Callable[[], Case]]]:
+    """Get the benchmarks of a corpus.
+
+    Yields:
+        Names of the benchmarks and functions preparing them, which raise
+        SkipBenchmark if the benchmark cannot run on the corpus
+    """
+    yield 'import_package', import_package_case
+    yield 'setup_instances', lambda: setup_instances_case(corpus, use_cache=False)
+    yield 'setup_instances[cached]', lambda: setup_instances_case(corpus, use_cache=True)
+    yield 'parse_yaml', lambda: parse_yaml_case(corpus, c_loader=True)
+    yield 'parse_yaml[python]', lambda: parse_yaml_case(corpus, c_loader=False)
+    yield 'read_axe_snapshot', lambda: read_axe_snapshot_case(corpus)
+    yield 'sorted_relationships', sorted_relationships_case
+    yield 'yaml_validator', lambda: yaml_validator_case(corpus, 'jsonschema')
+    yield 'yaml_validator[codegen]', lambda: yaml_validator_case(corpus, 'codegen')
+    yield 'normalize_text', lambda: normalize_text_case(corpus)
+    yield 'render_conditions', lambda: render_conditions_case(cached=False)
+    yield 'render_conditions[cached]', lambda: render_conditions_case(cached=True)
+    yield 'process_yaml_data', lambda: process_yaml_data_case(corpus)
+    for name, config, file_generator in yaml2rst_configs(corpus):
+        yield f'yaml2rst.{name}', lambda config=config, file_generator=file_generator: \
+            yaml2rst_case(corpus, config, file_generator)
+    yield 'yaml2sheet.prepare_sheets', lambda: prepare_sheets_case(corpus)
+    yield 'yaml2sheet.generate_batch_requests', lambda: generate_batch_requests_case(corpus)
+
+
+def import_package_case() -> Case:
+    """Import the package in a new interpreter."""
+    def run(_):
+        subprocess.run([sys.executable, '-c', 'import freee_a11y_gl'], check=True)
+    return Case(run)
+
+
+def setup_instances_case(corpus: BenchmarkCorpus, use_cache: bool) -> Case:
+    def run(_):
+        clear_instances()
+        setup_instances(corpus.basedir, use_cache=use_cache)
+    return Case(run)
+
+
+def parse_yaml_case(corpus: BenchmarkCorpus, c_loader: bool) -> Case:
+    """Parse all YAML files of the corpus with the C or the pure-Python loader."""
+    import yaml
+    from freee_a11y_gl import yaml_loader
+
+    if c_loader and not yaml_loader.LIBYAML_AVAILABLE:
+        raise SkipBenchmark('PyYAML is built without libyaml')
+    loader = yaml.CSafeLoader if c_loader else yaml.SafeLoader
+    contents = [path.read_text(encoding='utf-8')
+                for path in sorted(Path(corpus.basedir, 'data', 'yaml').rglob('*.yaml'))]
+
+    def run(_):
+        for content in contents:
+            yaml.load(content, Loader=loader)
+    return Case(run)
+
+
+def require_axe_core(corpus: BenchmarkCorpus) -> None:
+    if not os.path.exists(os.path.join(corpus.basedir, 'vendor', 'axe-core', '.git')):
+        raise SkipBenchmark('the axe-core submodule is not checked out')
+
+
+def read_axe_snapshot_case(corpus: BenchmarkCorpus) -> Case:
+    """Read the axe-core rules and messages from the submodule commit."""
+    from freee_a11y_gl.config import Config
+    from freee_a11y_gl.initializer import read_axe_snapshot
+
+    require_axe_core(corpus)
+    axe_core_config = Config.get_axe_core_config()
+    return Case(lambda _: read_axe_snapshot(corpus.basedir, axe_core_config))
+
+
+def sorted_relationships_case() -> Case:
+    """Look up the sorted guidelines and FAQs of all objects, as the templates do."""
+    from freee_a11y_gl.relationship_manager import RelationshipManager
+
+    # Number of times the templates look up the same relationships
+    lookups = 10
+    manager = RelationshipManager()
+    objects = [obj for cls in (Check, Guideline, Faq, InfoRef) for obj in cls._instances.values()]
+
+    def run(_):
+        for _ in range(lookups):
+            for obj in objects:
+                manager.get_sorted_related_objects(obj, 'guideline')
+                manager.get_sorted_related_objects(obj, 'faq')
+    return Case(run, manager.clear_cache)
+
+
+def yaml_validator_case(corpus: BenchmarkCorpus, backend: str) -> Case:
+    """Validate all YAML files with validators compiled before the timing."""
+    from freee_a11y_gl import yaml_loader, yaml_validator
+    from freee_a11y_gl.yaml_validator import YamlValidator
+
+    if backend == 'codegen' and yaml_validator.fastjsonschema is None:
+        raise SkipBenchmark('fastjsonschema is not installed')
+    schema_dir = os.path.join(corpus.basedir, 'data', 'json', 'schemas')
+    validator = YamlValidator(schema_dir, 'strict', backend)
+    documents = []
+    for schema_name, subdir in [('check', 'checks'), ('guideline', 'gl'), ('faq', 'faq')]:
+        for path in sorted(Path(corpus.basedir, 'data', 'yaml', subdir).rglob('*.yaml')):
+            with open(path, encoding='utf-8') as f:
+                documents.append((yaml_loader.safe_load(f), schema_name, str(path)))
+
+    def run(_):
+        for data, schema_name, path in documents:
+            validator.validate_yaml_data(data, schema_name, path)
+    return Case(run)
+
+
+def normalize_text_case(corpus: BenchmarkCorpus) -> Case:
+    """Normalize the Japanese texts of all checks and procedures."""
+    from freee_a11y_gl.yaml_processor.rst_processor import normalize_text
+
+    texts: List[str] = []
+
+    def collect(condition):
+        if condition['type'] == 'simple':
+            texts.append(condition['procedure']['procedure'][LANG])
+        else:
+            for child in condition['conditions']:
+                collect(child)
+
+    for check in Check.object_data_all().values():
+        texts.append(check['check'][LANG])
+        for condition in check.get('conditions', []):
+            collect(condition)
+
+    def run(_):
+        for text in texts:
+            normalize_text(text)
+    return Case(run)
+
+
+def render_conditions_case(cached: bool) -> Case:
+    """Build the summaries, template data and object data of all conditions."""
+    from freee_a11y_gl.settings_manager import settings
+
+    conditions = [condition for check in Check._instances.values() for condition in check.conditions]
+
+    def setup():
+        if not cached:
+            # Discard the data built by the conditions, as a settings change does
+            settings.revision += 1
+
+    def run(_):
+        for condition in conditions:
+            condition.object_data(None, is_top=True)
+            for lang in ('ja', 'en'):
+                condition.summary(lang)
+                condition.template_data(lang)
+    return Case(run, setup)
+
+
+def require_info_links(corpus: BenchmarkCorpus) -> None:
+    for lang in ('ja', 'en'):
+        pickle_path = os.path.join(corpus.basedir, lang, 'build', 'doctrees', 'environment.pickle')
+        if not os.path.isfile(pickle_path):
+            raise SkipBenchmark(f'{pickle_path} not found; build the {lang} documentation first')
+
+
+def load_source_data(corpus: BenchmarkCorpus) -> Dict[str, Any]:
+    """Reload the model and convert it with process_yaml_data()."""
+    from freee_a11y_gl.yaml_processor import process_yaml_data
+
+    clear_instances()
+    return process_yaml_data(corpus.basedir, use_cache=False)
+
+
+def process_yaml_data_case(corpus: BenchmarkCorpus) -> Case:
+    require_info_links(corpus)
+    return Case(lambda _: load_source_data(corpus))
+
+
+def yaml2rst_configs(corpus: BenchmarkCorpus) -> Iterator[Tuple[str, Any, Any]]:
+    """Get the yaml2rst generator configurations writing to the work directory.
+
+    Yields:
+        Template names, generator configurations and the file generator
+    """
+    from freee_a11y_gl.config import Config
+    from yaml2rst import initializer, yaml2rst
+    from yaml2rst.generators.file_generator import FileGenerator
+
+    Config.initialize(profile='yaml2rst', config_override={
+        'basedir': corpus.basedir, 'languages': {'default': LANG}})
+    settings = {'lang': LANG, 'basedir': corpus.basedir}
+    dest_dirs, static_files, makefile_vars = initializer.setup_constants(settings)
+    source_root = os.path.join(corpus.basedir, LANG)
+
+    def relocate(paths: Dict[str, str]) -> Dict[str, str]:
+        return {key: os.path.join(corpus.workdir, os.path.relpath(path, source_root))
+                if path.startswith(source_root + os.sep) else path
+                for key, path in paths.items()}
+
+    dest_dirs, static_files = relocate(dest_dirs), relocate(static_files)
+    makefile_vars = {key: ' '.join(relocate({'path': path})['path'] for path in value.split(' '))
+                     for key, value in makefile_vars.items()}
+    for directory in dest_dirs.values():
+        os.makedirs(directory, exist_ok=True)
+
+    file_generator = FileGenerator(initializer.setup_templates(None), LANG)
+    base_vars, vars_list = initializer.setup_variables()
+    configs = yaml2rst.get_generator_configs(dest_dirs, static_files) + [
+        yaml2rst.get_makefile_generator_config(dest_dirs, static_files, makefile_vars,
+                                               base_vars, vars_list)]
+    for config in configs:
+        yield config.template_name, config, file_generator
+
+
+def yaml2rst_case(corpus: BenchmarkCorpus, config, file_generator) -> Case:
+    from yaml2rst.generators.content_generators import AxeRulesGenerator
+
+    if config.generator_class is AxeRulesGenerator:
+        require_axe_core(corpus)
+    return Case(lambda _: file_generator.generate(config, True, []))
+
+
+class SheetsRequestStub:
+    def __init__(self, result: Dict[str, Any]):
+        self.result = result
+
+    def execute(self) -> Dict[str, Any]:
+        return self.result
+
+
+class SheetsServiceStub:
+    """Sheets API service of a spreadsheet which has all checklist sheets."""
+
+    def __init__(self):
+        from yaml2sheet.config import LANGS, TARGET_NAMES
+
+        titles = [TARGET_NAMES[target][lang] for lang in LANGS for target in TARGET_NAMES]
+        self.spreadsheet = {'sheets': [
+            {'properties': {'sheetId': sheet_id, 'title': title, 'index': sheet_id,
+                            'gridProperties': {'rowCount': 1000, 'columnCount': 26}}}
+            for sheet_id, title in enumerate(titles)
+        ]}
+
+    def spreadsheets(self):
+        return self
+
+    def get(self, **kwargs) -> SheetsRequestStub:
+        return SheetsRequestStub(self.spreadsheet)
+
+    def batchUpdate(self, **kwargs) -> SheetsRequestStub:
+        return SheetsRequestStub({'replies': []})
+
+
+def sheet_generator(corpus: BenchmarkCorpus):
+    from yaml2sheet.sheet_generator import ChecklistSheetGenerator
+
+    with patch('yaml2sheet.sheet_generator.build', return_value=SheetsServiceStub()):
+        return ChecklistSheetGenerator(None, 'benchmark', 'editor@example.com')
+
+
+def sheet_source_data(corpus: BenchmarkCorpus) -> Dict[str, Any]:
+    require_info_links(corpus)
+    return corpus.cached('source_data', lambda: load_source_data(corpus))
+
+
+def prepare_sheets_case(corpus: BenchmarkCorpus) -> Case:
+    """Process the source data and build the sheets, without sending requests."""
+    source_data = sheet_source_data(corpus)
+
+    def setup():
+        generator = sheet_generator(corpus)
+        generator.execute_batch_update = lambda: None
+        return generator, copy.deepcopy(source_data)
+
+    return Case(lambda args: args[0].generate_checklist(args[1]), setup)
+
+
+def generate_batch_requests_case(corpus: BenchmarkCorpus) -> Case:
+    source_data = sheet_source_data(corpus)
+    generator = sheet_generator(corpus)
+    generator.execute_batch_update = lambda: None
+    generator.generate_checklist(copy.deepcopy(source_data))
+    return Case(lambda _: generator.generate_batch_requests())
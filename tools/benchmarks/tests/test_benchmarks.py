@@ -0,0 +1,121 @@
+"""Tests for the benchmark harness and suites."""
+import json
+
+import pytest
+
+import run_benchmarks
+import suites
+from harness import (
+    Case, Comparison, compare_results, format_comparisons, load_results, save_results,
+    time_case
+)
+
+
+def results(times, skipped=()):
+    """Result set with the given minimum times by benchmark name."""
+    return {
+        'version': 1,
+        'benchmarks': [{'benchmark': name, 'corpus': 'real', 'min': value}
+                       for name, value in times.items()] +
+                      [{'benchmark': name, 'corpus': 'real', 'skipped': 'reason'}
+                       for name in skipped],
+    }
+
+
+class TestHarness:
+    """Tests for timing and comparing benchmarks."""
+
+    def test_time_case_repeats_fast_calls(self):
+        calls = []
+        stats = time_case(Case(lambda _: calls.append(None)), rounds=3)
+        assert stats['rounds'] == 3
+        assert stats['number'] > 1
+        assert len(calls) == 1 + 3 * stats['number']
+        assert 0 < stats['min'] <= stats['median'] <= max(stats['mean'], stats['median'])
+
+    def test_time_case_calls_setup_per_round(self):
+        received = []
+        counter = iter(range(100))
+        time_case(Case(received.append, lambda: next(counter)), rounds=2)
+        assert received == [0, 1, 2]
+
+    def test_compare_results(self):
+        baseline = results({'same': 1.0, 'slower': 1.0, 'faster': 1.0, 'gone': 1.0,
+                            'now_skipped': 1.0})
+        current = results({'same': 1.05, 'slower': 1.2, 'faster': 0.5, 'added': 1.0},
+                          skipped=['now_skipped'])
+        comparisons = compare_results(baseline, current, threshold=0.1)
+        assert {c.benchmark: c.status for c in comparisons} == {
+            'same': 'unchanged', 'slower': 'regression', 'faster': 'improvement',
+            'added': 'new', 'gone': 'missing', 'now_skipped': 'missing'}
+        assert comparisons[1].change == pytest.approx(0.2)
+
+    def test_format_comparisons(self):
+        table = format_comparisons([
+            Comparison('load', 'real', 0.002, 0.003, 'regression'),
+            Comparison('new', 'real', None, 1e-6, 'new')])
+        lines = table.splitlines()
+        assert lines[0].split() == ['benchmark', 'corpus', 'baseline', 'current', 'change',
+                                    'status']
+        assert lines[1].split() == ['load', 'real', '2', 'ms', '3', 'ms', '+50.0%',
+                                    'REGRESSION']
+        assert lines[2].split() == ['new', 'real', '-', '1', 'us', '-', 'new']
+
+    def test_load_results(self, tmp_path):
+        path = str(tmp_path / 'results.json')
+        save_results(results({'load': 1.0}), path)
+        assert load_results(path) == results({'load': 1.0})
+        (tmp_path / 'other.json').write_text(json.dumps({'version': 0}))
+        with pytest.raises(ValueError):
+            load_results(str(tmp_path / 'other.json'))
+
+    def test_parse_corpus(self):
+        assert suites.parse_corpus('real') is None
+        assert suites.parse_corpus('synthetic:2.5') == 2.5
+        for spec in ['synthetic', 'synthetic:0', 'synthetic:x', 'fake:1']:
+            with pytest.raises(ValueError):
+                suites.parse_corpus(spec)
+
+
+class TestSuites:
+    """Tests running the benchmarks on a small synthetic data set."""
+
+    def test_run_all_benchmarks(self, tmp_path):
+        lines = []
+        output = run_benchmarks.run_benchmarks(['synthetic:0.1'], rounds=1,
+                                               report=lines.append)
+        names = [record['benchmark'] for record in output['benchmarks']]
+        assert names[:13] == ['import_package', 'setup_instances', 'setup_instances[cached]',
+                              'parse_yaml', 'parse_yaml[python]', 'read_axe_snapshot',
+                              'sorted_relationships', 'yaml_validator',
+                              'yaml_validator[codegen]', 'normalize_text', 'render_conditions',
+                              'render_conditions[cached]', 'process_yaml_data']
+        assert 'yaml2rst.category_page' in names
+        assert 'yaml2rst.makefile' in names
+        assert names[-2:] == ['yaml2sheet.prepare_sheets', 'yaml2sheet.generate_batch_requests']
+        assert [record for record in output['benchmarks'] if 'skipped' in record] == []
+        assert output['corpora']['synthetic:0.1']['checks'] == 16
+        assert output['corpora']['synthetic:0.1']['model_bytes'] > 0
+        assert len(lines) == len(names)
+
+    def test_main_run_and_compare(self, tmp_path, capsys):
+        baseline = str(tmp_path / 'baseline.json')
+        current = str(tmp_path / 'current.json')
+        argv = ['run', '--corpus', 'synthetic:0.1', '--rounds', '1', '-k', 'normalize_text']
+        assert run_benchmarks.main(argv + ['-o', baseline]) == 0
+        assert [record['benchmark'] for record in load_results(baseline)['benchmarks']] == \
+            ['normalize_text']
+        # Two runs of the same code never differ by a factor of 100
+        assert run_benchmarks.main(argv + ['-o', current, '--baseline', baseline,
+                                           '--threshold', '100']) == 0
+        assert run_benchmarks.main(['compare', baseline, current, '--threshold', '100']) == 0
+
+        slow = load_results(current)
+        slow['benchmarks'][0]['min'] *= 2
+        save_results(slow, current)
+        assert run_benchmarks.main(['compare', baseline, current]) == 1
+        assert 'REGRESSION' in capsys.readouterr().out
+
+    def test_main_invalid_corpus(self, capsys):
+        assert run_benchmarks.main(['run', '--corpus', 'synthetic:1', 'fake']) == 2
+        assert 'Invalid corpus: fake' in capsys.readouterr().err
@@ -10,37 +10,76 @@ Main components:
 - Models: Category, Guideline, Check, Faq, WcagSc, etc.
 - YAML processing and validation
 - Relationship management between entities
+- Isolated corpora of instances and relationships
 - Configuration and settings management
 - Message catalog for internationalization
 """
 
-# Core models
-from .models.content import Category, Guideline
-from .models.check import Check, CheckTool
-from .models.reference import WcagSc, InfoRef
-from .models.faq.article import Faq
-from .models.faq.tag import FaqTag
-from .models.axe import AxeRule
-from .relationship_manager import RelationshipManager
-
-# Constants and utilities
-from .source import get_src_path
-from .initializer import setup_instances
-from .info_utils import get_info_links
-from .version_utils import get_version_info
-from .settings import settings
-
-# Data processing
-from .yaml_processor import process_yaml_data
+import importlib
+
+# Exported names and the modules defining them. The modules are imported on
+# first access, so that importing the package, or a light submodule such as
+# yaml_loader, does not load jsonschema, GitPython, pydantic and the models.
+# The settings object lives in settings_manager rather than a submodule named
+# settings, because importing such a submodule would replace the exported
+# object with the module on the package.
+_EXPORTS = {
+    # Settings
+    'settings': '.settings_manager',
+
+    # Core models
+    'Category': '.models.content',
+    'Guideline': '.models.content',
+    'Check': '.models.check',
+    'CheckTool': '.models.check',
+    'WcagSc': '.models.reference',
+    'InfoRef': '.models.reference',
+    'Faq': '.models.faq.article',
+    'FaqTag': '.models.faq.tag',
+    'AxeRule': '.models.axe',
+    'RelationshipManager': '.relationship_manager',
+    'Corpus': '.corpus',
+    'get_default_corpus': '.corpus',
+    'get_active_corpus': '.corpus',
+
+    # Constants and utilities
+    'get_src_path': '.source',
+    'setup_instances': '.initializer',
+    'clear_instances': '.initializer',
+    'reload_sources': '.reload',
+    'ReloadResult': '.reload',
+    'get_cache_stats': '.parse_cache',
+    'get_info_links': '.info_utils',
+    'get_version_info': '.version_utils',
+
+    # Data processing
+    'process_yaml_data': '.yaml_processor',
+}
+
+
+def __getattr__(name):
+    """Import an exported name from its module on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # Models
     'Category', 'Check', 'Guideline', 'Faq', 'FaqTag',
     'WcagSc', 'InfoRef', 'AxeRule', 'CheckTool',
     # Managers
-    'RelationshipManager',
+    'RelationshipManager', 'Corpus', 'get_default_corpus', 'get_active_corpus',
     # Utils
-    'get_src_path', 'setup_instances', 'get_info_links',
+    'get_src_path', 'setup_instances', 'clear_instances', 'reload_sources', 'ReloadResult',
+    'get_cache_stats', 'get_info_links',
     'get_version_info',
     # YAML processing functionality
     'process_yaml_data',
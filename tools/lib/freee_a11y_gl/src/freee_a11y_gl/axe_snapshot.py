@@ -0,0 +1,136 @@
+"""Snapshot cache of the axe-core rules read from the Git submodule.
+
+The axe-core rules, the Japanese messages, the package version and the commit
+timestamp only change when the axe-core submodule is moved to another commit.
+This module stores them in the cache directory keyed by the commit SHA the
+submodule points to, so that unchanged runs do not need GitPython at all.
+"""
+
+import os
+import pickle
+import subprocess
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .logging_config import get_logger
+
+logger = get_logger()
+
+# Name of the snapshot file in the cache directory
+SNAPSHOT_FILE_NAME = "axe_core.pickle"
+
+# Format version of the snapshot file; bump when AxeSnapshot changes
+SNAPSHOT_FORMAT_VERSION = 1
+
+# axe-core configuration keys which determine the content of a snapshot
+SOURCE_CONFIG_KEYS = ('pkg_file', 'rules_dir', 'locale_dir', 'locale_ja_file')
+
+
+@dataclass
+class AxeSnapshot:
+    """Parsed axe-core data of one submodule commit."""
+    hexsha: str
+    rules: List[Dict[str, Any]] = field(default_factory=list)
+    messages_ja: Dict[str, Any] = field(default_factory=dict)
+    version: str = ''
+    authored_date: int = 0
+    source: Dict[str, str] = field(default_factory=dict)
+
+
+def snapshot_source(axe_core_config: Dict[str, str]) -> Dict[str, str]:
+    """
+    Get the part of the axe-core configuration a snapshot depends on.
+
+    Args:
+        axe_core_config: Dictionary containing axe-core configuration
+
+    Returns:
+        Dictionary of the configured file and directory names
+    """
+    return {key: axe_core_config.get(key) for key in SOURCE_CONFIG_KEYS}
+
+
+def get_submodule_hexsha(basedir: str, submodule_path: str) -> Optional[str]:
+    """
+    Get the commit SHA the submodule is recorded at in HEAD of the root repository.
+
+    This is the value of Submodule.hexsha in GitPython, obtained with a single
+    git command instead of parsing the submodule configuration.
+
+    Args:
+        basedir: Root directory of the repository
+        submodule_path: Path of the submodule relative to basedir
+
+    Returns:
+        Commit SHA, or None if it cannot be determined
+    """
+    try:
+        result = subprocess.run(
+            ['git', '-C', basedir, 'rev-parse', '--verify', '--quiet', f'HEAD:./{submodule_path}'],
+            capture_output=True, text=True, check=False
+        )
+    except OSError:
+        return None
+    hexsha = result.stdout.strip()
+    if result.returncode != 0 or not hexsha:
+        return None
+    return hexsha
+
+
+def load_snapshot(cache_dir: str, hexsha: str, axe_core_config: Dict[str, str]) -> Optional[AxeSnapshot]:
+    """
+    Load the snapshot of a submodule commit from the cache directory.
+
+    Args:
+        cache_dir: Cache directory
+        hexsha: Commit SHA the submodule points to
+        axe_core_config: Dictionary containing axe-core configuration
+
+    Returns:
+        AxeSnapshot, or None if no usable snapshot of this commit is cached
+    """
+    path = os.path.join(cache_dir, SNAPSHOT_FILE_NAME)
+    try:
+        with open(path, 'rb') as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable axe-core snapshot {path}: {e}")
+        return None
+
+    if not isinstance(cached, dict) or cached.get('version') != SNAPSHOT_FORMAT_VERSION:
+        return None
+    snapshot = cached.get('snapshot')
+    if not isinstance(snapshot, AxeSnapshot) or snapshot.hexsha != hexsha:
+        return None
+    if snapshot.source != snapshot_source(axe_core_config):
+        return None
+    return snapshot
+
+
+def save_snapshot(cache_dir: str, snapshot: AxeSnapshot) -> None:
+    """
+    Write a snapshot to the cache directory, replacing the previous one.
+
+    Failures are logged and otherwise ignored, since the snapshot is only an
+    optimization.
+
+    Args:
+        cache_dir: Cache directory
+        snapshot: Snapshot to store
+    """
+    path = os.path.join(cache_dir, SNAPSHOT_FILE_NAME)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': SNAPSHOT_FORMAT_VERSION, 'snapshot': snapshot},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to write axe-core snapshot {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -4,10 +4,11 @@ from .localization_config import LocalizationConfig
 from .message_config import MessageConfig
 from .validation_config import ValidationConfig
 from .tool_config import ToolConfig
+from .cache_config import CacheConfig
 
 # Re-export the main Config class and types
 from ..config_main import Config, LanguageCode
-from ..settings import settings
+from ..settings_manager import settings
 
 __all__ = [
     "Config",
@@ -18,4 +19,5 @@ __all__ = [
     "MessageConfig",
     "ValidationConfig",
     "ToolConfig",
+    "CacheConfig",
 ]
@@ -0,0 +1,52 @@
+"""Parsed source file cache configuration management."""
+import os
+from ..settings_manager import settings
+from ..exceptions import ConfigurationError
+from ..logging_config import get_logger
+
+logger = get_logger()
+
+
+class CacheConfig:
+    """Manages configuration of the parsed source file cache."""
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Check whether the cache is enabled.
+
+        Returns:
+            True if the cache is enabled
+        """
+        return bool(settings.get("cache.enabled", True))
+
+    @classmethod
+    def set_enabled(cls, enabled: bool) -> None:
+        """Enable or disable the cache.
+
+        Args:
+            enabled: Whether the cache should be used
+
+        Raises:
+            ConfigurationError: If the setting cannot be updated
+        """
+        try:
+            settings.set("cache.enabled", bool(enabled))
+            logger.info(f"Set parse cache enabled to: {bool(enabled)}")
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to set parse cache enabled to {enabled}",
+                str(e)
+            )
+
+    @classmethod
+    def get_cache_dir(cls, basedir: str) -> str:
+        """Get the cache directory.
+
+        Args:
+            basedir: Base directory relative paths are resolved against
+
+        Returns:
+            Absolute path of the cache directory
+        """
+        directory = settings.get("cache.directory", "build/.a11y_gl_cache")
+        return os.path.abspath(os.path.join(basedir, directory))
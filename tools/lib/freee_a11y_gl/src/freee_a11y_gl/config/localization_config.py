@@ -1,6 +1,6 @@
 """Localization configuration management."""
 from typing import List, Optional
-from ..settings import settings
+from ..settings_manager import settings
 
 LanguageCode = str  # Simplified type hint
 
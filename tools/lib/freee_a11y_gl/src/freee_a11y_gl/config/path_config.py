@@ -1,6 +1,6 @@
 """Path and URL configuration management."""
 from typing import Optional
-from ..settings import settings
+from ..settings_manager import settings
 from ..validation_utils import InputValidator
 from ..logging_config import get_logger
 
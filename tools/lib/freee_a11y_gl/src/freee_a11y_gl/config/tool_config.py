@@ -1,6 +1,6 @@
 """External tool configuration management."""
 from typing import Dict
-from ..settings import settings
+from ..settings_manager import settings
 
 
 class ToolConfig:
@@ -1,5 +1,5 @@
 """Validation configuration management."""
-from ..settings import settings
+from ..settings_manager import settings
 from ..exceptions import ConfigurationError
 from ..validation_utils import InputValidator
 from ..logging_config import get_logger
@@ -23,6 +23,43 @@ class ValidationConfig:
             logger.warning(f"Failed to get YAML validation mode: {e}")
             return "strict"
 
+    @classmethod
+    def get_yaml_validation_backend(cls) -> str:
+        """Get YAML validation backend.
+
+        Returns:
+            YAML validation backend ("jsonschema" or "codegen")
+        """
+        try:
+            return settings.get("validation.backend", "jsonschema")
+        except Exception as e:
+            logger.warning(f"Failed to get YAML validation backend: {e}")
+            return "jsonschema"
+
+    @classmethod
+    def set_yaml_validation_backend(cls, backend: str) -> None:
+        """Set YAML validation backend.
+
+        Args:
+            backend: Validation backend ("jsonschema" or "codegen")
+
+        Raises:
+            ConfigurationError: If backend is not valid
+        """
+        backend = InputValidator.validate_non_empty_string(backend, "validation backend")
+        backend = InputValidator.validate_enum(
+            backend, ["jsonschema", "codegen"], "validation backend"
+        )
+
+        try:
+            settings.set("validation.backend", backend)
+            logger.info(f"Set YAML validation backend to: {backend}")
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to set YAML validation backend to {backend}",
+                str(e)
+            )
+
     @classmethod
     def set_yaml_validation_mode(cls, mode: str) -> None:
         """Set YAML validation mode.
@@ -1,6 +1,6 @@
 """Configuration interface for freee_a11y_gl module."""
 from typing import Any, Dict, List, Literal, Optional
-from .settings import settings
+from .settings_manager import settings
 from .exceptions import ConfigurationError
 from .validation_utils import InputValidator
 from .logging_config import get_logger
@@ -9,6 +9,7 @@ from .config.localization_config import LocalizationConfig
 from .config.message_config import MessageConfig
 from .config.validation_config import ValidationConfig
 from .config.tool_config import ToolConfig
+from .config.cache_config import CacheConfig
 
 logger = get_logger()
 
@@ -296,6 +297,27 @@ class Config:
         """
         return ValidationConfig.set_yaml_validation_mode(mode)
 
+    @classmethod
+    def get_yaml_validation_backend(cls) -> str:
+        """Get YAML validation backend.
+
+        Returns:
+            YAML validation backend ("jsonschema" or "codegen")
+        """
+        return ValidationConfig.get_yaml_validation_backend()
+
+    @classmethod
+    def set_yaml_validation_backend(cls, backend: str) -> None:
+        """Set YAML validation backend.
+
+        Args:
+            backend: Validation backend ("jsonschema" or "codegen")
+
+        Raises:
+            ValueError: If backend is not valid
+        """
+        return ValidationConfig.set_yaml_validation_backend(backend)
+
     @classmethod
     def get_axe_core_config(cls) -> Dict[str, str]:
         """Get axe-core configuration.
@@ -304,3 +326,34 @@ class Config:
             Dictionary containing axe-core configuration settings
         """
         return ToolConfig.get_axe_core_config()
+
+    @classmethod
+    def is_cache_enabled(cls) -> bool:
+        """Check whether the parsed source file cache is enabled.
+
+        Returns:
+            True if parsed source files are cached between runs
+        """
+        return CacheConfig.is_enabled()
+
+    @classmethod
+    def set_cache_enabled(cls, enabled: bool) -> None:
+        """Enable or disable the parsed source file cache.
+
+        Args:
+            enabled: Whether parsed source files should be cached between runs
+        """
+        return CacheConfig.set_enabled(enabled)
+
+    @classmethod
+    def get_cache_dir(cls, basedir: Optional[str] = None) -> str:
+        """Get the directory of the parsed source file cache.
+
+        Args:
+            basedir: Base directory the cache directory is relative to.
+                    If None, the base directory from settings will be used.
+
+        Returns:
+            Absolute path of the cache directory
+        """
+        return CacheConfig.get_cache_dir(basedir if basedir is not None else cls.get_basedir())
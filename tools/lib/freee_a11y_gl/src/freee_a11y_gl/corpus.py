@@ -0,0 +1,199 @@
+"""Isolated sets of model instances and relationships.
+
+The models keep their instances in class-level registries (Check._instances,
+Guideline._instances, ...), the axe-core metadata in AxeRule class
+attributes and the relationships in the RelationshipManager singleton. A
+Corpus owns one such set of registries, metadata and relationships, so that
+several data sets, e.g. different basedirs or guideline versions, can be
+loaded side by side in one process.
+
+The class-level API remains the interface to the model: while a corpus is
+active, its registries and relationship manager are installed in the model
+classes, and Check.get_by_id(), RelationshipManager(), setup_instances(),
+reload_sources() etc. operate on it. Outside of any activation, the default
+corpus holding the instances loaded by plain setup_instances() calls is
+installed.
+
+Activation switches process-wide state and is not thread-safe: use one
+corpus at a time per process, e.g. serve builds one after another in a
+long-running worker.
+
+Example:
+    >>> v1 = Corpus.load('/path/to/v1')
+    >>> v2 = Corpus.load('/path/to/v2')
+    >>> with v1.activate():
+    ...     print(Check.get_by_id('0001').check_text['ja'])
+    >>> with v2.activate():
+    ...     print(Check.get_by_id('0001').check_text['ja'])
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .relationship_manager import RelationshipManager
+from .models.content import Category, Guideline
+from .models.check import Check, CheckTool
+from .models.reference import WcagSc, InfoRef
+from .models.faq.article import Faq
+from .models.faq.tag import FaqTag
+from .models.axe import AxeRule
+from .models.base import Registry
+
+# Model classes with a class-level instance registry
+MODELS = (Category, Guideline, Check, CheckTool, Faq, FaqTag, WcagSc, InfoRef, AxeRule)
+
+# Class-level AxeRule attributes set by loading the axe-core rules
+AXE_ATTRIBUTES = ('timestamp', 'version', 'major_version', 'deque_url', '_loader')
+
+
+class Corpus:
+    """Instance registries and relationships of one data set.
+
+    Attributes:
+        basedir: Base directory the corpus is loaded from, or None to use the
+            value from settings
+    """
+
+    def __init__(self, basedir: Optional[str] = None):
+        """Create an empty corpus.
+
+        Args:
+            basedir: Base directory containing data files.
+                If None, value from settings will be used.
+        """
+        self.basedir = basedir
+        self._registries: Dict[type, Dict[str, Any]] = {
+            model: Registry.for_model(model) for model in MODELS}
+        self._axe_attributes: Dict[str, Any] = dict.fromkeys(AXE_ATTRIBUTES)
+        self._relationship_manager: Optional[RelationshipManager] = None
+
+    @classmethod
+    def load(cls, basedir: Optional[str] = None, **kwargs) -> 'Corpus':
+        """Create a corpus and load the model from basedir.
+
+        Args:
+            basedir: Base directory containing data files
+            **kwargs: Further arguments of setup_instances()
+
+        Returns:
+            Loaded corpus, which is not active
+        """
+        corpus = cls(basedir)
+        corpus.setup(**kwargs)
+        return corpus
+
+    @contextmanager
+    def activate(self) -> Iterator['Corpus']:
+        """Install this corpus in the model classes for the duration of a block.
+
+        Activations can be nested; the previously active corpus is installed
+        again when the block is left.
+        """
+        global _active
+        previous = _active
+        if previous is self:
+            yield self
+            return
+        previous._store()
+        self._install()
+        _active = self
+        try:
+            yield self
+        finally:
+            self._store()
+            previous._install()
+            _active = previous
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the corpus is currently installed in the model classes."""
+        return _active is self
+
+    @property
+    def relationship_manager(self) -> RelationshipManager:
+        """Relationship manager of the corpus."""
+        with self.activate():
+            return RelationshipManager()
+
+    def setup(self, **kwargs) -> RelationshipManager:
+        """Load the model into the corpus with setup_instances().
+
+        Args:
+            **kwargs: Further arguments of setup_instances()
+
+        Returns:
+            RelationshipManager of the corpus
+        """
+        from .initializer import setup_instances
+        with self.activate():
+            return setup_instances(self.basedir, **kwargs)
+
+    def reload(self, changed_paths: Iterable[str], **kwargs):
+        """Update the corpus for changed source files with reload_sources().
+
+        Args:
+            changed_paths: Paths of modified, added or deleted source files
+            **kwargs: Further arguments of reload_sources()
+
+        Returns:
+            ReloadResult of the reload
+        """
+        from .reload import reload_sources
+        with self.activate():
+            return reload_sources(changed_paths, self.basedir, **kwargs)
+
+    def clear(self) -> None:
+        """Remove all instances, relationships and the pending axe-core loader."""
+        with self.activate():
+            for model in MODELS:
+                model._instances.clear()
+            AxeRule.set_loader(None)
+            RelationshipManager._instance = None
+
+    def get_by_id(self, model: type, id: str) -> Optional[Any]:
+        """Get an instance of a model class in this corpus by ID.
+
+        Args:
+            model: Model class, e.g. Check
+            id: Instance identifier
+
+        Returns:
+            Model instance if found, None otherwise
+        """
+        with self.activate():
+            return model.get_by_id(id)
+
+    def _store(self) -> None:
+        """Take over the state currently installed in the model classes."""
+        self._registries = {model: model._instances for model in MODELS}
+        self._axe_attributes = {name: getattr(AxeRule, name) for name in AXE_ATTRIBUTES}
+        self._relationship_manager = RelationshipManager._instance
+
+    def _install(self) -> None:
+        """Install the state of this corpus in the model classes."""
+        for model, instances in self._registries.items():
+            model._instances = instances
+        for name, value in self._axe_attributes.items():
+            setattr(AxeRule, name, value)
+        RelationshipManager._instance = self._relationship_manager
+
+
+def _create_default_corpus() -> Corpus:
+    """Create the corpus for the state defined in the model classes."""
+    corpus = Corpus()
+    corpus._store()
+    return corpus
+
+
+_default = _create_default_corpus()
+_active = _default
+
+
+def get_default_corpus() -> Corpus:
+    """Get the corpus used when no other corpus is active."""
+    return _default
+
+
+def get_active_corpus() -> Corpus:
+    """Get the corpus currently installed in the model classes."""
+    return _active
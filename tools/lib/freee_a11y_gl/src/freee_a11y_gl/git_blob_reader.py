@@ -0,0 +1,245 @@
+"""Bulk reading of files from a Git commit.
+
+Reading blobs one by one through GitPython costs a Python-level round trip
+per object (tree traversal, object lookup and stream setup). This module keeps
+a single `git cat-file --batch` process open and sends it all requested object
+names at once. Directories are listed by reading their tree objects through
+the same pipe, so reading a whole directory of a commit takes one batch per
+directory level plus one batch for the files, without spawning other git
+commands.
+"""
+
+import subprocess
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .logging_config import get_logger
+
+logger = get_logger()
+
+
+class GitBlobReader:
+    """Reads objects of a Git repository through a persistent cat-file pipe.
+
+    The reader can be used as a context manager, which closes the git process
+    on exit:
+
+        with GitBlobReader(repo_dir) as reader:
+            rules = reader.read_tree(commit, 'lib/rules', '.json')
+            files = reader.read_files(commit, ['package.json'])
+    """
+
+    def __init__(self, repo_dir: str):
+        """Initialize the reader.
+
+        Args:
+            repo_dir: Working directory of the repository (or a submodule)
+        """
+        self.repo_dir = repo_dir
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> 'GitBlobReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Terminate the cat-file process if it is running."""
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+    def _start(self) -> subprocess.Popen:
+        """Start the cat-file process on first use."""
+        if self._process is None:
+            self._process = subprocess.Popen(
+                ['git', '-C', self.repo_dir, 'cat-file', '--batch'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+        return self._process
+
+    def list_tree(self, commit: str, path: str, suffix: Optional[str] = None) -> Dict[str, str]:
+        """List the files below a directory of a commit, recursively.
+
+        The tree objects are read through the cat-file pipe, one batch per
+        directory level.
+
+        Args:
+            commit: Commit SHA or other revision
+            path: Directory path relative to the repository root
+            suffix: Only list files whose name ends with this suffix (optional)
+
+        Returns:
+            Dictionary mapping file paths relative to the repository root to
+            blob SHAs, breadth-first in tree order
+
+        Raises:
+            ValueError: If the commit or the directory does not exist
+        """
+        path = path.strip('/')
+        files = {}
+        trees = {path: f'{commit}:{path}'}
+        while trees:
+            objects = self._read(list(trees.values()))
+            subtrees = {}
+            for tree_path, (tree_sha, object_type, data) in zip(trees, objects):
+                if object_type != b'tree':
+                    raise ValueError(f'{tree_path} is not a directory in {self.repo_dir}')
+                for mode, name, sha in _parse_tree(data, len(tree_sha) // 2):
+                    entry_path = f'{tree_path}/{name}' if tree_path else name
+                    if mode == b'40000':
+                        subtrees[entry_path] = sha
+                    elif mode != b'160000':  # skip nested submodules
+                        if suffix is None or name.endswith(suffix):
+                            files[entry_path] = sha
+            trees = subtrees
+        return files
+
+    def read_tree(self, commit: str, path: str, suffix: Optional[str] = None) -> Dict[str, bytes]:
+        """Read all files below a directory of a commit.
+
+        Args:
+            commit: Commit SHA or other revision
+            path: Directory path relative to the repository root
+            suffix: Only read files whose name ends with this suffix (optional)
+
+        Returns:
+            Dictionary mapping file paths relative to the repository root to
+            the file contents, in the order of list_tree()
+
+        Raises:
+            ValueError: If the commit or the directory does not exist
+        """
+        files = self.list_tree(commit, path, suffix)
+        contents = self._read(list(files.values()))
+        return {file_path: data for file_path, (_, _, data) in zip(files, contents)}
+
+    def read_objects(self, names: Iterable[str]) -> Dict[str, bytes]:
+        """Read the contents of Git objects in a single pass.
+
+        Args:
+            names: Object names understood by git, e.g. SHAs or "<commit>:<path>"
+
+        Returns:
+            Dictionary mapping each requested name to the object contents
+
+        Raises:
+            ValueError: If an object does not exist
+        """
+        names = list(names)
+        return {name: data for name, (_, _, data) in zip(names, self._read(names))}
+
+    def _read(self, names: List[str]) -> List[Tuple[str, bytes, bytes]]:
+        """Send all object names to cat-file and read the responses in order.
+
+        Returns:
+            List of (SHA, object type, contents) tuples, one per name
+        """
+        if not names:
+            return []
+        process = self._start()
+        request = ''.join(f'{name}\n' for name in names).encode('utf-8')
+
+        # Write the requests from another thread, so that large responses
+        # cannot fill the output pipe while requests are still being sent.
+        writer = threading.Thread(target=self._write, args=(process, request), daemon=True)
+        writer.start()
+        try:
+            objects = []
+            for name in names:
+                header = process.stdout.readline()
+                if not header:
+                    raise ValueError(f'git cat-file exited unexpectedly in {self.repo_dir}')
+                if header.endswith(b' missing\n') or header.endswith(b' ambiguous\n'):
+                    raise ValueError(f'Object {name} not found in {self.repo_dir}')
+                sha, object_type, size = header.split()
+                objects.append((sha.decode('ascii'), object_type, process.stdout.read(int(size))))
+                process.stdout.read(1)  # trailing newline
+        except Exception:
+            # The remaining responses cannot be matched to requests anymore
+            self.close()
+            raise
+        finally:
+            writer.join()
+        return objects
+
+    @staticmethod
+    def _write(process: subprocess.Popen, request: bytes) -> None:
+        try:
+            process.stdin.write(request)
+            process.stdin.flush()
+        except (OSError, ValueError) as e:
+            logger.debug(f"Failed to send requests to git cat-file: {e}")
+
+    def read_files(self, commit: str, paths: Iterable[str]) -> Dict[str, bytes]:
+        """Read files of a commit in a single pass.
+
+        Args:
+            commit: Commit SHA or other revision
+            paths: File paths relative to the repository root
+
+        Returns:
+            Dictionary mapping each path to the file contents
+
+        Raises:
+            ValueError: If a file does not exist in the commit
+        """
+        paths = list(paths)
+        contents = self.read_objects(f'{commit}:{path}' for path in paths)
+        return {path: contents[f'{commit}:{path}'] for path in paths}
+
+    def authored_date(self, commit: str) -> int:
+        """Get the author timestamp of a commit.
+
+        Args:
+            commit: Commit SHA or other revision
+
+        Returns:
+            Author time as seconds since the epoch
+
+        Raises:
+            ValueError: If the commit does not exist or has no author line
+        """
+        data = self.read_objects([commit])[commit]
+        for line in data.split(b'\n'):
+            if not line:
+                break  # end of the commit headers
+            if line.startswith(b'author '):
+                return int(line.rsplit(b' ', 2)[1])
+        raise ValueError(f'Commit {commit} has no author in {self.repo_dir}')
+
+
+def _parse_tree(data: bytes, id_length: int) -> Iterator[Tuple[bytes, str, str]]:
+    """Parse the entries of a raw tree object.
+
+    Each entry is "<mode> <name>\\0" followed by the binary object ID.
+
+    Args:
+        data: Contents of the tree object
+        id_length: Length of a binary object ID (20 for SHA-1, 32 for SHA-256)
+
+    Yields:
+        Tuples of (mode, name, hex SHA)
+    """
+    pos = 0
+    end = len(data)
+    while pos < end:
+        space = data.index(b' ', pos)
+        nul = data.index(b'\0', space)
+        mode = data[pos:space]
+        name = data[space + 1:nul].decode('utf-8', 'surrogateescape')
+        id_end = nul + 1 + id_length
+        yield mode, name, data[nul + 1:id_end].hex()
+        pos = id_end
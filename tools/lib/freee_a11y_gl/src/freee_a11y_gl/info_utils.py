@@ -2,13 +2,28 @@
 Utility functions for info and link processing.
 """
 
+import os
 import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+from .sphinx_labels import ENVIRONMENT_PICKLE_NAME, LABELS_INDEX_NAME, read_labels_index
 
 # Constants
 LANGUAGES: List[str] = ['ja', 'en']
-PICKLE_PATH: str = 'build/doctrees/environment.pickle'
+DOCTREE_PATH: str = 'build/doctrees'
+PICKLE_PATH: str = f'{DOCTREE_PATH}/{ENVIRONMENT_PICKLE_NAME}'
+PATH_PREFIX: Dict[str, str] = {
+    'ja': '',
+    'en': 'en/'
+}
+
+# Info links by base directory and base URL, with the modification times and
+# sizes of the files they were read from
+_info_links_cache: Dict[Tuple[str, str], Tuple[Tuple, Dict[str, Any]]] = {}
 
 
 class InfoUtilsError(Exception):
@@ -16,9 +31,101 @@ class InfoUtilsError(Exception):
     pass
 
 
+def _load_pickle_labels(pickle_path: str) -> Dict[str, Any]:
+    """Unpickle a Sphinx build environment and get the labels of the standard domain."""
+    try:
+        with open(pickle_path, 'rb') as f:
+            doctree = pickle.load(f)
+    except Exception as e:
+        raise InfoUtilsError(f'Failed to load pickle file {pickle_path}: {str(e)}')
+    return doctree.domaindata['std']['labels']
+
+
+def load_labels(basedir: str, lang: str) -> Dict[str, Any]:
+    """
+    Load the labels of the Sphinx build of a language.
+
+    The labels index written by the freee_a11y_gl.sphinx_labels extension is
+    read if it was written with the current environment pickle. Otherwise
+    the whole build environment is unpickled.
+
+    Args:
+        basedir: Project root directory containing language-specific data
+        lang: Language code
+
+    Returns:
+        Labels of the standard domain, the document name, anchor and section
+        title of each label
+
+    Raises:
+        InfoUtilsError: If the labels cannot be loaded
+    """
+    labels = read_labels_index(str(Path(basedir) / lang / DOCTREE_PATH))
+    if labels is not None:
+        return labels
+    return _load_pickle_labels(str(Path(basedir) / lang / PICKLE_PATH))
+
+
+def _load_all_labels(basedir: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the labels of the Sphinx builds of all languages concurrently.
+
+    The labels indexes are read in threads. The build environments of the
+    languages without a usable index are unpickled in worker processes, so
+    that they never take up the memory of this process.
+
+    Args:
+        basedir: Project root directory containing language-specific data
+
+    Returns:
+        Labels of each language
+    """
+    with ThreadPoolExecutor(max_workers=len(LANGUAGES)) as executor:
+        indexes = executor.map(read_labels_index,
+                               [str(Path(basedir) / lang / DOCTREE_PATH) for lang in LANGUAGES])
+        labels = dict(zip(LANGUAGES, indexes))
+
+    missing = [lang for lang in LANGUAGES if labels[lang] is None]
+    pickle_paths = [str(Path(basedir) / lang / PICKLE_PATH) for lang in missing]
+    if missing:
+        try:
+            with ProcessPoolExecutor(max_workers=len(missing)) as executor:
+                labels.update(zip(missing, executor.map(_load_pickle_labels, pickle_paths)))
+        except (OSError, BrokenProcessPool):
+            # No worker processes available; unpickle in this process
+            labels.update(zip(missing, map(_load_pickle_labels, pickle_paths)))
+    return labels
+
+
+def _source_stamp(basedir: str) -> Optional[Tuple]:
+    """Get the modification times and sizes of the files the labels are read from."""
+    stamp = []
+    for lang in LANGUAGES:
+        for name in (ENVIRONMENT_PICKLE_NAME, LABELS_INDEX_NAME):
+            try:
+                stat = os.stat(Path(basedir) / lang / DOCTREE_PATH / name)
+            except FileNotFoundError:
+                stamp.append(None)
+                continue
+            except OSError:
+                return None
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+def _link_data(labels: Dict[str, Any], lang: str, baseurl: str) -> Dict[str, Tuple[str, str]]:
+    """Get the text and URL of the complete labels of a language."""
+    prefix = f'{baseurl}/{PATH_PREFIX[lang]}'
+    return {label: (value[2], f'{prefix}{value[0]}.html#{value[1]}')
+            for label, value in labels.items() if value[0] and value[1] and value[2]}
+
+
 def get_info_links(basedir: Optional[str] = None, baseurl: Optional[str] = None) -> Dict[str, Any]:
     """
-    Extract labels and links from the environment pickle file.
+    Extract labels and links from the Sphinx builds of all languages.
+
+    The result is kept for each base directory and base URL until the
+    Sphinx builds change. Do not modify it; copy it first if needed.
 
     Args:
         basedir: Project root directory containing language-specific data.
@@ -30,7 +137,7 @@ def get_info_links(basedir: Optional[str] = None, baseurl: Optional[str] = None)
         Dictionary containing extracted labels and their associated information
 
     Raises:
-        InfoUtilsError: If pickle file cannot be loaded or processed
+        InfoUtilsError: If neither the labels index nor the pickle file can be loaded
     """
     from .config import Config
 
@@ -38,31 +145,27 @@ def get_info_links(basedir: Optional[str] = None, baseurl: Optional[str] = None)
     effective_basedir = basedir if basedir is not None else Config.get_basedir()
     effective_baseurl = baseurl if baseurl is not None else Config.get_base_url(None)
 
-    info: Dict[str, Dict[str, Dict[str, str]]] = {}
-    path_prefix = {
-        'ja': '',
-        'en': 'en/'
+    key = (os.path.abspath(effective_basedir), effective_baseurl)
+    stamp = _source_stamp(effective_basedir)
+    cached = _info_links_cache.get(key)
+    if cached is not None and stamp is not None and cached[0] == stamp:
+        return cached[1]
+
+    links = {lang: _link_data(labels, lang, effective_baseurl)
+             for lang, labels in _load_all_labels(effective_basedir).items()}
+    info: Dict[str, Dict[str, Dict[str, str]]] = {
+        label: {
+            'text': {lang: links[lang][label][0] for lang in LANGUAGES if label in links[lang]},
+            'url': {lang: links[lang][label][1] for lang in LANGUAGES if label in links[lang]},
+        }
+        for label in dict.fromkeys(chain.from_iterable(links.values()))
     }
 
-    for lang in LANGUAGES:
-        pickle_path = Path(effective_basedir) / lang / PICKLE_PATH
-        try:
-            with open(pickle_path, 'rb') as f:
-                doctree = pickle.load(f)
-        except Exception as e:
-            raise InfoUtilsError(f'Failed to load pickle file {pickle_path}: {str(e)}')
-
-        labels = doctree.domaindata['std']['labels']
-        for label in labels:
-            if not all(labels[label][i] for i in range(3)):
-                continue
+    if stamp is not None:
+        _info_links_cache[key] = (stamp, info)
+    return info
 
-            if label not in info:
-                info[label] = {
-                    'text': {},
-                    'url': {}
-                }
-            info[label]['text'][lang] = labels[label][2]
-            info[label]['url'][lang] = f'{effective_baseurl}/{path_prefix[lang]}{labels[label][0]}.html#{labels[label][1]}'
 
-    return info
+def clear_info_links_cache() -> None:
+    """Discard the info links kept by get_info_links()."""
+    _info_links_cache.clear()
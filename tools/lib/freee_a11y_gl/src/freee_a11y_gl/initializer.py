@@ -5,13 +5,14 @@ including loading data from YAML and JSON files, processing axe-core rules
 from Git submodules, and establishing relationships between entities.
 """
 
+import functools
 import os
 import sys
 import re
 import json
 import time
-import yaml
-import git
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from typing import Optional
 from .relationship_manager import RelationshipManager
 from .models.content import Category, Guideline
@@ -20,17 +21,37 @@ from .models.faq.article import Faq
 from .models.faq.tag import FaqTag
 from .models.axe import AxeRule
 from .models.check import Check, CheckTool
+from .corpus import get_active_corpus
 from .source import get_src_path
 from .yaml_validator import YamlValidator, ValidationError
+from . import yaml_loader
+from .parse_cache import ParseCache, _set_last_stats
+from .git_blob_reader import GitBlobReader
+from .axe_snapshot import AxeSnapshot, get_submodule_hexsha, load_snapshot, save_snapshot, snapshot_source
+from .logging_config import get_logger
+from . import tracing
 
+logger = get_logger()
 
-def setup_instances(basedir: Optional[str] = None):
+
+@tracing.traced('setup_instances', phase=True)
+def setup_instances(basedir: Optional[str] = None, workers: Optional[int] = None,
+                    use_cache: Optional[bool] = None, load_axe: bool = False):
     """
     Set up instances for all components.
 
     Args:
         basedir: Base directory containing data files.
                 If None, value from settings will be used. If not in settings, defaults to '.'
+        workers: Number of worker processes used to parse and validate YAML files.
+                If None or 1, files are processed in the current process.
+                If 0, the number of CPUs is used.
+        use_cache: Whether to reuse parsed and validated source files from the
+                on-disk cache. If None, value from settings will be used.
+        load_axe: Whether to read the axe-core rules immediately. By default
+                they are read from the Git submodule when AxeRule.list_all(),
+                AxeRule.get_by_id() or a relationship lookup involving axe
+                rules is first used.
 
     Returns:
         RelationshipManager instance with resolved relationships
@@ -44,7 +65,11 @@ def setup_instances(basedir: Optional[str] = None):
     # Initialize YAML validator with configuration
     schema_dir = os.path.join(effective_basedir, 'data', 'json', 'schemas')
     validation_mode = Config.get_yaml_validation_mode()
-    validator = YamlValidator(schema_dir, validation_mode)
+    validator = YamlValidator(schema_dir, validation_mode, Config.get_yaml_validation_backend())
+
+    if use_cache is None:
+        use_cache = Config.is_cache_enabled()
+    cache = ParseCache(Config.get_cache_dir(effective_basedir)) if use_cache else None
 
     # Mapping of entity type, srcdir, constructor, and schema name.
     # The order is important for the initialization of the instances.
@@ -61,25 +86,53 @@ def setup_instances(basedir: Optional[str] = None):
     ]
 
     # Setup CheckTool instances
-    from .settings import settings
+    from .settings_manager import settings
     check_tools = settings.message_catalog.check_tools
     for tool_id, tool_names in check_tools.items():
         CheckTool(tool_id, tool_names)
 
     for entity_type, srcfile, constructor in static_entity_config:
-        process_static_entity_file(srcfile, constructor)
-
-    for entity_type, srcdir, constructor, schema_name in entity_config:
-        process_entity_files(srcdir, constructor, schema_name, validator)
+        with tracing.span(f'load.{entity_type}'):
+            process_static_entity_file(srcfile, constructor, cache)
+
+    # Parsing and validation may run in worker processes, but the instances
+    # are always constructed here in the order defined above.
+    with create_executor(workers, validator) as executor:
+        for entity_type, srcdir, constructor, schema_name in entity_config:
+            with tracing.span(f'load.{entity_type}', workers=workers):
+                process_entity_files(srcdir, constructor, schema_name, validator, executor, cache)
+
+    if cache is not None:
+        with tracing.span('parse_cache.save'):
+            cache.save()
+        logger.info(f"Parse cache: {cache.stats}")
+    _set_last_stats(cache.stats if cache is not None else None)
 
     axe_core_config = Config.get_axe_core_config()
-    process_axe_rules(basedir, axe_core_config)
+    axe_loader = functools.partial(process_axe_rules, basedir, axe_core_config,
+                                   cache.cache_dir if cache is not None else None)
+    AxeRule.set_loader(axe_loader)
+    if load_axe:
+        AxeRule.ensure_loaded()
     rel = RelationshipManager()
-    rel.resolve_faqs()
+    with tracing.span('resolve_faqs'):
+        rel.resolve_faqs()
     return rel
 
 
-def process_axe_rules(basedir: Optional[str], axe_core_config):
+def clear_instances() -> None:
+    """
+    Remove all instances and relationships.
+
+    setup_instances() can then be called again to load the model from scratch,
+    e.g. after static JSON files have changed. Only the active corpus is
+    cleared; see freee_a11y_gl.corpus.
+    """
+    get_active_corpus().clear()
+
+
+@tracing.traced('load.axe_rules')
+def process_axe_rules(basedir: Optional[str], axe_core_config, cache_dir: Optional[str] = None):
     """
     Process axe-core rules from the Git submodule.
 
@@ -87,6 +140,9 @@ def process_axe_rules(basedir: Optional[str], axe_core_config):
         basedir: Base directory containing the Git repository.
                 If None, value from settings will be used. If not in settings, defaults to '.'
         axe_core_config: Dictionary containing axe-core configuration
+        cache_dir: Directory of the axe-core snapshot cache (optional).
+                If the snapshot of the commit the submodule points to is
+                cached, the Git repositories are not accessed.
 
     Raises:
         ValueError: If the axe-core submodule is not found
@@ -94,43 +150,68 @@ def process_axe_rules(basedir: Optional[str], axe_core_config):
     from .config import Config
 
     effective_basedir = basedir if basedir is not None else Config.get_basedir()
-    root_repo = git.Repo(effective_basedir)
-    submodule = None
-    for sm in root_repo.submodules:
-        if sm.name == axe_core_config['submodule_name']:
-            submodule = sm
-            break
-
-    if submodule is None:
-        raise ValueError(f'Submodule with name {axe_core_config["submodule_name"]} not found.')
 
-    axe_base = os.path.join(effective_basedir, axe_core_config['base_dir'])
-    axe_commit_id = submodule.hexsha
-    axe_repo = git.Repo(axe_base)
-    axe_commit = axe_repo.commit(axe_commit_id)
+    snapshot = None
+    hexsha = None
+    if cache_dir is not None:
+        hexsha = get_submodule_hexsha(effective_basedir, axe_core_config['base_dir'])
+        if hexsha is not None:
+            snapshot = load_snapshot(cache_dir, hexsha, axe_core_config)
+        logger.info(f"axe-core snapshot cache {'hit' if snapshot else 'miss'} for {hexsha}")
 
-    # Get message file
-    msg_ja_path = os.path.join(axe_core_config['locale_dir'], axe_core_config['locale_ja_file'])
-    blob = axe_commit.tree / msg_ja_path
-    file_content = blob.data_stream.read().decode('utf-8')
-    messages_ja = json.loads(file_content)
-
-    # Get rule files
-    tree = axe_commit.tree / axe_core_config['rules_dir']
-    rule_blobs = [item for item in tree.traverse() if item.type == 'blob' and item.path.endswith('.json')]
-    for blob in rule_blobs:
-        file_content = blob.data_stream.read().decode('utf-8')
-        parsed_data = json.loads(file_content)
-        AxeRule(parsed_data, messages_ja)
-
-    # Get the package file
-    blob = axe_commit.tree / axe_core_config['pkg_file']
-    file_content = blob.data_stream.read().decode('utf-8')
-    parsed_data = json.loads(file_content)
-    AxeRule.version = parsed_data['version']
-    AxeRule.major_version = re.sub(r'(\d+)\.(\d+)\.\d+', r'\1.\2', parsed_data['version'])
+    if snapshot is None:
+        snapshot = read_axe_snapshot(effective_basedir, axe_core_config, hexsha)
+        if cache_dir is not None:
+            save_snapshot(cache_dir, snapshot)
+
+    for rule in snapshot.rules:
+        AxeRule(rule, snapshot.messages_ja)
+
+    AxeRule.version = snapshot.version
+    AxeRule.major_version = re.sub(r'(\d+)\.(\d+)\.\d+', r'\1.\2', snapshot.version)
     AxeRule.deque_url = axe_core_config['deque_url']
-    AxeRule.timestamp = time.strftime("%F %T%z", time.localtime(axe_commit.authored_date))
+    AxeRule.timestamp = time.strftime("%F %T%z", time.localtime(snapshot.authored_date))
+
+
+def read_axe_snapshot(basedir: str, axe_core_config, hexsha: Optional[str] = None) -> AxeSnapshot:
+    """
+    Read the axe-core rules from the Git submodule.
+
+    The rules directory, all rule files, the Japanese messages and the
+    package file are read through a single git process.
+
+    Args:
+        basedir: Base directory containing the Git repository
+        axe_core_config: Dictionary containing axe-core configuration
+        hexsha: Commit SHA the submodule points to, if already known
+
+    Returns:
+        AxeSnapshot of the commit the submodule points to
+
+    Raises:
+        ValueError: If the axe-core submodule is not found
+    """
+    axe_commit_id = hexsha or get_submodule_hexsha(basedir, axe_core_config['base_dir'])
+    if axe_commit_id is None:
+        raise ValueError(f'Submodule with name {axe_core_config["submodule_name"]} not found.')
+
+    axe_base = os.path.join(basedir, axe_core_config['base_dir'])
+    msg_ja_path = os.path.join(axe_core_config['locale_dir'], axe_core_config['locale_ja_file'])
+    pkg_path = axe_core_config['pkg_file']
+
+    with GitBlobReader(axe_base) as reader:
+        rule_files = reader.read_tree(axe_commit_id, axe_core_config['rules_dir'], '.json')
+        files = reader.read_files(axe_commit_id, [msg_ja_path, pkg_path])
+        authored_date = reader.authored_date(axe_commit_id)
+
+    return AxeSnapshot(
+        hexsha=axe_commit_id,
+        rules=[json.loads(content.decode('utf-8')) for content in rule_files.values()],
+        messages_ja=json.loads(files[msg_ja_path].decode('utf-8')),
+        version=json.loads(files[pkg_path].decode('utf-8'))['version'],
+        authored_date=authored_date,
+        source=snapshot_source(axe_core_config)
+    )
 
 
 def ls_dir(dirname, extension=None):
@@ -196,13 +277,85 @@ def read_yaml_file(file):
     """
     try:
         file_content = read_file_content(file)
-        data = yaml.safe_load(file_content)
+        data = yaml_loader.safe_load(file_content)
         return data
     except Exception as e:
         handle_file_error(e, file)
 
 
-def process_entity_files(srcdir, constructor, schema_name=None, validator=None):
+def create_executor(workers: Optional[int], validator: Optional[YamlValidator] = None):
+    """
+    Create a process pool for parsing and validating YAML files.
+
+    Args:
+        workers: Number of worker processes. If None or 1, no pool is created.
+                If 0, the number of CPUs is used.
+        validator: YamlValidator whose schema directory and validation mode
+                are reproduced in each worker (optional)
+
+    Returns:
+        ProcessPoolExecutor, or a null context yielding None for serial processing
+    """
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers is None or workers <= 1:
+        return nullcontext()
+
+    initargs = (None, "disabled", "jsonschema")
+    if validator is not None:
+        initargs = (validator.schema_dir, validator.validation_mode, validator.backend)
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs)
+
+
+# Number of files sent to a worker process at a time
+PARSE_CHUNKSIZE = 8
+
+# YamlValidator owned by each worker process of the pool
+_worker_validator: Optional[YamlValidator] = None
+
+
+def _init_worker(schema_dir: Optional[str], validation_mode: str, backend: str = "jsonschema"):
+    """
+    Initialize a worker process with its own YamlValidator.
+
+    Args:
+        schema_dir: Directory containing JSON schema files, or None
+        validation_mode: Validation mode of the validator in the parent process
+        backend: Validation backend of the validator in the parent process
+    """
+    global _worker_validator
+    if schema_dir is not None and validation_mode != "disabled":
+        _worker_validator = YamlValidator(schema_dir, validation_mode, backend)
+
+
+def _parse_entity_file(file, schema_name=None):
+    """
+    Read, parse and validate a YAML file in a worker process.
+
+    Errors are returned as messages instead of being raised, so that the
+    parent process can report them in file order.
+
+    Args:
+        file: Path to the YAML file
+        schema_name: Name of the schema to validate against (optional)
+
+    Returns:
+        Tuple of (parsed data, error message, validation error message)
+    """
+    try:
+        parsed_data = yaml_loader.safe_load(read_file_content(file))
+        validation_error = None
+        if _worker_validator is not None and schema_name:
+            try:
+                _worker_validator.validate_yaml_data(parsed_data, schema_name, file)
+            except ValidationError as e:
+                validation_error = str(e)
+        return parsed_data, None, validation_error
+    except Exception as e:
+        return None, str(e), None
+
+
+def process_entity_files(srcdir, constructor, schema_name=None, validator=None, executor=None, cache=None):
     """
     Process entity files with optional validation.
 
@@ -211,20 +364,48 @@ def process_entity_files(srcdir, constructor, schema_name=None, validator=None):
         constructor: Constructor function for the entity
         schema_name: Name of the schema to validate against (optional)
         validator: YamlValidator instance (optional)
+        executor: Process pool created by create_executor() (optional).
+                If given, files are parsed and validated in the pool and
+                the instances are constructed in file order.
+        cache: ParseCache instance (optional). Unchanged files are taken
+                from the cache without parsing and validation, and files
+                which passed validation are stored in it.
     """
     files = ls_dir(srcdir)
+    validation_key = _get_validation_key(validator, schema_name) if cache is not None else None
+    cached = {}
+    if cache is not None:
+        for file in files:
+            data = cache.get(file, validation_key)
+            if data is not None:
+                cached[file] = data
+
+    if executor is not None:
+        _process_parsed_entity_files(files, constructor, schema_name, validator, executor,
+                                     cache, cached, validation_key)
+        return
+
     for file in files:
         try:
-            file_content = read_file_content(file)
-            parsed_data = yaml.safe_load(file_content)
-
-            # Perform validation if validator and schema_name are provided
-            if validator and schema_name:
-                try:
-                    validator.validate_with_mode(parsed_data, schema_name, file)
-                except ValidationError as e:
-                    print(f"YAML Validation Error: {e}", file=sys.stderr)
-                    sys.exit(1)
+            if file in cached:
+                parsed_data = cached[file]
+            else:
+                with tracing.span('yaml.parse'):
+                    file_content = read_file_content(file)
+                    parsed_data = yaml_loader.safe_load(file_content)
+
+                # Perform validation if validator and schema_name are provided
+                validated = True
+                if validator and schema_name:
+                    try:
+                        with tracing.span('yaml.validate'):
+                            validated = validator.validate_with_mode(parsed_data, schema_name, file)
+                    except ValidationError as e:
+                        print(f"YAML Validation Error: {e}", file=sys.stderr)
+                        sys.exit(1)
+
+                if cache is not None and validated:
+                    cache.put(file, parsed_data, validation_key)
 
             parsed_data['src_path'] = os.path.abspath(file)
             try:
@@ -235,20 +416,95 @@ def process_entity_files(srcdir, constructor, schema_name=None, validator=None):
             handle_file_error(e, file)
 
 
-def process_static_entity_file(srcfile, constructor):
+def _process_parsed_entity_files(files, constructor, schema_name, validator, executor,
+                                 cache=None, cached=None, validation_key=None):
+    """
+    Construct entities from files parsed and validated in a process pool.
+
+    Args:
+        files: List of YAML file paths
+        constructor: Constructor function for the entity
+        schema_name: Name of the schema to validate against (optional)
+        validator: YamlValidator instance (optional)
+        executor: ProcessPoolExecutor to parse and validate files with
+        cache: ParseCache to store newly parsed files in (optional)
+        cached: Dictionary of file paths to payloads taken from the cache;
+                these files are not sent to the pool (optional)
+        validation_key: Validation key to store newly parsed files with (optional)
+    """
+    cached = cached or {}
+    if not (validator and schema_name):
+        schema_name = None
+    pending = [file for file in files if file not in cached]
+    results = executor.map(_parse_entity_file, pending, [schema_name] * len(pending), chunksize=PARSE_CHUNKSIZE)
+    for file in files:
+        if file in cached:
+            try:
+                parsed_data = cached[file]
+                parsed_data['src_path'] = os.path.abspath(file)
+                constructor(parsed_data)
+            except Exception as e:
+                handle_file_error(e, file)
+            continue
+
+        parsed_data, error, validation_error = next(results)
+        if error is not None:
+            handle_file_error(error, file)
+            continue
+
+        validated = True
+        if validation_error is not None:
+            try:
+                validated = validator.handle_validation_error(ValidationError(validation_error))
+            except ValidationError as e:
+                print(f"YAML Validation Error: {e}", file=sys.stderr)
+                sys.exit(1)
+
+        if cache is not None and validated:
+            cache.put(file, parsed_data, validation_key)
+
+        try:
+            parsed_data['src_path'] = os.path.abspath(file)
+            constructor(parsed_data)
+        except Exception as e:
+            handle_file_error(e, file)
+
+
+def _get_validation_key(validator, schema_name):
+    """
+    Get the key identifying the validation cached payloads have to pass.
+
+    Args:
+        validator: YamlValidator instance, or None
+        schema_name: Name of the schema to validate against, or None
+
+    Returns:
+        Validation key, or None if files are not validated
+    """
+    if not (validator and schema_name) or validator.validation_mode == "disabled":
+        return None
+    return validator.get_fingerprint(schema_name)
+
+
+def process_static_entity_file(srcfile, constructor, cache=None):
     """
     Process a static entity JSON file and create instances.
 
     Args:
         srcfile: Path to the JSON file containing entity data
         constructor: Constructor function for creating entity instances
+        cache: ParseCache instance (optional)
 
     Raises:
         Exception: If file reading or JSON parsing fails
     """
     try:
-        file_content = read_file_content(srcfile)
-        parsed_data = json.loads(file_content)
+        parsed_data = cache.get(srcfile) if cache is not None else None
+        if parsed_data is None:
+            file_content = read_file_content(srcfile)
+            parsed_data = json.loads(file_content)
+            if cache is not None:
+                cache.put(srcfile, parsed_data)
         for key, data in parsed_data.items():
             try:
                 constructor(key, data)
@@ -0,0 +1,264 @@
+"""Memory profiling of the phases of the guideline tools.
+
+Phases such as loading the model, converting it for yaml2sheet or running a
+yaml2rst generator are the spans of the tracing module marked with
+phase=True. While profiling is on, the profiler listens to these phases and
+tracemalloc traces the allocations of the process. The report lists for
+each phase the change of the traced memory, the peak of the traced memory
+during the phase and the peak resident set size of the process so far. A
+snapshot is taken when an outermost phase is entered and left, and the
+allocation sites that grew the most during these phases are listed, followed
+by the sites of the memory still allocated at the end.
+
+Profiling is off by default. It is turned on by the --profile-memory option
+of yaml2rst and yaml2sheet. Tracing allocations slows the tools down several
+times, so the durations of a run with memory profiling are not
+representative.
+
+Example:
+    >>> from freee_a11y_gl import memory_profile, tracing
+    >>> memory_profile.enable()
+    >>> with tracing.span('load', phase=True):
+    ...     load_checks()
+    >>> memory_profile.finish()  # prints the report
+"""
+import os
+import sys
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from . import tracing
+
+DEFAULT_TOP = 10
+TRACEBACK_LIMIT = 1
+
+
+class _Profiler:
+    """State of the memory profile of the process."""
+
+    def __init__(self):
+        self.enabled = False
+        self.top = DEFAULT_TOP
+        self.started_tracemalloc = False
+        self.phases: List[Dict[str, Any]] = []
+        # Phases entered and not left yet, innermost last
+        self.stack: List['_Phase'] = []
+
+
+_profiler = _Profiler()
+
+
+def _excluded_files() -> Tuple[str, ...]:
+    """Files of the allocations of the profiler and the import system."""
+    import tracemalloc
+
+    return (tracemalloc.__file__, __file__, tracing.__file__, '<frozen importlib._bootstrap>',
+            '<frozen importlib._bootstrap_external>', '<unknown>')
+
+
+def _site(frame) -> str:
+    """Location of an allocation, relative to its entry of sys.path."""
+    filename = frame.filename
+    prefixes = [path for path in sys.path
+                if path and filename.startswith(os.path.join(path, ''))]
+    if prefixes:
+        filename = os.path.relpath(filename, max(prefixes, key=len))
+    return f'{filename}:{frame.lineno}'
+
+
+def _take_sites() -> Dict[Any, Tuple[int, int]]:
+    """Take a snapshot and group the traced memory by allocation site.
+
+    Returns:
+        Size and number of the blocks allocated by each site, by the
+        tracemalloc frame of the site
+    """
+    import tracemalloc
+
+    excluded = _excluded_files()
+    # Grouping the snapshot once is much faster than filtering its traces
+    return {stat.traceback[0]: (stat.size, stat.count)
+            for stat in tracemalloc.take_snapshot().statistics('lineno')
+            if stat.traceback[0].filename not in excluded}
+
+
+def _top_sites(sites: Dict[Any, Tuple[int, int]],
+               base: Optional[Dict[Any, Tuple[int, int]]] = None) -> List[Dict[str, Any]]:
+    """Get the sites which allocated the most, or grew the most since base."""
+    if base is not None:
+        sites = {frame: (size - base.get(frame, (0, 0))[0], count - base.get(frame, (0, 0))[1])
+                 for frame, (size, count) in sites.items()}
+    top = sorted(((size, count, frame) for frame, (size, count) in sites.items() if size > 0),
+                 key=lambda item: item[0], reverse=True)[:_profiler.top]
+    return [{'site': _site(frame), 'size': size, 'count': count} for size, count, frame in top]
+
+
+def peak_rss() -> Optional[int]:
+    """Get the peak resident set size of the process in bytes.
+
+    Returns:
+        Peak resident set size, or None if the platform does not report it
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+class _Phase:
+    """Phase profiled between two snapshots."""
+    __slots__ = ('record', 'sites', 'start', 'peak')
+
+    def __init__(self, name: str):
+        self.record: Dict[str, Any] = {'name': name, 'depth': len(_profiler.stack)}
+
+    def __enter__(self):
+        import tracemalloc
+
+        _profiler.phases.append(self.record)
+        # Grouping a snapshot takes a pass over all traced blocks, so only the
+        # outermost phases are compared by allocation site
+        self.sites = _take_sites() if not _profiler.stack else None
+        # Measure after the snapshot, whose sites are kept until the phase is left
+        self.start, peak = tracemalloc.get_traced_memory()
+        for outer in _profiler.stack:
+            outer.peak = max(outer.peak, peak)
+        tracemalloc.reset_peak()
+        self.peak = self.start
+        _profiler.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        import tracemalloc
+
+        current, peak = tracemalloc.get_traced_memory()
+        _profiler.stack.pop()
+        for phase in _profiler.stack + [self]:
+            phase.peak = max(phase.peak, peak)
+        self.record.update({
+            'delta': current - self.start,
+            'peak': self.peak,
+            'peak_rss': peak_rss(),
+            'top': _top_sites(_take_sites(), self.sites) if self.sites is not None else [],
+        })
+        self.sites = None
+        if exc_type is not None:
+            self.record['error'] = exc_type.__name__
+        tracemalloc.reset_peak()
+        return False
+
+
+def _phase_name(name: str, args: Dict[str, Any]) -> str:
+    """Name of a phase, with the arguments of its span if any."""
+    if not args:
+        return name
+    return f"{name}({', '.join(f'{key}={value}' for key, value in args.items())})"
+
+
+def _listen(name: str, args: Dict[str, Any]) -> _Phase:
+    """Phase listener profiling each phase entered."""
+    return _Phase(_phase_name(name, args))
+
+
+def enable(top: int = DEFAULT_TOP) -> None:
+    """Turn profiling on and start tracing allocations.
+
+    Args:
+        top: Number of allocation sites reported for each phase and at the end
+    """
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEBACK_LIMIT)
+        _profiler.started_tracemalloc = True
+    tracing.add_phase_listener(_listen)
+    _profiler.enabled = True
+    _profiler.top = top
+
+
+def is_enabled() -> bool:
+    return _profiler.enabled
+
+
+def _stop() -> None:
+    """Turn profiling off, stopping tracemalloc if enable() started it."""
+    if _profiler.started_tracemalloc:
+        import tracemalloc
+        tracemalloc.stop()
+    tracing.remove_phase_listener(_listen)
+    _profiler.enabled = False
+    _profiler.started_tracemalloc = False
+    _profiler.stack = []
+
+
+def reset() -> None:
+    """Turn profiling off and discard the profiled phases."""
+    _stop()
+    _profiler.phases = []
+
+
+def get_phases() -> List[Dict[str, Any]]:
+    """Get the profiled phases in the order they were entered.
+
+    Returns:
+        Name, nesting depth, change and peak of the traced memory, peak
+        resident set size and the allocation sites that grew the most of each
+        phase, with the sizes in bytes
+    """
+    return [dict(record) for record in _profiler.phases if 'delta' in record]
+
+
+def format_size(size: Optional[int], sign: bool = False) -> str:
+    """Format a number of bytes in MiB."""
+    if size is None:
+        return '-'
+    return f'{size / 1024 / 1024:{"+" if sign else ""}.1f} MiB'
+
+
+def format_report(retained: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Format the report of the profiled phases.
+
+    Args:
+        retained: Allocation sites of the memory still allocated, reported
+            after the phases
+    """
+    phases = get_phases()
+    names = ['  ' * record['depth'] + record['name'] for record in phases]
+    width = max([len('phase')] + [len(name) for name in names])
+    lines = [f"{'phase':<{width}}  {'delta':>12}  {'peak':>12}  {'peak RSS':>12}"]
+    for name, record in zip(names, phases):
+        lines.append(f"{name:<{width}}  {format_size(record['delta'], True):>12}  "
+                     f"{format_size(record['peak']):>12}  {format_size(record['peak_rss']):>12}")
+
+    for name, record in zip(names, phases):
+        if record['top']:
+            lines += ['', f"Top allocation sites of {record['name']}:"]
+            lines += [f"  {format_size(site['size'], True):>12}  {site['count']:>+9} blocks  "
+                      f"{site['site']}" for site in record['top']]
+    if retained:
+        lines += ['', 'Top allocation sites of the memory still allocated:']
+        lines += [f"  {format_size(site['size']):>12}  {site['count']:>9} blocks  {site['site']}"
+                  for site in retained]
+    lines += ['', f'Peak RSS: {format_size(peak_rss())}']
+    return '\n'.join(lines)
+
+
+def finish(stream: Optional[TextIO] = None) -> Optional[str]:
+    """Print the report and stop tracing allocations if profiling is on.
+
+    Profiling is turned off afterwards; the phases are kept.
+
+    Args:
+        stream: Stream to print the report to; sys.stderr by default
+
+    Returns:
+        The report, or None if profiling is off
+    """
+    if not _profiler.enabled:
+        return None
+    report = format_report(_top_sites(_take_sites()))
+    print(report, file=stream or sys.stderr)
+    _stop()
+    return report
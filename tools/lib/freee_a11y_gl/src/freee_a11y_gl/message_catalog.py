@@ -4,6 +4,8 @@ from typing import Dict, Optional
 import yaml
 from pydantic import BaseModel, Field
 
+from . import yaml_loader
+
 from importlib import resources
 
 
@@ -38,7 +40,7 @@ class MessageCatalog(BaseModel):
             raise FileNotFoundError(f"Message catalog file not found: {file_path}")
 
         with file_path.open(encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml_loader.safe_load(f) or {}
 
         return cls(**data)
 
@@ -93,7 +95,7 @@ class MessageCatalog(BaseModel):
             message_files = resources.files("freee_a11y_gl.data")
             message_file = message_files / "messages.yaml"
             if message_file.is_file():
-                data = yaml.safe_load(message_file.read_text(encoding='utf-8')) or {}
+                data = yaml_loader.safe_load(message_file.read_text(encoding='utf-8')) or {}
                 return cls(**data)
             else:
                 raise FileNotFoundError("messages.yaml not found in package resources")
@@ -6,6 +6,8 @@ from ..utils import join_items
 class TemplateDataMixin:
     """Mixin providing common template data generation functionality."""
 
+    __slots__ = ()
+
     def get_base_template_data(self, lang: str) -> Dict[str, Any]:
         """Generate basic template data common to all models.
 
@@ -1,6 +1,6 @@
 """Models for axe-core accessibility testing tool."""
 import re
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from dataclasses import dataclass
 from .base import BaseModel
 from ..utils import tag2sc
@@ -10,6 +10,8 @@ from ..relationship_manager import RelationshipManager  # noqa: F401
 @dataclass
 class AxeMessage:
     """Container for axe-core message translations."""
+    __slots__ = ('help', 'description')
+
     help: Dict[str, str]
     description: Dict[str, str]
 
@@ -17,6 +19,8 @@ class AxeMessage:
 class AxeRule(BaseModel):
     """axe-core rule model."""
 
+    __slots__ = ('translated', 'message', 'has_wcag_sc', 'has_guideline')
+
     object_type = "axe_rule"
     _instances: Dict[str, 'AxeRule'] = {}
 
@@ -26,6 +30,9 @@ class AxeRule(BaseModel):
     major_version: Optional[str] = None
     deque_url: Optional[str] = None
 
+    # Deferred loader of the rules, registered by setup_instances()
+    _loader: Optional[Callable[[], None]] = None
+
     def __init__(self, rule: Dict[str, Any], messages_ja: Dict[str, Any]):
         """Initialize axe rule.
 
@@ -122,9 +129,55 @@ class AxeRule(BaseModel):
 
         return data
 
+    @classmethod
+    def set_loader(cls, loader: Optional[Callable[[], None]]) -> None:
+        """Register a function which creates the rules on first use.
+
+        Reading the rules requires access to the axe-core Git submodule, which
+        most processes never need. The loader is called once by
+        ensure_loaded(), and only if the rules are actually used.
+
+        Args:
+            loader: Function creating the AxeRule instances and setting the
+                class-level metadata, or None to cancel a pending load
+        """
+        cls._loader = loader
+
+    @classmethod
+    def is_loaded(cls) -> bool:
+        """Check whether no deferred load of the rules is pending."""
+        return cls._loader is None
+
+    @classmethod
+    def ensure_loaded(cls) -> None:
+        """Load the rules now if loading was deferred.
+
+        This has to be called before the class-level metadata (version,
+        timestamp, etc.) is read. list_all(), get_by_id() and relationship
+        lookups involving axe rules call it automatically. If the loader
+        fails, it stays registered and is called again on the next use.
+        """
+        loader = cls._loader
+        if loader is None:
+            return
+        # Clear the loader first, since loading looks up the rules itself
+        cls._loader = None
+        try:
+            loader()
+        except Exception:
+            cls._loader = loader
+            raise
+
+    @classmethod
+    def get_by_id(cls, id: str) -> Optional['AxeRule']:
+        """Get axe rule by ID, loading the rules if necessary."""
+        cls.ensure_loaded()
+        return super().get_by_id(id)
+
     @classmethod
     def list_all(cls) -> List['AxeRule']:
         """Get all axe rules sorted by relevance and ID."""
+        cls.ensure_loaded()
         sorted_all_rules = sorted(cls._instances, key=lambda x: cls._instances[x].id)
         with_guidelines = []
         with_sc = []
@@ -1,15 +1,139 @@
 """Base model classes."""
-from typing import Any, Dict, Optional, Type, TypeVar
+import inspect
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
+
+from ..relationship_manager import RelationshipManager
 
 T = TypeVar('T', bound='BaseModel')
 
 
+class Registry(dict):
+    """Instance registry with secondary indexes.
+
+    Maps instance IDs to instances like a plain dict, and keeps an index of
+    the instances by the value of each indexed field up to date on every
+    insertion and removal. A field is read from an attribute of the instance,
+    which may be a dotted path such as 'data.platform', and called if it is a
+    method; list, tuple and set values index the instance under each of their
+    elements.
+
+    Attributes:
+        fields: Mapping of indexed field names to instance attribute names
+    """
+
+    def __init__(self, fields: Optional[Dict[str, str]] = None, *args, **kwargs):
+        """Initialize registry.
+
+        Args:
+            fields: Mapping of indexed field names to instance attribute names
+            *args, **kwargs: Initial instances, as for dict()
+        """
+        super().__init__()
+        self.fields = dict(fields or {})
+        self._indexes: Dict[str, Dict[Any, Dict[str, Any]]] = {field: {} for field in self.fields}
+        self.update(*args, **kwargs)
+
+    @classmethod
+    def for_model(cls, model: type) -> 'Registry':
+        """Create an empty registry with the indexed fields of a model class."""
+        return cls(getattr(model, '_indexed_fields', None))
+
+    def field_values(self, obj: Any, field: str) -> List[Any]:
+        """Get the index keys of an instance for a field."""
+        value = obj
+        for name in self.fields[field].split('.'):
+            value = getattr(value, name, None)
+        if inspect.ismethod(value):
+            value = value()
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return list(value)
+        return [value]
+
+    def lookup(self, field: str, value: Any) -> List[Any]:
+        """Get the instances whose field has a value, in registration order.
+
+        Args:
+            field: Indexed field name
+            value: Field value
+
+        Returns:
+            List of matching instances
+        """
+        return list(self._indexes[field].get(value, {}).values())
+
+    def __setitem__(self, key: str, obj: Any) -> None:
+        if key in self:
+            self._unindex(key, self[key])
+        super().__setitem__(key, obj)
+        for field in self.fields:
+            for value in self.field_values(obj, field):
+                self._indexes[field].setdefault(value, {})[key] = obj
+
+    def __delitem__(self, key: str) -> None:
+        self._unindex(key, self[key])
+        super().__delitem__(key)
+
+    def _unindex(self, key: str, obj: Any) -> None:
+        for field in self.fields:
+            index = self._indexes[field]
+            for value in self.field_values(obj, field):
+                entries = index.get(value)
+                if entries is not None:
+                    entries.pop(key, None)
+                    if not entries:
+                        del index[value]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        obj = self[key]
+        del self[key]
+        return obj
+
+    def popitem(self):
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, obj in dict(*args, **kwargs).items():
+            self[key] = obj
+
+    def clear(self) -> None:
+        super().clear()
+        for index in self._indexes.values():
+            index.clear()
+
+    def copy(self) -> 'Registry':
+        return Registry(self.fields, self)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
 class BaseModel:
-    """Base class for all models."""
+    """Base class for all models.
+
+    The models created for every check, procedure and reference declare
+    __slots__ to keep the corpus compact; subclasses without __slots__ get a
+    __dict__ as usual.
+    """
+
+    __slots__ = ('id',)
 
     object_type: str = ""
     _instances: Dict[str, Any] = {}
 
+    # Fields available to query(), mapped to the instance attributes they are
+    # read from; subclasses registering their instances in a Registry with
+    # these fields get indexed lookups
+    _indexed_fields: Dict[str, str] = {}
+
     def __init__(self, id: str):
         """Initialize base model.
 
@@ -17,20 +141,20 @@ class BaseModel:
             id: Unique identifier for the model instance
         """
         self.id = id
-        self._relationship_manager = None
         if not hasattr(self.__class__, '_instances'):
             self.__class__._instances = {}
 
-    def _get_relationship_manager(self):
-        """Get cached relationship manager instance.
+    def _get_relationship_manager(self) -> RelationshipManager:
+        """Get the relationship manager shared by all instances.
+
+        The singleton is looked up on each call instead of being stored in
+        every instance, so that instances also follow clear_instances() and
+        corpus activation.
 
         Returns:
             RelationshipManager: Singleton instance
         """
-        if self._relationship_manager is None:
-            from ..relationship_manager import RelationshipManager
-            self._relationship_manager = RelationshipManager()
-        return self._relationship_manager
+        return RelationshipManager._instance or RelationshipManager()
 
     @classmethod
     def get_by_id(cls: Type[T], id: str) -> Optional[T]:
@@ -43,3 +167,41 @@ class BaseModel:
             Model instance if found, None otherwise
         """
         return cls._instances.get(id)
+
+    @classmethod
+    def query(cls: Type[T], **criteria: Any) -> List[T]:
+        """Get the instances matching all given field values.
+
+        Fields with list values (e.g. platform) match instances having the
+        given value among their values. Lookups use the secondary indexes of
+        the registry; registries without indexes are scanned.
+
+        Args:
+            **criteria: Field names from _indexed_fields and their values
+
+        Returns:
+            Matching instances in registration order
+
+        Raises:
+            ValueError: If a field is not queryable
+
+        Example:
+            >>> Check.query(platform='ios', severity='critical')
+        """
+        unknown = sorted(set(criteria) - set(cls._indexed_fields))
+        if unknown:
+            raise ValueError(f'Cannot query {cls.__name__} by {", ".join(unknown)}; '
+                             f'available fields: {", ".join(cls._indexed_fields)}')
+        registry = cls._instances
+        if not isinstance(registry, Registry) or set(criteria) - set(registry.fields):
+            registry = Registry(cls._indexed_fields, registry)
+        if not criteria:
+            return list(registry.values())
+
+        matches = [registry.lookup(field, value) for field, value in criteria.items()]
+        matches.sort(key=len)
+        candidates: Iterable[Any] = matches[0]
+        for other in matches[1:]:
+            ids = {obj.id for obj in other}
+            candidates = [obj for obj in candidates if obj.id in ids]
+        return list(candidates)
@@ -2,9 +2,10 @@
 from typing import Dict, List, Any, Optional, ClassVar, Literal
 from dataclasses import dataclass
 
-from .base import BaseModel
+from .base import BaseModel, Registry
 from ..mixins.template_mixin import TemplateDataMixin
 from ..config import Config
+from ..settings_manager import settings
 from ..utils import uniq
 
 LanguageCode = Literal["ja", "en"]
@@ -13,8 +14,19 @@ LanguageCode = Literal["ja", "en"]
 class Check(BaseModel, TemplateDataMixin):
     """Check model for accessibility validation criteria."""
 
+    __slots__ = ('sort_key', 'check_text', 'severity', 'target', 'platform', 'src_path',
+                 'conditions', 'implementations')
+
     object_type = "check"
-    _instances: Dict[str, 'Check'] = {}
+    _indexed_fields = {
+        'sort_key': 'sort_key',
+        'src_path': 'src_path',
+        'severity': 'severity',
+        'target': 'target',
+        'platform': 'platform',
+        'tool': 'tool_ids',
+    }
+    _instances: Dict[str, 'Check'] = Registry(_indexed_fields)
 
     def __init__(self, check: Dict[str, Any]):
         """Initialize check.
@@ -28,7 +40,7 @@ class Check(BaseModel, TemplateDataMixin):
             raise ValueError(f'Duplicate check ID: {self.id}')
 
         self.sort_key = check['sortKey']
-        if self.sort_key in [c.sort_key for c in self._instances.values()]:
+        if self.query(sort_key=self.sort_key):
             raise ValueError(f'Duplicate check sortKey: {self.sort_key}')
 
         self.check_text = check['check']
@@ -54,6 +66,12 @@ class Check(BaseModel, TemplateDataMixin):
         """Get list of unique platforms from conditions."""
         return sorted({cond.platform for cond in self.conditions})
 
+    def tool_ids(self) -> List[str]:
+        """Get list of unique IDs of the tools used by the procedures."""
+        return uniq([procedure.tool.id
+                     for condition in self.conditions
+                     for procedure in condition.procedures()])
+
     def template_data(self, lang: str, **kwargs) -> Dict[str, Any]:
         """Get template data for check.
 
@@ -238,7 +256,13 @@ class Check(BaseModel, TemplateDataMixin):
 
 
 class Example:
-    """Example use of a check procedure."""
+    """Example use of a check procedure.
+
+    The check fields are read from the check rather than copied, so that an
+    example costs two references per procedure.
+    """
+
+    __slots__ = ('procedure', 'check')
 
     def __init__(self, procedure: 'Procedure', check: 'Check'):
         """Initialize example.
@@ -247,10 +271,23 @@ class Example:
             procedure: The procedure this example demonstrates
             check: The check this example belongs to
         """
-        self.check_id = check.id
-        self.check_text = check.check_text
-        self.check_src_path = check.src_path
         self.procedure = procedure
+        self.check = check
+
+    @property
+    def check_id(self) -> str:
+        """ID of the check."""
+        return self.check.id
+
+    @property
+    def check_text(self) -> Dict[str, str]:
+        """Localized text of the check."""
+        return self.check.check_text
+
+    @property
+    def check_src_path(self) -> str:
+        """Source file path of the check."""
+        return self.check.src_path
 
     def template_data(self, lang: str) -> Dict[str, Any]:
         """Get template data for example."""
@@ -266,7 +303,7 @@ class Example:
 class CheckTool:
     """Tool used for accessibility checks."""
 
-    _instances: ClassVar[Dict[str, 'CheckTool']] = {}
+    _instances: ClassVar[Dict[str, 'CheckTool']] = Registry()
 
     def __init__(self, tool_id: str, names: Dict[str, str]):
         """Initialize check tool.
@@ -351,6 +388,8 @@ class CheckTool:
 @dataclass
 class YouTube:
     """YouTube video reference."""
+    __slots__ = ('id', 'title')
+
     id: str
     title: str
 
@@ -365,6 +404,8 @@ class YouTube:
 @dataclass
 class Method:
     """Implementation method for a check."""
+    __slots__ = ('platform', 'method')
+
     platform: str
     method: Dict[str, str]
 
@@ -383,6 +424,8 @@ class Method:
 @dataclass
 class Implementation:
     """Implementation details for a check."""
+    __slots__ = ('title', 'methods')
+
     title: Dict[str, str]
     methods: List[Dict[str, Any]]
 
@@ -401,6 +444,8 @@ class Implementation:
 class Procedure:
     """Check procedure for validation."""
 
+    __slots__ = ('id', 'tool_display_name', 'tool', 'procedure', 'note', 'youtube')
+
     def __init__(self, condition: Dict[str, Any], check: 'Check'):
         """Initialize procedure.
 
@@ -412,8 +457,8 @@ class Procedure:
         tool_name = condition['tool']
 
         # Get or create tool
-        if tool_name in CheckTool.list_all_ids():
-            tool = CheckTool.get_by_id(tool_name)
+        tool = CheckTool.get_by_id(tool_name)
+        if tool is not None:
             self.tool_display_name = None
         else:
             tool = CheckTool.get_by_id('misc')
@@ -461,7 +506,15 @@ class Procedure:
 
 
 class Condition:
-    """Check condition for validation."""
+    """Check condition for validation.
+
+    Conditions do not change after they are loaded, so the summaries and the
+    template and object data of a condition tree are built once per language
+    and kept on each node. They are built again when the settings or the
+    message catalog change.
+    """
+
+    __slots__ = ('type', 'platform', 'procedure', 'conditions', '_cache', '_cache_revision')
 
     def __init__(self, condition: Dict[str, Any], check: 'Check'):
         """Initialize condition.
@@ -472,12 +525,21 @@ class Condition:
         """
         self.type = condition['type']
         self.platform = condition.get('platform')
+        self._cache = None
+        self._cache_revision = None
 
         if self.type == 'simple':
             self.procedure = Procedure(condition, check)
         else:
             self.conditions = [Condition(cond, check) for cond in condition['conditions']]
 
+    def _get_cache(self) -> Dict[Any, Any]:
+        """Get the data built for this condition, discarding it if the settings have changed."""
+        if self._cache is None or self._cache_revision != settings.revision:
+            self._cache = {}
+            self._cache_revision = settings.revision
+        return self._cache
+
     def procedures(self) -> List[Procedure]:
         """Get all procedures in this condition."""
         if self.type == 'simple':
@@ -489,6 +551,15 @@ class Condition:
 
     def summary(self, lang: str) -> str:
         """Get localized summary of condition."""
+        cache = self._get_cache()
+        key = ('summary', lang)
+        summary = cache.get(key)
+        if summary is None:
+            summary = cache[key] = self._build_summary(lang)
+        return summary
+
+    def _build_summary(self, lang: str) -> str:
+        """Build the localized summary of condition from the summaries of its children."""
         if self.type == 'simple':
             return f'{self.procedure.id}{Config.get_pass_singular_text(lang)}'
 
@@ -509,7 +580,19 @@ class Condition:
             return summary_connector.join(simple_conditions + complex_conditions)
 
     def template_data(self, lang: str) -> Dict[str, Any]:
-        """Get template data for condition."""
+        """Get template data for condition.
+
+        The procedures in the data are shared between calls; do not modify them.
+        """
+        cache = self._get_cache()
+        key = ('template_data', lang)
+        data = cache.get(key)
+        if data is None:
+            data = cache[key] = self._build_template_data(lang)
+        return dict(data)
+
+    def _build_template_data(self, lang: str) -> Dict[str, Any]:
+        """Build template data for condition."""
         if not self.platform:
             return {}
 
@@ -525,6 +608,9 @@ class Condition:
     def object_data(self, parent_platform: Optional[str] = None, is_top: bool = True) -> Dict[str, Any]:
         """Get object data for condition.
 
+        The nested conditions and procedures in the data are shared between
+        calls; do not modify them.
+
         Args:
             parent_platform: Optional platform from parent condition
             is_top: Whether this is a top-level condition
@@ -532,6 +618,15 @@ class Condition:
         Returns:
             Dictionary containing condition data
         """
+        cache = self._get_cache()
+        key = ('object_data', parent_platform, is_top)
+        data = cache.get(key)
+        if data is None:
+            data = cache[key] = self._build_object_data(parent_platform, is_top)
+        return dict(data)
+
+    def _build_object_data(self, parent_platform: Optional[str], is_top: bool) -> Dict[str, Any]:
+        """Build object data for condition."""
         data = {'type': self.type}
 
         # プラットフォームの解決（自身のplatformがNoneの場合は親から継承）
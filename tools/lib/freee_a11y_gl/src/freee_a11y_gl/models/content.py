@@ -1,7 +1,7 @@
 """Content models for a11y-guidelines."""
 from typing import Dict, List, Any
 from dataclasses import dataclass
-from .base import BaseModel
+from .base import BaseModel, Registry
 from ..mixins.template_mixin import TemplateDataMixin
 from ..config import Config
 from ..utils import uniq
@@ -48,18 +48,13 @@ class Category(BaseModel):
     def get_dependency(self) -> List[str]:
         """Get list of file dependencies for this category.
 
+        The guidelines of the category in sort order, each followed by its
+        checks and FAQs.
+
         Returns:
             List of file paths that this category depends on
         """
-        rel = self._get_relationship_manager()
-        dependency = []
-        for guideline in rel.get_sorted_related_objects(self, 'guideline'):
-            dependency.append(guideline.src_path)
-            # Add check dependencies
-            dependency.extend([check.src_path for check in rel.get_related_objects(guideline, 'check')])
-            # Add FAQ dependencies
-            dependency.extend([faq.src_path for faq in rel.get_related_objects(guideline, 'faq')])
-        return uniq(dependency)  # Remove duplicates while preserving order
+        return self._get_relationship_manager().get_dependencies(self)
 
     @classmethod
     def list_all(cls) -> List['Category']:
@@ -75,7 +70,12 @@ class Guideline(BaseModel, TemplateDataMixin):
     """Guideline model representing accessibility guidelines."""
 
     object_type = "guideline"
-    _instances: Dict[str, 'Guideline'] = {}
+    _indexed_fields = {
+        'sort_key': 'sort_key',
+        'src_path': 'src_path',
+        'platform': 'data.platform',
+    }
+    _instances: Dict[str, 'Guideline'] = Registry(_indexed_fields)
 
     def __init__(self, gl: Dict[str, Any]):
         """Initialize guideline.
@@ -89,7 +89,7 @@ class Guideline(BaseModel, TemplateDataMixin):
             raise ValueError(f'Duplicate guideline ID: {self.id}')
 
         self.sort_key = gl['sortKey']
-        if self.sort_key in [g.sort_key for g in self._instances.values()]:
+        if self.query(sort_key=self.sort_key):
             raise ValueError(f'Duplicate guideline sortKey: {self.sort_key}')
 
         # Store guideline data
@@ -105,30 +105,33 @@ class Guideline(BaseModel, TemplateDataMixin):
         rel = self._get_relationship_manager()
         if not Category.get_by_id(gl['category']):
             raise ValueError(f'Category ID {gl["category"]} referenced in guideline {self.id} does not exist.')
-        rel.associate_objects(self, Category.get_by_id(gl['category']))
+        pairs = [(self, Category.get_by_id(gl['category']))]
 
         # Associate checks
+        checks = []
         for check_id in gl.get('checks', []):
             from .check import Check  # Import here to avoid circular imports
             if not Check.get_by_id(check_id):
                 raise ValueError(f'Check ID {check_id} referenced in guideline {self.id} does not exist.')
-            rel.associate_objects(self, Check.get_by_id(check_id))
+            checks.append(Check.get_by_id(check_id))
+        checks = uniq(checks)
+        pairs.extend((self, check) for check in checks)
 
         # Associate WCAG success criteria
         for sc in gl.get('sc', []):
             from .reference import WcagSc  # Import here to avoid circular imports
             if not WcagSc.get_by_id(sc):
                 raise ValueError(f'Success criterion ID {sc} referenced in guideline {self.id} does not exist.')
-            rel.associate_objects(self, WcagSc.get_by_id(sc))
+            pairs.append((self, WcagSc.get_by_id(sc)))
 
         # Associate info references
         if 'info' in gl:
             for info in gl['info']:
                 from .reference import InfoRef  # Import here to avoid circular imports
                 info_ref = InfoRef(info)
-                rel.associate_objects(self, info_ref)
-                for check in rel.get_related_objects(self, 'check'):
-                    rel.associate_objects(check, info_ref)
+                pairs.append((self, info_ref))
+                pairs.extend((check, info_ref) for check in checks)
+        rel.associate_many(pairs)
 
         Guideline._instances[self.id] = self
 
@@ -1,17 +1,23 @@
 """FAQ article model."""
 import datetime
 from typing import Dict, List, Any
-from ..base import BaseModel
+from ..base import BaseModel, Registry
 from ...mixins.template_mixin import TemplateDataMixin
 from ...config import Config
-from ...utils import uniq
 
 
 class Faq(BaseModel, TemplateDataMixin):
     """FAQ article model."""
 
+    __slots__ = ('sort_key', 'src_path', 'updated', 'title', 'problem', 'solution',
+                 'explanation')
+
     object_type = "faq"
-    _instances: Dict[str, 'Faq'] = {}
+    _indexed_fields = {
+        'sort_key': 'sort_key',
+        'src_path': 'src_path',
+    }
+    _instances: Dict[str, 'Faq'] = Registry(_indexed_fields)
 
     def __init__(self, faq: Dict[str, Any]):
         """Initialize FAQ article.
@@ -24,7 +30,7 @@ class Faq(BaseModel, TemplateDataMixin):
             raise ValueError(f'Duplicate FAQ ID: {self.id}')
 
         self.sort_key = faq['sortKey']
-        if self.sort_key in [f.sort_key for f in self._instances.values()]:
+        if self.query(sort_key=self.sort_key):
             raise ValueError(f'Duplicate FAQ sortKey: {self.sort_key}')
 
         self.src_path = faq['src_path']
@@ -42,13 +48,14 @@ class Faq(BaseModel, TemplateDataMixin):
     def _create_relationships(self, faq: Dict[str, Any]) -> None:
         """Create relationships with other objects."""
         rel = self._get_relationship_manager()
+        pairs = []
 
         # Associate tags
         from .tag import FaqTag
         for tag_id in faq['tags']:
             if not FaqTag.get_by_id(tag_id):
                 raise ValueError(f'Tag ID {tag_id} referenced in FAQ {self.id} does not exist.')
-            rel.associate_objects(self, FaqTag.get_by_id(tag_id))
+            pairs.append((self, FaqTag.get_by_id(tag_id)))
 
         # Associate guidelines if present
         if 'guidelines' in faq:
@@ -56,7 +63,7 @@ class Faq(BaseModel, TemplateDataMixin):
             for gl_id in faq['guidelines']:
                 if not Guideline.get_by_id(gl_id):
                     raise ValueError(f'Guideline ID {gl_id} referenced in FAQ {self.id} does not exist.')
-                rel.associate_objects(self, Guideline.get_by_id(gl_id))
+                pairs.append((self, Guideline.get_by_id(gl_id)))
 
         # Associate checks if present
         if 'checks' in faq:
@@ -64,13 +71,14 @@ class Faq(BaseModel, TemplateDataMixin):
             for check_id in faq['checks']:
                 if not Check.get_by_id(check_id):
                     raise ValueError(f'Check ID {check_id} referenced in FAQ {self.id} does not exist.')
-                rel.associate_objects(self, Check.get_by_id(check_id))
+                pairs.append((self, Check.get_by_id(check_id)))
 
         # Associate info references if present
         if 'info' in faq:
             from ..reference import InfoRef
             for info in faq['info']:
-                rel.associate_objects(self, InfoRef(info))
+                pairs.append((self, InfoRef(info)))
+        rel.associate_many(pairs)
 
         # Add unresolved FAQ relationships
         if 'faqs' in faq:
@@ -78,19 +86,11 @@ class Faq(BaseModel, TemplateDataMixin):
                 rel.add_unresolved_faqs(self.id, related_faq)
 
     def get_dependency(self) -> List[str]:
-        """Get file dependencies for this FAQ."""
-        rel = self._get_relationship_manager()
-        dependency = [self.src_path]
-
-        guidelines = rel.get_related_objects(self, 'guideline')
-        if guidelines:
-            dependency.extend(gl.src_path for gl in guidelines)
+        """Get file dependencies for this FAQ.
 
-        checks = rel.get_related_objects(self, 'check')
-        if checks:
-            dependency.extend(check.src_path for check in checks)
-
-        return uniq(dependency)
+        The FAQ itself, followed by its guidelines and checks in sort order.
+        """
+        return self._get_relationship_manager().get_dependencies(self)
 
     def link_data(self, baseurl: str = '') -> Dict[str, Dict[str, str]]:
         """Get link data for FAQ.
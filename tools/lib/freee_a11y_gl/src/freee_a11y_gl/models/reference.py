@@ -2,13 +2,15 @@
 from typing import Dict, List, Optional, Any
 from urllib.parse import quote as url_encode
 from dataclasses import dataclass
-from .base import BaseModel
+from .base import BaseModel, Registry
 import re
 
 
 @dataclass
 class LocalizedReference:
     """Container for localized reference data."""
+    __slots__ = ('title', 'url')
+
     title: Dict[str, str]
     url: Dict[str, str]
 
@@ -16,6 +18,8 @@ class LocalizedReference:
 class WcagSc(BaseModel):
     """Web Content Accessibility Guidelines (WCAG) Success Criteria."""
 
+    __slots__ = ('scnum', 'sort_key', 'level', 'local_priority', 'data')
+
     object_type = "wcag_sc"
     _instances: Dict[str, 'WcagSc'] = {}
 
@@ -65,8 +69,11 @@ class WcagSc(BaseModel):
 class InfoRef(BaseModel):
     """Information reference model for both internal and external references."""
 
+    __slots__ = ('ref', 'internal', 'ref_data', 'initialized')
+
     object_type = "info_ref"
-    _instances: Dict[str, 'InfoRef'] = {}
+    _indexed_fields = {'internal': 'internal'}
+    _instances: Dict[str, 'InfoRef'] = Registry(_indexed_fields)
 
     def __new__(cls, ref: str, data: Optional[Dict[str, Any]] = None) -> 'InfoRef':
         """Create or return existing InfoRef instance.
@@ -78,9 +85,7 @@ class InfoRef(BaseModel):
         ref_id = url_encode(ref)
         if ref_id in cls._instances:
             return cls._instances[ref_id]
-        instance = super(InfoRef, cls).__new__(cls)
-        cls._instances[ref_id] = instance
-        return instance
+        return super(InfoRef, cls).__new__(cls)
 
     def __init__(self, ref: str, data: Optional[Dict[str, Any]] = None):
         """Initialize info reference.
@@ -99,6 +104,8 @@ class InfoRef(BaseModel):
         # データは内部/外部に関係なく保存
         self.ref_data = data if data else None
         self.initialized = True
+        # Registered once initialized, so that it is indexed as internal or external
+        InfoRef._instances[self.id] = self
 
     def refstring(self) -> str:
         """Get reference string format."""
@@ -152,12 +159,12 @@ class InfoRef(BaseModel):
     @classmethod
     def list_all_internal(cls) -> List['InfoRef']:
         """Get all internal references."""
-        return [ref for ref in cls._instances.values() if ref.internal]
+        return cls.query(internal=True)
 
     @classmethod
     def list_all_external(cls) -> List['InfoRef']:
         """Get all external references."""
-        return [ref for ref in cls._instances.values() if not ref.internal]
+        return cls.query(internal=False)
 
     @classmethod
     def list_has_guidelines(cls) -> List['InfoRef']:
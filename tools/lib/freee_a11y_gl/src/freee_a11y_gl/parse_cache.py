@@ -0,0 +1,217 @@
+"""Persistent cache of parsed source files.
+
+This module stores the parsed payload of YAML and JSON source files on disk,
+so that files which did not change since the previous run do not have to be
+parsed and validated again.
+
+Each entry is keyed by the absolute path of the source file and records the
+modification time, size and SHA-256 hash of the file content. An entry is
+used as long as the file is unchanged: if the modification time or size
+differs, the content hash decides whether the entry is still valid.
+"""
+
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .logging_config import get_logger
+
+logger = get_logger()
+
+# Name of the cache file in the cache directory
+CACHE_FILE_NAME = "parsed.pickle"
+
+# Format version of the cache file; bump when the entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class CacheStats:
+    """Statistics of a ParseCache session."""
+    hits: int = 0
+    misses: int = 0
+    invalidated: int = 0
+    writes: int = 0
+
+    def __str__(self) -> str:
+        return (f"{self.hits} hits, {self.misses} misses "
+                f"({self.invalidated} invalidated), {self.writes} writes")
+
+
+class ParseCache:
+    """On-disk cache of parsed and validated source files."""
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the cache and load existing entries from the cache directory.
+
+        Args:
+            cache_dir: Directory to store the cache file in
+        """
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, CACHE_FILE_NAME)
+        self.stats = CacheStats()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load cache entries from the cache file, discarding unusable caches."""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache {self.cache_file}: {e}")
+            return
+
+        if not isinstance(cached, dict) or cached.get('version') != CACHE_FORMAT_VERSION:
+            logger.info(f"Ignoring parse cache {self.cache_file} with an old format")
+            return
+        self._entries = cached.get('entries', {})
+
+    def get(self, file_path: str, validation_key: Optional[str] = None) -> Optional[Any]:
+        """
+        Get the cached payload of a source file.
+
+        Args:
+            file_path: Path to the source file
+            validation_key: Key identifying the schema the payload has to be
+                validated against, or None if no validation is required
+
+        Returns:
+            A fresh copy of the cached payload, or None if the file is not
+            cached, has changed, or was not validated with validation_key
+        """
+        path = os.path.abspath(file_path)
+        entry = self._entries.get(path)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.stats.misses += 1
+            return None
+
+        if (entry['mtime_ns'], entry['size']) != (stat.st_mtime_ns, stat.st_size):
+            # The file was touched; fall back to comparing the content
+            try:
+                digest = _file_digest(path)
+            except OSError:
+                self.stats.misses += 1
+                return None
+            if digest != entry['sha256']:
+                del self._entries[path]
+                self._dirty = True
+                self.stats.misses += 1
+                self.stats.invalidated += 1
+                return None
+            entry['mtime_ns'] = stat.st_mtime_ns
+            entry['size'] = stat.st_size
+            self._dirty = True
+
+        if validation_key is not None and entry['validation_key'] != validation_key:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return pickle.loads(entry['payload'])
+
+    def put(self, file_path: str, data: Any, validation_key: Optional[str] = None) -> None:
+        """
+        Store the payload of a source file.
+
+        The payload is serialized immediately, so later modifications of data
+        do not affect the cached copy.
+
+        Args:
+            file_path: Path to the source file
+            data: Parsed (and validated) payload of the file
+            validation_key: Key identifying the schema data was validated
+                against, or None if it was not validated
+        """
+        path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(path)
+            digest = _file_digest(path)
+        except OSError:
+            return
+
+        self._entries[path] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'validation_key': validation_key,
+            'payload': pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+        }
+        self._dirty = True
+        self.stats.writes += 1
+
+    def save(self) -> None:
+        """
+        Write the cache to disk if it has changed.
+
+        Entries of source files which no longer exist are dropped. Failures
+        are logged and otherwise ignored, since the cache is only an
+        optimization.
+        """
+        for path in [path for path in self._entries if not os.path.exists(path)]:
+            del self._entries[path]
+            self._dirty = True
+
+        if not self._dirty:
+            return
+
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({'version': CACHE_FORMAT_VERSION, 'entries': self._entries},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write parse cache {self.cache_file}: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove all entries, including the cache file on disk."""
+        self._entries = {}
+        self._dirty = False
+        try:
+            os.remove(self.cache_file)
+        except FileNotFoundError:
+            pass
+
+
+# Statistics of the cache used by the most recent setup_instances() call
+_last_stats: Optional[CacheStats] = None
+
+
+def get_cache_stats() -> Optional[CacheStats]:
+    """
+    Get statistics of the parse cache used by the most recent setup_instances() call.
+
+    Returns:
+        CacheStats, or None if the cache was not used
+    """
+    return _last_stats
+
+
+def _set_last_stats(stats: Optional[CacheStats]) -> None:
+    global _last_stats
+    _last_stats = stats
+
+
+def _file_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
@@ -1,11 +1,39 @@
 """Relationship management for accessibility guidelines entities."""
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
-from .models.base import BaseModel
+if TYPE_CHECKING:
+    # Not imported at runtime: the models import this module
+    from .models.base import BaseModel
+
+# Source files the generated pages of an object depend on, by dependency rule:
+# the type of the objects the rule applies to, whether their own source file
+# is included, and a tree of the related object types walked from such an
+# object. Each related object visited contributes its source file. Objects
+# directly related to the object are visited in sort order, objects further
+# away in relationship order.
+DEPENDENCY_RULES: Dict[str, Tuple[str, bool, Dict[str, Any]]] = {
+    'category': ('category', False, {'guideline': {'check': {}, 'faq': {}}}),
+    'faq': ('faq', True, {'guideline': {}, 'check': {}}),
+    'faq_tag': ('faq_tag', False, {'faq': {'guideline': {}, 'check': {}}}),
+    'info_to_guideline': ('info_ref', False, {'guideline': {}}),
+    'info_to_faq': ('info_ref', False, {'faq': {}}),
+}
 
 
 class RelationshipManager:
-    """Manages relationships between different model objects."""
+    """Manages relationships between different model objects.
+
+    The related objects of each object are kept per type in insertion-ordered
+    sets (dicts with None values), so that adding a relationship does not scan
+    the existing ones. The lists returned by get_related_objects() and
+    get_sorted_related_objects() are cached per object, type and sort key, and
+    dropped whenever the relationships they are built from change. They must
+    not be modified by callers, and objects must not change the attributes
+    they are sorted by while related.
+
+    The source files objects depend on (see DEPENDENCY_RULES) are computed on
+    first use and cached until any relationship changes.
+    """
 
     _instance = None
     _initialized = False
@@ -23,37 +51,109 @@ class RelationshipManager:
         if self._initialized:
             return
         self._data = {}
+        self._views = {}
+        self._dependencies = {}
         self._unresolved_faqs = {}
+        self._declared_faqs = {}
         self._initialized = True
 
-    def associate_objects(self, obj1: BaseModel, obj2: BaseModel) -> None:
+    def associate_objects(self, obj1: 'BaseModel', obj2: 'BaseModel') -> None:
         """Associate two objects bidirectionally.
 
         Args:
             obj1: First object to associate
             obj2: Second object to associate
         """
-        obj1_type = obj1.object_type
-        obj2_type = obj2.object_type
-        obj1_id = obj1.id
-        obj2_id = obj2.id
-
-        # Create nested dictionaries if they don't exist
-        for obj_type, obj_id in [(obj1_type, obj1_id), (obj2_type, obj2_id)]:
-            if obj_type not in self._data:
-                self._data[obj_type] = {}
-            if obj_id not in self._data[obj_type]:
-                self._data[obj_type][obj_id] = {}
-
-        # Add bidirectional relationship
-        for (src_type, src_id, src_obj, dest_type, dest_obj) in [
-            (obj1_type, obj1_id, obj1, obj2_type, obj2),
-            (obj2_type, obj2_id, obj2, obj1_type, obj1)
-        ]:
-            if dest_type not in self._data[src_type][src_id]:
-                self._data[src_type][src_id][dest_type] = []
-            if dest_obj not in self._data[src_type][src_id][dest_type]:
-                self._data[src_type][src_id][dest_type].append(dest_obj)
+        self.associate_many([(obj1, obj2)])
+
+    def associate_many(self, pairs: Iterable[Tuple['BaseModel', 'BaseModel']]) -> None:
+        """Associate pairs of objects bidirectionally.
+
+        Equivalent to calling associate_objects() for each pair in order, for
+        loaders creating many relationships at once.
+
+        Args:
+            pairs: Pairs of objects to associate
+        """
+        data = self._data
+        changed = set()
+        for obj1, obj2 in pairs:
+            for src, dest in ((obj1, obj2), (obj2, obj1)):
+                related = data.setdefault(src.object_type, {}).setdefault(src.id, {})
+                objects = related.setdefault(dest.object_type, {})
+                if dest not in objects:
+                    objects[dest] = None
+                    changed.add((src.object_type, src.id, dest.object_type))
+        for key in changed:
+            self._invalidate(key)
+
+    def clear_cache(self) -> None:
+        """Drop the cached lists of related objects.
+
+        Needed only after replacing the relationship data as a whole; the
+        methods changing relationships drop the affected lists themselves.
+        """
+        self._views = {}
+        self._dependencies = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy the relationships and the FAQ relationships to resolve.
+
+        Returns:
+            Copy unaffected by later changes, to be passed to restore()
+        """
+        return self._copy_state({'data': self._data, 'unresolved_faqs': self._unresolved_faqs,
+                                 'declared_faqs': self._declared_faqs})
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """Restore the relationships copied by snapshot().
+
+        The cached lists are dropped. The snapshot is copied again, so it can
+        be restored more than once.
+
+        Args:
+            snapshot: Copy returned by snapshot()
+        """
+        state = self._copy_state(snapshot)
+        self._data = state['data']
+        self._unresolved_faqs = state['unresolved_faqs']
+        self._declared_faqs = state['declared_faqs']
+        self.clear_cache()
+
+    @staticmethod
+    def _copy_state(state: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the relationship data and the FAQ declarations down to their lists."""
+        return {
+            'data': {
+                obj_type: {obj_id: {dest_type: dict(objects) for dest_type, objects in related.items()}
+                           for obj_id, related in ids.items()}
+                for obj_type, ids in state['data'].items()
+            },
+            'unresolved_faqs': {faq_id: list(ids) for faq_id, ids in state['unresolved_faqs'].items()},
+            'declared_faqs': {faq_id: list(ids) for faq_id, ids in state['declared_faqs'].items()},
+        }
+
+    def _invalidate(self, view_key: Tuple[str, str, str]) -> None:
+        """Drop the cached data depending on a relationship list."""
+        self._views.pop(view_key, None)
+        if self._dependencies:
+            self._dependencies = {}
+
+    def _view(self, obj: 'BaseModel', related_type: str, key: Optional[str]) -> List[Any]:
+        """Get the cached list of related objects, sorted by key if not None."""
+        view_key = (obj.object_type, obj.id, related_type)
+        views = self._views.get(view_key)
+        if views is None:
+            views = self._views[view_key] = {}
+        elif key in views:
+            return views[key]
+        objects = self._data.get(obj.object_type, {}).get(obj.id, {}).get(related_type, ())
+        if key is None:
+            view = list(objects)
+        else:
+            view = sorted(objects, key=lambda x: getattr(x, key))
+        views[key] = view
+        return view
 
     def add_unresolved_faqs(self, faq1_id: str, faq2_id: str) -> None:
         """Add unresolved FAQ relationship to be resolved later.
@@ -62,24 +162,52 @@ class RelationshipManager:
             faq1_id: ID of first FAQ
             faq2_id: ID of second FAQ
         """
+        declared = self._declared_faqs.setdefault(faq1_id, [])
+        if faq2_id not in declared:
+            declared.append(faq2_id)
         for id1, id2 in [(faq1_id, faq2_id), (faq2_id, faq1_id)]:
             if id1 not in self._unresolved_faqs:
                 self._unresolved_faqs[id1] = []
             if id2 not in self._unresolved_faqs[id1]:
                 self._unresolved_faqs[id1].append(id2)
 
-    def resolve_faqs(self) -> None:
-        """Resolve all unresolved FAQ relationships."""
+    def forget_declared_faqs(self, faq_id: str) -> None:
+        """Drop the FAQ relationships declared by an FAQ.
+
+        Relationships declared by other FAQs towards this FAQ are kept.
+
+        Args:
+            faq_id: ID of the FAQ whose declarations are dropped
+        """
+        if self._declared_faqs.pop(faq_id, None) is None:
+            return
+        self._unresolved_faqs = {}
+        for id1, declared in self._declared_faqs.items():
+            for id2 in declared:
+                for a, b in [(id1, id2), (id2, id1)]:
+                    related = self._unresolved_faqs.setdefault(a, [])
+                    if b not in related:
+                        related.append(b)
+
+    def resolve_faqs(self, faq_ids: Optional[Iterable[str]] = None) -> None:
+        """Resolve unresolved FAQ relationships.
+
+        Args:
+            faq_ids: IDs of the FAQs whose relationships are resolved.
+                If None, all relationships are resolved.
+        """
         from .models.faq.article import Faq  # Import here to avoid circular imports
 
-        for faq_id in self._unresolved_faqs:
-            for faq2_id in self._unresolved_faqs[faq_id]:
+        if faq_ids is None:
+            faq_ids = list(self._unresolved_faqs)
+        for faq_id in faq_ids:
+            for faq2_id in self._unresolved_faqs.get(faq_id, []):
                 faq1 = Faq.get_by_id(faq_id)
                 faq2 = Faq.get_by_id(faq2_id)
                 if faq1 and faq2:
                     self.associate_objects(faq1, faq2)
 
-    def get_related_objects(self, obj: BaseModel, related_type: str) -> List[Any]:
+    def get_related_objects(self, obj: 'BaseModel', related_type: str) -> List[Any]:
         """Get all related objects of a specific type for an object.
 
         Args:
@@ -89,14 +217,14 @@ class RelationshipManager:
         Returns:
             List of related objects
         """
-        try:
-            return self._data[obj.object_type][obj.id][related_type]
-        except KeyError:
-            return []
+        if related_type == 'axe_rule' or obj.object_type == 'axe_rule':
+            from .models.axe import AxeRule  # Import here to avoid circular imports
+            AxeRule.ensure_loaded()
+        return self._view(obj, related_type, None)
 
     def get_sorted_related_objects(
         self,
-        obj: BaseModel,
+        obj: 'BaseModel',
         related_type: str,
         key: str = 'sort_key'
     ) -> List[Any]:
@@ -110,5 +238,137 @@ class RelationshipManager:
         Returns:
             Sorted list of related objects
         """
-        objects = self.get_related_objects(obj, related_type)
-        return sorted(objects, key=lambda x: getattr(x, key))
+        if related_type == 'axe_rule' or obj.object_type == 'axe_rule':
+            from .models.axe import AxeRule  # Import here to avoid circular imports
+            AxeRule.ensure_loaded()
+        return self._view(obj, related_type, key)
+
+    def has_related_objects(self, obj: 'BaseModel') -> bool:
+        """Check whether an object has any relationships.
+
+        Args:
+            obj: Object to check
+
+        Returns:
+            True if the object is related to at least one object
+        """
+        related = self._data.get(obj.object_type, {}).get(obj.id, {})
+        return any(related.values())
+
+    def disassociate_objects(self, obj1: 'BaseModel', obj2: 'BaseModel') -> None:
+        """Remove the relationship between two objects in both directions.
+
+        Args:
+            obj1: First object
+            obj2: Second object
+        """
+        for src, dest in [(obj1, obj2), (obj2, obj1)]:
+            related = self._data.get(src.object_type, {}).get(src.id, {})
+            objects = related.get(dest.object_type)
+            if objects is None or dest not in objects:
+                continue
+            del objects[dest]
+            if not objects:
+                del related[dest.object_type]
+            self._invalidate((src.object_type, src.id, dest.object_type))
+
+    def get_positions(self, obj: 'BaseModel') -> Dict[Tuple[str, str], int]:
+        """Get the position of an object in the relationship lists of its related objects.
+
+        Args:
+            obj: Object to look up
+
+        Returns:
+            Dictionary mapping (object type, ID) of each related object to the
+            index of obj in its list
+        """
+        positions = {}
+        for dest_type, objects in self._data.get(obj.object_type, {}).get(obj.id, {}).items():
+            for other in objects:
+                peers = self._data[dest_type][other.id].get(obj.object_type, {})
+                for index, peer in enumerate(peers):
+                    if peer is obj:
+                        positions[(dest_type, other.id)] = index
+                        break
+        return positions
+
+    def detach_object(self, obj: 'BaseModel') -> Dict[str, List[Any]]:
+        """Remove all relationships of an object.
+
+        Args:
+            obj: Object to detach
+
+        Returns:
+            Dictionary mapping object types to the objects obj was related to
+        """
+        related = self._data.get(obj.object_type, {}).pop(obj.id, {})
+        for dest_type, objects in related.items():
+            self._invalidate((obj.object_type, obj.id, dest_type))
+            for other in objects:
+                peer_related = self._data.get(dest_type, {}).get(other.id)
+                if peer_related is None or obj not in peer_related.get(obj.object_type, {}):
+                    continue
+                del peer_related[obj.object_type][obj]
+                if not peer_related[obj.object_type]:
+                    del peer_related[obj.object_type]
+                self._invalidate((dest_type, other.id, obj.object_type))
+        return {dest_type: list(objects) for dest_type, objects in related.items()}
+
+    def move_to_positions(self, moves: Iterable[Tuple['BaseModel', Dict[Tuple[str, str], int]]]) -> None:
+        """Move objects to recorded positions in the relationship lists of related objects.
+
+        This restores the order of the relationship lists after objects have
+        been detached and replaced by new objects, which are appended at the
+        end. Moves are applied in ascending order of position, so several
+        objects in the same list are restored correctly.
+
+        Args:
+            moves: Pairs of a new object and positions returned by
+                get_positions() for the object it replaces
+        """
+        ordered = sorted(
+            ((index, key, obj) for obj, positions in moves for key, index in positions.items()),
+            key=lambda item: item[0]
+        )
+        for index, (dest_type, dest_id), obj in ordered:
+            related = self._data.get(dest_type, {}).get(dest_id, {})
+            peers = related.get(obj.object_type)
+            if not peers or obj not in peers:
+                continue
+            members = [peer for peer in peers if peer is not obj]
+            members.insert(min(index, len(members)), obj)
+            related[obj.object_type] = dict.fromkeys(members)
+            self._invalidate((dest_type, dest_id, obj.object_type))
+
+    def get_dependencies(self, obj: 'BaseModel', rule: Optional[str] = None) -> List[str]:
+        """Get the source files the generated pages of an object depend on.
+
+        Args:
+            obj: Object to get the dependencies of
+            rule: Name of the rule in DEPENDENCY_RULES. Defaults to the
+                object type.
+
+        Returns:
+            Source file paths without duplicates, in the order of the walk
+
+        Raises:
+            KeyError: If there is no such rule
+        """
+        rule = rule or obj.object_type
+        cache_key = (rule, obj.object_type, obj.id)
+        dependencies = self._dependencies.get(cache_key)
+        if dependencies is None:
+            _, include_self, tree = DEPENDENCY_RULES[rule]
+            paths = {obj.src_path: None} if include_self else {}
+            for related_type, subtree in tree.items():
+                for related in self.get_sorted_related_objects(obj, related_type):
+                    self._collect_src_paths(related, subtree, paths)
+            dependencies = self._dependencies[cache_key] = list(paths)
+        return dependencies
+
+    def _collect_src_paths(self, obj: 'BaseModel', tree: Dict[str, Any], paths: Dict[str, None]) -> None:
+        """Add the source files of an object and the objects below it in a rule tree."""
+        paths[obj.src_path] = None
+        for related_type, subtree in tree.items():
+            for related in self.get_related_objects(obj, related_type):
+                self._collect_src_paths(related, subtree, paths)
@@ -0,0 +1,486 @@
+"""Incremental reloading of changed check, guideline and FAQ source files.
+
+setup_instances() builds the whole model from all source files. When only a
+few YAML files change, reload_sources() replaces just the affected instances:
+the old instance of each changed file is detached from all relationships,
+the file is parsed and validated again, and a new instance is constructed.
+Relationships declared by unchanged files towards a reloaded instance are
+restored, and relationship lists, instance registries and tool examples keep
+the order a full reload would produce.
+
+Static JSON files (categories, WCAG success criteria, FAQ tags and external
+information) cannot be reloaded incrementally; changing them requires a full
+setup_instances().
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import quote as url_encode
+
+from .relationship_manager import RelationshipManager
+from .models.base import BaseModel
+from .models.content import Guideline
+from .models.check import Check, CheckTool
+from .models.faq.article import Faq
+from .models.reference import InfoRef
+from .models.axe import AxeRule
+from .source import get_src_path
+from .yaml_validator import YamlValidator
+from . import yaml_loader
+from .initializer import read_file_content
+from .logging_config import get_logger
+
+logger = get_logger()
+
+# Reloadable entity types with their source directory key, constructor and
+# schema name, in the order they are constructed by setup_instances()
+RELOADABLE_ENTITIES = [
+    ('check', 'checks', Check, 'check'),
+    ('guideline', 'guidelines', Guideline, 'guideline'),
+    ('faq', 'faq', Faq, 'faq')
+]
+
+# Relationships declared by other entities towards reloadable entities:
+# entity type -> list of (referring type, error message template)
+INBOUND_REFERENCES = {
+    'check': [
+        ('guideline', 'Check ID {id} referenced in guideline {ref} does not exist.'),
+        ('faq', 'Check ID {id} referenced in FAQ {ref} does not exist.')
+    ],
+    'guideline': [
+        ('faq', 'Guideline ID {id} referenced in FAQ {ref} does not exist.')
+    ],
+    'faq': []
+}
+
+# Relationships reloadable entities declare themselves: entity type -> types
+# of the related objects whose lists are in construction order
+DECLARED_REFERENCES = {
+    'check': [],
+    'guideline': ['category', 'check', 'wcag_sc', 'info_ref'],
+    'faq': ['faq_tag', 'guideline', 'check', 'info_ref']
+}
+
+
+@dataclass
+class ReloadResult:
+    """Instances affected by reload_sources().
+
+    Attributes:
+        updated: New instances constructed from changed or added files
+        removed: Old instances whose source files were deleted
+    """
+    updated: List[BaseModel] = field(default_factory=list)
+    removed: List[BaseModel] = field(default_factory=list)
+
+
+def reload_sources(changed_paths: Iterable[str], basedir: Optional[str] = None,
+                   validator: Optional[YamlValidator] = None) -> ReloadResult:
+    """
+    Reload changed check, guideline and FAQ source files into the current model.
+
+    The model must have been set up with setup_instances() for the same
+    basedir. Changed paths may refer to modified, added or deleted files.
+    All files are parsed and validated, and references are checked, before
+    the model is modified. If constructing the new instances fails, the
+    model is restored, so errors in the changed files leave the model
+    unchanged.
+
+    Args:
+        changed_paths: Paths of the changed source files
+        basedir: Base directory containing data files.
+                If None, value from settings will be used. If not in settings, defaults to '.'
+        validator: YamlValidator to validate the files with (optional).
+                If None, a validator is created from the configuration.
+
+    Returns:
+        ReloadResult with the new and removed instances
+
+    Raises:
+        ValueError: If a path is not a reloadable source file, a file cannot
+            be parsed, or the changes leave references unresolved
+        ValidationError: If a file fails schema validation in strict mode
+    """
+    from .config import Config
+
+    effective_basedir = basedir if basedir is not None else Config.get_basedir()
+    src_path = get_src_path(effective_basedir)
+    if validator is None:
+        schema_dir = os.path.join(effective_basedir, 'data', 'json', 'schemas')
+        validator = YamlValidator(schema_dir, Config.get_yaml_validation_mode(),
+                                  Config.get_yaml_validation_backend())
+
+    changes = _read_changes(changed_paths, src_path, validator)
+    old = {
+        entity_type: [obj for obj in constructor._instances.values() if obj.src_path in changes[entity_type]]
+        for entity_type, _, constructor, _ in RELOADABLE_ENTITIES
+    }
+    _check_changes(changes, old)
+
+    rel = RelationshipManager()
+    saved = _save_model(rel)
+    try:
+        result = _apply_changes(rel, changes, old, src_path)
+    except Exception:
+        # Errors raised by the constructors leave the model half updated
+        _restore_model(rel, saved)
+        raise
+
+    logger.info(f"Reloaded {len(result.updated)} instances, removed {len(result.removed)}")
+    return result
+
+
+def _apply_changes(rel: RelationshipManager, changes: Dict[str, Dict[str, Optional[Dict[str, Any]]]],
+                   old: Dict[str, List[BaseModel]], src_path: Dict[str, str]) -> ReloadResult:
+    """Replace the old instances with instances constructed from the changed files."""
+    result = ReloadResult()
+    order = {entity_type: list(constructor._instances) for entity_type, _, constructor, _ in RELOADABLE_ENTITIES}
+    positions = {}
+    inbound = {}
+    info_candidates = []
+    affected_checks = []
+    affected_axe_rules = []
+    example_positions = _get_example_positions(old['check'])
+
+    # Detach the old instances
+    for entity_type, _, constructor, _ in RELOADABLE_ENTITIES:
+        for obj in old[entity_type]:
+            positions[obj.src_path] = rel.get_positions(obj)
+            related = rel.detach_object(obj)
+            inbound[(entity_type, obj.id)] = related
+            info_candidates.extend(related.get('info_ref', []))
+            if entity_type == 'guideline':
+                affected_checks.extend(related.get('check', []))
+                affected_axe_rules.extend(related.get('axe_rule', []))
+            elif entity_type == 'faq':
+                rel.forget_declared_faqs(obj.id)
+            del constructor._instances[obj.id]
+        if entity_type == 'check':
+            _remove_examples(old['check'])
+
+    # Construct the new instances in the order of setup_instances()
+    new = {}
+    for entity_type, _, constructor, _ in RELOADABLE_ENTITIES:
+        new[entity_type] = []
+        for path, data in changes[entity_type].items():
+            if data is None:
+                continue
+            try:
+                obj = constructor(data)
+            except Exception as e:
+                raise ValueError(f"Error with file {path}: {e}") from e
+            new[entity_type].append(obj)
+            result.updated.append(obj)
+
+    # Restore relationships declared by unchanged files
+    for entity_type, _, _, _ in RELOADABLE_ENTITIES:
+        for obj in new[entity_type]:
+            related = inbound.get((entity_type, obj.id), {})
+            for ref_type, _ in INBOUND_REFERENCES[entity_type]:
+                for referrer in related.get(ref_type, []):
+                    if _is_live(referrer):
+                        rel.associate_objects(referrer, obj)
+    rel.resolve_faqs([faq.id for faq in new['faq']])
+
+    # Put the new instances where the old instances of the same files were
+    replaced_paths = set()
+    for entity_type, _, constructor, _ in RELOADABLE_ENTITIES:
+        old_ids = {obj.src_path: obj.id for obj in old[entity_type]}
+        new_ids = {obj.src_path: obj.id for obj in new[entity_type]}
+        replaced_paths.update(old_ids.keys() & new_ids.keys())
+        _restore_order(constructor._instances, order[entity_type], old_ids, new_ids)
+
+    # Relationships declared by a reloaded instance are in construction order
+    for entity_type in ('guideline', 'faq'):
+        for obj in new[entity_type]:
+            _sort_declared_relationships(rel, obj)
+    rel.move_to_positions(
+        (obj, positions[obj.src_path])
+        for entity_type, _, _, _ in RELOADABLE_ENTITIES
+        for obj in new[entity_type]
+        if obj.src_path in replaced_paths
+    )
+
+    # Recompute relationships derived from guidelines
+    for guideline in new['guideline']:
+        affected_checks.extend(rel.get_related_objects(guideline, 'check'))
+        info_candidates.extend(rel.get_related_objects(guideline, 'info_ref'))
+    for faq in new['faq']:
+        info_candidates.extend(rel.get_related_objects(faq, 'info_ref'))
+    _update_check_info_refs(rel, affected_checks + new['check'], info_candidates)
+    if AxeRule.is_loaded():
+        _update_axe_rules(rel, new['guideline'], affected_axe_rules)
+
+    _restore_example_positions(new['check'], example_positions)
+    static_info_ids = _read_static_info_ids(src_path['info'])
+    _remove_orphan_info_refs(rel, info_candidates, static_info_ids)
+    _restore_info_ref_order(rel, static_info_ids)
+    result.removed = [
+        obj for entity_type, _, _, _ in RELOADABLE_ENTITIES
+        for obj in old[entity_type] if obj.src_path not in replaced_paths
+    ]
+
+    return result
+
+
+def _save_model(rel: RelationshipManager) -> Dict[str, Any]:
+    """Copy the parts of the model reload_sources() modifies."""
+    return {
+        'instances': {model: dict(model._instances) for model in (Check, Guideline, Faq, InfoRef)},
+        'relationships': rel.snapshot(),
+        'examples': {tool.id: list(tool.examples) for tool in CheckTool.list_all()},
+        'axe_rules': {rule.id: rule.has_guideline for rule in AxeRule._instances.values()}
+    }
+
+
+def _restore_model(rel: RelationshipManager, saved: Dict[str, Any]) -> None:
+    """Restore the model copied by _save_model()."""
+    for model, instances in saved['instances'].items():
+        model._instances.clear()
+        model._instances.update(instances)
+    rel.restore(saved['relationships'])
+    for tool in CheckTool.list_all():
+        tool.examples[:] = saved['examples'][tool.id]
+    for rule_id, has_guideline in saved['axe_rules'].items():
+        AxeRule._instances[rule_id].has_guideline = has_guideline
+
+
+def _read_changes(changed_paths: Iterable[str], src_path: Dict[str, str],
+                  validator: YamlValidator) -> Dict[str, Dict[str, Optional[Dict[str, Any]]]]:
+    """Classify, parse and validate the changed files.
+
+    Returns:
+        Dictionary mapping entity types to dictionaries of absolute paths to
+        parsed data, or None for deleted files
+    """
+    changes = {entity_type: {} for entity_type, _, _, _ in RELOADABLE_ENTITIES}
+    for path in changed_paths:
+        abspath = os.path.abspath(path)
+        for entity_type, src_key, _, schema_name in RELOADABLE_ENTITIES:
+            if abspath.startswith(os.path.abspath(src_path[src_key]) + os.sep):
+                break
+        else:
+            raise ValueError(f"{path} is not a check, guideline or FAQ source file; a full reload is required")
+
+        if not os.path.isfile(abspath):
+            changes[entity_type][abspath] = None
+            continue
+        try:
+            data = yaml_loader.safe_load(read_file_content(abspath))
+        except Exception as e:
+            raise ValueError(f"Error with file {abspath}: {e}") from e
+        if not isinstance(data, dict):
+            # An empty file, e.g. one truncated by an editor before writing
+            raise ValueError(f"Error with file {abspath}: not a mapping")
+        validator.validate_with_mode(data, schema_name, abspath)
+        data['src_path'] = abspath
+        changes[entity_type][abspath] = data
+    return changes
+
+
+def _check_changes(changes: Dict[str, Dict[str, Optional[Dict[str, Any]]]],
+                   old: Dict[str, List[BaseModel]]) -> None:
+    """Check that the changes can be applied without leaving dangling references.
+
+    Raises:
+        ValueError: If an ID is duplicated, or an ID which unchanged files
+            refer to is removed
+    """
+    constructors = {entity_type: constructor for entity_type, _, constructor, _ in RELOADABLE_ENTITIES}
+    rel = RelationshipManager()
+    for entity_type, constructor in constructors.items():
+        old_ids = {obj.id for obj in old[entity_type]}
+        new_ids = set()
+        for data in changes[entity_type].values():
+            if data is None:
+                continue
+            if data['id'] in new_ids or (data['id'] in constructor._instances and data['id'] not in old_ids):
+                raise ValueError(f"Duplicate {entity_type} ID: {data['id']}")
+            new_ids.add(data['id'])
+
+        for obj in old[entity_type]:
+            if obj.id in new_ids:
+                continue
+            for ref_type, message in INBOUND_REFERENCES[entity_type]:
+                changed_paths = changes[ref_type]
+                for referrer in rel.get_related_objects(obj, ref_type):
+                    if referrer.src_path not in changed_paths:
+                        raise ValueError(message.format(id=obj.id, ref=referrer.id))
+
+
+def _is_live(obj: BaseModel) -> bool:
+    """Check whether an instance is still registered."""
+    return type(obj)._instances.get(obj.id) is obj
+
+
+def _restore_order(instances: Dict[str, BaseModel], order: List[str],
+                   old_ids: Dict[str, str], new_ids: Dict[str, str]) -> None:
+    """Reorder an instance registry in place.
+
+    Instances of reloaded files take the position of the old instance of the
+    same file; instances of added files are appended.
+    """
+    renamed = {old_ids[path]: new_ids[path] for path in old_ids.keys() & new_ids.keys()}
+    keys = [renamed.get(key, key) for key in order]
+    keys = [key for key in keys if key in instances]
+    placed = set(keys)
+    keys.extend(key for key in instances if key not in placed)
+    items = [(key, instances[key]) for key in keys]
+    instances.clear()
+    instances.update(items)
+
+
+def _get_example_positions(checks: List[Check]) -> Dict[str, Dict[str, int]]:
+    """Get the index of the first example of each check on each tool.
+
+    Returns:
+        Dictionary mapping source paths to dictionaries of tool IDs to indexes
+    """
+    positions = {}
+    for tool in CheckTool.list_all():
+        for index, example in enumerate(tool.examples):
+            for check in checks:
+                if example.check_id == check.id:
+                    positions.setdefault(check.src_path, {}).setdefault(tool.id, index)
+    return positions
+
+
+def _remove_examples(checks: List[Check]) -> None:
+    """Remove the examples of checks from all tools."""
+    check_ids = {check.id for check in checks}
+    for tool in CheckTool.list_all():
+        tool.examples[:] = [example for example in tool.examples if example.check_id not in check_ids]
+
+
+def _restore_example_positions(checks: List[Check], positions: Dict[str, Dict[str, int]]) -> None:
+    """Move the examples of reloaded checks to where the old examples were."""
+    moves = []
+    for check in checks:
+        for tool_id, index in positions.get(check.src_path, {}).items():
+            moves.append((index, tool_id, check.id))
+    for index, tool_id, check_id in sorted(moves):
+        tool = CheckTool.get_by_id(tool_id)
+        examples = [example for example in tool.examples if example.check_id == check_id]
+        if not examples:
+            continue
+        others = [example for example in tool.examples if example.check_id != check_id]
+        tool.examples[:] = others[:index] + examples + others[index:]
+
+
+def _sort_declared_relationships(rel: RelationshipManager, obj: BaseModel) -> None:
+    """Sort the lists obj was added to by its own constructor into construction order."""
+    rank = {obj_id: index for index, obj_id in enumerate(type(obj)._instances)}
+    for peer_type in DECLARED_REFERENCES[obj.object_type]:
+        for peer in rel.get_related_objects(obj, peer_type):
+            members = sorted(rel.get_related_objects(peer, obj.object_type),
+                             key=lambda member: rank.get(member.id, len(rank)))
+            _set_order(rel, peer, members)
+
+
+def _set_order(rel: RelationshipManager, peer: BaseModel, members: List[BaseModel]) -> None:
+    """Reorder a relationship list of peer to the order of members."""
+    rel.move_to_positions((member, {(peer.object_type, peer.id): index}) for index, member in enumerate(members))
+
+
+def _update_check_info_refs(rel: RelationshipManager, checks: List[Check], infos: List[InfoRef]) -> None:
+    """Recompute the info references checks inherit from their guidelines.
+
+    A check is related to the info references of all its guidelines, in the
+    order the guidelines were constructed, and the checks of an info
+    reference are ordered the same way.
+    """
+    guideline_order = {guideline_id: index for index, guideline_id in enumerate(Guideline._instances)}
+
+    def sorted_guidelines(obj):
+        return sorted(
+            (gl for gl in rel.get_related_objects(obj, 'guideline') if gl.id in guideline_order),
+            key=lambda gl: guideline_order[gl.id]
+        )
+
+    infos = list(infos)
+    done = set()
+    for check in checks:
+        if check.id in done or not _is_live(check):
+            continue
+        done.add(check.id)
+        for info in list(rel.get_related_objects(check, 'info_ref')):
+            infos.append(info)
+            rel.disassociate_objects(check, info)
+        for guideline in sorted_guidelines(check):
+            for info in rel.get_related_objects(guideline, 'info_ref'):
+                rel.associate_objects(check, info)
+                infos.append(info)
+
+    done = set()
+    for info in infos:
+        if info.id in done or not _is_live(info):
+            continue
+        done.add(info.id)
+        members = {}
+        for guideline in sorted_guidelines(info):
+            for check in rel.get_related_objects(guideline, 'check'):
+                members.setdefault(check.id, check)
+        _set_order(rel, info, list(members.values()))
+
+
+def _update_axe_rules(rel: RelationshipManager, guidelines: List[Guideline],
+                      axe_rules: List[AxeRule]) -> None:
+    """Recompute the guidelines axe rules are related to through WCAG success criteria."""
+    axe_rules = list(axe_rules)
+    for guideline in guidelines:
+        for sc in rel.get_related_objects(guideline, 'wcag_sc'):
+            for axe_rule in rel.get_related_objects(sc, 'axe_rule'):
+                rel.associate_objects(axe_rule, guideline)
+                axe_rules.append(axe_rule)
+    for axe_rule in axe_rules:
+        axe_rule.has_guideline = bool(rel.get_related_objects(axe_rule, 'guideline'))
+
+
+def _read_static_info_ids(info_file: str) -> Optional[List[str]]:
+    """Get the IDs of the info references defined in the external information file.
+
+    Returns:
+        List of IDs in file order, or None if the file cannot be read
+    """
+    try:
+        return [url_encode(ref) for ref in json.loads(read_file_content(info_file))]
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read {info_file}, keeping the order of info references: {e}")
+        return None
+
+
+def _remove_orphan_info_refs(rel: RelationshipManager, candidates: List[InfoRef],
+                             static_ids: Optional[List[str]]) -> None:
+    """Remove info references no source file refers to anymore.
+
+    References defined in the external information file are kept, as a full
+    reload creates them regardless of their use. Nothing is removed if the
+    file could not be read.
+    """
+    if static_ids is None:
+        return
+    static_ids = set(static_ids)
+    for info in candidates:
+        if _is_live(info) and info.id not in static_ids and not rel.has_related_objects(info):
+            rel.detach_object(info)
+            del InfoRef._instances[info.id]
+
+
+def _restore_info_ref_order(rel: RelationshipManager, static_ids: Optional[List[str]]) -> None:
+    """Reorder the info reference registry like a full reload creates it.
+
+    References of the external information file come first, followed by
+    references in the order guidelines and FAQs first refer to them.
+    """
+    if static_ids is None:
+        return
+    keys = dict.fromkeys(key for key in static_ids if key in InfoRef._instances)
+    for constructor in (Guideline, Faq):
+        for obj in constructor._instances.values():
+            keys.update(dict.fromkeys(info.id for info in rel.get_related_objects(obj, 'info_ref')))
+    keys.update(dict.fromkeys(InfoRef._instances))
+    items = [(key, InfoRef._instances[key]) for key in keys]
+    InfoRef._instances.clear()
+    InfoRef._instances.update(items)
@@ -4,6 +4,7 @@ from typing import Any, Dict, Optional, List, Literal
 import yaml
 from pydantic import BaseModel, Field, field_validator
 from .message_catalog import MessageCatalog
+from . import yaml_loader
 
 from importlib import resources
 
@@ -45,6 +46,13 @@ class PathConfig(BaseModel):
 class ValidationConfig(BaseModel):
     """Validation configuration."""
     yaml_validation: Literal["strict", "warning", "disabled"] = "strict"
+    backend: Literal["jsonschema", "codegen"] = "jsonschema"
+
+
+class CacheConfig(BaseModel):
+    """Parsed source file cache configuration."""
+    enabled: bool = True
+    directory: str = "build/.a11y_gl_cache"
 
 
 class AxeCoreConfig(BaseModel):
@@ -64,6 +72,7 @@ class GlobalConfig(BaseModel):
     base_url: str
     paths: PathConfig
     validation: ValidationConfig = Field(default_factory=ValidationConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     axe_core: AxeCoreConfig
 
 
@@ -78,6 +87,10 @@ class Settings:
     6. 緊急時フォールバック（最小限のハードコード値）
     """
 
+    # 設定またはメッセージカタログが変更されるたびに増える番号
+    # （設定値から作られたキャッシュの無効化に使用）
+    revision: int = 0
+
     def __init__(self, profile: Optional[str] = None):
         self._settings: Dict[str, Any] = {}
         self._config_model: Optional[GlobalConfig] = None
@@ -104,7 +117,7 @@ class Settings:
             config_files = resources.files("freee_a11y_gl.data")
             config_file = config_files / "config.yaml"
             if config_file.is_file():
-                config_data = yaml.safe_load(config_file.read_text(encoding='utf-8'))
+                config_data = yaml_loader.safe_load(config_file.read_text(encoding='utf-8'))
                 if config_data:
                     self._settings = config_data
                 else:
@@ -117,7 +130,7 @@ class Settings:
                 default_config_path = Path(__file__).parent / "data" / "config.yaml"
                 if default_config_path.exists():
                     with default_config_path.open(encoding='utf-8') as f:
-                        config_data = yaml.safe_load(f)
+                        config_data = yaml_loader.safe_load(f)
                         if config_data:
                             self._settings = config_data
                         else:
@@ -141,7 +154,12 @@ class Settings:
                 "faq": "/faq/articles/"
             },
             "validation": {
-                "yaml_validation": "strict"
+                "yaml_validation": "strict",
+                "backend": "jsonschema"
+            },
+            "cache": {
+                "enabled": True,
+                "directory": "build/.a11y_gl_cache"
             },
             "axe_core": {
                 "submodule_name": "vendor/axe-core",
@@ -190,7 +208,7 @@ class Settings:
             try:
                 if path.exists() and path.is_file():
                     with path.open(encoding='utf-8') as f:
-                        config_data = yaml.safe_load(f)
+                        config_data = yaml_loader.safe_load(f)
                         if config_data:
                             self.update(config_data)
                             break  # 最初に見つかった設定ファイルを使用
@@ -243,6 +261,7 @@ class Settings:
         # フォールバック: デフォルトのメッセージカタログ
         if self._message_catalog is None:
             self._message_catalog = MessageCatalog()
+        self.revision += 1
 
     def get(self, key: str, default: Any = None) -> Any:
         """設定値の取得
@@ -305,6 +324,7 @@ class Settings:
     def validate(self) -> None:
         """設定値の検証"""
         self._config_model = GlobalConfig(**self._settings)
+        self.revision += 1
 
     @property
     def config(self) -> GlobalConfig:
@@ -0,0 +1,102 @@
+"""Sphinx extension writing an index of the labels of the documentation.
+
+get_info_links() only needs the labels of the standard domain, the document,
+anchor and section title of each ``.. _label:`` target, but they are stored
+in ``environment.pickle`` together with the whole Sphinx build environment.
+When the build has finished, this extension writes them to ``labels.json``
+in the doctree directory, next to the pickle. The index records the
+modification time and size of the pickle it was written with, so that an
+index left behind by an older build is not used.
+
+The extension is registered in ``ja/source/conf.py`` and
+``en/source/conf.py``::
+
+    extensions = ['freee_a11y_gl.sphinx_labels']
+
+This module does not import Sphinx, so the index can be read without it.
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+# Names of the files in the doctree directory
+ENVIRONMENT_PICKLE_NAME = 'environment.pickle'
+LABELS_INDEX_NAME = 'labels.json'
+
+# Format version of the index; bump when its layout changes
+LABELS_INDEX_VERSION = 1
+
+
+def write_labels_index(doctreedir: str, labels: Dict[str, Any]) -> Optional[str]:
+    """
+    Write the labels index of a build.
+
+    Args:
+        doctreedir: Doctree directory containing the environment pickle
+        labels: Labels of the standard domain, the document name, anchor and
+            section title of each label
+
+    Returns:
+        Path of the index, or None if there is no environment pickle
+    """
+    pickle_path = os.path.join(doctreedir, ENVIRONMENT_PICKLE_NAME)
+    try:
+        stat = os.stat(pickle_path)
+    except OSError:
+        return None
+
+    index = {
+        'version': LABELS_INDEX_VERSION,
+        'pickle_mtime_ns': stat.st_mtime_ns,
+        'pickle_size': stat.st_size,
+        'labels': {label: list(value) for label, value in labels.items()},
+    }
+    path = os.path.join(doctreedir, LABELS_INDEX_NAME)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_labels_index(doctreedir: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the labels index of a build if it matches the environment pickle.
+
+    Args:
+        doctreedir: Doctree directory containing the environment pickle
+
+    Returns:
+        Labels of the standard domain, or None if the index is missing,
+        unreadable, or was written with another environment pickle
+    """
+    try:
+        stat = os.stat(os.path.join(doctreedir, ENVIRONMENT_PICKLE_NAME))
+        with open(os.path.join(doctreedir, LABELS_INDEX_NAME), encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (not isinstance(index, dict) or index.get('version') != LABELS_INDEX_VERSION
+            or index.get('pickle_mtime_ns') != stat.st_mtime_ns
+            or index.get('pickle_size') != stat.st_size):
+        return None
+    return index.get('labels')
+
+
+def build_finished(app, exception) -> None:
+    """Write the labels index when a build has succeeded."""
+    if exception is not None:
+        return
+    write_labels_index(app.doctreedir, app.env.domaindata['std']['labels'])
+
+
+def setup(app) -> Dict[str, Any]:
+    """Register the extension with Sphinx."""
+    app.connect('build-finished', build_finished)
+    return {
+        'version': str(LABELS_INDEX_VERSION),
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }
@@ -0,0 +1,518 @@
+"""Synthetic data sets for scale testing.
+
+The data set of the guidelines is only a few hundred files, which is too
+small to tell how the toolchain scales. generate_corpus() writes a data set
+of any size with the layout of the a11y-guidelines repository:
+
+- data/yaml/checks, data/yaml/gl and data/yaml/faq with bilingual checks,
+  guidelines and FAQ articles, including nested conditions and
+  implementations for several platforms
+- data/json/*.json with the categories, WCAG success criteria, FAQ tags and
+  external references, and optionally the JSON schemas
+- vendor/axe-core, a Git submodule with axe-core rules, Japanese messages and
+  a package file, committed in a Git repository at the base directory
+- ja/build and en/build with the labels of the Sphinx environment pickle
+  and the labels index, for the internal references
+- version.py
+
+The data is generated from a seeded random number generator, so the same
+arguments always produce the same data set. The tools can then run on it like
+on the repository, e.g. yaml2rst -b OUTDIR.
+
+Example:
+    >>> generate_corpus('/tmp/corpus', scale=10, schema_dir='data/json/schemas')
+
+Command line:
+    python -m freee_a11y_gl.synthetic_corpus OUTDIR --scale 10
+"""
+
+import argparse
+import datetime
+import json
+import os
+import pickle
+import random
+import shutil
+import subprocess
+import types
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from .sphinx_labels import write_labels_index
+
+# Number of objects of each type in a data set of scale 1, about the size of
+# the data set of the guidelines
+DEFAULT_SIZES = {
+    'checks': 160,
+    'guidelines': 90,
+    'faqs': 15,
+    'tags': 12,
+    'info_refs': 40,
+    'axe_rules': 100,
+}
+
+# Guideline categories, in the order of their sort key ranges
+CATEGORIES = ['markup', 'page', 'login_session', 'input_device', 'text', 'images_of_text',
+              'image', 'icon', 'link', 'form', 'dynamic_content', 'multimedia']
+
+# Guideline sort keys range from 1001 to 2199, 100 per category
+MAX_GUIDELINES_PER_CATEGORY = 99
+MAX_FAQS = 3 * 9999
+
+# Tools used by the procedures of each condition platform; names which are
+# not check tool IDs are shown as they are
+PLATFORM_TOOLS = {
+    'web': ['nvda', 'macos-vo', 'keyboard', 'axe', 'misc', 'misc', 'WebAIM Contrast Checker'],
+    'ios': ['ios-vo', 'misc'],
+    'android': ['android-tb', 'misc'],
+}
+
+AXE_VERSION = '4.10.2'
+
+GIT = ['git', '-c', 'user.name=Synthetic Corpus', '-c', 'user.email=synthetic@example.com',
+       '-c', 'init.defaultBranch=main', '-c', 'commit.gpgsign=false']
+
+# Subjects and phrases the texts are built from, as (ja, en) pairs
+SUBJECTS = [
+    ('テキスト', 'text'), ('画像', 'images'), ('フォーム・コントロール', 'form controls'),
+    ('リンク', 'links'), ('見出し', 'headings'), ('アイコン', 'icons'),
+    ('エラー・メッセージ', 'error messages'), ('動画', 'videos'), ('ボタン', 'buttons'),
+    ('表', 'tables'), ('ダイアログ', 'dialogs'), ('ナビゲーション', 'navigation'),
+]
+CHECK_TEXTS = [
+    ('{ja}に適切な代替テキストが設定されている。', 'Appropriate text alternatives are provided for {en}.'),
+    ('{ja}の表示色と背景色に、充分なコントラスト比が確保されている。',
+     'Sufficient contrast ratio is maintained between {en} and the background.'),
+    ('{ja}がキーボードだけで操作できる。', '{En} can be operated with the keyboard alone.'),
+    ('{ja}の役割が支援技術に正しく伝わる。', 'The role of {en} is conveyed correctly to assistive technologies.'),
+    ('{ja}の表示が、画面を拡大しても損なわれない。', '{En} remain usable when the screen is magnified.'),
+]
+PROCEDURES = [
+    ('{tool}で{ja}を確認し、内容が正しく読み上げられる。', 'Using {tool}, verify that {en} are read out correctly.'),
+    ('{tool}で{ja}を操作し、すべての機能が利用できる。', 'Using {tool}, verify that all functions of {en} are available.'),
+    ('{tool}で、{ja}に関する問題が報告されない。', 'No issues regarding {en} are reported by {tool}.'),
+]
+LIST_ITEMS = [
+    ('フォーカスの移動順序が適切である', 'The focus order is appropriate'),
+    ('状態の変化が伝わる', 'Changes of state are conveyed'),
+    ('名前が表示と一致している', 'The name matches the visible label'),
+]
+
+
+def _text(rng: random.Random, templates, subject=None, tool: str = '',
+          with_list: bool = False) -> Dict[str, str]:
+    """Build a bilingual text from a template and a subject."""
+    ja_subject, en_subject = subject or rng.choice(SUBJECTS)
+    ja, en = rng.choice(templates)
+    text = {
+        'ja': ja.format(ja=ja_subject, tool=tool),
+        'en': en.format(en=en_subject, En=en_subject.capitalize(), tool=tool),
+    }
+    if with_list:
+        items = rng.sample(LIST_ITEMS, rng.randint(2, len(LIST_ITEMS)))
+        text['ja'] += '\n\n' + '\n'.join(f'*  {ja_item}' for ja_item, _ in items)
+        text['en'] += '\n\n' + '\n'.join(f'*  {en_item}' for _, en_item in items)
+    return text
+
+
+def _paragraphs(rng: random.Random, kind: Dict[str, str], count: int) -> Dict[str, str]:
+    """Build a bilingual text of several paragraphs."""
+    subjects = [rng.choice(SUBJECTS) for _ in range(count)]
+    return {
+        'ja': '\n\n'.join(f'{kind["ja"]}：{ja}に関する説明です。' for ja, _ in subjects),
+        'en': '\n\n'.join(f'{kind["en"]}: an explanation regarding {en}.' for _, en in subjects),
+    }
+
+
+class _Generator:
+    """Generator of one synthetic data set."""
+
+    def __init__(self, sizes: Dict[str, int], seed: int):
+        self.sizes = sizes
+        self.rng = random.Random(seed)
+        self.sc_ids: List[str] = []
+        self.labels: List[str] = []
+        self.external_refs: List[str] = []
+        self.check_ids: List[str] = []
+        self.check_platforms: Dict[str, List[str]] = {}
+        self.guideline_ids: List[str] = []
+        self.tag_ids: List[str] = []
+
+    def wcag_sc(self) -> Dict[str, Any]:
+        """Success criteria 1.1.1 to 4.9.5, with single-digit guideline numbers as in axe-core tags."""
+        criteria = {}
+        for principle in range(1, 5):
+            for guideline in range(1, 10):
+                for number in range(1, 6):
+                    sc_id = f'{principle}.{guideline}.{number}'
+                    anchor = f'sc-{principle}-{guideline}-{number}'
+                    level = self.rng.choice(['A', 'A', 'AA', 'AAA'])
+                    criteria[sc_id] = {
+                        'id': sc_id,
+                        'sortKey': f'{principle}{guideline:02d}{number:02d}',
+                        'en': {'title': f'Success Criterion {sc_id}',
+                               'url': f'https://www.w3.org/TR/WCAG21/#{anchor}'},
+                        'ja': {'title': f'達成基準 {sc_id}',
+                               'url': f'https://waic.jp/translations/WCAG21/#{anchor}'},
+                        'level': level,
+                        'localPriority': level,
+                    }
+        self.sc_ids = list(criteria)
+        return criteria
+
+    def info(self) -> Dict[str, Any]:
+        """External references; the other references are labels of internal pages."""
+        count = self.sizes['info_refs']
+        external = min(count, max(1, count // 10))
+        self.labels = [f'exp-synthetic-{i:04d}' for i in range(1, count - external + 1)]
+        self.external_refs = [f'|Synthetic Reference {i}|' for i in range(1, external + 1)]
+        return {
+            ref: {
+                'text': {'ja': f'外部資料{i}', 'en': f'External Reference {i}'},
+                'url': {'ja': f'https://example.com/ja/reference-{i}',
+                        'en': f'https://example.com/en/reference-{i}'},
+            }
+            for i, ref in enumerate(self.external_refs, 1)
+        }
+
+    def faq_tags(self) -> Dict[str, Dict[str, str]]:
+        self.tag_ids = [f'tag-{i:03d}' for i in range(1, self.sizes['tags'] + 1)]
+        return {tag_id: {'ja': f'タグ{i}', 'en': f'Tag {i}'}
+                for i, tag_id in enumerate(self.tag_ids, 1)}
+
+    def info_refs(self, maximum: int) -> List[str]:
+        """Pick up to maximum references, mostly internal ones."""
+        refs = self.labels + self.external_refs
+        if not refs:
+            return []
+        return sorted(set(self.rng.choice(refs) for _ in range(self.rng.randint(1, maximum))),
+                      key=refs.index)
+
+    def condition(self, check_id: str, platform: str, counter: List[int]) -> Dict[str, Any]:
+        """Condition of a check for one platform, with nested and/or groups."""
+        tools = PLATFORM_TOOLS[platform]
+
+        def simple(tool):
+            counter[0] += 1
+            slug = tool if ' ' not in tool else 'other'
+            procedure = {
+                'type': 'simple',
+                'id': f'{check_id}-{slug}-{counter[0]:02d}',
+                'tool': tool,
+                'procedure': _text(self.rng, PROCEDURES, tool=tool,
+                                   with_list=self.rng.random() < 0.2),
+            }
+            if self.rng.random() < 0.15:
+                procedure['note'] = _paragraphs(self.rng, {'ja': '注記', 'en': 'Note'}, 2)
+            if self.rng.random() < 0.05:
+                procedure['YouTube'] = {'id': f'synthetic{counter[0]:04d}', 'title': f'{tool} demo'}
+            return procedure
+
+        choice = self.rng.random()
+        if choice < 0.3:
+            condition = simple(self.rng.choice(tools))
+        else:
+            condition = {
+                'type': 'or',
+                'conditions': [simple(tool) for tool in self.rng.sample(tools, min(len(tools), 2))],
+            }
+            if choice > 0.8:
+                nested = {'type': 'and', 'conditions': [simple(tool) for tool in
+                                                        self.rng.sample(tools, 2)]}
+                condition['conditions'].append(nested)
+        return {'platform': platform, **condition}
+
+    def check(self, index: int) -> Dict[str, Any]:
+        check_id = f'{index:04d}'
+        target = self.rng.choices(['design', 'code', 'product'], weights=[40, 15, 45])[0]
+        platform = self.rng.choice([['web'], ['mobile'], ['web', 'mobile'], ['web', 'mobile']])
+        subject = self.rng.choice(SUBJECTS)
+        data = {
+            'id': check_id,
+            'sortKey': index * 100,
+            'severity': self.rng.choice(['critical', 'major', 'normal', 'normal', 'minor']),
+            'target': target,
+            'platform': platform,
+            'check': _text(self.rng, CHECK_TEXTS, subject),
+        }
+        if target == 'code':
+            method_platforms = (['web'] if 'web' in platform else []) + \
+                (['ios', 'android'] if 'mobile' in platform else [])
+            data['implementations'] = [
+                {
+                    'title': {'ja': f'実装例{i}', 'en': f'Implementation {i}'},
+                    'methods': [{'platform': method_platform,
+                                 'method': _paragraphs(self.rng, {'ja': '実装方法', 'en': 'Method'}, 1)}
+                                for method_platform in method_platforms],
+                }
+                for i in range(1, self.rng.randint(1, 2) + 1)
+            ]
+        else:
+            # As in the guidelines, design checks have conditions for the web
+            # only, and product checks for the web, iOS and Android
+            condition_platforms = [p for p in ['web'] if p in platform]
+            if target == 'product' and 'mobile' in platform:
+                condition_platforms += ['ios', 'android']
+            if condition_platforms and self.rng.random() < 0.8:
+                counter = [0]
+                data['conditions'] = [self.condition(check_id, condition_platform, counter)
+                                      for condition_platform in condition_platforms]
+        self.check_ids.append(check_id)
+        self.check_platforms[check_id] = platform
+        return data
+
+    def guidelines(self) -> List[Any]:
+        """Guidelines spread over the categories, covering every check at least once."""
+        count = self.sizes['guidelines']
+        assigned: List[List[str]] = [[] for _ in range(count)]
+        shuffled = self.check_ids[:]
+        self.rng.shuffle(shuffled)
+        for i, check_id in enumerate(shuffled):
+            assigned[i % count].append(check_id)
+
+        guidelines = []
+        for i in range(count):
+            category = CATEGORIES[i % len(CATEGORIES)]
+            number = i // len(CATEGORIES) + 1
+            checks = assigned[i] + self.rng.sample(self.check_ids, min(len(self.check_ids),
+                                                                       self.rng.randint(0, 2)))
+            checks = list(dict.fromkeys(checks)) or [self.rng.choice(self.check_ids)]
+            platforms = {p for check_id in checks for p in self.check_platforms[check_id]}
+            subject = self.rng.choice(SUBJECTS)
+            data = {
+                'id': f'gl-{category}-synthetic-{number:03d}',
+                'sortKey': 1000 + 100 * CATEGORIES.index(category) + number,
+                'category': category,
+                'title': {'ja': f'{subject[0]}のガイドライン{number}',
+                          'en': f'Guideline {number} for {subject[1]}'},
+                'platform': [p for p in ('web', 'mobile') if p in platforms],
+                'guideline': _text(self.rng, CHECK_TEXTS, subject),
+                'sc': sorted(self.rng.sample(self.sc_ids, self.rng.randint(1, 3)),
+                             key=self.sc_ids.index),
+                'intent': _paragraphs(self.rng, {'ja': '意図', 'en': 'Intent'}, 1),
+                'checks': checks,
+            }
+            if self.rng.random() < 0.6:
+                info = self.info_refs(2)
+                if info:
+                    data['info'] = info
+            self.guideline_ids.append(data['id'])
+            guidelines.append((f'{category}/synthetic-{number:03d}.yaml', data))
+        return guidelines
+
+    def faq(self, index: int, previous: List[str]) -> Dict[str, Any]:
+        faq_id = f'{"cdp"[index % 3]}{index // 3 + 1:04d}'
+        tags = [self.tag_ids[index % len(self.tag_ids)]]
+        if self.rng.random() < 0.3:
+            tags = list(dict.fromkeys(tags + [self.rng.choice(self.tag_ids)]))
+        updated = datetime.date(2024, 1, 1) + datetime.timedelta(days=self.rng.randint(0, 700))
+        subject = self.rng.choice(SUBJECTS)
+        data = {
+            'id': faq_id,
+            'sortKey': (index + 1) * 10,
+            'updated': updated.isoformat(),
+            'tags': tags,
+            'title': {'ja': f'{subject[0]}に関する質問{index + 1}',
+                      'en': f'Question {index + 1} About {subject[1].title()}'},
+            'problem': _paragraphs(self.rng, {'ja': '問題', 'en': 'Problem'}, 1),
+            'solution': _text(self.rng, CHECK_TEXTS, subject, with_list=True),
+            'explanation': _paragraphs(self.rng, {'ja': '解説', 'en': 'Explanation'}, 3),
+        }
+        if self.guideline_ids and self.rng.random() < 0.7:
+            data['guidelines'] = sorted(set(self.rng.sample(
+                self.guideline_ids, min(len(self.guideline_ids), self.rng.randint(1, 3)))))
+        if self.check_ids and self.rng.random() < 0.7:
+            data['checks'] = sorted(set(self.rng.sample(
+                self.check_ids, min(len(self.check_ids), self.rng.randint(1, 3)))))
+        if self.rng.random() < 0.5:
+            info = self.info_refs(2)
+            if info:
+                data['info'] = info
+        if previous and self.rng.random() < 0.3:
+            data['faqs'] = sorted(set(self.rng.sample(previous, min(len(previous), 2))))
+        return data
+
+    def axe_rules(self) -> List[Dict[str, Any]]:
+        rules = []
+        for i in range(1, self.sizes['axe_rules'] + 1):
+            tags = ['cat.synthetic']
+            if self.rng.random() < 0.8:
+                tags.append('wcag2a')
+                tags += ['wcag' + sc_id.replace('.', '')
+                         for sc_id in self.rng.sample(self.sc_ids, self.rng.randint(1, 2))]
+            else:
+                tags.append('best-practice')
+            rules.append({
+                'id': f'synthetic-rule-{i:03d}',
+                'selector': '*',
+                'tags': tags,
+                'metadata': {'description': f'Ensures synthetic rule {i} is satisfied',
+                             'help': f'Synthetic rule {i} must be satisfied'},
+                'all': [], 'any': [f'synthetic-check-{i:03d}'], 'none': [],
+            })
+        return rules
+
+
+def _write_yaml(path: str, data: Any) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
+
+
+def _write_json(path: str, data: Any) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _git(cwd: str, *args: str) -> None:
+    subprocess.run(GIT + list(args), cwd=cwd, check=True, capture_output=True, text=True)
+
+
+def _write_axe_core(basedir: str, generator: _Generator) -> None:
+    """Commit the axe-core files and add them as a submodule of the base directory."""
+    axe_dir = os.path.join(basedir, 'vendor', 'axe-core')
+    rules = generator.axe_rules()
+    for rule in rules:
+        _write_json(os.path.join(axe_dir, 'lib', 'rules', f'{rule["id"]}.json'), rule)
+    _write_json(os.path.join(axe_dir, 'locales', 'ja.json'), {
+        'lang': 'ja',
+        'rules': {
+            rule['id']: {'description': f'合成ルール{i}の説明', 'help': f'合成ルール{i}を満たす必要があります'}
+            for i, rule in enumerate(rules, 1) if i % 5
+        },
+    })
+    _write_json(os.path.join(axe_dir, 'package.json'), {'name': 'axe-core', 'version': AXE_VERSION})
+    _git(axe_dir, 'init', '-q')
+    _git(axe_dir, 'add', '-A')
+    _git(axe_dir, 'commit', '-q', '-m', f'Release {AXE_VERSION}')
+
+    _git(basedir, 'init', '-q')
+    _git(basedir, 'submodule', 'add', '-q', 'https://github.com/dequelabs/axe-core', 'vendor/axe-core')
+
+
+def _write_label_index(basedir: str, generator: _Generator) -> None:
+    """Write the labels of the internal references as the Sphinx builds do.
+
+    Both the environment pickle and the labels index of sphinx_labels are
+    written.
+    """
+    for lang in ('ja', 'en'):
+        labels = {
+            label: (f'explanations/synthetic-{i:04d}', label,
+                    f'解説{i}' if lang == 'ja' else f'Explanation {i}')
+            for i, label in enumerate(generator.labels, 1)
+        }
+        environment = types.SimpleNamespace(domaindata={'std': {'labels': labels}})
+        path = os.path.join(basedir, lang, 'build', 'doctrees', 'environment.pickle')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump(environment, f)
+        write_labels_index(os.path.dirname(path), labels)
+        os.makedirs(os.path.join(basedir, lang, 'source'), exist_ok=True)
+
+
+def generate_corpus(basedir: str, scale: float = 1, seed: int = 0,
+                    schema_dir: Optional[str] = None, **sizes: int) -> Dict[str, int]:
+    """Write a synthetic data set.
+
+    Args:
+        basedir: Directory to create the data set in. It must not exist or be
+            empty.
+        scale: Factor applied to DEFAULT_SIZES
+        seed: Seed of the random number generator
+        schema_dir: Directory of the JSON schemas copied to data/json/schemas.
+            Without schemas, the data set can only be loaded with YAML
+            validation disabled.
+        **sizes: Numbers of objects overriding the scaled default sizes:
+            checks, guidelines, faqs, tags, info_refs, axe_rules
+
+    Returns:
+        Numbers of objects of each type written
+
+    Raises:
+        ValueError: If a size is unknown or out of range, or basedir is not
+            empty
+    """
+    unknown = sorted(set(sizes) - set(DEFAULT_SIZES))
+    if unknown:
+        raise ValueError(f'Unknown sizes: {", ".join(unknown)}')
+    sizes = {name: sizes.get(name, max(1, round(default * scale)))
+             for name, default in DEFAULT_SIZES.items()}
+    if sizes['guidelines'] > len(CATEGORIES) * MAX_GUIDELINES_PER_CATEGORY:
+        raise ValueError(f'At most {len(CATEGORIES) * MAX_GUIDELINES_PER_CATEGORY} guidelines '
+                         'fit in the range of guideline sort keys')
+    if sizes['faqs'] > MAX_FAQS:
+        raise ValueError(f'At most {MAX_FAQS} FAQ IDs are available')
+    if os.path.isdir(basedir) and os.listdir(basedir):
+        raise ValueError(f'Directory {basedir} is not empty')
+
+    generator = _Generator(sizes, seed)
+    json_dir = os.path.join(basedir, 'data', 'json')
+    yaml_dir = os.path.join(basedir, 'data', 'yaml')
+    _write_json(os.path.join(json_dir, 'guideline-categories.json'), {
+        category: {'ja': f'カテゴリー{i}', 'en': f'Category {i}'}
+        for i, category in enumerate(CATEGORIES, 1)
+    })
+    _write_json(os.path.join(json_dir, 'wcag-sc.json'), generator.wcag_sc())
+    _write_json(os.path.join(json_dir, 'faq-tags.json'), generator.faq_tags())
+    _write_json(os.path.join(json_dir, 'info.json'), generator.info())
+    if schema_dir is not None:
+        shutil.copytree(schema_dir, os.path.join(json_dir, 'schemas'))
+
+    for index in range(1, sizes['checks'] + 1):
+        check = generator.check(index)
+        _write_yaml(os.path.join(yaml_dir, 'checks', check['target'], f'{check["id"]}.yaml'), check)
+    for path, guideline in generator.guidelines():
+        _write_yaml(os.path.join(yaml_dir, 'gl', path), guideline)
+    faq_ids: List[str] = []
+    for index in range(sizes['faqs']):
+        faq = generator.faq(index, faq_ids)
+        _write_yaml(os.path.join(yaml_dir, 'faq', f'{faq["id"]}.yaml'), faq)
+        faq_ids.append(faq['id'])
+
+    _write_label_index(basedir, generator)
+    with open(os.path.join(basedir, 'version.py'), 'w', encoding='utf-8') as f:
+        f.write("guidelines_version = 'Ver. 209901.0'\n"
+                "checksheet_version = '99.0.0'\n"
+                "checksheet_date = '2099-01-01'\n"
+                "publishedDate = '2099-01-01'\n")
+    with open(os.path.join(basedir, '.gitignore'), 'w', encoding='utf-8') as f:
+        f.write('build/\n')
+
+    _write_axe_core(basedir, generator)
+    _git(basedir, 'add', '-A')
+    _git(basedir, 'commit', '-q', '-m', 'Synthetic corpus')
+    return sizes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line interface of generate_corpus()."""
+    parser = argparse.ArgumentParser(
+        prog='python -m freee_a11y_gl.synthetic_corpus',
+        description='Generate a synthetic guidelines data set for scale testing')
+    parser.add_argument('basedir', help='Directory to create the data set in')
+    parser.add_argument('--scale', type=float, default=1,
+                        help='Factor applied to the default sizes (default: 1, about the size of the guidelines)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--schema-dir', default=os.path.join('data', 'json', 'schemas'),
+                        help='Directory of the JSON schemas to copy (default: data/json/schemas)')
+    for name in DEFAULT_SIZES:
+        parser.add_argument(f'--{name.replace("_", "-")}', type=int, dest=name,
+                            help=f'Number of {name.replace("_", " ")}')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.schema_dir):
+        parser.error(f'Schema directory {args.schema_dir} not found')
+    sizes = {name: getattr(args, name) for name in DEFAULT_SIZES if getattr(args, name) is not None}
+    try:
+        written = generate_corpus(args.basedir, args.scale, args.seed, args.schema_dir, **sizes)
+    except ValueError as e:
+        parser.error(str(e))
+    print(', '.join(f'{count} {name.replace("_", " ")}' for name, count in written.items()))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,270 @@
+"""Lightweight tracing of the phases of the guideline tools.
+
+Spans mark phases such as loading an entity type or rendering a template.
+Tracing is off by default, and span() then returns a shared no-op context
+manager, so the instrumentation costs one function call per span. When
+tracing is on, each span is recorded as a complete event of the Chrome trace
+event format, which chrome://tracing and https://ui.perfetto.dev display as
+a timeline, and the spans are summarized by name.
+
+Tracing is turned on by setting the environment variable FREEE_A11Y_GL_TRACE
+to the path of the trace file, which is then written with the summary when
+the process exits, or by the --trace option of yaml2rst and yaml2sheet.
+
+The coarse spans marked as phases are also passed to the phase listeners,
+whether tracing is on or not, so that other reports such as the memory
+profile measure the same phases.
+
+Example:
+    >>> from freee_a11y_gl import tracing
+    >>> tracing.enable('trace.json')
+    >>> with tracing.span('load', entity='check'):
+    ...     load_checks()
+    >>> tracing.finish()  # writes trace.json and prints the summary
+"""
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, List, Optional, TextIO, TypeVar
+
+ENV_VAR = 'FREEE_A11Y_GL_TRACE'
+DEFAULT_CATEGORY = 'freee_a11y_gl'
+
+F = TypeVar('F', bound=Callable[..., Any])
+PhaseListener = Callable[[str, Dict[str, Any]], ContextManager[Any]]
+
+
+class _NullSpan:
+    """Span returned while tracing is off."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Tracer:
+    """Recorder of the spans of the process."""
+
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[str] = None
+        self.events: List[Dict[str, Any]] = []
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.phase_listeners: List[PhaseListener] = []
+
+
+_tracer = _Tracer()
+
+
+class _Span:
+    """Span recorded as a complete event when it is left."""
+    __slots__ = ('name', 'category', 'args', 'phase', 'start', 'listeners')
+
+    def __init__(self, name: str, category: str, args: Dict[str, Any], phase: bool = False):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.phase = phase
+
+    def __enter__(self):
+        # Listeners are entered before the span starts, so they are not timed
+        self.listeners = ([listener(self.name, self.args) for listener in _tracer.phase_listeners]
+                          if self.phase else [])
+        for listener in self.listeners:
+            listener.__enter__()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if _tracer.enabled:
+            self._record(end, exc_type)
+        for listener in reversed(self.listeners):
+            listener.__exit__(exc_type, exc, tb)
+        return False
+
+    def _record(self, end: int, exc_type) -> None:
+        event = {
+            'name': self.name,
+            'cat': self.category,
+            'ph': 'X',
+            'ts': (self.start - _tracer.origin) / 1000,
+            'dur': (end - self.start) / 1000,
+            'pid': _tracer.pid,
+            'tid': threading.get_ident(),
+        }
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        if self.args:
+            event['args'] = {key: value if isinstance(value, (int, float, bool)) or value is None
+                             else str(value) for key, value in self.args.items()}
+        _tracer.events.append(event)
+
+
+def _active(phase: bool) -> bool:
+    return _tracer.enabled or (phase and bool(_tracer.phase_listeners))
+
+
+def span(name: str, category: str = DEFAULT_CATEGORY, *, phase: bool = False, **args: Any):
+    """Get a context manager marking a span.
+
+    Args:
+        name: Name of the span; spans of the same name are summarized together
+        category: Category of the span, e.g. the name of the tool
+        phase: Whether the span is a phase passed to the phase listeners
+        **args: Values shown with the span in the trace viewer
+
+    Returns:
+        Context manager recording the span while tracing is on
+    """
+    if not _active(phase):
+        return _NULL_SPAN
+    return _Span(name, category, args, phase)
+
+
+def traced(name: Optional[str] = None, category: str = DEFAULT_CATEGORY,
+           phase: bool = False) -> Callable[[F], F]:
+    """Decorate a function to run it in a span.
+
+    Args:
+        name: Name of the span; the qualified name of the function by default
+        category: Category of the span
+        phase: Whether the span is a phase passed to the phase listeners
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _active(phase):
+                return func(*args, **kwargs)
+            with _Span(span_name, category, {}, phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def add_phase_listener(listener: PhaseListener) -> None:
+    """Pass the phases to a listener, whether tracing is on or not.
+
+    Args:
+        listener: Function called with the name and the arguments of each
+            phase entered, returning a context manager that is entered and
+            left with the phase
+    """
+    if listener not in _tracer.phase_listeners:
+        _tracer.phase_listeners.append(listener)
+
+
+def remove_phase_listener(listener: PhaseListener) -> None:
+    """Stop passing the phases to a listener added by add_phase_listener()."""
+    if listener in _tracer.phase_listeners:
+        _tracer.phase_listeners.remove(listener)
+
+
+def enable(path: Optional[str] = None) -> None:
+    """Turn tracing on.
+
+    Args:
+        path: Trace file written by finish() (optional)
+    """
+    _tracer.enabled = True
+    if path is not None:
+        _tracer.path = path
+
+
+def disable() -> None:
+    """Turn tracing off, keeping the spans recorded so far."""
+    _tracer.enabled = False
+
+
+def is_enabled() -> bool:
+    return _tracer.enabled
+
+
+def reset() -> None:
+    """Turn tracing off and discard the recorded spans."""
+    _tracer.enabled = False
+    _tracer.path = None
+    _tracer.events = []
+
+
+def get_events() -> List[Dict[str, Any]]:
+    """Get the recorded spans as Chrome trace events, in the order they ended."""
+    return list(_tracer.events)
+
+
+def write_trace(path: str) -> None:
+    """Write the recorded spans as a Chrome trace event file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    metadata = {'name': 'process_name', 'ph': 'M', 'pid': _tracer.pid,
+                'args': {'name': os.path.basename(sys.argv[0]) or 'python'}}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': [metadata] + _tracer.events, 'displayTimeUnit': 'ms'}, f)
+
+
+def summarize() -> List[Dict[str, Any]]:
+    """Summarize the recorded spans by name.
+
+    Returns:
+        Name, count and total, mean and maximum duration in milliseconds of
+        each span name, in the order of decreasing total duration
+    """
+    totals: Dict[str, List[float]] = {}
+    for event in _tracer.events:
+        totals.setdefault(event['name'], []).append(event['dur'] / 1000)
+    rows = [{'name': name, 'count': len(durations), 'total_ms': sum(durations),
+             'mean_ms': sum(durations) / len(durations), 'max_ms': max(durations)}
+            for name, durations in totals.items()]
+    return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+
+def format_summary() -> str:
+    """Format the summary of the recorded spans as a table."""
+    rows = summarize()
+    width = max([len('span')] + [len(row['name']) for row in rows])
+    lines = [f"{'span':<{width}}  {'count':>7}  {'total ms':>10}  {'mean ms':>9}  {'max ms':>9}"]
+    for row in rows:
+        lines.append(f"{row['name']:<{width}}  {row['count']:>7}  {row['total_ms']:>10.2f}  "
+                     f"{row['mean_ms']:>9.3f}  {row['max_ms']:>9.3f}")
+    return '\n'.join(lines)
+
+
+def finish(stream: Optional[TextIO] = None) -> Optional[str]:
+    """Write the trace file and print the summary if tracing is on.
+
+    Tracing is turned off afterwards.
+
+    Args:
+        stream: Stream to print the summary to; sys.stderr by default
+
+    Returns:
+        Path of the trace file written, or None
+    """
+    if not _tracer.enabled:
+        return None
+    _tracer.enabled = False
+    path = _tracer.path
+    if path is not None:
+        write_trace(path)
+    print(format_summary(), file=stream or sys.stderr)
+    if path is not None:
+        print(f'Trace written to {path}', file=stream or sys.stderr)
+    return path
+
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR])
+    atexit.register(finish)
@@ -0,0 +1,36 @@
+"""YAML loading with the libyaml C extension when available.
+
+PyYAML's pure-Python SafeLoader is considerably slower than CSafeLoader,
+which is only available when PyYAML was built against libyaml. This module
+selects the fastest available safe loader once, so that all YAML files of
+the library and its tools are parsed the same way.
+"""
+
+from typing import Any, IO, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+    LIBYAML_AVAILABLE = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+    LIBYAML_AVAILABLE = False
+
+__all__ = ['SafeLoader', 'LIBYAML_AVAILABLE', 'safe_load']
+
+
+def safe_load(stream: Union[str, bytes, IO]) -> Any:
+    """
+    Parse a YAML document with the fastest available safe loader.
+
+    This is a drop-in replacement for yaml.safe_load(). Parse errors are
+    raised as yaml.YAMLError in both implementations.
+
+    Args:
+        stream: YAML document as a string, bytes or file object
+
+    Returns:
+        Parsed YAML data
+    """
+    return yaml.load(stream, Loader=SafeLoader)
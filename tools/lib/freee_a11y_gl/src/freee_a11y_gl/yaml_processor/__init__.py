@@ -7,9 +7,11 @@ with special handling for RST markup and accessibility guideline specific conten
 
 from .process_yaml import process_yaml_data
 from .rst_processor import process_rst_text, process_rst_condition
+from .rst_cache import RstCache
 
 __all__ = [
     'process_yaml_data',
     'process_rst_text',
-    'process_rst_condition'
+    'process_rst_condition',
+    'RstCache'
 ]
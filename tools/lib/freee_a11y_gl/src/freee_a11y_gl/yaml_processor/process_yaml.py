@@ -9,18 +9,27 @@ from typing import Dict, Any, Optional
 
 from ..models.reference import InfoRef
 from ..models.check import Check
-from .. import info_utils
+from .. import info_utils, tracing
+from ..logging_config import get_logger
 from ..version_utils import get_version_info
 from ..initializer import setup_instances
 from . import rst_processor
+from .rst_cache import RstCache
 
+logger = get_logger()
 
-def process_yaml_data(basedir: Optional[str] = None) -> Dict[str, Any]:
+
+@tracing.traced('process_yaml_data', phase=True)
+def process_yaml_data(basedir: Optional[str] = None, workers: Optional[int] = None,
+                      use_cache: Optional[bool] = None) -> Dict[str, Any]:
     """
     Process YAML files and return structured data as a Python dictionary.
 
     Args:
         basedir (str, optional): Base directory containing YAML files
+        workers (int, optional): Number of worker processes used to parse and validate YAML files
+        use_cache (bool, optional): Whether to use the on-disk caches of parsed source files
+            and processed RST texts
 
     Returns:
         Dict[str, Any]: Processed data including version info, checks, and conditions
@@ -28,18 +37,42 @@ def process_yaml_data(basedir: Optional[str] = None) -> Dict[str, Any]:
     Raises:
         Exception: If there's an error during the conversion process
     """
+    from ..config import Config
+
     # Get version info and setup instances with basedir
-    version_info: Dict[str, str] = get_version_info(basedir)
-    setup_instances(basedir)
+    with tracing.span('process_yaml_data.version_info'):
+        version_info: Dict[str, str] = get_version_info(basedir)
+    setup_instances(basedir, workers=workers, use_cache=use_cache)
 
     # Process information links and references
-    info_links: Dict[str, Any] = info_utils.get_info_links(basedir)
-    for info in InfoRef.list_all_internal():
-        if info.ref in info_links:
-            info.set_link(info_links[info.ref])
+    with tracing.span('process_yaml_data.info_links'):
+        info_links: Dict[str, Any] = info_utils.get_info_links(basedir)
+        for info in InfoRef.list_all_internal():
+            if info.ref in info_links:
+                info.set_link(info_links[info.ref])
 
     # Process checks and their conditions
-    checks: Dict[str, Any] = Check.object_data_all()
+    with tracing.span('process_yaml_data.object_data', phase=True):
+        checks: Dict[str, Any] = Check.object_data_all()
+    if use_cache is None:
+        use_cache = Config.is_cache_enabled()
+    rst_cache = RstCache(info_links, Config.get_cache_dir(basedir) if use_cache else None)
+    with tracing.span('process_yaml_data.rst', phase=True, checks=len(checks)):
+        _process_rst(checks, info_links, rst_cache)
+    with tracing.span('rst_cache.save'):
+        rst_cache.save()
+    logger.info(f"RST cache: {rst_cache.stats}")
+
+    # Return output data
+    return {
+        'version': version_info['checksheet_version'],
+        'date': version_info['checksheet_date'],
+        'checks': checks
+    }
+
+
+def _process_rst(checks: Dict[str, Any], info_links: Dict[str, Any], cache: RstCache) -> None:
+    """Process the RST markup of the texts and conditions of the checks in place."""
     for key in checks:
         # Process check text for RST markup
         if 'check' in checks[key]:
@@ -47,19 +80,13 @@ def process_yaml_data(basedir: Optional[str] = None) -> Dict[str, Any]:
                 checks[key]['check'][lang] = rst_processor.process_rst_text(
                     checks[key]['check'][lang],
                     info_links,
-                    lang
+                    lang,
+                    cache=cache
                 )
 
         # Process conditions for RST markup
         if 'conditions' in checks[key]:
             checks[key]['conditions'] = [
-                rst_processor.process_rst_condition(condition, info_links)
+                rst_processor.process_rst_condition(condition, info_links, cache=cache)
                 for condition in checks[key]['conditions']
             ]
-
-    # Return output data
-    return {
-        'version': version_info['checksheet_version'],
-        'date': version_info['checksheet_date'],
-        'checks': checks
-    }
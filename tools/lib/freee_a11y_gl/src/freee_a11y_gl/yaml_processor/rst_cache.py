@@ -0,0 +1,178 @@
+"""Memo cache of processed RST texts.
+
+process_yaml_data() processes the RST markup of the text of every check and
+of every procedure in every language, and many procedure texts repeat across
+checks. RstCache keeps the processed texts keyed by the source text and the
+language, for one set of info links, so that a text is substituted and
+normalized only once. The texts are short, and hashing them as dictionary keys
+is cheaper than computing a digest of each.
+
+The cache can be stored in the cache directory next to the parse cache. It
+records a hash of the info links it was built with and a hash of the source
+of rst_processor, and is discarded when either differs: the texts of the
+:ref: targets are substituted into the processed texts, and a change of the
+processing code changes the processed texts without a change of the sources.
+Only the entries used by a run are stored again.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Dict, Optional, Tuple
+
+from ..logging_config import get_logger
+from ..parse_cache import CacheStats
+from . import rst_processor
+
+logger = get_logger()
+
+# Name of the cache file in the cache directory
+CACHE_FILE_NAME = "rst.pickle"
+
+# Format version of the cache file; bump when the entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Source text and language of an entry
+Key = Tuple[str, str]
+
+
+def info_links_version(info: Dict[str, Any]) -> str:
+    """
+    Get the version of a set of info links.
+
+    Args:
+        info: Dictionary containing reference information
+
+    Returns:
+        SHA-256 hex digest of the info links
+    """
+    content = json.dumps(info, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def processor_version() -> str:
+    """
+    Get the version of the code processing the RST texts.
+
+    Returns:
+        SHA-256 hex digest of the source of rst_processor
+    """
+    with open(rst_processor.__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class RstCache:
+    """Processed RST texts of one set of info links."""
+
+    def __init__(self, info: Dict[str, Any], cache_dir: Optional[str] = None):
+        """
+        Initialize the cache and load stored entries of the same info links.
+
+        Args:
+            info: Dictionary containing reference information the texts are
+                processed with
+            cache_dir: Directory to store the cache file in, or None to keep
+                the cache in memory only
+        """
+        self.version = info_links_version(info)
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, CACHE_FILE_NAME) if cache_dir is not None else None
+        self.stats = CacheStats()
+        self._stored: Dict[Key, str] = {}
+        self._entries: Dict[Key, str] = {}
+        self._dirty = False
+        if self.cache_file is not None:
+            self._load()
+
+    def _load(self) -> None:
+        """Load stored entries from the cache file, discarding unusable caches."""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable RST cache {self.cache_file}: {e}")
+            return
+
+        if not isinstance(cached, dict) or cached.get('version') != CACHE_FORMAT_VERSION:
+            logger.info(f"Ignoring RST cache {self.cache_file} with an old format")
+            return
+        entries = cached.get('entries', {})
+        if cached.get('processor_version') != processor_version():
+            logger.info(f"Ignoring RST cache {self.cache_file} of other RST processing code")
+            self.stats.invalidated += len(entries)
+            return
+        if cached.get('info_version') != self.version:
+            # The texts of the references may have changed
+            self.stats.invalidated += len(entries)
+            return
+        self._stored = entries
+
+    def get(self, text: str, lang: str) -> Optional[str]:
+        """
+        Get the processed form of a text.
+
+        Args:
+            text: The RST text
+            lang: Language code
+
+        Returns:
+            The processed text, or None if it is not cached
+        """
+        key = (text, lang)
+        result = self._entries.get(key)
+        if result is None:
+            result = self._stored.get(key)
+            if result is None:
+                self.stats.misses += 1
+                return None
+            # Keep the stored entries used by this run
+            self._entries[key] = result
+        self.stats.hits += 1
+        return result
+
+    def put(self, text: str, lang: str, result: str) -> None:
+        """
+        Store the processed form of a text.
+
+        Args:
+            text: The RST text
+            lang: Language code
+            result: The processed text
+        """
+        self._entries[(text, lang)] = result
+        self._dirty = True
+        self.stats.writes += 1
+
+    def save(self) -> None:
+        """
+        Write the entries used by this run to disk if they have changed.
+
+        Failures are logged and otherwise ignored, since the cache is only an
+        optimization.
+        """
+        if self.cache_file is None:
+            return
+        if not self._dirty and len(self._entries) == len(self._stored):
+            return
+
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({'version': CACHE_FORMAT_VERSION, 'info_version': self.version,
+                             'processor_version': processor_version(), 'entries': self._entries},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+            self._stored = dict(self._entries)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write RST cache {self.cache_file}: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
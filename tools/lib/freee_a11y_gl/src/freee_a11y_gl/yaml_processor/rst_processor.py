@@ -6,61 +6,121 @@ including references, keyboard shortcuts, and text width formatting.
 """
 
 import re
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .rst_cache import RstCache
 
 # Regular expression patterns
 RST_REF_PATTERN = re.compile(r':ref:`([-a-z0-9]+)`')  # Match reference IDs
 RST_KBD_PATTERN = re.compile(r':kbd:`([^`]+)`')  # Match keyboard shortcuts
 
+# Character classes of normalize_text()
+FULLWIDTH_CHARS = '\u3000-\u303F\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF'
+HALFWIDTH_CHARS = '\u0000-\u007F\uFF61-\uFFDC\uFFE8-\uFFEE'
+# Whitespace excluding newlines and the fullwidth space (U+3000)
+SPACE_CHARS = ' \t\f\v\r\u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f'
 
-def normalize_text(text: str) -> str:
-    """Normalize whitespace and spacing between characters."""
-    # Define regexp for half and full width chars
-    fullwidth_chars = r'[\u3000-\u303F\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]'
-    halfwidth_chars = r'[\u0000-\u007F\uFF61-\uFFDC\uFFE8-\uFFEE]'
-
-    # Define whitespace pattern excluding newlines and fullwidth space (U+3000)
-    whitespace_no_newline = r'[ \t\f\v\r\u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f]+'
-
-    # Check if text contains bullet points before processing
-    has_bullets = bool(re.search(r'^[ \t]*[*\-+][ \t]+', text, re.MULTILINE))
+FULLWIDTH_PATTERN = re.compile(f'[{FULLWIDTH_CHARS}]')
+HALFWIDTH_PATTERN = re.compile(f'[{HALFWIDTH_CHARS}]')
+SPACE_RUN_PATTERN = re.compile(f'[{SPACE_CHARS}]+')
+# A bullet line and its indented continuation lines, left as they are
+BULLET_BLOCK_PATTERN = re.compile(r'^[ \t]*[*\-+][ \t]+.*(?:\n[ \t]+.*)*', re.MULTILINE)
 
-    # First, preserve bullet point patterns and their continuation lines
-    # This pattern matches bullet lines and any indented continuation lines
-    bullet_and_continuation_pattern = re.compile(r'^([ \t]*[*\-+][ \t]+.*(?:\n[ \t]+.*)*)', re.MULTILINE)
-    bullet_matches = []
+_is_fullwidth = FULLWIDTH_PATTERN.fullmatch
+_is_halfwidth = HALFWIDTH_PATTERN.fullmatch
 
-    def bullet_replacer(match):
-        bullet_matches.append(match.group(1))  # Store the complete bullet block with indentation
-        return f'__BULLET_PRESERVE_{len(bullet_matches)-1}__'
 
-    text = bullet_and_continuation_pattern.sub(bullet_replacer, text)
+def _normalize_spaces(text: str, parts: List[str]) -> None:
+    """Remove the spaces between fullwidth and other characters.
 
-    # Remove whitespaces (excluding newlines) between fullwidth chars
-    text = re.sub(rf'({fullwidth_chars}){whitespace_no_newline}({fullwidth_chars})', r'\1\2', text)
+    The spaces are removed in a single scan of the runs of spaces, with the
+    result of the three substitutions the normalizer used to apply one after
+    the other: a run of spaces is removed between two fullwidth characters,
+    then between a fullwidth and a halfwidth character, then between a
+    halfwidth and a fullwidth character. Each substitution consumed the
+    character after a run, so of two runs separated by a single fullwidth
+    character only the first is removed between fullwidth characters, and
+    the spaces are halfwidth characters themselves.
 
-    # Remove whitespaces (excluding newlines) between fullwidth and halfwidth chars
-    text = re.sub(rf'({fullwidth_chars}){whitespace_no_newline}({halfwidth_chars})', r'\1\2', text)
+    Args:
+        text: Text without bullet blocks
+        parts: List the pieces of the normalized text are appended to
+    """
+    pos = 0
+    # End of the previous run and whether it was removed between fullwidth
+    # characters, consuming the character after it
+    previous_end = -2
+    previous_consumed = False
+    for match in SPACE_RUN_PATTERN.finditer(text):
+        start, end = match.span()
+        before = text[start - 1] if start else ''
+        after = text[end] if end < len(text) else ''
+        fullwidth_before = bool(before) and _is_fullwidth(before) is not None
+        fullwidth_after = bool(after) and _is_fullwidth(after) is not None
+        consumed = previous_consumed and start == previous_end + 1
+        previous_end = end
+        previous_consumed = False
+        parts.append(text[pos:start])
+        pos = end
+
+        # Between fullwidth characters
+        if fullwidth_before and fullwidth_after and not consumed:
+            previous_consumed = True
+            continue
+
+        run = match.group()
+        # Between a fullwidth and a halfwidth character, where the halfwidth
+        # character may be the last halfwidth space of the run
+        if fullwidth_before:
+            if after and _is_halfwidth(after) is not None:
+                continue
+            for index in range(len(run) - 1, 0, -1):
+                if _is_halfwidth(run[index]) is not None:
+                    run = run[index:]
+                    break
+
+        # Between a halfwidth and a fullwidth character, where the halfwidth
+        # character may be the first halfwidth space of the run
+        if fullwidth_after:
+            if before and _is_halfwidth(before) is not None:
+                run = ''
+            else:
+                for index in range(len(run) - 1):
+                    if _is_halfwidth(run[index]) is not None:
+                        run = run[:index + 1]
+                        break
+        parts.append(run)
+    parts.append(text[pos:])
 
-    # Remove whitespaces (excluding newlines) between halfwidth and fullwidth chars
-    text = re.sub(rf'({halfwidth_chars}){whitespace_no_newline}({fullwidth_chars})', r'\1\2', text)
 
-    # Restore bullet point patterns with original indentation
-    for i, bullet_pattern_str in enumerate(bullet_matches):
-        text = text.replace(f'__BULLET_PRESERVE_{i}__', bullet_pattern_str)
+def normalize_text(text: str) -> str:
+    """Normalize whitespace and spacing between characters."""
+    if FULLWIDTH_PATTERN.search(text) is None:
+        # Spaces are only removed next to fullwidth characters
+        if BULLET_BLOCK_PATTERN.search(text):
+            return text.rstrip()
+        return text.strip()
+
+    parts: List[str] = []
+    pos = 0
+    for match in BULLET_BLOCK_PATTERN.finditer(text):
+        _normalize_spaces(text[pos:match.start()], parts)
+        # Preserve bullet points and their continuation lines
+        parts.append(match.group())
+        pos = match.end()
+    _normalize_spaces(text[pos:], parts)
 
     # Remove leading and trailing whitespaces, but preserve bullet indentation
-    if has_bullets:
+    if pos:
         # For text with bullets, only strip trailing whitespace
-        text = text.rstrip()
-    else:
-        # For regular text, strip both leading and trailing whitespace
-        text = text.strip()
-
-    return text
+        return ''.join(parts).rstrip()
+    # For regular text, strip both leading and trailing whitespace
+    return ''.join(parts).strip()
 
 
-def process_rst_text(text: str, info: Dict[str, Any], lang: str) -> str:
+def process_rst_text(text: str, info: Dict[str, Any], lang: str,
+                     cache: Optional['RstCache'] = None) -> str:
     """
     Process RST markup text by replacing references and keyboard shortcuts.
 
@@ -68,10 +128,18 @@ def process_rst_text(text: str, info: Dict[str, Any], lang: str) -> str:
         text: The RST text to process
         info: Dictionary containing reference information
         lang: Language code (e.g. 'en', 'ja')
+        cache: Cache of processed texts built with the same info (optional)
 
     Returns:
         Processed text with RST markup replaced
     """
+    if cache is not None:
+        result = cache.get(text, lang)
+        if result is None:
+            result = process_rst_text(text, info, lang)
+            cache.put(text, lang, result)
+        return result
+
     def ref_replace(match):
         """Replace reference with its text."""
         ref_id = match.group(1)
@@ -91,13 +159,15 @@ def process_rst_text(text: str, info: Dict[str, Any], lang: str) -> str:
     return text
 
 
-def process_rst_condition(condition: Dict[str, Any], info: Dict[str, Any]) -> Dict[str, Any]:
+def process_rst_condition(condition: Dict[str, Any], info: Dict[str, Any],
+                          cache: Optional['RstCache'] = None) -> Dict[str, Any]:
     """
     Process RST markup in condition data.
 
     Args:
         condition: Dictionary containing condition data
         info: Dictionary containing reference information
+        cache: Cache of processed texts built with the same info (optional)
 
     Returns:
         Processed condition with RST markup replaced
@@ -108,13 +178,14 @@ def process_rst_condition(condition: Dict[str, Any], info: Dict[str, Any]) -> Di
                 condition['procedure']['procedure'][lang] = process_rst_text(
                     condition['procedure']['procedure'][lang],
                     info,
-                    lang
+                    lang,
+                    cache
                 )
         return condition
 
     # Process nested conditions recursively
     condition['conditions'] = [
-        process_rst_condition(cond, info)
+        process_rst_condition(cond, info, cache)
         for cond in condition['conditions']
     ]
     return condition
@@ -4,11 +4,26 @@ YAML validation module for accessibility guidelines.
 This module provides validation functionality for YAML files using JSON Schema.
 """
 
+import hashlib
 import json
 import os
 import sys
-from typing import Dict, Any, Literal
-from jsonschema import Draft202012Validator, RefResolver
+from typing import Dict, Any, Callable, List, Literal, Optional
+from jsonschema import Draft202012Validator
+
+try:
+    # jsonschema >= 4.18 resolves references through a referencing.Registry
+    from referencing import Registry, Resource
+    from referencing.jsonschema import DRAFT202012
+except ImportError:
+    Registry = None
+    from jsonschema import RefResolver
+
+try:
+    # Optional code-generating backend
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 
 class ValidationError(Exception):
@@ -17,30 +32,66 @@ class ValidationError(Exception):
 
 
 ValidationMode = Literal["strict", "warning", "disabled"]
+ValidationBackend = Literal["jsonschema", "codegen"]
+
+# Schemas expected in the schema directory; any other *.json file there is
+# loaded as well, so that it can be referenced from these schemas.
+SCHEMA_FILES = ['check.json', 'guideline.json', 'faq.json', 'common.json']
 
 
 class YamlValidator:
-    """Validator for YAML files using JSON Schema definitions"""
+    """Validator for YAML files using JSON Schema definitions
 
-    def __init__(self, schema_dir: str, validation_mode: ValidationMode = "strict"):
+    Each schema is compiled into a validator once, on first use, and reused
+    for all files. References between schemas are resolved from the schemas
+    loaded from the schema directory, never over the network.
+    """
+
+    def __init__(self, schema_dir: str, validation_mode: ValidationMode = "strict",
+                 backend: ValidationBackend = "jsonschema"):
         """
         Initialize the validator with schema directory.
 
         Args:
             schema_dir: Directory containing JSON schema files
             validation_mode: Validation mode ("strict", "warning", or "disabled")
+            backend: Validation backend. "jsonschema" validates with the
+                    jsonschema package. "codegen" compiles schemas into Python
+                    functions with fastjsonschema and falls back to jsonschema
+                    to report the errors of invalid files. If fastjsonschema is
+                    not installed, "jsonschema" is used.
         """
         self.schema_dir = schema_dir
         self.validation_mode = validation_mode
+        if backend == "codegen" and fastjsonschema is None:
+            print("Warning: fastjsonschema is not installed, using jsonschema for YAML validation",
+                  file=sys.stderr)
+            backend = "jsonschema"
+        self.backend = backend
         self.schemas: Dict[str, Dict[str, Any]] = {}
-        self.resolvers: Dict[str, RefResolver] = {}
+        self.resolvers: Dict[str, Any] = {}
+        self.validators: Dict[str, Draft202012Validator] = {}
+        self.compiled: Dict[str, Optional[Callable[[Any], Any]]] = {}
+        self.registry = None
+        self._store: Dict[str, Dict[str, Any]] = {}
+        self._schemas_digest: Optional[str] = None
         self._load_schemas()
 
+    def _schema_files(self) -> List[str]:
+        """Get the names of all schema files to load"""
+        schema_files = list(SCHEMA_FILES)
+        if os.path.isdir(self.schema_dir):
+            schema_files += sorted(
+                f for f in os.listdir(self.schema_dir)
+                if f.endswith('.json') and f not in SCHEMA_FILES
+            )
+        return schema_files
+
     def _load_schemas(self):
-        """Load all schema files and create resolvers"""
-        schema_files = ['check.json', 'guideline.json', 'faq.json', 'common.json']
+        """Load all schema files and preload them for $ref resolution"""
+        base_uri = f"file://{os.path.abspath(self.schema_dir)}/"
 
-        for schema_file in schema_files:
+        for schema_file in self._schema_files():
             schema_path = os.path.join(self.schema_dir, schema_file)
             try:
                 with open(schema_path, 'r', encoding='utf-8') as f:
@@ -48,15 +99,79 @@ class YamlValidator:
                     schema_name = schema_file.replace('.json', '')
                     self.schemas[schema_name] = schema
 
-                    # Create resolver for $ref resolution
-                    base_uri = f"file://{os.path.abspath(self.schema_dir)}/"
-                    self.resolvers[schema_name] = RefResolver(base_uri, schema)
+                    # Schemas are referenced by their $id, or by their file
+                    # location if they have none
+                    file_uri = base_uri + schema_file
+                    self._store[file_uri] = schema
+                    if isinstance(schema, dict) and isinstance(schema.get('$id'), str):
+                        self._store[schema['$id'].rstrip('#')] = schema
             except FileNotFoundError:
                 print(f"Warning: Schema file {schema_path} not found", file=sys.stderr)
             except json.JSONDecodeError as e:
                 print(f"Error: Invalid JSON in schema file {schema_path}: {e}", file=sys.stderr)
                 sys.exit(1)
 
+        if Registry is not None:
+            self.registry = Registry().with_resources(
+                (uri, Resource.from_contents(schema, default_specification=DRAFT202012))
+                for uri, schema in self._store.items()
+            )
+        else:
+            for schema_name, schema in self.schemas.items():
+                self.resolvers[schema_name] = RefResolver(
+                    self._base_uri_of(schema_name), schema, store=dict(self._store)
+                )
+
+    def _base_uri_of(self, schema_name: str) -> str:
+        """Get the URI relative references in a schema are resolved against"""
+        schema = self.schemas[schema_name]
+        if isinstance(schema, dict) and isinstance(schema.get('$id'), str):
+            return schema['$id']
+        return f"file://{os.path.abspath(self.schema_dir)}/{schema_name}.json"
+
+    def get_validator(self, schema_name: str) -> Draft202012Validator:
+        """
+        Get the compiled validator of a schema.
+
+        Args:
+            schema_name: Name of the schema
+
+        Returns:
+            Draft202012Validator reused for every file validated against the schema
+        """
+        validator = self.validators.get(schema_name)
+        if validator is None:
+            schema = self.schemas[schema_name]
+            if self.registry is not None:
+                if '$id' not in schema:
+                    schema = dict(schema, **{'$id': self._base_uri_of(schema_name)})
+                validator = Draft202012Validator(schema, registry=self.registry)
+            else:
+                validator = Draft202012Validator(schema, resolver=self.resolvers[schema_name])
+            self.validators[schema_name] = validator
+        return validator
+
+    def _get_compiled(self, schema_name: str) -> Optional[Callable[[Any], Any]]:
+        """Get the schema compiled into a Python function by fastjsonschema"""
+        if schema_name not in self.compiled:
+            def resolve(uri: str) -> Dict[str, Any]:
+                return self._store[uri.split('#')[0]]
+
+            schema = self.schemas[schema_name]
+            if '$id' not in schema:
+                schema = dict(schema, **{'$id': self._base_uri_of(schema_name)})
+            try:
+                self.compiled[schema_name] = fastjsonschema.compile(
+                    schema,
+                    handlers={'https': resolve, 'http': resolve, 'file': resolve},
+                    use_default=False,
+                )
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                print(f"Warning: Schema '{schema_name}' cannot be compiled, using jsonschema: {e}",
+                      file=sys.stderr)
+                self.compiled[schema_name] = None
+        return self.compiled[schema_name]
+
     def validate_yaml_data(self, data: Dict[str, Any], schema_name: str, file_path: str):
         """
         Validate YAML data against specified schema.
@@ -72,13 +187,16 @@ class YamlValidator:
         if schema_name not in self.schemas:
             raise ValidationError(f"Schema '{schema_name}' not found")
 
-        schema = self.schemas[schema_name]
-        resolver = self.resolvers[schema_name]
-
-        # Create validator with resolver for $ref support
-        validator = Draft202012Validator(schema, resolver=resolver)
+        compiled = self._get_compiled(schema_name) if self.backend == "codegen" else None
+        if compiled is not None:
+            try:
+                compiled(data)
+                return
+            except fastjsonschema.JsonSchemaException:
+                # Collect all errors with jsonschema for a complete report
+                pass
 
-        errors = list(validator.iter_errors(data))
+        errors = list(self.get_validator(schema_name).iter_errors(data))
         if errors:
             error_messages = []
             for error in errors:
@@ -113,16 +231,49 @@ class YamlValidator:
             self.validate_yaml_data(data, schema_name, file_path)
             return True
         except ValidationError as e:
-            if self.validation_mode == "strict":
-                # Re-raise the error to maintain strict behavior
-                raise
-            elif self.validation_mode == "warning":
-                # Log warning and continue processing
-                print(f"YAML Validation Warning: {e}", file=sys.stderr)
-                return False
+            return self.handle_validation_error(e)
+
+    def handle_validation_error(self, error: ValidationError) -> bool:
+        """
+        Handle a validation error according to the configured validation mode.
+
+        Args:
+            error: Validation error raised by validate_yaml_data
+
+        Returns:
+            False if the error was reported as a warning, True if validation is disabled
+
+        Raises:
+            ValidationError: If validation mode is strict
+        """
+        if self.validation_mode == "strict":
+            # Re-raise the error to maintain strict behavior
+            raise error
+        elif self.validation_mode == "warning":
+            # Log warning and continue processing
+            print(f"YAML Validation Warning: {error}", file=sys.stderr)
+            return False
 
         return True
 
+    def get_fingerprint(self, schema_name: str) -> str:
+        """
+        Get a key identifying the schema used to validate data.
+
+        The key changes whenever any of the loaded schema files changes, since
+        schemas may refer to each other.
+
+        Args:
+            schema_name: Name of the schema
+
+        Returns:
+            String of the schema name and a hash of all loaded schemas
+        """
+        if self._schemas_digest is None:
+            content = json.dumps(self.schemas, sort_keys=True, ensure_ascii=False)
+            self._schemas_digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return f"{schema_name}:{self._schemas_digest}"
+
     def get_available_schemas(self):
         """
         Get list of available schema names.
@@ -0,0 +1,192 @@
+"""
+Tests for the axe-core snapshot cache.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from freee_a11y_gl.axe_snapshot import (
+    AxeSnapshot,
+    get_submodule_hexsha,
+    load_snapshot,
+    save_snapshot,
+    snapshot_source,
+    SNAPSHOT_FILE_NAME
+)
+from freee_a11y_gl.config import Config
+from freee_a11y_gl.initializer import process_axe_rules
+from freee_a11y_gl.models.axe import AxeRule
+
+GIT = ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com',
+       '-c', 'protocol.file.allow=always', '-c', 'init.defaultBranch=main']
+
+
+def git(cwd, *args):
+    """Run a git command and return its output."""
+    return subprocess.run(GIT + list(args), cwd=cwd, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def rule(rule_id):
+    return {
+        "id": rule_id,
+        "metadata": {"help": f"{rule_id} help", "description": f"{rule_id} description"},
+        "tags": ["cat.text-alternatives", "best-practice"]
+    }
+
+
+class TestAxeSnapshot(unittest.TestCase):
+    """Test cases for the axe-core snapshot cache with a real submodule"""
+
+    def setUp(self):
+        """Create a repository with an axe-core submodule"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.axe_src = os.path.join(self.temp_dir, 'axe-core')
+        self.basedir = os.path.join(self.temp_dir, 'guidelines')
+        self.cache_dir = os.path.join(self.basedir, 'build', '.a11y_gl_cache')
+        self.axe_core_config = Config.get_axe_core_config()
+
+        os.makedirs(self.axe_src)
+        git(self.axe_src, 'init', '-q')
+        write_json(os.path.join(self.axe_src, 'lib', 'rules', 'image-alt.json'), rule('image-alt'))
+        write_json(os.path.join(self.axe_src, 'lib', 'rules', 'label.json'), rule('label'))
+        write_json(os.path.join(self.axe_src, 'locales', 'ja.json'), {
+            "rules": {"label": {"help": "ラベル", "description": "ラベルの説明"}}
+        })
+        write_json(os.path.join(self.axe_src, 'package.json'), {"version": "4.9.1"})
+        git(self.axe_src, 'add', '-A')
+        git(self.axe_src, 'commit', '-q', '-m', 'Initial rules')
+
+        os.makedirs(self.basedir)
+        git(self.basedir, 'init', '-q')
+        git(self.basedir, 'submodule', 'add', '-q', self.axe_src, 'vendor/axe-core')
+        git(self.basedir, 'commit', '-q', '-m', 'Add axe-core')
+
+        AxeRule._instances.clear()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        AxeRule._instances.clear()
+        shutil.rmtree(self.temp_dir)
+
+    def _bump_submodule(self):
+        """Add a rule to axe-core and move the submodule to the new commit."""
+        write_json(os.path.join(self.axe_src, 'lib', 'rules', 'region.json'), rule('region'))
+        write_json(os.path.join(self.axe_src, 'package.json'), {"version": "4.10.0"})
+        git(self.axe_src, 'add', '-A')
+        git(self.axe_src, 'commit', '-q', '-m', 'Add region')
+        submodule = os.path.join(self.basedir, 'vendor', 'axe-core')
+        git(submodule, 'pull', '-q', 'origin', 'HEAD')
+        git(self.basedir, 'commit', '-q', '-am', 'Bump axe-core')
+
+    def test_get_submodule_hexsha(self):
+        """Test that the SHA matches the submodule commit recorded in HEAD"""
+        import git as gitpython
+        expected = gitpython.Repo(self.basedir).submodules[0].hexsha
+        self.assertEqual(get_submodule_hexsha(self.basedir, 'vendor/axe-core'), expected)
+
+    def test_get_submodule_hexsha_unknown_path(self):
+        """Test that an unknown submodule path yields None"""
+        self.assertIsNone(get_submodule_hexsha(self.basedir, 'vendor/unknown'))
+        self.assertIsNone(get_submodule_hexsha(self.temp_dir, 'vendor/axe-core'))
+
+    def test_cold_start_writes_snapshot(self):
+        """Test that reading from git stores a snapshot"""
+        process_axe_rules(self.basedir, self.axe_core_config, self.cache_dir)
+
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, SNAPSHOT_FILE_NAME)))
+        self.assertEqual(sorted(AxeRule._instances), ['image-alt', 'label'])
+        self.assertEqual(AxeRule.version, '4.9.1')
+        self.assertEqual(AxeRule.major_version, '4.9')
+
+    def test_warm_start_skips_git_objects(self):
+        """Test that a cached snapshot is used without reading the submodule objects"""
+        process_axe_rules(self.basedir, self.axe_core_config, self.cache_dir)
+        expected = {rule_id: r.template_data('ja') for rule_id, r in AxeRule._instances.items()}
+        expected_timestamp = AxeRule.timestamp
+        AxeRule._instances.clear()
+
+        with patch('freee_a11y_gl.initializer.GitBlobReader', side_effect=AssertionError("git objects read")):
+            process_axe_rules(self.basedir, self.axe_core_config, self.cache_dir)
+
+        actual = {rule_id: r.template_data('ja') for rule_id, r in AxeRule._instances.items()}
+        self.assertEqual(actual, expected)
+        self.assertEqual(AxeRule.timestamp, expected_timestamp)
+        self.assertTrue(AxeRule._instances['label'].translated)
+
+    def test_submodule_bump_invalidates_snapshot(self):
+        """Test that moving the submodule to another commit reads from git again"""
+        process_axe_rules(self.basedir, self.axe_core_config, self.cache_dir)
+        self._bump_submodule()
+        AxeRule._instances.clear()
+
+        process_axe_rules(self.basedir, self.axe_core_config, self.cache_dir)
+
+        self.assertEqual(sorted(AxeRule._instances), ['image-alt', 'label', 'region'])
+        self.assertEqual(AxeRule.version, '4.10.0')
+
+    def test_without_cache_dir(self):
+        """Test that no snapshot is written without a cache directory"""
+        process_axe_rules(self.basedir, self.axe_core_config)
+
+        self.assertFalse(os.path.exists(self.cache_dir))
+        self.assertEqual(len(AxeRule._instances), 2)
+
+
+class TestSnapshotFile(unittest.TestCase):
+    """Test cases for loading and saving snapshot files"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.axe_core_config = Config.get_axe_core_config()
+        self.snapshot = AxeSnapshot(
+            hexsha='abc123',
+            rules=[rule('label')],
+            messages_ja={"rules": {}},
+            version='4.9.1',
+            authored_date=1700000000,
+            source=snapshot_source(self.axe_core_config)
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.cache_dir)
+
+    def test_round_trip(self):
+        """Test that a saved snapshot is loaded for the same SHA"""
+        save_snapshot(self.cache_dir, self.snapshot)
+        self.assertEqual(load_snapshot(self.cache_dir, 'abc123', self.axe_core_config), self.snapshot)
+
+    def test_other_sha(self):
+        """Test that a snapshot of another commit is not used"""
+        save_snapshot(self.cache_dir, self.snapshot)
+        self.assertIsNone(load_snapshot(self.cache_dir, 'def456', self.axe_core_config))
+
+    def test_changed_config(self):
+        """Test that a snapshot read with other file locations is not used"""
+        save_snapshot(self.cache_dir, self.snapshot)
+        config = dict(self.axe_core_config, rules_dir='lib/other-rules')
+        self.assertIsNone(load_snapshot(self.cache_dir, 'abc123', config))
+
+    def test_missing_or_corrupt_file(self):
+        """Test that missing and unreadable snapshots are ignored"""
+        self.assertIsNone(load_snapshot(self.cache_dir, 'abc123', self.axe_core_config))
+        with open(os.path.join(self.cache_dir, SNAPSHOT_FILE_NAME), 'wb') as f:
+            f.write(b'not a pickle')
+        self.assertIsNone(load_snapshot(self.cache_dir, 'abc123', self.axe_core_config))
+
+
+if __name__ == '__main__':
+    unittest.main()
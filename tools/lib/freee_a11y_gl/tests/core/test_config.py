@@ -4,7 +4,7 @@ from freee_a11y_gl.config import Config
 from freee_a11y_gl.message_catalog import MessageCatalog
 
 # Test data for mocking valid configuration
-from freee_a11y_gl.settings import settings
+from freee_a11y_gl.settings_manager import settings
 MOCK_CONFIG_DATA = {
     "check_tools": {
         "names": {
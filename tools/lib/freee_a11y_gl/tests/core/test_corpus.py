@@ -0,0 +1,173 @@
+"""
+Tests for isolated corpora of instances and relationships.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+import yaml
+
+from freee_a11y_gl import yaml_loader
+from freee_a11y_gl.corpus import Corpus, get_active_corpus, get_default_corpus
+from freee_a11y_gl.initializer import clear_instances
+from freee_a11y_gl.models.axe import AxeRule
+from freee_a11y_gl.models.check import Check
+from freee_a11y_gl.models.content import Guideline
+from freee_a11y_gl.relationship_manager import RelationshipManager
+
+# Root of the a11y-guidelines repository, containing data/yaml and data/json
+REPO_ROOT = Path(__file__).resolve().parents[5]
+
+
+class TestCorpusActivation(unittest.TestCase):
+    """Test installing corpora in the model classes"""
+
+    def setUp(self):
+        """Start from an empty default corpus"""
+        clear_instances()
+
+    def tearDown(self):
+        """Clean up the default corpus"""
+        clear_instances()
+
+    def test_default_corpus_is_active(self):
+        """Test that the default corpus is active outside of any activation"""
+        self.assertIs(get_active_corpus(), get_default_corpus())
+        self.assertTrue(get_default_corpus().is_active)
+
+    def test_activation_isolates_registries(self):
+        """Test that registries and relationships are switched and restored"""
+        Check._instances['default'] = 'default check'
+        default_rel = RelationshipManager()
+        AxeRule.version = '4.0.0'
+        corpus = Corpus()
+
+        with corpus.activate() as active:
+            self.assertIs(active, corpus)
+            self.assertIs(get_active_corpus(), corpus)
+            self.assertEqual(Check._instances, {})
+            self.assertIsNone(AxeRule.version)
+            self.assertIsNot(RelationshipManager(), default_rel)
+            Check._instances['other'] = 'other check'
+            AxeRule.version = '4.8.0'
+            corpus_rel = RelationshipManager()
+
+        self.assertIs(get_active_corpus(), get_default_corpus())
+        self.assertEqual(Check._instances, {'default': 'default check'})
+        self.assertEqual(AxeRule.version, '4.0.0')
+        self.assertIs(RelationshipManager(), default_rel)
+
+        self.assertEqual(corpus.get_by_id(Check, 'other'), 'other check')
+        self.assertIs(corpus.relationship_manager, corpus_rel)
+        with corpus.activate():
+            self.assertEqual(AxeRule.version, '4.8.0')
+        AxeRule.version = None
+
+    def test_nested_activation(self):
+        """Test that leaving a nested activation restores the outer corpus"""
+        outer = Corpus()
+        inner = Corpus()
+        with outer.activate():
+            Check._instances['outer'] = 'outer check'
+            with inner.activate():
+                self.assertEqual(Check._instances, {})
+                with inner.activate():
+                    self.assertIs(get_active_corpus(), inner)
+                self.assertIs(get_active_corpus(), inner)
+            self.assertEqual(Check._instances, {'outer': 'outer check'})
+        self.assertEqual(Check._instances, {})
+
+    def test_clear_instances_clears_active_corpus(self):
+        """Test that clear_instances() leaves inactive corpora unchanged"""
+        corpus = Corpus()
+        with corpus.activate():
+            Check._instances['kept'] = 'kept check'
+        Check._instances['cleared'] = 'cleared check'
+
+        clear_instances()
+
+        self.assertEqual(Check._instances, {})
+        self.assertEqual(corpus.get_by_id(Check, 'kept'), 'kept check')
+        corpus.clear()
+        self.assertIsNone(corpus.get_by_id(Check, 'kept'))
+
+    def test_activation_restored_on_error(self):
+        """Test that the previous corpus is installed again after an exception"""
+        with self.assertRaises(RuntimeError):
+            with Corpus().activate():
+                raise RuntimeError('failed')
+        self.assertIs(get_active_corpus(), get_default_corpus())
+
+
+@pytest.mark.skipif(not (REPO_ROOT / 'data' / 'yaml').is_dir(), reason="data corpus not available")
+class TestCorpusLoading(unittest.TestCase):
+    """Test loading two data sets side by side"""
+
+    def setUp(self):
+        """Create two copies of the data corpus with different check texts"""
+        clear_instances()
+        self.temp_dirs = []
+        for text in ('バージョン1', 'バージョン2'):
+            temp_dir = tempfile.mkdtemp()
+            shutil.copytree(REPO_ROOT / 'data', os.path.join(temp_dir, 'data'))
+            self.write_check_text(temp_dir, text)
+            self.temp_dirs.append(temp_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        clear_instances()
+        for temp_dir in self.temp_dirs:
+            shutil.rmtree(temp_dir)
+
+    def check_path(self, basedir):
+        return os.path.join(basedir, 'data', 'yaml', 'checks', 'design', '0001.yaml')
+
+    def write_check_text(self, basedir, text):
+        path = self.check_path(basedir)
+        with open(path, encoding='utf-8') as f:
+            data = yaml_loader.safe_load(f)
+        data['check']['ja'] = text
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
+
+    def test_load_side_by_side(self):
+        """Test that each corpus keeps its own instances and relationships"""
+        v1 = Corpus.load(self.temp_dirs[0], use_cache=False)
+        v2 = Corpus.load(self.temp_dirs[1], use_cache=False)
+
+        self.assertEqual(Check._instances, {})
+        self.assertFalse(v1.is_active)
+        check1 = v1.get_by_id(Check, '0001')
+        check2 = v2.get_by_id(Check, '0001')
+        self.assertEqual(check1.check_text['ja'], 'バージョン1')
+        self.assertEqual(check2.check_text['ja'], 'バージョン2')
+
+        with v1.activate():
+            guidelines = RelationshipManager().get_related_objects(check1, 'guideline')
+            self.assertTrue(guidelines)
+            self.assertTrue(all(Guideline.get_by_id(gl.id) is gl for gl in guidelines))
+            self.assertEqual(check1.template_data('ja')['check'], 'バージョン1')
+            count = len(Guideline._instances)
+        with v2.activate():
+            self.assertEqual(len(Guideline._instances), count)
+            self.assertTrue(all(Guideline.get_by_id(gl.id) is not gl for gl in guidelines))
+
+    def test_reload(self):
+        """Test that reloading changed files only updates the given corpus"""
+        v1 = Corpus.load(self.temp_dirs[0], use_cache=False)
+        v2 = Corpus.load(self.temp_dirs[1], use_cache=False)
+        self.write_check_text(self.temp_dirs[0], '変更後')
+
+        result = v1.reload([self.check_path(self.temp_dirs[0])])
+
+        self.assertEqual([obj.id for obj in result.updated], ['0001'])
+        self.assertEqual(v1.get_by_id(Check, '0001').check_text['ja'], '変更後')
+        self.assertEqual(v2.get_by_id(Check, '0001').check_text['ja'], 'バージョン2')
+
+
+if __name__ == '__main__':
+    unittest.main()
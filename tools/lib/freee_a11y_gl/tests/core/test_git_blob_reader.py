@@ -0,0 +1,170 @@
+"""
+Tests for the bulk Git blob reader.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from freee_a11y_gl.config import Config
+from freee_a11y_gl.git_blob_reader import GitBlobReader
+from freee_a11y_gl.initializer import read_axe_snapshot
+from .test_axe_snapshot import git, rule, write_json
+
+
+def read_axe_snapshot_gitpython(basedir, axe_core_config):
+    """Read the axe-core data blob by blob with GitPython, as done before GitBlobReader."""
+    import git as gitpython
+    root_repo = gitpython.Repo(basedir)
+    submodule = [sm for sm in root_repo.submodules if sm.name == axe_core_config['submodule_name']][0]
+    axe_commit = gitpython.Repo(os.path.join(basedir, axe_core_config['base_dir'])).commit(submodule.hexsha)
+
+    msg_ja_path = os.path.join(axe_core_config['locale_dir'], axe_core_config['locale_ja_file'])
+    messages_ja = json.loads((axe_commit.tree / msg_ja_path).data_stream.read().decode('utf-8'))
+    tree = axe_commit.tree / axe_core_config['rules_dir']
+    rules = [json.loads(item.data_stream.read().decode('utf-8'))
+             for item in tree.traverse() if item.type == 'blob' and item.path.endswith('.json')]
+    pkg = json.loads((axe_commit.tree / axe_core_config['pkg_file']).data_stream.read().decode('utf-8'))
+    return rules, messages_ja, pkg['version'], axe_commit.authored_date
+
+
+def create_axe_repositories(temp_dir, rule_count):
+    """Create a repository with an axe-core submodule containing rule_count rules."""
+    axe_src = os.path.join(temp_dir, 'axe-core')
+    basedir = os.path.join(temp_dir, 'guidelines')
+    os.makedirs(axe_src)
+    git(axe_src, 'init', '-q')
+    for i in range(rule_count):
+        write_json(os.path.join(axe_src, 'lib', 'rules', f'rule-{i:03d}.json'), rule(f'rule-{i:03d}'))
+    write_json(os.path.join(axe_src, 'lib', 'rules', 'nested', 'nested-rule.json'), rule('nested-rule'))
+    with open(os.path.join(axe_src, 'lib', 'rules', 'README.md'), 'w') as f:
+        f.write('not a rule\n')
+    write_json(os.path.join(axe_src, 'locales', 'ja.json'), {"rules": {}})
+    write_json(os.path.join(axe_src, 'package.json'), {"version": "4.9.1"})
+    git(axe_src, 'add', '-A')
+    git(axe_src, 'commit', '-q', '-m', 'Initial rules')
+
+    os.makedirs(basedir)
+    git(basedir, 'init', '-q')
+    git(basedir, 'submodule', 'add', '-q', axe_src, 'vendor/axe-core')
+    git(basedir, 'commit', '-q', '-m', 'Add axe-core')
+    return axe_src, basedir
+
+
+class TestGitBlobReader(unittest.TestCase):
+    """Test cases for GitBlobReader"""
+
+    def setUp(self):
+        """Create a repository with a few files"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.axe_src, self.basedir = create_axe_repositories(self.temp_dir, 3)
+        self.commit = git(self.axe_src, 'rev-parse', 'HEAD')
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_list_tree(self):
+        """Test that directories are listed recursively, breadth-first, and filtered by suffix"""
+        expected = git(self.axe_src, 'ls-tree', '-r', self.commit, '--', 'lib/rules').splitlines()
+        expected = {line.split('\t')[1]: line.split()[2] for line in expected}
+
+        with GitBlobReader(self.axe_src) as reader:
+            files = reader.list_tree(self.commit, 'lib/rules', '.json')
+            self.assertEqual(list(files), [
+                'lib/rules/rule-000.json',
+                'lib/rules/rule-001.json',
+                'lib/rules/rule-002.json',
+                'lib/rules/nested/nested-rule.json'
+            ])
+            self.assertEqual(files, {path: expected[path] for path in files})
+            self.assertEqual(reader.list_tree(self.commit, 'lib/rules/'), expected)
+
+    def test_list_tree_errors(self):
+        """Test that unknown commits and non-directories raise ValueError"""
+        with GitBlobReader(self.axe_src) as reader:
+            with self.assertRaises(ValueError):
+                reader.list_tree('0' * 40, 'lib/rules')
+            with self.assertRaises(ValueError):
+                reader.list_tree(self.commit, 'package.json')
+
+    def test_read_tree(self):
+        """Test that all files of a directory are read"""
+        with GitBlobReader(self.axe_src) as reader:
+            files = reader.read_tree(self.commit, 'lib/rules', '.json')
+
+        self.assertEqual(len(files), 4)
+        self.assertEqual(json.loads(files['lib/rules/nested/nested-rule.json']), rule('nested-rule'))
+
+    def test_read_files(self):
+        """Test that files are returned as a mapping of path to contents"""
+        with GitBlobReader(self.axe_src) as reader:
+            files = reader.read_files(self.commit, ['package.json', 'lib/rules/README.md'])
+
+        self.assertEqual(list(files), ['package.json', 'lib/rules/README.md'])
+        self.assertEqual(json.loads(files['package.json']), {"version": "4.9.1"})
+        self.assertEqual(files['lib/rules/README.md'], b'not a rule\n')
+
+    def test_process_is_reused(self):
+        """Test that consecutive reads share one cat-file process"""
+        with GitBlobReader(self.axe_src) as reader:
+            reader.read_files(self.commit, ['package.json'])
+            process = reader._process
+            reader.read_files(self.commit, ['locales/ja.json'])
+            self.assertIs(reader._process, process)
+        self.assertIsNone(reader._process)
+        self.assertIsNotNone(process.returncode)
+
+    def test_missing_file(self):
+        """Test that a missing file raises ValueError and the reader stays usable"""
+        with GitBlobReader(self.axe_src) as reader:
+            with self.assertRaises(ValueError):
+                reader.read_files(self.commit, ['package.json', 'missing.json'])
+            self.assertIn('package.json', reader.read_files(self.commit, ['package.json']))
+
+    def test_large_batch(self):
+        """Test that responses larger than the pipe buffer are read completely"""
+        content = 'x' * (256 * 1024)
+        with open(os.path.join(self.axe_src, 'large.txt'), 'w') as f:
+            f.write(content)
+        git(self.axe_src, 'add', '-A')
+        git(self.axe_src, 'commit', '-q', '-m', 'Add a large file')
+        commit = git(self.axe_src, 'rev-parse', 'HEAD')
+
+        with GitBlobReader(self.axe_src) as reader:
+            objects = reader.read_objects([f'{commit}:large.txt'] * 3 + [f'{commit}:package.json'])
+
+        self.assertEqual(objects[f'{commit}:large.txt'].decode('utf-8'), content)
+        self.assertEqual(json.loads(objects[f'{commit}:package.json']), {"version": "4.9.1"})
+
+    def test_authored_date(self):
+        """Test that the author time matches the commit"""
+        expected = int(git(self.axe_src, 'log', '-1', '--format=%at'))
+        with GitBlobReader(self.axe_src) as reader:
+            self.assertEqual(reader.authored_date(self.commit), expected)
+
+    def test_read_tree_matches_gitpython(self):
+        """Test that the blobs read are the ones read with GitPython"""
+        import git as gitpython
+        tree = gitpython.Repo(self.axe_src).commit(self.commit).tree / 'lib/rules'
+        expected = {item.path: item.data_stream.read() for item in tree.traverse() if item.type == 'blob'}
+
+        with GitBlobReader(self.axe_src) as reader:
+            self.assertEqual(reader.read_tree(self.commit, 'lib/rules'), expected)
+
+    def test_read_axe_snapshot_matches_gitpython(self):
+        """Test that the snapshot has the same content as when read with GitPython"""
+        axe_core_config = Config.get_axe_core_config()
+        snapshot = read_axe_snapshot(self.basedir, axe_core_config)
+        rules, messages_ja, version, authored_date = read_axe_snapshot_gitpython(self.basedir, axe_core_config)
+
+        self.assertEqual(snapshot.rules, rules)
+        self.assertEqual(snapshot.messages_ja, messages_ja)
+        self.assertEqual(snapshot.version, version)
+        self.assertEqual(snapshot.authored_date, authored_date)
+
+
+if __name__ == '__main__':
+    unittest.main()
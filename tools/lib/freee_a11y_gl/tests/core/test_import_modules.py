@@ -0,0 +1,89 @@
+"""
+Tests for the modules loaded by importing the package.
+"""
+
+import subprocess
+import sys
+import unittest
+
+# Modules which must only be imported when the exports using them are used
+HEAVY_MODULES = ['pydantic', 'yaml', 'jsonschema', 'git',
+                 'freee_a11y_gl.settings_manager', 'freee_a11y_gl.yaml_validator',
+                 'freee_a11y_gl.models', 'freee_a11y_gl.yaml_processor']
+
+# Submodules which the command line tools import before parsing the arguments
+CLI_SUBMODULES = ['freee_a11y_gl.tracing', 'freee_a11y_gl.memory_profile']
+
+
+def loaded_modules(statement):
+    """Run a statement in a new interpreter and get the modules it loaded.
+
+    Returns:
+        Set of the names of the modules in sys.modules after the statement
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', f'{statement}\nimport sys\nprint("\\n".join(sys.modules))'],
+        capture_output=True, text=True, check=True)
+    return set(result.stdout.splitlines())
+
+
+def package_modules(modules):
+    """Get the modules of the package among the loaded modules."""
+    return sorted(name for name in modules
+                  if name == 'freee_a11y_gl' or name.startswith('freee_a11y_gl.'))
+
+
+class TestImportModules(unittest.TestCase):
+    """Test that importing the package does not load heavy dependencies"""
+
+    def test_package_import(self):
+        """Test that importing the package loads nothing else of the package"""
+        modules = loaded_modules('import freee_a11y_gl')
+        self.assertEqual([name for name in HEAVY_MODULES if name in modules], [])
+        self.assertEqual(package_modules(modules), ['freee_a11y_gl'])
+
+    def test_cli_submodules(self):
+        """Test that the submodules used at startup by the tools stay light"""
+        modules = loaded_modules('import ' + ', '.join(CLI_SUBMODULES))
+        self.assertEqual([name for name in HEAVY_MODULES if name in modules], [])
+        self.assertEqual(package_modules(modules), sorted(['freee_a11y_gl'] + CLI_SUBMODULES))
+
+    def test_light_submodule(self):
+        """Test that a light submodule can be used without the data model"""
+        modules = loaded_modules('from freee_a11y_gl import yaml_loader')
+        self.assertNotIn('freee_a11y_gl.models', modules)
+        self.assertNotIn('jsonschema', modules)
+
+    def test_exports_are_loaded_on_access(self):
+        """Test that exported names are imported on first access"""
+        import freee_a11y_gl
+        from freee_a11y_gl.models.check import Check
+        from freee_a11y_gl.settings_manager import settings
+
+        self.assertIs(freee_a11y_gl.Check, Check)
+        self.assertIs(freee_a11y_gl.settings, settings)
+        self.assertIn('setup_instances', dir(freee_a11y_gl))
+        with self.assertRaises(AttributeError):
+            freee_a11y_gl.no_such_name
+
+    def test_exports_importable_first(self):
+        """Test that each exported module can be the first one imported"""
+        from freee_a11y_gl import _EXPORTS
+        for module_name in sorted(set(_EXPORTS.values())):
+            with self.subTest(module=module_name):
+                subprocess.run(
+                    [sys.executable, '-c', f'import freee_a11y_gl{module_name}'],
+                    capture_output=True, text=True, check=True)
+
+    def test_settings_submodule_import(self):
+        """Test that importing the settings submodule keeps the settings object"""
+        result = subprocess.run(
+            [sys.executable, '-c',
+             'import freee_a11y_gl.settings_manager, freee_a11y_gl; '
+             'print(type(freee_a11y_gl.settings).__name__)'],
+            capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), 'Settings')
+
+
+if __name__ == '__main__':
+    unittest.main()
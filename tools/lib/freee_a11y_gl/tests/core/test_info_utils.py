@@ -6,7 +6,9 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-from freee_a11y_gl.info_utils import get_info_links, InfoUtilsError
+from freee_a11y_gl import info_utils
+from freee_a11y_gl.info_utils import clear_info_links_cache, get_info_links, InfoUtilsError
+from freee_a11y_gl.sphinx_labels import write_labels_index
 
 
 class MockDoctree:
@@ -19,9 +21,24 @@ class MockDoctree:
         }
 
 
+def write_pickles(basedir, labels_by_lang):
+    """Write the environment pickles of the languages"""
+    for lang, labels_dict in labels_by_lang.items():
+        doctree_dir = Path(basedir) / lang / 'build' / 'doctrees'
+        doctree_dir.mkdir(parents=True, exist_ok=True)
+        with open(doctree_dir / 'environment.pickle', 'wb') as f:
+            pickle.dump(MockDoctree(labels_dict), f)
+
+
 class TestGetInfoLinks:
     """Test cases for get_info_links function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        clear_info_links_cache()
+        yield
+        clear_info_links_cache()
+
     def test_get_info_links_with_valid_pickle_files(self):
         """Test get_info_links with valid pickle files."""
         labels_dict = {
@@ -181,6 +198,85 @@ class TestGetInfoLinks:
 
             assert result == {}
 
+    def test_get_info_links_with_labels_index(self):
+        """Test get_info_links reads the labels index instead of the pickle files."""
+        labels_dict = {'test-label': ('page', 'anchor', 'Test Label Text')}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for lang in ['ja', 'en']:
+                doctree_dir = Path(temp_dir) / lang / 'build' / 'doctrees'
+                doctree_dir.mkdir(parents=True)
+                # The pickle is only checked for its modification time and size
+                (doctree_dir / 'environment.pickle').write_bytes(b'not unpickled')
+                write_labels_index(str(doctree_dir), labels_dict)
+
+            result = get_info_links(basedir=temp_dir, baseurl='https://example.com')
+
+            assert result['test-label']['text'] == {'ja': 'Test Label Text', 'en': 'Test Label Text'}
+            assert result['test-label']['url']['en'] == 'https://example.com/en/page.html#anchor'
+
+    def test_get_info_links_with_outdated_labels_index(self):
+        """Test get_info_links falls back to the pickle files when they were rebuilt."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for lang in ['ja', 'en']:
+                doctree_dir = Path(temp_dir) / lang / 'build' / 'doctrees'
+                doctree_dir.mkdir(parents=True)
+                with open(doctree_dir / 'environment.pickle', 'wb') as f:
+                    pickle.dump(MockDoctree({'old-label': ['page', 'anchor', 'Old']}), f)
+                write_labels_index(str(doctree_dir), {'old-label': ['page', 'anchor', 'Old']})
+                with open(doctree_dir / 'environment.pickle', 'wb') as f:
+                    pickle.dump(MockDoctree({'new-label': ['page', 'anchor', 'New label']}), f)
+
+            result = get_info_links(basedir=temp_dir, baseurl='https://example.com')
+
+            assert list(result) == ['new-label']
+
+    def test_get_info_links_merge_order(self):
+        """Test that labels and languages are merged in the order they are read."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_pickles(temp_dir, {
+                'ja': {'b': ['p', 'b', 'B'], 'a': ['p', 'a', 'A'], 'x': ['p', '', 'X']},
+                'en': {'c': ['p', 'c', 'C'], 'a': ['p', 'a', 'A-en'], 'x': ['p', 'x', 'X-en']},
+            })
+            result = get_info_links(basedir=temp_dir, baseurl='')
+
+            assert list(result) == ['b', 'a', 'c', 'x']
+            assert list(result['a']['text'].items()) == [('ja', 'A'), ('en', 'A-en')]
+            assert result['x'] == {'text': {'en': 'X-en'}, 'url': {'en': '/en/p.html#x'}}
+            assert result['c']['url'] == {'en': '/en/p.html#c'}
+
+    def test_get_info_links_mixed_sources(self):
+        """Test reading the index of one language and the pickle of the other."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_pickles(temp_dir, {'ja': {}, 'en': {'label': ['page', 'anchor', 'Label']}})
+            write_labels_index(str(Path(temp_dir) / 'ja' / 'build' / 'doctrees'),
+                               {'label': ['page', 'anchor', 'ラベル']})
+
+            result = get_info_links(basedir=temp_dir, baseurl='https://example.com')
+
+            assert result['label']['text'] == {'ja': 'ラベル', 'en': 'Label'}
+
+    def test_get_info_links_memoized(self):
+        """Test that the links are read again only when a build changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            write_pickles(temp_dir, {lang: {'label': ['page', 'anchor', 'Label']}
+                                     for lang in ['ja', 'en']})
+            first = get_info_links(basedir=temp_dir, baseurl='https://example.com')
+            with patch.object(info_utils, '_load_all_labels') as mock_load:
+                assert get_info_links(basedir=temp_dir, baseurl='https://example.com') is first
+                mock_load.assert_not_called()
+
+            # Another base URL gives other links
+            other = get_info_links(basedir=temp_dir, baseurl='https://other.example.com')
+            assert other['label']['url']['ja'] == 'https://other.example.com/page.html#anchor'
+
+            write_pickles(temp_dir, {'en': {'label': ['page', 'anchor', 'Rebuilt label']}})
+            rebuilt = get_info_links(basedir=temp_dir, baseurl='https://example.com')
+            assert rebuilt['label']['text']['en'] == 'Rebuilt label'
+
+            clear_info_links_cache()
+            assert get_info_links(basedir=temp_dir, baseurl='https://example.com') is not rebuilt
+
 
 class TestInfoUtilsError:
     """Test cases for InfoUtilsError exception."""
@@ -11,6 +11,8 @@ from unittest.mock import patch, MagicMock, call
 
 from freee_a11y_gl.initializer import (
     setup_instances,
+    clear_instances,
+    create_executor,
     process_axe_rules,
     ls_dir,
     read_file_content,
@@ -19,7 +21,9 @@ from freee_a11y_gl.initializer import (
     process_entity_files,
     process_static_entity_file
 )
-from freee_a11y_gl.yaml_validator import ValidationError
+from freee_a11y_gl.yaml_validator import YamlValidator, ValidationError
+from freee_a11y_gl.parse_cache import ParseCache
+from freee_a11y_gl.models.axe import AxeRule
 
 
 class TestSetupInstances(unittest.TestCase):
@@ -58,6 +62,7 @@ class TestSetupInstances(unittest.TestCase):
         """Clean up test fixtures"""
         import shutil
         shutil.rmtree(self.temp_dir)
+        AxeRule.set_loader(None)
 
     @patch('freee_a11y_gl.initializer.process_axe_rules')
     @patch('freee_a11y_gl.initializer.RelationshipManager')
@@ -97,6 +102,29 @@ class TestSetupInstances(unittest.TestCase):
         result = setup_instances(basedir=self.temp_dir)
 
         self.assertIsNotNone(result)
+        # axe-core rules are only read when they are first used
+        mock_axe_rules.assert_not_called()
+        AxeRule.list_all()
+        AxeRule.list_all()
+        mock_axe_rules.assert_called_once()
+        self.assertEqual(mock_axe_rules.call_args.args[0], self.temp_dir)
+
+    @patch('freee_a11y_gl.initializer.process_axe_rules')
+    @patch('freee_a11y_gl.initializer.RelationshipManager')
+    @patch('freee_a11y_gl.initializer.process_entity_files')
+    @patch('freee_a11y_gl.initializer.process_static_entity_file')
+    @patch('freee_a11y_gl.initializer.CheckTool')
+    @patch('freee_a11y_gl.config.Config.get_yaml_validation_mode')
+    def test_setup_instances_load_axe(self, mock_validation_mode, mock_check_tool,
+                                      mock_process_static, mock_process_entity,
+                                      mock_rel_manager, mock_axe_rules):
+        """Test that load_axe=True reads axe-core rules immediately"""
+        mock_validation_mode.return_value = 'strict'
+
+        setup_instances(basedir=self.temp_dir, load_axe=True)
+
+        mock_axe_rules.assert_called_once()
+        AxeRule.get_by_id('image-alt')
         mock_axe_rules.assert_called_once()
 
     @patch('freee_a11y_gl.initializer.process_axe_rules')
@@ -116,7 +144,7 @@ class TestSetupInstances(unittest.TestCase):
         setup_instances(basedir=self.temp_dir)
 
         # Verify CheckTool was called for each tool in check_tools
-        from freee_a11y_gl.settings import settings
+        from freee_a11y_gl.settings_manager import settings
         check_tools = settings.message_catalog.check_tools
         expected_calls = [call(tool_id, tool_names) for tool_id, tool_names in check_tools.items()]
         mock_check_tool.assert_has_calls(expected_calls, any_order=True)
@@ -147,6 +175,20 @@ class TestSetupInstances(unittest.TestCase):
         entity_calls = mock_process_entity.call_args_list
         self.assertEqual(len(entity_calls), 3)
 
+    def test_clear_instances(self):
+        """Test that instances, relationships and the axe-core loader are removed"""
+        from freee_a11y_gl.models.content import Category
+        from freee_a11y_gl.relationship_manager import RelationshipManager
+        rel = RelationshipManager()
+        Category._instances['test'] = MagicMock()
+        AxeRule.set_loader(MagicMock())
+
+        clear_instances()
+
+        self.assertEqual(Category._instances, {})
+        self.assertTrue(AxeRule.is_loaded())
+        self.assertIsNot(RelationshipManager(), rel)
+
 
 class TestProcessAxeRules(unittest.TestCase):
     """Test cases for process_axe_rules function"""
@@ -160,125 +202,77 @@ class TestProcessAxeRules(unittest.TestCase):
         import shutil
         shutil.rmtree(self.temp_dir)
 
+    def _mock_reader(self, mock_reader_class, messages_ja):
+        """Set up a GitBlobReader mock returning one rule."""
+        reader = mock_reader_class.return_value.__enter__.return_value
+        reader.read_tree.return_value = {
+            'lib/rules/test-rule.json': b'{"id": "test-rule", "ruleId": "test-rule", "metadata": {"help": "Test help text", "description": "Test description"}, "tags": ["wcag2a", "section508"]}'
+        }
+        reader.read_files.return_value = {
+            'locales/ja.json': json.dumps(messages_ja).encode('utf-8'),
+            'package.json': b'{"version": "4.6.3"}'
+        }
+        reader.authored_date.return_value = 1672574400
+        return reader
+
     @patch('freee_a11y_gl.initializer.AxeRule')
+    @patch('freee_a11y_gl.initializer.GitBlobReader')
+    @patch('freee_a11y_gl.initializer.get_submodule_hexsha')
     @patch('freee_a11y_gl.config.Config.get_basedir')
-    def test_process_axe_rules_with_basedir_none(self, mock_get_basedir, mock_axe_rule):
+    def test_process_axe_rules_with_basedir_none(self, mock_get_basedir, mock_hexsha,
+                                                 mock_reader_class, mock_axe_rule):
         """Test process_axe_rules when basedir is None"""
         mock_get_basedir.return_value = self.temp_dir
+        mock_hexsha.return_value = 'abc123'
+        self._mock_reader(mock_reader_class, {"rules": {}})
 
-        # Mock git repository
-        with patch('git.Repo') as mock_repo:
-            mock_root_repo = MagicMock()
-            mock_submodule = MagicMock()
-            mock_submodule.name = 'vendor/axe-core'  # Use correct submodule name
-            mock_submodule.hexsha = 'abc123'
-            mock_root_repo.submodules = [mock_submodule]
-            mock_repo.return_value = mock_root_repo
-
-            # Mock axe repository and commit
-            mock_axe_repo = MagicMock()
-            mock_commit = MagicMock()
-            mock_commit.authored_date = 1234567890
-            mock_axe_repo.commit.return_value = mock_commit
-
-            # Mock tree structure
-            mock_tree = MagicMock()
-
-            # Mock message blob
-            mock_msg_blob = MagicMock()
-            mock_msg_blob.data_stream.read.return_value = b'{"rules": {"test-rule": {"message": "Test message", "help": "Test help", "description": "Test description"}}}'
-
-            # Mock package blob with version
-            mock_pkg_blob = MagicMock()
-            mock_pkg_blob.data_stream.read.return_value = b'{"version": "4.6.3"}'
-
-            # Setup tree navigation to return different blobs for different paths
-            # Need to handle 3 calls: message file, rules directory, package file
-            mock_tree.__truediv__ = MagicMock(side_effect=[mock_msg_blob, mock_tree, mock_pkg_blob])
-            mock_commit.tree = mock_tree
-
-            # Mock rule blobs
-            mock_rule_blob = MagicMock()
-            mock_rule_blob.type = 'blob'
-            mock_rule_blob.path = 'test-rule.json'
-            mock_rule_blob.data_stream.read.return_value = b'{"id": "test-rule", "ruleId": "test-rule", "metadata": {"help": "Test help text", "description": "Test description"}, "tags": ["wcag2a", "section508"]}'
-            mock_tree.traverse.return_value = [mock_rule_blob]
-
-            mock_repo.side_effect = [mock_root_repo, mock_axe_repo]
-
-            from freee_a11y_gl.config import Config
-            axe_core_config = Config.get_axe_core_config()
-            process_axe_rules(None, axe_core_config)
-
-            mock_get_basedir.assert_called_once()
-            mock_axe_rule.assert_called()
-
-    def test_process_axe_rules_submodule_not_found(self):
+        from freee_a11y_gl.config import Config
+        axe_core_config = Config.get_axe_core_config()
+        process_axe_rules(None, axe_core_config)
+
+        mock_get_basedir.assert_called_once()
+        mock_hexsha.assert_called_once_with(self.temp_dir, axe_core_config['base_dir'])
+        mock_reader_class.assert_called_once_with(os.path.join(self.temp_dir, axe_core_config['base_dir']))
+        mock_axe_rule.assert_called()
+
+    @patch('freee_a11y_gl.initializer.get_submodule_hexsha')
+    def test_process_axe_rules_submodule_not_found(self, mock_hexsha):
         """Test process_axe_rules when submodule is not found"""
-        with patch('git.Repo') as mock_repo:
-            mock_root_repo = MagicMock()
-            mock_root_repo.submodules = []  # No submodules
-            mock_repo.return_value = mock_root_repo
+        mock_hexsha.return_value = None
 
-            from freee_a11y_gl.config import Config
-            axe_core_config = Config.get_axe_core_config()
+        from freee_a11y_gl.config import Config
+        axe_core_config = Config.get_axe_core_config()
 
-            with self.assertRaises(ValueError) as context:
-                process_axe_rules(self.temp_dir, axe_core_config)
+        with self.assertRaises(ValueError) as context:
+            process_axe_rules(self.temp_dir, axe_core_config)
 
-            self.assertIn('Submodule with name', str(context.exception))
+        self.assertIn('Submodule with name', str(context.exception))
 
     @patch('freee_a11y_gl.initializer.AxeRule')
+    @patch('freee_a11y_gl.initializer.GitBlobReader')
+    @patch('freee_a11y_gl.initializer.get_submodule_hexsha')
     @patch('time.strftime')
     @patch('time.localtime')
-    def test_process_axe_rules_complete_flow(self, mock_localtime, mock_strftime, mock_axe_rule):
+    def test_process_axe_rules_complete_flow(self, mock_localtime, mock_strftime, mock_hexsha,
+                                             mock_reader_class, mock_axe_rule):
         """Test complete flow of process_axe_rules"""
         mock_localtime.return_value = 'mock_time'
         mock_strftime.return_value = '2023-01-01 12:00:00+0000'
+        mock_hexsha.return_value = 'commit123'
+        messages_ja = {"rules": {"test-rule": {"message": "テストメッセージ", "help": "テストヘルプ", "description": "テスト説明"}}}
+        reader = self._mock_reader(mock_reader_class, messages_ja)
 
-        with patch('git.Repo') as mock_repo:
-            # Setup mock repository structure
-            mock_root_repo = MagicMock()
-            mock_submodule = MagicMock()
-            mock_submodule.name = 'vendor/axe-core'  # Use correct submodule name
-            mock_submodule.hexsha = 'commit123'
-            mock_root_repo.submodules = [mock_submodule]
-
-            mock_axe_repo = MagicMock()
-            mock_commit = MagicMock()
-            mock_commit.authored_date = 1672574400
-            mock_axe_repo.commit.return_value = mock_commit
-
-            # Mock message file
-            mock_msg_blob = MagicMock()
-            mock_msg_blob.data_stream.read.return_value = '{"rules": {"test-rule": {"message": "テストメッセージ", "help": "テストヘルプ", "description": "テスト説明"}}}'.encode('utf-8')
-
-            # Mock rule files
-            mock_rule_blob = MagicMock()
-            mock_rule_blob.type = 'blob'
-            mock_rule_blob.path = 'test-rule.json'
-            mock_rule_blob.data_stream.read.return_value = b'{"id": "test-rule", "ruleId": "test-rule", "metadata": {"help": "Test help text", "description": "Test description"}, "tags": ["wcag2a", "section508"]}'
-
-            # Mock package file
-            mock_pkg_blob = MagicMock()
-            mock_pkg_blob.data_stream.read.return_value = b'{"version": "4.6.3"}'
-
-            # Setup tree navigation
-            mock_tree = MagicMock()
-            mock_tree.__truediv__ = MagicMock()
-            # Need to handle 3 calls: message file, rules directory, package file
-            mock_tree.__truediv__.side_effect = [mock_msg_blob, mock_tree, mock_pkg_blob]
-            mock_tree.traverse.return_value = [mock_rule_blob]
-            mock_commit.tree = mock_tree
-
-            mock_repo.side_effect = [mock_root_repo, mock_axe_repo]
-
-            from freee_a11y_gl.config import Config
-            axe_core_config = Config.get_axe_core_config()
-            process_axe_rules(self.temp_dir, axe_core_config)
+        from freee_a11y_gl.config import Config
+        axe_core_config = Config.get_axe_core_config()
+        process_axe_rules(self.temp_dir, axe_core_config)
 
-            # Verify AxeRule was called
-            mock_axe_rule.assert_called()
+        reader.read_tree.assert_called_once_with('commit123', 'lib/rules', '.json')
+        reader.read_files.assert_called_once_with('commit123', ['locales/ja.json', 'package.json'])
+        mock_localtime.assert_called_once_with(1672574400)
+        mock_axe_rule.assert_called_once()
+        self.assertEqual(mock_axe_rule.call_args.args[1], messages_ja)
+        self.assertEqual(mock_axe_rule.version, '4.6.3')
+        self.assertEqual(mock_axe_rule.timestamp, '2023-01-01 12:00:00+0000')
 
 
 class TestUtilityFunctions(unittest.TestCase):
@@ -522,6 +516,240 @@ class TestProcessEntityFiles(unittest.TestCase):
         mock_handle_error.assert_called_once()
 
 
+class TestParallelEntityFiles(unittest.TestCase):
+    """Test cases for process_entity_files with a process pool"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.srcdir = os.path.join(self.temp_dir, 'entities')
+        self.schema_dir = os.path.join(self.temp_dir, 'schemas')
+        os.makedirs(self.srcdir)
+        os.makedirs(self.schema_dir)
+
+        test_schema = {
+            "type": "object",
+            "properties": {"id": {"type": "string"}},
+            "required": ["id"]
+        }
+        for schema_name in ['check.json', 'guideline.json', 'faq.json', 'common.json']:
+            with open(os.path.join(self.schema_dir, schema_name), 'w') as f:
+                json.dump(test_schema, f)
+
+        for i in range(20):
+            with open(os.path.join(self.srcdir, f'{i:04d}.yaml'), 'w') as f:
+                yaml.dump({'id': f'{i:04d}'}, f)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_create_executor_serial(self):
+        """Test that no pool is created for serial processing"""
+        for workers in [None, 1]:
+            with create_executor(workers) as executor:
+                self.assertIsNone(executor)
+
+    def test_parallel_construction_order_matches_serial(self):
+        """Test that instances are constructed in the same order as in serial mode"""
+        validator = YamlValidator(self.schema_dir, 'strict')
+
+        serial_constructor = MagicMock()
+        process_entity_files(self.srcdir, serial_constructor, 'check', validator)
+
+        parallel_constructor = MagicMock()
+        with create_executor(2, validator) as executor:
+            process_entity_files(self.srcdir, parallel_constructor, 'check', validator, executor)
+
+        self.assertEqual(parallel_constructor.call_args_list, serial_constructor.call_args_list)
+        self.assertEqual(parallel_constructor.call_count, 20)
+
+    @patch('sys.exit')
+    @patch('sys.stderr')
+    def test_parallel_validation_error_strict(self, mock_stderr, mock_exit):
+        """Test that validation errors are reported by the parent in strict mode"""
+        with open(os.path.join(self.srcdir, '0005.yaml'), 'w') as f:
+            yaml.dump({'name': 'no id'}, f)
+        validator = YamlValidator(self.schema_dir, 'strict')
+
+        with create_executor(2, validator) as executor:
+            process_entity_files(self.srcdir, MagicMock(), 'check', validator, executor)
+
+        mock_exit.assert_called_once_with(1)
+        written = ''.join(c.args[0] for c in mock_stderr.write.call_args_list)
+        self.assertIn('YAML Validation Error: Validation failed for file:', written)
+        self.assertIn('0005.yaml', written)
+
+    @patch('sys.stderr')
+    def test_parallel_validation_error_warning(self, mock_stderr):
+        """Test that invalid files are still constructed in warning mode"""
+        with open(os.path.join(self.srcdir, '0005.yaml'), 'w') as f:
+            yaml.dump({'id': 5}, f)
+        validator = YamlValidator(self.schema_dir, 'warning')
+        mock_constructor = MagicMock()
+
+        with create_executor(2, validator) as executor:
+            process_entity_files(self.srcdir, mock_constructor, 'check', validator, executor)
+
+        self.assertEqual(mock_constructor.call_count, 20)
+        written = ''.join(c.args[0] for c in mock_stderr.write.call_args_list)
+        self.assertIn('YAML Validation Warning: Validation failed for file:', written)
+
+    @patch('freee_a11y_gl.initializer.handle_file_error')
+    def test_parallel_yaml_error(self, mock_handle_error):
+        """Test that parse errors are reported with the file name"""
+        invalid_file = os.path.join(self.srcdir, '0003.yaml')
+        with open(invalid_file, 'w') as f:
+            f.write('invalid: yaml: content: [')
+
+        with create_executor(2) as executor:
+            process_entity_files(self.srcdir, MagicMock(), executor=executor)
+
+        mock_handle_error.assert_called_once()
+        self.assertEqual(mock_handle_error.call_args[0][1], invalid_file)
+
+
+class TestEntityFilesCache(unittest.TestCase):
+    """Test cases for process_entity_files and process_static_entity_file with a parse cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.srcdir = os.path.join(self.temp_dir, 'entities')
+        self.schema_dir = os.path.join(self.temp_dir, 'schemas')
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        os.makedirs(self.srcdir)
+        os.makedirs(self.schema_dir)
+
+        test_schema = {
+            "type": "object",
+            "properties": {"id": {"type": "string"}},
+            "required": ["id"]
+        }
+        for schema_name in ['check.json', 'guideline.json', 'faq.json', 'common.json']:
+            with open(os.path.join(self.schema_dir, schema_name), 'w') as f:
+                json.dump(test_schema, f)
+
+        for i in range(5):
+            with open(os.path.join(self.srcdir, f'{i:04d}.yaml'), 'w') as f:
+                yaml.dump({'id': f'{i:04d}'}, f)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _cold_start(self, validator):
+        cache = ParseCache(self.cache_dir)
+        process_entity_files(self.srcdir, MagicMock(), 'check', validator, cache=cache)
+        cache.save()
+        return cache
+
+    def test_warm_start_skips_parsing_and_validation(self):
+        """Test that unchanged files are neither parsed nor validated again"""
+        validator = YamlValidator(self.schema_dir, 'strict')
+        cache = self._cold_start(validator)
+        self.assertEqual(cache.stats.writes, 5)
+
+        cache = ParseCache(self.cache_dir)
+        mock_constructor = MagicMock()
+        with patch('freee_a11y_gl.initializer.yaml_loader.safe_load') as mock_load, \
+                patch.object(validator, 'validate_yaml_data') as mock_validate:
+            process_entity_files(self.srcdir, mock_constructor, 'check', validator, cache=cache)
+
+        mock_load.assert_not_called()
+        mock_validate.assert_not_called()
+        self.assertEqual(cache.stats.hits, 5)
+        self.assertEqual(mock_constructor.call_count, 5)
+        first_file = ls_dir(self.srcdir)[0]
+        first = mock_constructor.call_args_list[0][0][0]
+        self.assertEqual(first['id'], os.path.basename(first_file)[:4])
+        self.assertEqual(first['src_path'], os.path.abspath(first_file))
+
+    def test_changed_file_is_parsed_again(self):
+        """Test that only changed files are parsed on a warm start"""
+        validator = YamlValidator(self.schema_dir, 'strict')
+        self._cold_start(validator)
+        with open(os.path.join(self.srcdir, '0002.yaml'), 'w') as f:
+            yaml.dump({'id': 'changed'}, f)
+
+        cache = ParseCache(self.cache_dir)
+        mock_constructor = MagicMock()
+        process_entity_files(self.srcdir, mock_constructor, 'check', validator, cache=cache)
+
+        self.assertEqual(cache.stats.hits, 4)
+        self.assertEqual(cache.stats.invalidated, 1)
+        ids = [c[0][0]['id'] for c in mock_constructor.call_args_list]
+        expected = [os.path.basename(f)[:4] for f in ls_dir(self.srcdir)]
+        self.assertEqual(ids, ['changed' if i == '0002' else i for i in expected])
+
+    def test_changed_schema_requires_validation(self):
+        """Test that cached payloads are validated again when a schema changes"""
+        self._cold_start(YamlValidator(self.schema_dir, 'strict'))
+        with open(os.path.join(self.schema_dir, 'common.json'), 'w') as f:
+            json.dump({"type": "object"}, f)
+
+        validator = YamlValidator(self.schema_dir, 'strict')
+        cache = ParseCache(self.cache_dir)
+        with patch.object(validator, 'validate_yaml_data') as mock_validate:
+            process_entity_files(self.srcdir, MagicMock(), 'check', validator, cache=cache)
+
+        self.assertEqual(mock_validate.call_count, 5)
+        self.assertEqual(cache.stats.hits, 0)
+
+    @patch('sys.stderr')
+    def test_invalid_file_not_cached_in_warning_mode(self, mock_stderr):
+        """Test that files failing validation are validated again on every run"""
+        with open(os.path.join(self.srcdir, '0001.yaml'), 'w') as f:
+            yaml.dump({'id': 1}, f)
+        validator = YamlValidator(self.schema_dir, 'warning')
+        self._cold_start(validator)
+
+        cache = ParseCache(self.cache_dir)
+        process_entity_files(self.srcdir, MagicMock(), 'check', validator, cache=cache)
+
+        self.assertEqual(cache.stats.hits, 4)
+        written = ''.join(c.args[0] for c in mock_stderr.write.call_args_list)
+        self.assertEqual(written.count('YAML Validation Warning'), 2)
+
+    def test_parallel_warm_start(self):
+        """Test that cached files are not sent to the process pool"""
+        validator = YamlValidator(self.schema_dir, 'strict')
+        self._cold_start(validator)
+        with open(os.path.join(self.srcdir, '0003.yaml'), 'w') as f:
+            yaml.dump({'id': 'changed'}, f)
+
+        cache = ParseCache(self.cache_dir)
+        mock_constructor = MagicMock()
+        with create_executor(2, validator) as executor:
+            process_entity_files(self.srcdir, mock_constructor, 'check', validator, executor, cache)
+
+        self.assertEqual(cache.stats.hits, 4)
+        self.assertEqual(cache.stats.writes, 1)
+        ids = [c[0][0]['id'] for c in mock_constructor.call_args_list]
+        expected = [os.path.basename(f)[:4] for f in ls_dir(self.srcdir)]
+        self.assertEqual(ids, ['changed' if i == '0003' else i for i in expected])
+
+    def test_static_entity_file_cache(self):
+        """Test that static JSON files are served from the cache"""
+        test_file = os.path.join(self.temp_dir, 'static.json')
+        with open(test_file, 'w') as f:
+            json.dump({'key1': {'name': 'one'}, 'key2': {'name': 'two'}}, f)
+
+        cache = ParseCache(self.cache_dir)
+        process_static_entity_file(test_file, MagicMock(), cache)
+        cache.save()
+
+        cache = ParseCache(self.cache_dir)
+        mock_constructor = MagicMock()
+        with patch('freee_a11y_gl.initializer.read_file_content') as mock_read:
+            process_static_entity_file(test_file, mock_constructor, cache)
+
+        mock_read.assert_not_called()
+        mock_constructor.assert_has_calls([call('key1', {'name': 'one'}), call('key2', {'name': 'two'})])
+
+
 class TestProcessStaticEntityFile(unittest.TestCase):
     """Test cases for process_static_entity_file function"""
 
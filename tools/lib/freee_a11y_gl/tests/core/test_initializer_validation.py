@@ -10,6 +10,7 @@ import yaml
 from unittest.mock import patch
 
 from freee_a11y_gl.initializer import setup_instances
+from freee_a11y_gl.models.axe import AxeRule
 
 
 class TestInitializerValidation(unittest.TestCase):
@@ -99,6 +100,7 @@ class TestInitializerValidation(unittest.TestCase):
         """Clean up test fixtures"""
         import shutil
         shutil.rmtree(self.temp_dir)
+        AxeRule.set_loader(None)
 
     def create_valid_check_yaml(self, filename='0001.yaml'):
         """Create a valid check YAML file"""
@@ -195,6 +197,22 @@ class TestInitializerValidation(unittest.TestCase):
             setup_instances(self.temp_dir)
             mock_exit.assert_called_with(1)
 
+    @patch('freee_a11y_gl.initializer.process_axe_rules')
+    @patch('freee_a11y_gl.initializer.RelationshipManager')
+    @patch('sys.exit')
+    def test_setup_instances_with_invalid_yaml_parallel(self, mock_exit, mock_rel_manager, mock_axe_rules):
+        """Test setup_instances with invalid YAML files using worker processes"""
+        self.create_valid_check_yaml('0001.yaml')
+        self.create_invalid_check_yaml('0002.yaml')
+
+        mock_axe_rules.return_value = None
+        mock_rel_instance = mock_rel_manager.return_value
+        mock_rel_instance.resolve_faqs.return_value = None
+
+        setup_instances(self.temp_dir, workers=2)
+
+        mock_exit.assert_called_with(1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,131 @@
+"""
+Tests for the memory profiling of the phases of the guideline tools.
+"""
+
+import io
+import tracemalloc
+import unittest
+
+from freee_a11y_gl import memory_profile, tracing
+
+MIB = 1024 * 1024
+
+
+class TestMemoryProfile(unittest.TestCase):
+    """Test cases for phases and the report"""
+
+    def setUp(self):
+        memory_profile.reset()
+
+    def tearDown(self):
+        memory_profile.reset()
+
+    def test_disabled(self):
+        """Test that phases are not profiled while profiling is off"""
+        self.assertFalse(memory_profile.is_enabled())
+        self.assertIs(tracing.span('a', phase=True), tracing.span('b', phase=True))
+        with tracing.span('a', phase=True):
+            pass
+        self.assertEqual(memory_profile.get_phases(), [])
+        self.assertIsNone(memory_profile.finish())
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_nested_phases(self):
+        """Test the change and peak of the traced memory of nested phases"""
+        memory_profile.enable()
+        self.assertTrue(tracemalloc.is_tracing())
+        with tracing.span('outer', phase=True):
+            kept = [bytearray(1024) for _ in range(2048)]
+            with tracing.span('inner', phase=True):
+                freed = [bytearray(1024) for _ in range(4096)]
+            del freed
+        outer, inner = memory_profile.get_phases()
+
+        self.assertEqual((outer['name'], outer['depth']), ('outer', 0))
+        self.assertEqual((inner['name'], inner['depth']), ('inner', 1))
+        self.assertGreater(inner['delta'], 4 * MIB)
+        self.assertGreater(outer['delta'], 2 * MIB)
+        self.assertLess(outer['delta'], inner['delta'])
+        self.assertGreaterEqual(outer['peak'], inner['peak'])
+        self.assertGreater(outer['peak'], 6 * MIB)
+        # Only the outermost phases are compared by allocation site
+        self.assertEqual(inner['top'], [])
+        self.assertEqual(outer['top'][0]['site'].rsplit(':', 1)[1],
+                         str(line_of('kept = [bytearray')))
+        self.assertGreaterEqual(outer['top'][0]['count'], 2048)
+        self.assertEqual(len(kept), 2048)
+
+    def test_exception(self):
+        """Test that a phase left by an exception is reported with the error"""
+        memory_profile.enable()
+        with self.assertRaises(KeyError):
+            with tracing.span('failing', phase=True):
+                raise KeyError('x')
+        self.assertEqual(memory_profile.get_phases()[0]['error'], 'KeyError')
+
+    def test_phase_spans(self):
+        """Test that only the spans marked as phases are profiled, named with their arguments"""
+        @tracing.traced(phase=True)
+        def allocate(size):
+            return bytearray(size)
+
+        @tracing.traced('not_a_phase')
+        def identity(value):
+            return value
+
+        self.assertEqual(len(allocate(1)), 1)
+        memory_profile.enable()
+        self.assertEqual(len(allocate(MIB)), MIB)
+        self.assertEqual(identity(3), 3)
+        with tracing.span('language', phase=True, lang='ja', checks=2):
+            pass
+        self.assertEqual([record['name'] for record in memory_profile.get_phases()],
+                         [allocate.__qualname__, 'language(lang=ja, checks=2)'])
+        self.assertEqual(tracing.get_events(), [])
+
+    def test_finish(self):
+        """Test the report printed by finish()"""
+        memory_profile.enable(top=2)
+        with tracing.span('load', phase=True):
+            data = [bytearray(1024) for _ in range(1024)]
+        stream = io.StringIO()
+        report = memory_profile.finish(stream)
+
+        self.assertFalse(memory_profile.is_enabled())
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIs(tracing.span('a', phase=True), tracing.span('b', phase=True))
+        self.assertEqual(stream.getvalue(), report + '\n')
+        lines = report.splitlines()
+        self.assertEqual(lines[0].split(), ['phase', 'delta', 'peak', 'peak', 'RSS'])
+        self.assertEqual(lines[1].split()[0], 'load')
+        self.assertTrue(lines[1].split()[1].startswith('+1.'))
+        self.assertIn('Top allocation sites of load:', lines)
+        self.assertIn('Top allocation sites of the memory still allocated:', lines)
+        self.assertTrue(lines[-1].startswith('Peak RSS: '))
+        self.assertIn(len(memory_profile.get_phases()[0]['top']), (1, 2))
+        self.assertEqual(len(data), 1024)
+
+    def test_keeps_tracemalloc_running(self):
+        """Test that finish() does not stop tracing started by the caller"""
+        tracemalloc.start()
+        try:
+            memory_profile.enable()
+            memory_profile.finish(io.StringIO())
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+    def test_peak_rss(self):
+        """Test the peak resident set size of the process"""
+        self.assertGreater(memory_profile.peak_rss(), MIB)
+        self.assertEqual(memory_profile.format_size(None), '-')
+        self.assertEqual(memory_profile.format_size(3 * MIB // 2, sign=True), '+1.5 MiB')
+
+
+def line_of(text):
+    """Line number of the first line of this file containing text"""
+    with open(__file__, encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if text in line:
+                return number
+    raise ValueError(text)
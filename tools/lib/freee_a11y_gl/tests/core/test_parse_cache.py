@@ -0,0 +1,167 @@
+"""
+Tests for the persistent parse cache.
+"""
+
+import os
+import pickle
+import tempfile
+import unittest
+
+from freee_a11y_gl.config import Config
+from freee_a11y_gl.parse_cache import ParseCache, CacheStats, CACHE_FILE_NAME
+
+
+class TestParseCache(unittest.TestCase):
+    """Test cases for ParseCache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'build', '.a11y_gl_cache')
+        self.src_file = os.path.join(self.temp_dir, 'entity.yaml')
+        with open(self.src_file, 'w') as f:
+            f.write('id: test\n')
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _reopen(self):
+        return ParseCache(self.cache_dir)
+
+    def test_miss_then_hit_after_save(self):
+        """Test that stored payloads are returned by a new cache instance"""
+        cache = ParseCache(self.cache_dir)
+        self.assertIsNone(cache.get(self.src_file))
+        cache.put(self.src_file, {'id': 'test'})
+        cache.save()
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, CACHE_FILE_NAME)))
+
+        cache = self._reopen()
+        self.assertEqual(cache.get(self.src_file), {'id': 'test'})
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertEqual(cache.stats.misses, 0)
+
+    def test_payload_is_copied(self):
+        """Test that modifying data does not affect the cached payload"""
+        cache = ParseCache(self.cache_dir)
+        data = {'id': 'test'}
+        cache.put(self.src_file, data)
+        data['src_path'] = '/modified'
+
+        first = cache.get(self.src_file)
+        first['other'] = 'value'
+        self.assertEqual(cache.get(self.src_file), {'id': 'test'})
+
+    def test_changed_content_invalidates_entry(self):
+        """Test that a file with different content is not served from the cache"""
+        cache = ParseCache(self.cache_dir)
+        cache.put(self.src_file, {'id': 'test'})
+        with open(self.src_file, 'w') as f:
+            f.write('id: changed-content\n')
+
+        self.assertIsNone(cache.get(self.src_file))
+        self.assertEqual(cache.stats.invalidated, 1)
+
+    def test_touched_file_with_same_content_is_hit(self):
+        """Test that a changed mtime alone does not invalidate an entry"""
+        cache = ParseCache(self.cache_dir)
+        cache.put(self.src_file, {'id': 'test'})
+        stat = os.stat(self.src_file)
+        os.utime(self.src_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertEqual(cache.get(self.src_file), {'id': 'test'})
+        self.assertEqual(cache.stats.invalidated, 0)
+
+    def test_validation_key_mismatch(self):
+        """Test that payloads validated against another schema are not used"""
+        cache = ParseCache(self.cache_dir)
+        cache.put(self.src_file, {'id': 'test'}, 'check:abc')
+
+        self.assertEqual(cache.get(self.src_file, 'check:abc'), {'id': 'test'})
+        self.assertIsNone(cache.get(self.src_file, 'check:def'))
+        self.assertEqual(cache.get(self.src_file), {'id': 'test'})
+
+    def test_unvalidated_payload_not_used_for_validation(self):
+        """Test that payloads stored without validation require validation"""
+        cache = ParseCache(self.cache_dir)
+        cache.put(self.src_file, {'id': 'test'})
+
+        self.assertIsNone(cache.get(self.src_file, 'check:abc'))
+
+    def test_corrupt_cache_file_is_ignored(self):
+        """Test that an unreadable cache file is treated as an empty cache"""
+        os.makedirs(self.cache_dir)
+        with open(os.path.join(self.cache_dir, CACHE_FILE_NAME), 'wb') as f:
+            f.write(b'not a pickle')
+
+        cache = ParseCache(self.cache_dir)
+        self.assertIsNone(cache.get(self.src_file))
+
+    def test_old_format_is_ignored(self):
+        """Test that a cache file of another format version is discarded"""
+        os.makedirs(self.cache_dir)
+        with open(os.path.join(self.cache_dir, CACHE_FILE_NAME), 'wb') as f:
+            pickle.dump({'version': -1, 'entries': {self.src_file: {}}}, f)
+
+        cache = ParseCache(self.cache_dir)
+        self.assertIsNone(cache.get(self.src_file))
+
+    def test_save_drops_removed_files(self):
+        """Test that entries of deleted source files are not persisted"""
+        cache = ParseCache(self.cache_dir)
+        cache.put(self.src_file, {'id': 'test'})
+        cache.save()
+        os.remove(self.src_file)
+        cache.save()
+
+        with open(os.path.join(self.cache_dir, CACHE_FILE_NAME), 'rb') as f:
+            self.assertEqual(pickle.load(f)['entries'], {})
+
+    def test_save_failure_is_ignored(self):
+        """Test that failing to write the cache does not raise"""
+        blocker = os.path.join(self.temp_dir, 'blocker')
+        with open(blocker, 'w') as f:
+            f.write('')
+        cache = ParseCache(os.path.join(blocker, 'cache'))
+        cache.put(self.src_file, {'id': 'test'})
+        cache.save()
+
+    def test_clear(self):
+        """Test that clear removes the cache file"""
+        cache = ParseCache(self.cache_dir)
+        cache.put(self.src_file, {'id': 'test'})
+        cache.save()
+        cache.clear()
+
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, CACHE_FILE_NAME)))
+        self.assertIsNone(cache.get(self.src_file))
+
+    def test_stats_str(self):
+        """Test the string representation of cache statistics"""
+        stats = CacheStats(hits=3, misses=2, invalidated=1, writes=2)
+        self.assertEqual(str(stats), "3 hits, 2 misses (1 invalidated), 2 writes")
+
+
+class TestCacheConfig(unittest.TestCase):
+    """Test cases for cache configuration"""
+
+    def test_defaults(self):
+        """Test default cache settings"""
+        self.assertTrue(Config.is_cache_enabled())
+        self.assertEqual(Config.get_cache_dir('/project'),
+                         os.path.abspath('/project/build/.a11y_gl_cache'))
+
+    def test_set_cache_enabled(self):
+        """Test disabling and enabling the cache"""
+        try:
+            Config.set_cache_enabled(False)
+            self.assertFalse(Config.is_cache_enabled())
+        finally:
+            Config.set_cache_enabled(True)
+        self.assertTrue(Config.is_cache_enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
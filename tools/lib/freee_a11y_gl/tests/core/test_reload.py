@@ -0,0 +1,259 @@
+"""
+Tests for incremental reloading of changed source files.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+import yaml
+
+from freee_a11y_gl import yaml_loader
+from freee_a11y_gl.initializer import setup_instances
+from freee_a11y_gl.models.axe import AxeRule
+from freee_a11y_gl.models.check import Check, CheckTool
+from freee_a11y_gl.models.content import Category, Guideline
+from freee_a11y_gl.models.faq.article import Faq
+from freee_a11y_gl.models.faq.tag import FaqTag
+from freee_a11y_gl.models.reference import InfoRef, WcagSc
+from freee_a11y_gl.relationship_manager import RelationshipManager
+from freee_a11y_gl.reload import reload_sources
+
+# Root of the a11y-guidelines repository, containing data/yaml and data/json
+REPO_ROOT = Path(__file__).resolve().parents[5]
+MODELS = [Check, Guideline, Faq, InfoRef, Category, WcagSc, FaqTag, AxeRule]
+
+
+def reset_model():
+    """Remove all instances and relationships."""
+    for model in MODELS:
+        model._instances.clear()
+    CheckTool._instances.clear()
+    AxeRule.set_loader(None)
+    RelationshipManager._instance = None
+
+
+def model_state(ordered=True):
+    """Get the registries, relationships and rendered data of the current model."""
+    def order(items):
+        return list(items) if ordered else sorted(items)
+
+    rel = RelationshipManager()
+    state = {model.__name__: order(model._instances) for model in MODELS}
+    state['relationships'] = {
+        (src_type, src_id, dest_type): order(obj.id for obj in objects)
+        for src_type, ids in rel._data.items()
+        for src_id, related in ids.items()
+        for dest_type, objects in related.items()
+        if objects
+    }
+    state['examples'] = {
+        tool.id: order((example.check_id, example.procedure.id) for example in tool.examples)
+        for tool in CheckTool.list_all()
+    }
+    state['checks'] = {check.id: (check.template_data('ja'), check.object_data())
+                       for check in Check._instances.values()}
+    state['guidelines'] = {gl.id: gl.template_data('en') for gl in Guideline._instances.values()}
+    state['faqs'] = {faq.id: faq.template_data('ja') for faq in Faq._instances.values()}
+    state['dependencies'] = {
+        'categories': {cat.id: order(cat.get_dependency()) for cat in Category.list_all()},
+        'tools': {tool.id: order(tool.get_dependency()) for tool in CheckTool.list_all()},
+        'faqs': {faq.id: order(faq.get_dependency()) for faq in Faq._instances.values()}
+    }
+    return state
+
+
+@pytest.mark.skipif(not (REPO_ROOT / 'data' / 'yaml').is_dir(), reason="data corpus not available")
+class TestReloadSources(unittest.TestCase):
+    """Test that reloading changed files gives the same model as a full reload"""
+
+    def setUp(self):
+        """Copy the data corpus and load it"""
+        self.temp_dir = tempfile.mkdtemp()
+        shutil.copytree(REPO_ROOT / 'data', os.path.join(self.temp_dir, 'data'))
+        reset_model()
+        setup_instances(self.temp_dir, use_cache=False)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        reset_model()
+        shutil.rmtree(self.temp_dir)
+
+    def path(self, *parts):
+        return os.path.join(self.temp_dir, 'data', 'yaml', *parts)
+
+    def read(self, path):
+        with open(path, encoding='utf-8') as f:
+            return yaml_loader.safe_load(f)
+
+    def write(self, path, data):
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
+
+    def assert_same_as_full_reload(self, ordered=True):
+        """Compare the current model with a model loaded from scratch."""
+        incremental = model_state(ordered)
+        reset_model()
+        setup_instances(self.temp_dir, use_cache=False)
+        self.assertEqual(incremental, model_state(ordered))
+
+    def test_reload_check(self):
+        """Test reloading a check with changed text and procedures"""
+        path = self.path('checks', 'design', '0001.yaml')
+        data = self.read(path)
+        data['check']['ja'] = '変更されたチェック'
+        data['conditions'] = data['conditions'][:1]
+        self.write(path, data)
+        unchanged = Check.get_by_id('0002')
+
+        result = reload_sources([path], self.temp_dir)
+
+        self.assertEqual([obj.id for obj in result.updated], ['0001'])
+        self.assertEqual(result.removed, [])
+        self.assertIs(Check.get_by_id('0001'), result.updated[0])
+        self.assertIs(Check.get_by_id('0002'), unchanged)
+        self.assertEqual(Check.get_by_id('0001').check_text['ja'], '変更されたチェック')
+        self.assert_same_as_full_reload()
+
+    def test_reload_guideline_references(self):
+        """Test reloading a guideline whose checks, success criteria and info changed"""
+        path = self.path('gl', 'image', 'adjacent-contrast.yaml')
+        data = self.read(path)
+        data['checks'] = ['0002', '0001']
+        data['sc'] = ['1.4.3']
+        data['info'] = data['info'][1:] + ['https://example.com/new-info']
+        self.write(path, data)
+
+        reload_sources([path], self.temp_dir)
+
+        self.assertIn('https%3A//example.com/new-info', InfoRef._instances)
+        self.assert_same_as_full_reload()
+
+    def test_reload_faq_references(self):
+        """Test reloading an FAQ whose tags, checks and related FAQs changed"""
+        path = self.path('faq', 'd0003.yaml')
+        data = self.read(path)
+        data['tags'] = list(FaqTag._instances)[:2]
+        data['checks'] = ['0001']
+        data['faqs'] = ['p0005']
+        self.write(path, data)
+
+        reload_sources([path], self.temp_dir)
+
+        rel = RelationshipManager()
+        related = [faq.id for faq in rel.get_related_objects(Faq.get_by_id('d0003'), 'faq')]
+        self.assertNotIn('d0002', related)
+        self.assertIn('p0005', related)
+        self.assert_same_as_full_reload()
+
+    def test_reload_several_files(self):
+        """Test reloading files of all entity types at once"""
+        paths = [
+            self.path('checks', 'design', '0001.yaml'),
+            self.path('gl', 'image', 'adjacent-contrast.yaml'),
+            self.path('faq', 'd0003.yaml')
+        ]
+        for path in paths:
+            data = self.read(path)
+            data['sortKey'] = data['sortKey'] + 1 if 'sortKey' in data else data.get('sortKey')
+            self.write(path, data)
+
+        result = reload_sources(paths, self.temp_dir)
+
+        self.assertEqual(len(result.updated), 3)
+        self.assert_same_as_full_reload()
+
+    def test_add_and_delete_files(self):
+        """Test replacing a check by a new file and updating all files referring to it"""
+        new_path = self.path('checks', 'design', '9999.yaml')
+        data = self.read(self.path('checks', 'design', '0001.yaml'))
+        data['id'] = '9999'
+        data['sortKey'] = 999999
+        self.write(new_path, data)
+
+        gl_path = self.path('gl', 'image', 'adjacent-contrast.yaml')
+        gl = self.read(gl_path)
+        gl['checks'] = ['9999']
+        self.write(gl_path, gl)
+
+        old_check = Check.get_by_id('0001')
+        referrers = RelationshipManager().get_related_objects(old_check, 'guideline')
+        self.assertEqual([g.id for g in referrers if g.src_path != gl_path], ['gl-icon-contrast'])
+        icon_path = self.path('gl', 'icon', 'contrast.yaml')
+        icon = self.read(icon_path)
+        icon['checks'] = [c if c != '0001' else '9999' for c in icon['checks']]
+        self.write(icon_path, icon)
+        faq_paths = [faq.src_path for faq in RelationshipManager().get_related_objects(old_check, 'faq')]
+        for faq_path in faq_paths:
+            faq = self.read(faq_path)
+            faq['checks'] = [c if c != '0001' else '9999' for c in faq['checks']]
+            self.write(faq_path, faq)
+        os.remove(old_check.src_path)
+
+        result = reload_sources([new_path, gl_path, icon_path, old_check.src_path] + faq_paths, self.temp_dir)
+
+        self.assertEqual([obj.id for obj in result.removed], ['0001'])
+        self.assertIsNone(Check.get_by_id('0001'))
+        self.assert_same_as_full_reload(ordered=False)
+
+    def test_dangling_reference(self):
+        """Test that deleting a check referenced by unchanged files fails without changes"""
+        before = model_state()
+        path = Check.get_by_id('0001').src_path
+        os.remove(path)
+
+        with self.assertRaises(ValueError) as context:
+            reload_sources([path], self.temp_dir)
+
+        self.assertIn('Check ID 0001 referenced in', str(context.exception))
+        self.assertEqual(model_state(), before)
+
+    def test_duplicate_id(self):
+        """Test that an ID used by another file is rejected"""
+        path = self.path('checks', 'design', '0001.yaml')
+        data = self.read(path)
+        data['id'] = '0002'
+        self.write(path, data)
+
+        with self.assertRaises(ValueError) as context:
+            reload_sources([path], self.temp_dir)
+        self.assertIn('Duplicate check ID: 0002', str(context.exception))
+
+    def test_invalid_yaml(self):
+        """Test that a file which cannot be parsed leaves the model unchanged"""
+        before = model_state()
+        path = self.path('checks', 'design', '0001.yaml')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('id: [')
+
+        with self.assertRaises(ValueError):
+            reload_sources([path], self.temp_dir)
+        self.assertEqual(model_state(), before)
+
+    def test_constructor_error_restores_model(self):
+        """Test that an error while constructing new instances restores the model"""
+        before = model_state()
+        self.write(self.path('faq', 'd0003.yaml'), dict(self.read(self.path('faq', 'd0003.yaml')), checks=['0002']))
+        path = self.path('checks', 'design', '0001.yaml')
+        data = self.read(path)
+        data['sortKey'] = Check.get_by_id('0002').sort_key
+        self.write(path, data)
+
+        with self.assertRaises(ValueError) as context:
+            reload_sources([self.path('faq', 'd0003.yaml'), path], self.temp_dir)
+        self.assertIn('Duplicate check sortKey', str(context.exception))
+        self.assertEqual(model_state(), before)
+
+    def test_static_file_requires_full_reload(self):
+        """Test that static JSON files are rejected"""
+        path = os.path.join(self.temp_dir, 'data', 'json', 'info.json')
+        with self.assertRaises(ValueError) as context:
+            reload_sources([path], self.temp_dir)
+        self.assertIn('full reload', str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
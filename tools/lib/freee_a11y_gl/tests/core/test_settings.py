@@ -9,7 +9,7 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
 from pydantic import ValidationError
 
-from freee_a11y_gl.settings import (
+from freee_a11y_gl.settings_manager import (
     Settings,
     LanguageConfig,
     PathConfig,
@@ -170,7 +170,7 @@ class TestSettings(unittest.TestCase):
             settings_instance = Settings(profile="test")
             self.assertEqual(settings_instance._profile, "test")
 
-    @patch('freee_a11y_gl.settings.resources')
+    @patch('freee_a11y_gl.settings_manager.resources')
     def test_load_defaults_success(self, mock_resources):
         """Test load_defaults with successful resource loading"""
         mock_config_data = {
@@ -192,7 +192,7 @@ class TestSettings(unittest.TestCase):
 
         self.assertEqual(settings_instance._settings, mock_config_data)
 
-    @patch('freee_a11y_gl.settings.resources')
+    @patch('freee_a11y_gl.settings_manager.resources')
     def test_load_defaults_file_not_found(self, mock_resources):
         """Test load_defaults when resource file not found"""
         mock_files = MagicMock()
@@ -209,7 +209,7 @@ class TestSettings(unittest.TestCase):
         self.assertIn("languages", settings_instance._settings)
         self.assertEqual(settings_instance._settings["languages"]["default"], "ja")
 
-    @patch('freee_a11y_gl.settings.resources')
+    @patch('freee_a11y_gl.settings_manager.resources')
     def test_load_defaults_empty_config_file(self, mock_resources):
         """Test load_defaults with empty config file"""
         mock_files = MagicMock()
@@ -229,7 +229,7 @@ class TestSettings(unittest.TestCase):
 
     def test_load_defaults_fallback_to_file_system(self):
         """Test load_defaults fallback to file system"""
-        with patch('freee_a11y_gl.settings.resources') as mock_resources:
+        with patch('freee_a11y_gl.settings_manager.resources') as mock_resources:
             mock_resources.files.side_effect = ModuleNotFoundError()
 
             # Create a mock config file
@@ -250,7 +250,7 @@ class TestSettings(unittest.TestCase):
 
     def test_load_defaults_all_fallbacks_fail(self):
         """Test load_defaults when all fallbacks fail"""
-        with patch('freee_a11y_gl.settings.resources') as mock_resources:
+        with patch('freee_a11y_gl.settings_manager.resources') as mock_resources:
             mock_resources.files.side_effect = ModuleNotFoundError()
 
             with patch('pathlib.Path.exists', return_value=False):
@@ -388,7 +388,7 @@ class TestSettings(unittest.TestCase):
             # Should not raise exception, update should not be called
             settings_instance.update.assert_not_called()
 
-    @patch('freee_a11y_gl.settings.resources')
+    @patch('freee_a11y_gl.settings_manager.resources')
     def test_load_message_catalog_success(self, mock_resources):
         """Test load_message_catalog with successful resource loading"""
         mock_files = MagicMock()
@@ -397,7 +397,7 @@ class TestSettings(unittest.TestCase):
         mock_files.__truediv__.return_value = mock_message_file
         mock_resources.files.return_value = mock_files
 
-        with patch('freee_a11y_gl.settings.MessageCatalog') as mock_catalog_class:
+        with patch('freee_a11y_gl.settings_manager.MessageCatalog') as mock_catalog_class:
             mock_catalog = MagicMock()
             mock_catalog_class.load_with_fallback.return_value = mock_catalog
 
@@ -410,7 +410,7 @@ class TestSettings(unittest.TestCase):
     def test_load_message_catalog_all_fail(self):
         """Test load_message_catalog when all attempts fail"""
         with patch.object(Settings, '_get_config_base_dir') as mock_base_dir, \
-             patch('freee_a11y_gl.settings.MessageCatalog') as mock_catalog_class:
+             patch('freee_a11y_gl.settings_manager.MessageCatalog') as mock_catalog_class:
 
             mock_base_dir.return_value = Path("/config")
             mock_catalog_class.load_with_fallback.side_effect = Exception("Load failed")
@@ -0,0 +1,98 @@
+"""
+Tests for the Sphinx extension writing the labels index.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import types
+import unittest
+
+from freee_a11y_gl import sphinx_labels
+from freee_a11y_gl.sphinx_labels import (
+    ENVIRONMENT_PICKLE_NAME, LABELS_INDEX_NAME, read_labels_index, write_labels_index
+)
+
+LABELS = {
+    'exp-label': ('explanations/label', 'exp-label', 'ラベル'),
+    'genindex': ('genindex', '', '索引'),
+}
+
+
+class FakeApp:
+    """Sphinx application with the attributes used by the extension"""
+
+    def __init__(self, doctreedir, labels):
+        self.doctreedir = doctreedir
+        self.env = types.SimpleNamespace(domaindata={'std': {'labels': labels}})
+        self.listeners = {}
+
+    def connect(self, event, callback):
+        self.listeners[event] = callback
+
+
+class TestSphinxLabels(unittest.TestCase):
+    """Test cases for writing and reading the labels index"""
+
+    def setUp(self):
+        self.doctreedir = tempfile.mkdtemp()
+        self.pickle_path = os.path.join(self.doctreedir, ENVIRONMENT_PICKLE_NAME)
+        self.index_path = os.path.join(self.doctreedir, LABELS_INDEX_NAME)
+        with open(self.pickle_path, 'wb') as f:
+            f.write(b'environment')
+
+    def tearDown(self):
+        shutil.rmtree(self.doctreedir)
+
+    def test_write_and_read(self):
+        """Test that the labels are read back as lists"""
+        self.assertEqual(write_labels_index(self.doctreedir, LABELS), self.index_path)
+        self.assertEqual(read_labels_index(self.doctreedir),
+                         {label: list(value) for label, value in LABELS.items()})
+        self.assertEqual(os.listdir(self.doctreedir).count(LABELS_INDEX_NAME), 1)
+
+    def test_changed_pickle(self):
+        """Test that an index written with another environment pickle is not used"""
+        write_labels_index(self.doctreedir, LABELS)
+        with open(self.pickle_path, 'wb') as f:
+            f.write(b'rebuilt environment')
+        self.assertIsNone(read_labels_index(self.doctreedir))
+
+    def test_missing_and_unusable_index(self):
+        """Test that missing, unreadable and old indexes are not used"""
+        self.assertIsNone(read_labels_index(self.doctreedir))
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            f.write('{')
+        self.assertIsNone(read_labels_index(self.doctreedir))
+
+        write_labels_index(self.doctreedir, LABELS)
+        with open(self.index_path, encoding='utf-8') as f:
+            index = json.load(f)
+        index['version'] = 0
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        self.assertIsNone(read_labels_index(self.doctreedir))
+
+    def test_without_pickle(self):
+        """Test that no index is written or read without an environment pickle"""
+        os.remove(self.pickle_path)
+        self.assertIsNone(write_labels_index(self.doctreedir, LABELS))
+        self.assertFalse(os.path.exists(self.index_path))
+
+    def test_extension(self):
+        """Test that the index is written when a build has succeeded"""
+        app = FakeApp(self.doctreedir, LABELS)
+        metadata = sphinx_labels.setup(app)
+        self.assertTrue(metadata['parallel_read_safe'])
+        build_finished = app.listeners['build-finished']
+
+        build_finished(app, RuntimeError('failed'))
+        self.assertFalse(os.path.exists(self.index_path))
+        build_finished(app, None)
+        self.assertEqual(read_labels_index(self.doctreedir)['exp-label'],
+                         list(LABELS['exp-label']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests for the synthetic data set generator.
+"""
+
+import filecmp
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+from freee_a11y_gl.corpus import Corpus
+from freee_a11y_gl.info_utils import get_info_links
+from freee_a11y_gl.models.axe import AxeRule
+from freee_a11y_gl.models.check import Check
+from freee_a11y_gl.models.content import Guideline
+from freee_a11y_gl.models.faq.article import Faq
+from freee_a11y_gl.models.faq.tag import FaqTag
+from freee_a11y_gl.synthetic_corpus import generate_corpus, main
+from freee_a11y_gl.yaml_validator import YamlValidator
+
+REPO_ROOT = Path(__file__).resolve().parents[5]
+SCHEMA_DIR = str(REPO_ROOT / 'data' / 'json' / 'schemas')
+SIZES = {'checks': 40, 'guidelines': 20, 'faqs': 9, 'tags': 4, 'info_refs': 20, 'axe_rules': 10}
+
+
+class TestSyntheticCorpus(unittest.TestCase):
+    """Test cases for generate_corpus()"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.basedir = os.path.join(cls.temp_dir, 'corpus')
+        cls.sizes = generate_corpus(cls.basedir, seed=1, schema_dir=SCHEMA_DIR, **SIZES)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    def test_sizes(self):
+        """Test the numbers of objects written"""
+        self.assertEqual(self.sizes, SIZES)
+        self.assertEqual(generate_corpus(os.path.join(self.temp_dir, 'scaled'), scale=0.1,
+                                         axe_rules=2)['checks'], 16)
+
+    def test_schema_valid(self):
+        """Test that every YAML file is valid against the schemas"""
+        validator = YamlValidator(os.path.join(self.basedir, 'data', 'json', 'schemas'), 'strict')
+        for schema_name, subdir in [('check', 'checks'), ('guideline', 'gl'), ('faq', 'faq')]:
+            for path in Path(self.basedir, 'data', 'yaml', subdir).rglob('*.yaml'):
+                with open(path, encoding='utf-8') as f:
+                    validator.validate_yaml_data(yaml.safe_load(f), schema_name, str(path))
+
+    def test_load(self):
+        """Test that the data set loads with strict validation and axe-core rules"""
+        corpus = Corpus.load(self.basedir, use_cache=False, load_axe=True)
+        with corpus.activate():
+            self.assertEqual(len(Check._instances), SIZES['checks'])
+            self.assertEqual(len(Guideline._instances), SIZES['guidelines'])
+            self.assertEqual(len(Faq.list_all()), SIZES['faqs'])
+            self.assertEqual(len(FaqTag.list_all()), SIZES['tags'])
+            self.assertEqual(len(AxeRule.list_all()), SIZES['axe_rules'])
+            self.assertEqual(AxeRule.version, '4.10.2')
+            rm = corpus.relationship_manager
+            for check in Check._instances.values():
+                self.assertTrue(rm.get_related_objects(check, 'guideline'))
+            for tag in FaqTag.list_all():
+                self.assertTrue(rm.get_related_objects(tag, 'faq'))
+            conditions = [check for check in Check._instances.values() if check.conditions]
+            self.assertTrue(any(condition.type != 'simple'
+                                for check in conditions for condition in check.conditions))
+
+    def test_info_links(self):
+        """Test that the internal references resolve with the label index"""
+        links = get_info_links(self.basedir)
+        self.assertEqual(len(links), 18)
+        self.assertEqual(links['exp-synthetic-0001']['text'], {'ja': '解説1', 'en': 'Explanation 1'})
+
+    def test_deterministic(self):
+        """Test that the same seed produces the same data set"""
+        other = os.path.join(self.temp_dir, 'again')
+        generate_corpus(other, seed=1, schema_dir=SCHEMA_DIR, **SIZES)
+        for subdir in ['data/yaml/checks/code', 'data/yaml/checks/design', 'data/yaml/faq',
+                       'data/json', 'vendor/axe-core/lib/rules']:
+            comparison = filecmp.dircmp(os.path.join(self.basedir, subdir), os.path.join(other, subdir))
+            self.assertEqual(comparison.left_only + comparison.right_only + comparison.diff_files, [])
+
+    def test_invalid_sizes(self):
+        """Test the errors on sizes out of range"""
+        target = os.path.join(self.temp_dir, 'invalid')
+        with self.assertRaises(ValueError):
+            generate_corpus(target, guidelines=12 * 99 + 1)
+        with self.assertRaises(ValueError):
+            generate_corpus(target, rules=1)
+        with self.assertRaises(ValueError):
+            generate_corpus(self.basedir)
+        self.assertFalse(os.path.exists(target))
+
+    def test_main(self):
+        """Test the command line interface"""
+        target = os.path.join(self.temp_dir, 'cli')
+        self.assertEqual(main([target, '--scale', '0.05', '--axe-rules', '3',
+                               '--schema-dir', SCHEMA_DIR]), 0)
+        self.assertEqual(len(os.listdir(os.path.join(target, 'vendor', 'axe-core', 'lib', 'rules'))), 3)
+        with self.assertRaises(SystemExit):
+            main([os.path.join(self.temp_dir, 'no-schemas'), '--schema-dir',
+                  os.path.join(self.temp_dir, 'missing')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+"""
+Tests for the tracing of the phases of the guideline tools.
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from freee_a11y_gl import tracing
+from freee_a11y_gl.initializer import clear_instances, setup_instances
+from freee_a11y_gl.synthetic_corpus import generate_corpus
+
+REPO_ROOT = Path(__file__).resolve().parents[5]
+SCHEMA_DIR = str(REPO_ROOT / 'data' / 'json' / 'schemas')
+
+
+class TestTracing(unittest.TestCase):
+    """Test cases for spans and the trace file"""
+
+    def setUp(self):
+        tracing.reset()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        tracing.reset()
+        shutil.rmtree(self.temp_dir)
+
+    def test_disabled(self):
+        """Test that spans are not recorded while tracing is off"""
+        self.assertFalse(tracing.is_enabled())
+        self.assertIs(tracing.span('a'), tracing.span('b', key='value'))
+        with tracing.span('a'):
+            pass
+        self.assertEqual(tracing.get_events(), [])
+        self.assertIsNone(tracing.finish())
+
+    def test_nested_spans(self):
+        """Test that nested spans are recorded as complete events"""
+        tracing.enable()
+        with tracing.span('outer', category='test', count=2, path=Path('a')):
+            with tracing.span('inner'):
+                pass
+        inner, outer = tracing.get_events()
+        self.assertEqual((inner['name'], inner['cat'], inner['ph']),
+                         ('inner', tracing.DEFAULT_CATEGORY, 'X'))
+        self.assertEqual(outer['cat'], 'test')
+        self.assertEqual(outer['args'], {'count': 2, 'path': 'a'})
+        self.assertNotIn('args', inner)
+        self.assertLessEqual(outer['ts'], inner['ts'])
+        self.assertGreaterEqual(outer['ts'] + outer['dur'], inner['ts'] + inner['dur'])
+        self.assertEqual(outer['pid'], os.getpid())
+
+    def test_exception(self):
+        """Test that a span left by an exception is recorded with the error"""
+        tracing.enable()
+        with self.assertRaises(KeyError):
+            with tracing.span('failing'):
+                raise KeyError('x')
+        self.assertEqual(tracing.get_events()[0]['args'], {'error': 'KeyError'})
+
+    def test_traced(self):
+        """Test that a decorated function runs in a span"""
+        @tracing.traced()
+        def double(value):
+            return value * 2
+
+        @tracing.traced('named', category='test')
+        def identity(value):
+            return value
+
+        self.assertEqual(double(1), 2)
+        tracing.enable()
+        self.assertEqual(double(2), 4)
+        self.assertEqual(identity(3), 3)
+        self.assertEqual([event['name'] for event in tracing.get_events()],
+                         [double.__qualname__, 'named'])
+        self.assertEqual(double.__name__, 'double')
+
+    def test_phase_listeners(self):
+        """Test that phases are passed to the listeners whether tracing is on or not"""
+        calls = []
+
+        @contextlib.contextmanager
+        def listener(name, args):
+            calls.append(('enter', name, dict(args)))
+            try:
+                yield
+            finally:
+                calls.append(('exit', name))
+
+        @tracing.traced('decorated', phase=True)
+        def decorated():
+            pass
+
+        tracing.add_phase_listener(listener)
+        tracing.add_phase_listener(listener)
+        try:
+            self.assertIs(tracing.span('a'), tracing.span('b'))
+            with tracing.span('outer', phase=True, lang='ja'):
+                with tracing.span('not_a_phase'):
+                    decorated()
+            with self.assertRaises(KeyError):
+                with tracing.span('failing', phase=True):
+                    raise KeyError('x')
+            self.assertEqual(tracing.get_events(), [])
+
+            tracing.enable()
+            with tracing.span('traced', phase=True):
+                pass
+            self.assertEqual([event['name'] for event in tracing.get_events()], ['traced'])
+        finally:
+            tracing.remove_phase_listener(listener)
+        with tracing.span('removed', phase=True):
+            pass
+
+        self.assertEqual(calls, [
+            ('enter', 'outer', {'lang': 'ja'}), ('enter', 'decorated', {}),
+            ('exit', 'decorated'), ('exit', 'outer'),
+            ('enter', 'failing', {}), ('exit', 'failing'),
+            ('enter', 'traced', {}), ('exit', 'traced'),
+        ])
+
+    def test_finish(self):
+        """Test the trace file and the summary written by finish()"""
+        path = os.path.join(self.temp_dir, 'out', 'trace.json')
+        tracing.enable(path)
+        for _ in range(3):
+            with tracing.span('repeated'):
+                pass
+        with tracing.span('once'):
+            pass
+        stream = io.StringIO()
+        self.assertEqual(tracing.finish(stream), path)
+        self.assertFalse(tracing.is_enabled())
+
+        with open(path, encoding='utf-8') as f:
+            trace = json.load(f)
+        self.assertEqual(trace['displayTimeUnit'], 'ms')
+        self.assertEqual(trace['traceEvents'][0]['ph'], 'M')
+        self.assertEqual([event['name'] for event in trace['traceEvents'][1:]],
+                         ['repeated'] * 3 + ['once'])
+
+        counts = {row['name']: row['count'] for row in tracing.summarize()}
+        self.assertEqual(counts, {'repeated': 3, 'once': 1})
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines[0].split(), ['span', 'count', 'total', 'ms', 'mean', 'ms',
+                                            'max', 'ms'])
+        self.assertEqual(sorted(line.split()[0] for line in lines[1:3]), ['once', 'repeated'])
+        self.assertEqual(lines[-1], f'Trace written to {path}')
+
+    def test_environment_variable(self):
+        """Test that the environment variable traces the process until it exits"""
+        path = os.path.join(self.temp_dir, 'trace.json')
+        script = ('from freee_a11y_gl import tracing\n'
+                  'with tracing.span("child"):\n'
+                  '    pass\n')
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                                env=dict(os.environ, **{tracing.ENV_VAR: path}), check=True)
+        self.assertIn('child', result.stderr)
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['traceEvents'][1]['name'], 'child')
+
+
+class TestSetupInstancesTracing(unittest.TestCase):
+    """Test cases for the spans of setup_instances()"""
+
+    def setUp(self):
+        tracing.reset()
+        self.temp_dir = tempfile.mkdtemp()
+        self.basedir = os.path.join(self.temp_dir, 'corpus')
+        generate_corpus(self.basedir, scale=0.05, schema_dir=SCHEMA_DIR, axe_rules=2)
+        clear_instances()
+
+    def tearDown(self):
+        tracing.reset()
+        clear_instances()
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_spans(self):
+        """Test that loading the model records a span for each phase"""
+        tracing.enable()
+        setup_instances(self.basedir, use_cache=False)
+        names = [event['name'] for event in tracing.get_events()]
+        self.assertEqual(names[-1], 'setup_instances')
+        for name in ['load.check', 'load.guideline', 'load.faq', 'load.wcag_sc',
+                     'resolve_faqs', 'yaml.parse', 'yaml.validate']:
+            self.assertIn(name, names)
+        self.assertNotIn('parse_cache.save', names)
@@ -0,0 +1,89 @@
+"""
+Tests for the YAML loader abstraction.
+"""
+
+import io
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from freee_a11y_gl import yaml_loader
+from freee_a11y_gl.initializer import ls_dir
+
+# Root of the a11y-guidelines repository, containing data/yaml
+REPO_ROOT = Path(__file__).resolve().parents[5]
+YAML_CORPUS_DIR = REPO_ROOT / 'data' / 'yaml'
+PACKAGE_DATA_DIR = Path(yaml_loader.__file__).parent / 'data'
+
+
+def corpus_files():
+    """Return all YAML files of the guidelines corpus and the package data."""
+    files = sorted(ls_dir(str(YAML_CORPUS_DIR), '.yaml'))
+    files += sorted(str(p) for p in PACKAGE_DATA_DIR.glob('*.yaml'))
+    return files
+
+
+class TestYamlLoader(unittest.TestCase):
+    """Test cases for yaml_loader"""
+
+    def test_loader_selection(self):
+        """Test that the C loader is used whenever PyYAML provides it"""
+        if getattr(yaml, '__with_libyaml__', False):
+            self.assertTrue(yaml_loader.LIBYAML_AVAILABLE)
+            self.assertIs(yaml_loader.SafeLoader, yaml.CSafeLoader)
+        else:
+            self.assertFalse(yaml_loader.LIBYAML_AVAILABLE)
+            self.assertIs(yaml_loader.SafeLoader, yaml.SafeLoader)
+
+    def test_safe_load_string_and_stream(self):
+        """Test loading from strings and file objects"""
+        document = "id: '0001'\nnames:\n  ja: 日本語\n  en: English\n"
+        expected = {'id': '0001', 'names': {'ja': '日本語', 'en': 'English'}}
+        self.assertEqual(yaml_loader.safe_load(document), expected)
+
+        self.assertEqual(yaml_loader.safe_load(io.StringIO(document)), expected)
+
+    def test_safe_load_empty_document(self):
+        """Test that an empty document is loaded as None"""
+        self.assertIsNone(yaml_loader.safe_load(''))
+
+    def test_safe_load_rejects_python_tags(self):
+        """Test that arbitrary Python objects cannot be constructed"""
+        with self.assertRaises(yaml.YAMLError):
+            yaml_loader.safe_load('!!python/object/apply:os.system ["true"]')
+
+    def test_safe_load_invalid_yaml(self):
+        """Test that parse errors are raised as yaml.YAMLError"""
+        with self.assertRaises(yaml.YAMLError):
+            yaml_loader.safe_load('invalid: yaml: content: [')
+
+    def test_fallback_loader(self):
+        """Test that the pure-Python loader is used without libyaml"""
+        with patch.object(yaml_loader, 'SafeLoader', yaml.SafeLoader):
+            self.assertEqual(yaml_loader.safe_load('a: [1, 2]'), {'a': [1, 2]})
+
+
+@pytest.mark.skipif(not YAML_CORPUS_DIR.is_dir(), reason="data/yaml corpus not available")
+@pytest.mark.skipif(not yaml_loader.LIBYAML_AVAILABLE, reason="PyYAML built without libyaml")
+class TestYamlLoaderParity(unittest.TestCase):
+    """Test that the C loader produces the same data as the pure-Python loader"""
+
+    def test_corpus_parity(self):
+        """Test parity on every YAML file of the corpus"""
+        files = corpus_files()
+        self.assertGreater(len(files), 0)
+        for file in files:
+            with self.subTest(file=file):
+                content = Path(file).read_text(encoding='utf-8')
+                expected = yaml.load(content, Loader=yaml.SafeLoader)
+                actual = yaml.load(content, Loader=yaml.CSafeLoader)
+                self.assertEqual(actual, expected)
+                # Equal values may still differ in type (e.g. 1 and True)
+                self.assertEqual(repr(actual), repr(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,7 @@ from freee_a11y_gl.config import Config
 from freee_a11y_gl.yaml_validator import YamlValidator
 from freee_a11y_gl.yaml_validator import ValidationError as YamlValidationError
 from freee_a11y_gl.exceptions import ValidationError
-from freee_a11y_gl.settings import settings
+from freee_a11y_gl.settings_manager import settings
 
 
 class TestYamlValidationConfig:
@@ -61,6 +61,20 @@ class TestYamlValidationConfig:
         with pytest.raises(ValidationError, match="validation mode must be one of"):
             Config.set_yaml_validation_mode("invalid_mode")
 
+    def test_default_validation_backend(self):
+        """Test that default validation backend is 'jsonschema'."""
+        assert Config.get_yaml_validation_backend() == "jsonschema"
+
+    def test_set_validation_backend(self):
+        """Test setting valid and invalid validation backends."""
+        Config.set_yaml_validation_backend("codegen")
+        assert Config.get_yaml_validation_backend() == "codegen"
+        Config.set_yaml_validation_backend("jsonschema")
+        assert Config.get_yaml_validation_backend() == "jsonschema"
+
+        with pytest.raises(ValidationError, match="validation backend must be one of"):
+            Config.set_yaml_validation_backend("invalid_backend")
+
     def test_config_initialize_with_validation_override(self):
         """Test initializing config with validation override."""
         Config.initialize(
@@ -239,7 +253,7 @@ class TestYamlValidationConfig:
 
     def test_settings_validation_config_structure(self):
         """Test that settings properly validate ValidationConfig structure."""
-        from freee_a11y_gl.settings import ValidationConfig
+        from freee_a11y_gl.settings_manager import ValidationConfig
 
         # Test valid configurations
         valid_config = ValidationConfig(yaml_validation="strict")
@@ -257,7 +271,7 @@ class TestYamlValidationConfig:
 
     def test_settings_global_config_with_validation(self):
         """Test that GlobalConfig properly includes ValidationConfig."""
-        from freee_a11y_gl.settings import GlobalConfig, LanguageConfig, PathConfig, ValidationConfig, AxeCoreConfig
+        from freee_a11y_gl.settings_manager import GlobalConfig, LanguageConfig, PathConfig, ValidationConfig, AxeCoreConfig
 
         axe_core_config = AxeCoreConfig(
             submodule_name="vendor/axe-core",
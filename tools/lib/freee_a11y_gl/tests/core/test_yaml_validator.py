@@ -6,14 +6,52 @@ import json
 import os
 import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch, mock_open
 
+import pytest
+
+from freee_a11y_gl import yaml_validator, yaml_loader
+from freee_a11y_gl.initializer import ls_dir
 from freee_a11y_gl.yaml_validator import YamlValidator, ValidationError
 
+# Root of the a11y-guidelines repository, containing data/yaml and data/json/schemas
+REPO_ROOT = Path(__file__).resolve().parents[5]
+SCHEMA_DIR = REPO_ROOT / 'data' / 'json' / 'schemas'
+CORPUS = [('check', 'checks'), ('guideline', 'gl'), ('faq', 'faq')]
+
+VALID_CHECK = {
+    "id": "0001",
+    "check": {
+        "ja": "日本語のチェック内容",
+        "en": "English check content"
+    },
+    "severity": "normal",
+    "target": "design",
+    "platform": ["web", "mobile"]
+}
+
+
+def load_corpus():
+    """Return (schema name, data, path) of every entity YAML file in the repository."""
+    corpus = []
+    for schema_name, subdir in CORPUS:
+        for file in sorted(ls_dir(str(REPO_ROOT / 'data' / 'yaml' / subdir))):
+            with open(file, encoding='utf-8') as f:
+                corpus.append((schema_name, yaml_loader.safe_load(f), file))
+    return corpus
+
 
 class TestYamlValidator(unittest.TestCase):
     """Test cases for YamlValidator class"""
 
+    # Backend of the validators created by the tests
+    backend = "jsonschema"
+
+    def create_validator(self, schema_dir):
+        """Create a validator with the backend of the test case"""
+        return YamlValidator(schema_dir, backend=self.backend)
+
     def setUp(self):
         """Set up test fixtures"""
         # Create temporary directory for schemas
@@ -86,7 +124,7 @@ class TestYamlValidator(unittest.TestCase):
 
     def test_validator_initialization(self):
         """Test validator initialization"""
-        validator = YamlValidator(self.temp_dir)
+        validator = self.create_validator(self.temp_dir)
 
         # Check that schemas are loaded
         self.assertIn('common', validator.schemas)
@@ -94,13 +132,16 @@ class TestYamlValidator(unittest.TestCase):
         self.assertIn('guideline', validator.schemas)
         self.assertIn('faq', validator.schemas)
 
-        # Check that resolvers are created
-        self.assertIn('common', validator.resolvers)
-        self.assertIn('check', validator.resolvers)
+        # Check that references can be resolved from the loaded schemas
+        if validator.registry is None:
+            self.assertIn('common', validator.resolvers)
+            self.assertIn('check', validator.resolvers)
+        else:
+            self.assertIsNotNone(validator.registry)
 
     def test_get_available_schemas(self):
         """Test getting available schema names"""
-        validator = YamlValidator(self.temp_dir)
+        validator = self.create_validator(self.temp_dir)
         schemas = validator.get_available_schemas()
 
         expected_schemas = ['common', 'check', 'guideline', 'faq']
@@ -109,7 +150,7 @@ class TestYamlValidator(unittest.TestCase):
 
     def test_valid_yaml_data(self):
         """Test validation with valid YAML data"""
-        validator = YamlValidator(self.temp_dir)
+        validator = self.create_validator(self.temp_dir)
 
         valid_data = {
             "id": "0001",
@@ -130,7 +171,7 @@ class TestYamlValidator(unittest.TestCase):
 
     def test_invalid_yaml_data_missing_required(self):
         """Test validation with missing required fields"""
-        validator = YamlValidator(self.temp_dir)
+        validator = self.create_validator(self.temp_dir)
 
         invalid_data = {
             "id": "0001",
@@ -151,7 +192,7 @@ class TestYamlValidator(unittest.TestCase):
 
     def test_invalid_yaml_data_wrong_type(self):
         """Test validation with wrong data types"""
-        validator = YamlValidator(self.temp_dir)
+        validator = self.create_validator(self.temp_dir)
 
         invalid_data = {
             "id": "0001",
@@ -172,7 +213,7 @@ class TestYamlValidator(unittest.TestCase):
 
     def test_invalid_yaml_data_ref_validation(self):
         """Test validation with $ref that fails"""
-        validator = YamlValidator(self.temp_dir)
+        validator = self.create_validator(self.temp_dir)
 
         invalid_data = {
             "id": "0001",
@@ -193,7 +234,7 @@ class TestYamlValidator(unittest.TestCase):
 
     def test_unknown_schema(self):
         """Test validation with unknown schema name"""
-        validator = YamlValidator(self.temp_dir)
+        validator = self.create_validator(self.temp_dir)
 
         valid_data = {"test": "data"}
 
@@ -208,7 +249,7 @@ class TestYamlValidator(unittest.TestCase):
     def test_missing_schema_file_warning(self, mock_stderr, mock_open_func):
         """Test warning when schema file is missing"""
         # This should not raise an exception, just print a warning
-        validator = YamlValidator('/nonexistent/path')
+        validator = self.create_validator('/nonexistent/path')
 
         # Validator should still be created but with empty schemas
         self.assertEqual(len(validator.schemas), 0)
@@ -218,7 +259,151 @@ class TestYamlValidator(unittest.TestCase):
     def test_invalid_json_schema_file(self, mock_stderr):
         """Test error handling for invalid JSON in schema file"""
         with self.assertRaises(SystemExit):
-            YamlValidator('/test/path')
+            self.create_validator('/test/path')
+
+    def test_validator_compiled_once(self):
+        """Test that each schema is compiled once and reused"""
+        validator = self.create_validator(self.temp_dir)
+
+        with patch('freee_a11y_gl.yaml_validator.Draft202012Validator',
+                   wraps=yaml_validator.Draft202012Validator) as mock_validator_class:
+            for i in range(3):
+                validator.validate_yaml_data(VALID_CHECK, 'check', f'/test/{i}.yaml')
+
+        mock_validator_class.assert_called_once()
+        self.assertIs(validator.get_validator('check'), validator.get_validator('check'))
+
+    def test_refs_resolved_without_network(self):
+        """Test that references to other schemas never fetch them remotely"""
+        validator = self.create_validator(self.temp_dir)
+        invalid_data = dict(VALID_CHECK, check={"ja": "日本語のみ"})
+
+        with patch('urllib.request.urlopen', side_effect=AssertionError("network access")):
+            validator.validate_yaml_data(VALID_CHECK, 'check', '/test/file.yaml')
+            with self.assertRaises(ValidationError) as context:
+                validator.validate_yaml_data(invalid_data, 'check', '/test/file.yaml')
+
+        self.assertIn("'en' is a required property", str(context.exception))
+
+    def test_additional_schema_files_are_preloaded(self):
+        """Test that other schemas in the directory can be referenced"""
+        with open(os.path.join(self.temp_dir, 'extra.json'), 'w') as f:
+            json.dump({
+                "$id": "https://a11y-guidelines.freee.co.jp/schemas/extra.json",
+                "$defs": {"code": {"type": "string", "pattern": "^[A-Z]+$"}}
+            }, f)
+        with open(os.path.join(self.temp_dir, 'faq.json'), 'w') as f:
+            json.dump({
+                "$id": "https://a11y-guidelines.freee.co.jp/schemas/faq.json",
+                "type": "object",
+                "properties": {"code": {"$ref": "extra.json#/$defs/code"}}
+            }, f)
+
+        validator = self.create_validator(self.temp_dir)
+        self.assertIn('extra', validator.get_available_schemas())
+        validator.validate_yaml_data({"code": "ABC"}, 'faq', '/test/faq.yaml')
+        with self.assertRaises(ValidationError):
+            validator.validate_yaml_data({"code": "abc"}, 'faq', '/test/faq.yaml')
+
+    def test_schema_without_id_references_by_file(self):
+        """Test that schemas without $id resolve references relative to their file"""
+        with open(os.path.join(self.temp_dir, 'guideline.json'), 'w') as f:
+            json.dump({
+                "type": "object",
+                "properties": {"title": {"$ref": "common.json#/$defs/i18nString"}}
+            }, f)
+
+        validator = self.create_validator(self.temp_dir)
+        validator.validate_yaml_data({"title": {"ja": "題", "en": "Title"}}, 'guideline', '/test/gl.yaml')
+        with self.assertRaises(ValidationError):
+            validator.validate_yaml_data({"title": {"ja": "題"}}, 'guideline', '/test/gl.yaml')
+
+    @patch('sys.stderr')
+    def test_codegen_backend_unavailable(self, mock_stderr):
+        """Test that the jsonschema backend is used without fastjsonschema"""
+        with patch.object(yaml_validator, 'fastjsonschema', None):
+            validator = YamlValidator(self.temp_dir, backend="codegen")
+
+        self.assertEqual(validator.backend, "jsonschema")
+        written = ''.join(c.args[0] for c in mock_stderr.write.call_args_list)
+        self.assertIn("fastjsonschema is not installed", written)
+
+
+@pytest.mark.skipif(yaml_validator.fastjsonschema is None, reason="fastjsonschema not installed")
+class TestCodegenBackend(TestYamlValidator):
+    """Run the YamlValidator tests with the code-generating backend"""
+
+    backend = "codegen"
+
+    def test_validator_compiled_once(self):
+        """Test that each schema is compiled into a function once and reused"""
+        validator = self.create_validator(self.temp_dir)
+
+        with patch('freee_a11y_gl.yaml_validator.fastjsonschema.compile',
+                   wraps=yaml_validator.fastjsonschema.compile) as mock_compile:
+            for i in range(3):
+                validator.validate_yaml_data(VALID_CHECK, 'check', f'/test/{i}.yaml')
+
+        mock_compile.assert_called_once()
+
+    def test_codegen_backend_selected(self):
+        """Test that schemas are compiled into functions"""
+        validator = self.create_validator(self.temp_dir)
+        self.assertEqual(validator.backend, "codegen")
+
+        validator.validate_yaml_data(VALID_CHECK, 'check', '/test/file.yaml')
+        self.assertTrue(callable(validator.compiled['check']))
+
+    def test_valid_data_skips_jsonschema(self):
+        """Test that valid data is not validated by jsonschema"""
+        validator = self.create_validator(self.temp_dir)
+
+        with patch.object(validator, 'get_validator') as mock_get_validator:
+            validator.validate_yaml_data(VALID_CHECK, 'check', '/test/file.yaml')
+
+        mock_get_validator.assert_not_called()
+
+    def test_error_report_matches_jsonschema(self):
+        """Test that invalid data is reported exactly as by the jsonschema backend"""
+        invalid_data = dict(VALID_CHECK, severity="invalid", check={"ja": "日本語のみ"})
+        messages = []
+        for backend in ["jsonschema", "codegen"]:
+            validator = YamlValidator(self.temp_dir, backend=backend)
+            with self.assertRaises(ValidationError) as context:
+                validator.validate_yaml_data(invalid_data, 'check', '/test/file.yaml')
+            messages.append(str(context.exception))
+
+        self.assertEqual(messages[0], messages[1])
+
+
+@pytest.mark.skipif(not SCHEMA_DIR.is_dir(), reason="repository schemas not available")
+class TestRepositorySchemas(unittest.TestCase):
+    """Validate the repository corpus with the repository schemas"""
+
+    def test_corpus_is_valid(self):
+        """Test that every entity file passes strict validation"""
+        validator = YamlValidator(str(SCHEMA_DIR))
+        for schema_name, data, file in load_corpus():
+            with self.subTest(file=file):
+                validator.validate_yaml_data(data, schema_name, file)
+
+    @pytest.mark.skipif(yaml_validator.fastjsonschema is None, reason="fastjsonschema not installed")
+    def test_codegen_parity(self):
+        """Test that both backends accept and reject the same corpus entries"""
+        validators = [YamlValidator(str(SCHEMA_DIR), backend=b) for b in ["jsonschema", "codegen"]]
+        for schema_name, data, file in load_corpus():
+            # Break each file in a way a schema should catch
+            broken = dict(data, id=0)
+            for sample in (data, broken):
+                results = []
+                for validator in validators:
+                    try:
+                        validator.validate_yaml_data(sample, schema_name, file)
+                        results.append(None)
+                    except ValidationError as e:
+                        results.append(str(e))
+                with self.subTest(file=file, sample=sample is broken):
+                    self.assertEqual(results[0], results[1])
 
 
 if __name__ == '__main__':
@@ -1,3 +1,5 @@
+import pytest
+
 from freee_a11y_gl.relationship_manager import RelationshipManager
 from freee_a11y_gl.models.base import BaseModel
 
@@ -329,3 +331,162 @@ class TestRelationshipManager:
 
         assert retrieved_obj2 is obj2
         assert retrieved_obj1 is obj1
+
+    def test_forget_declared_faqs(self):
+        """Test that only the relationships declared by an FAQ are dropped."""
+        manager = RelationshipManager()
+
+        manager.add_unresolved_faqs("faq1", "faq2")
+        manager.add_unresolved_faqs("faq3", "faq1")
+        manager.forget_declared_faqs("faq1")
+
+        assert manager._unresolved_faqs == {"faq3": ["faq1"], "faq1": ["faq3"]}
+
+    def test_disassociate_objects(self):
+        """Test removing a relationship in both directions."""
+        manager = RelationshipManager()
+
+        obj1 = MockModel("obj1", "type1")
+        obj2 = MockModel("obj2", "type2")
+        obj3 = MockModel("obj3", "type2")
+        manager.associate_objects(obj1, obj2)
+        manager.associate_objects(obj1, obj3)
+
+        manager.disassociate_objects(obj1, obj2)
+
+        assert manager.get_related_objects(obj1, "type2") == [obj3]
+        assert manager.get_related_objects(obj2, "type1") == []
+        assert not manager.has_related_objects(obj2)
+        assert manager.has_related_objects(obj3)
+
+    def test_detach_and_restore_positions(self):
+        """Test that a replacement object can take the positions of a detached object."""
+        manager = RelationshipManager()
+
+        parent = MockModel("parent", "parent")
+        children = [MockModel(f"child{i}", "child") for i in range(3)]
+        for child in children:
+            manager.associate_objects(parent, child)
+
+        positions = manager.get_positions(children[1])
+        related = manager.detach_object(children[1])
+        assert related == {"parent": [parent]}
+        assert manager.get_related_objects(parent, "child") == [children[0], children[2]]
+
+        replacement = MockModel("child1", "child")
+        manager.associate_objects(parent, replacement)
+        manager.move_to_positions([(replacement, positions)])
+
+        assert positions == {("parent", "parent"): 1}
+        assert manager.get_related_objects(parent, "child") == [children[0], replacement, children[2]]
+
+    def test_associate_many(self):
+        """Test associating pairs in bulk like repeated associate_objects calls."""
+        manager = RelationshipManager()
+
+        parent = MockModel("parent", "parent")
+        children = [MockModel(f"child{i}", "child") for i in range(3)]
+        manager.associate_many([(parent, children[2]), (parent, children[0]),
+                                (children[1], parent), (parent, children[0])])
+
+        assert manager.get_related_objects(parent, "child") == [children[2], children[0], children[1]]
+        assert manager.get_related_objects(children[1], "parent") == [parent]
+
+    def test_sorted_views_are_cached(self):
+        """Test that sorted lists are reused until the relationships change."""
+        manager = RelationshipManager()
+
+        parent = MockModel("parent", "parent")
+        first = MockModel("b", "child", sort_key="2")
+        second = MockModel("a", "child", sort_key="1")
+        manager.associate_many([(parent, first), (parent, second)])
+
+        by_sort_key = manager.get_sorted_related_objects(parent, "child")
+        by_id = manager.get_sorted_related_objects(parent, "child", key="id")
+        assert by_sort_key == [second, first]
+        assert manager.get_sorted_related_objects(parent, "child") is by_sort_key
+        assert manager.get_sorted_related_objects(parent, "child", key="id") is by_id
+
+        third = MockModel("c", "child", sort_key="0")
+        manager.associate_objects(parent, third)
+        assert manager.get_sorted_related_objects(parent, "child") == [third, second, first]
+        assert by_sort_key == [second, first]
+
+        manager.disassociate_objects(parent, second)
+        assert manager.get_sorted_related_objects(parent, "child") == [third, first]
+
+        manager.detach_object(third)
+        assert manager.get_sorted_related_objects(parent, "child") == [first]
+        assert manager.get_related_objects(third, "parent") == []
+
+    def test_move_to_positions_updates_views(self):
+        """Test that reordering a relationship list drops its cached view."""
+        manager = RelationshipManager()
+
+        parent = MockModel("parent", "parent")
+        children = [MockModel(f"child{i}", "child") for i in range(3)]
+        manager.associate_many((parent, child) for child in children)
+        assert manager.get_related_objects(parent, "child") == children
+
+        manager.move_to_positions([(children[2], {("parent", "parent"): 0})])
+        assert manager.get_related_objects(parent, "child") == [children[2], children[0], children[1]]
+
+    def test_snapshot_and_restore(self):
+        """Test that restore() undoes the changes made after snapshot()."""
+        manager = RelationshipManager()
+
+        obj1 = MockModel("obj1", "type1")
+        obj2 = MockModel("obj2", "type2")
+        obj3 = MockModel("obj3", "type2")
+        manager.associate_objects(obj1, obj2)
+        manager.add_unresolved_faqs("faq1", "faq2")
+        snapshot = manager.snapshot()
+
+        for _ in range(2):
+            manager.disassociate_objects(obj1, obj2)
+            manager.associate_objects(obj1, obj3)
+            manager.forget_declared_faqs("faq1")
+            manager.add_unresolved_faqs("faq3", "faq1")
+            assert manager.get_related_objects(obj1, "type2") == [obj3]
+
+            manager.restore(snapshot)
+            assert manager.get_related_objects(obj1, "type2") == [obj2]
+            assert manager.get_related_objects(obj3, "type1") == []
+            assert manager._unresolved_faqs == {"faq1": ["faq2"], "faq2": ["faq1"]}
+            assert manager._declared_faqs == {"faq1": ["faq2"]}
+
+    def _dependency_graph(self, manager):
+        """Create a FAQ tag with FAQs related to guidelines and checks."""
+        objects = {}
+        for id, object_type, sort_key in [("tag", "faq_tag", "tag"), ("faq1", "faq", "2"),
+                                          ("faq2", "faq", "1"), ("gl", "guideline", "gl"),
+                                          ("check", "check", "check")]:
+            objects[id] = MockModel(id, object_type, sort_key=sort_key)
+            objects[id].src_path = f"{id}.yaml"
+        manager.associate_many([(objects["faq1"], objects["tag"]), (objects["faq2"], objects["tag"]),
+                                (objects["faq1"], objects["gl"]), (objects["faq1"], objects["check"]),
+                                (objects["faq2"], objects["gl"])])
+        return objects
+
+    def test_get_dependencies(self):
+        """Test walking the source files of the related objects of a rule."""
+        manager = RelationshipManager()
+        objects = self._dependency_graph(manager)
+
+        assert manager.get_dependencies(objects["tag"]) == ["faq2.yaml", "gl.yaml", "faq1.yaml", "check.yaml"]
+        assert manager.get_dependencies(objects["faq1"]) == ["faq1.yaml", "gl.yaml", "check.yaml"]
+        assert manager.get_dependencies(objects["tag"]) is manager.get_dependencies(objects["tag"])
+        with pytest.raises(KeyError):
+            manager.get_dependencies(objects["tag"], "no_such_rule")
+
+    def test_dependencies_follow_relationship_changes(self):
+        """Test that cached dependencies are dropped when relationships change."""
+        manager = RelationshipManager()
+        objects = self._dependency_graph(manager)
+        assert "check.yaml" in manager.get_dependencies(objects["tag"])
+
+        manager.disassociate_objects(objects["faq1"], objects["check"])
+        assert manager.get_dependencies(objects["tag"]) == ["faq2.yaml", "gl.yaml", "faq1.yaml"]
+
+        manager.detach_object(objects["faq2"])
+        assert manager.get_dependencies(objects["tag"]) == ["faq1.yaml", "gl.yaml"]
@@ -2,6 +2,7 @@
 
 from freee_a11y_gl.mixins.template_mixin import TemplateDataMixin
 from freee_a11y_gl.models.base import BaseModel
+from freee_a11y_gl.relationship_manager import RelationshipManager
 
 
 from unittest.mock import Mock
@@ -146,30 +147,26 @@ class TestTemplateDataMixin:
         assert isinstance(result, str)
         assert len(result) > 0
 
-    def test_get_relationship_manager_caching(self):
-        """Test relationship manager caching behavior."""
-        model = MockModel("test_010")
+    def test_get_relationship_manager_shared(self):
+        """Test that all instances share the relationship manager singleton."""
+        model1 = MockModel("test_010")
+        model2 = MockModel("test_011")
 
-        # First call should create and cache the relationship manager
-        rel1 = model._get_relationship_manager()
-        rel2 = model._get_relationship_manager()
+        rel = model1._get_relationship_manager()
 
-        # Should return the same instance (cached)
-        assert rel1 is rel2
-        assert model._relationship_manager is rel1
+        assert model2._get_relationship_manager() is rel
+        assert rel is RelationshipManager()
 
-    def test_get_relationship_manager_fallback(self):
-        """Test fallback behavior when no cached relationship manager."""
-        model = MockModel("test_011")
-
-        # Ensure no cached relationship manager
-        model._relationship_manager = None
+    def test_get_relationship_manager_follows_reset(self):
+        """Test that instances use a new relationship manager after a reset."""
+        model = MockModel("test_012")
+        old_rel = model._get_relationship_manager()
 
+        RelationshipManager._instance = None
         rel = model._get_relationship_manager()
 
-        # Should create a new RelationshipManager instance
-        assert rel is not None
-        assert model._relationship_manager is rel
+        assert rel is not old_rel
+        assert rel is RelationshipManager()
 
 
 class TestTemplateDataMixinIntegration:
@@ -430,3 +430,52 @@ class TestAxeRule:
             assert AxeRule._instances['tracked-rule'] is rule
 
         self.tearDown()
+
+    def test_axe_rule_deferred_loader(self):
+        """Test that a registered loader runs once on first use."""
+        self.setUp()
+        loader = MagicMock()
+        AxeRule.set_loader(loader)
+
+        try:
+            loader.assert_not_called()
+            assert AxeRule.list_all() == []
+            assert AxeRule.get_by_id('missing') is None
+            loader.assert_called_once_with()
+        finally:
+            AxeRule.set_loader(None)
+            self.tearDown()
+
+    def test_axe_rule_failing_loader(self):
+        """Test that a failing loader is called again on the next use."""
+        self.setUp()
+        loader = MagicMock(side_effect=[RuntimeError('no axe-core submodule'), None])
+        AxeRule.set_loader(loader)
+
+        try:
+            with pytest.raises(RuntimeError):
+                AxeRule.list_all()
+            assert not AxeRule.is_loaded()
+            assert AxeRule.list_all() == []
+            assert loader.call_count == 2
+            assert AxeRule.is_loaded()
+        finally:
+            AxeRule.set_loader(None)
+            self.tearDown()
+
+    def test_axe_rule_relationship_lookup_triggers_loader(self):
+        """Test that relationship lookups involving axe rules load the rules."""
+        self.setUp()
+        loader = MagicMock()
+        rel = RelationshipManager()
+        other = MagicMock(object_type='wcag_sc', id='1.1.1')
+        AxeRule.set_loader(loader)
+
+        try:
+            rel.get_related_objects(other, 'guideline')
+            loader.assert_not_called()
+            rel.get_related_objects(other, 'axe_rule')
+            loader.assert_called_once_with()
+        finally:
+            AxeRule.set_loader(None)
+            self.tearDown()
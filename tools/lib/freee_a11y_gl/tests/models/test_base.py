@@ -1,4 +1,6 @@
-from freee_a11y_gl.models.base import BaseModel
+import pytest
+
+from freee_a11y_gl.models.base import BaseModel, Registry
 
 
 class ConcreteModel(BaseModel):
@@ -176,3 +178,113 @@ class TestBaseModel:
         model = ConcreteModel(123)
         assert model.id == 123
         assert ConcreteModel.get_by_id(123) == model
+
+
+class IndexedModel(BaseModel):
+    """Model with indexed fields for testing."""
+
+    object_type = "indexed_model"
+    _indexed_fields = {
+        'kind': 'kind',
+        'platform': 'platforms',
+        'tag': 'tags',
+    }
+    _instances = Registry(_indexed_fields)
+
+    def __init__(self, id: str, kind: str, platforms: list, tags: list = None):
+        super().__init__(id)
+        self.kind = kind
+        self.platforms = platforms
+        self._tags = tags or []
+        IndexedModel._instances[id] = self
+
+    def tags(self):
+        return self._tags
+
+
+class TestRegistry:
+    """Test cases for Registry and BaseModel.query."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        IndexedModel._instances.clear()
+
+    def test_lookup(self):
+        """Test that instances are indexed by scalar, list and method values."""
+        a = IndexedModel('a', 'x', ['web', 'ios'], ['t1'])
+        b = IndexedModel('b', 'y', ['web'], ['t1', 't2'])
+
+        registry = IndexedModel._instances
+        assert registry.lookup('kind', 'x') == [a]
+        assert registry.lookup('platform', 'web') == [a, b]
+        assert registry.lookup('tag', 't2') == [b]
+        assert registry.lookup('kind', 'z') == []
+
+    def test_index_follows_removal(self):
+        """Test that removed and replaced instances leave the indexes."""
+        a = IndexedModel('a', 'x', ['web'])
+        IndexedModel('b', 'x', ['ios'])
+        registry = IndexedModel._instances
+
+        del registry['b']
+        assert registry.lookup('kind', 'x') == [a]
+        assert 'ios' not in registry._indexes['platform']
+
+        c = IndexedModel('a', 'y', ['web'])
+        assert registry.lookup('kind', 'x') == []
+        assert registry.lookup('platform', 'web') == [c]
+
+        assert registry.pop('a') is c
+        assert registry.pop('a', None) is None
+        assert registry.lookup('platform', 'web') == []
+
+    def test_bulk_operations(self):
+        """Test that dict operations used by reloads keep the indexes"""
+        a = IndexedModel('a', 'x', ['web'])
+        b = IndexedModel('b', 'y', ['web'])
+        registry = IndexedModel._instances
+        saved = dict(registry)
+
+        registry.clear()
+        assert registry.lookup('platform', 'web') == []
+        registry.update(saved)
+        assert registry.lookup('platform', 'web') == [a, b]
+
+        copied = registry.copy()
+        assert isinstance(copied, Registry)
+        del copied['a']
+        assert copied.lookup('platform', 'web') == [b]
+        assert registry.lookup('platform', 'web') == [a, b]
+
+    def test_query(self):
+        """Test querying by one or several fields."""
+        a = IndexedModel('a', 'x', ['web', 'ios'])
+        b = IndexedModel('b', 'y', ['web'])
+        c = IndexedModel('c', 'x', ['android'])
+
+        assert IndexedModel.query(kind='x') == [a, c]
+        assert IndexedModel.query(platform='web') == [a, b]
+        assert IndexedModel.query(kind='x', platform='web') == [a]
+        assert IndexedModel.query(kind='y', platform='ios') == []
+        assert IndexedModel.query() == [a, b, c]
+
+    def test_query_unknown_field(self):
+        """Test that querying by a field without index raises ValueError."""
+        with pytest.raises(ValueError, match='Cannot query IndexedModel by color'):
+            IndexedModel.query(color='red')
+
+    def test_query_plain_dict_registry(self):
+        """Test that registries without indexes are scanned."""
+        class PlainModel(BaseModel):
+            object_type = "plain_model"
+            _indexed_fields = {'kind': 'kind'}
+            _instances = {}
+
+            def __init__(self, id: str, kind: str):
+                super().__init__(id)
+                self.kind = kind
+                PlainModel._instances[id] = self
+
+        a = PlainModel('a', 'x')
+        PlainModel('b', 'y')
+        assert PlainModel.query(kind='x') == [a]
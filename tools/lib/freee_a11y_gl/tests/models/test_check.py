@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock
 from freee_a11y_gl.models.check import (
     Check, Condition, Procedure, Implementation, Method, CheckTool, YouTube
 )
+from freee_a11y_gl.models.reference import InfoRef
 from tests.models.base_test import BaseModelTest
 
 
@@ -94,6 +95,28 @@ class TestCheck(BaseModelTest):
         with pytest.raises(ValueError, match="Duplicate check sortKey: 001"):
             Check(duplicate_data)
 
+    def test_query(self):
+        """Test querying checks by platform, severity and tool."""
+        CheckTool("axe", {"ja": "axe", "en": "axe"})
+        CheckTool("misc", {"ja": "その他", "en": "Misc"})
+        condition = {
+            "type": "simple",
+            "platform": "web",
+            "id": "test-proc-001",
+            "tool": "axe",
+            "procedure": {"ja": "テスト手順", "en": "Test procedure"}
+        }
+        web = Check({**self.sample_data, "conditions": [condition]})
+        ios = Check({**self.sample_data, "id": "test-check-002", "sortKey": "002",
+                     "severity": "critical", "platform": ["ios"]})
+
+        assert Check.query(platform="web") == [web]
+        assert Check.query(platform="ios", severity="critical") == [ios]
+        assert Check.query(platform="web", severity="critical") == []
+        assert Check.query(tool="axe") == [web]
+        assert Check.query(src_path="test/check.yaml") == [web, ios]
+        assert web.tool_ids() == ["axe"]
+
     def test_condition_platforms(self):
         """Test getting unique platforms from conditions."""
         # Mock condition objects
@@ -122,12 +145,12 @@ class TestCheck(BaseModelTest):
         mock_rel = MagicMock()
         mock_rel.get_related_objects.return_value = []
         mock_rel.get_sorted_related_objects.return_value = []
-        check._get_relationship_manager = MagicMock(return_value=mock_rel)
-
-        # Mock the join_platform_items method from mixin
-        check.join_platform_items = MagicMock(return_value='Web、モバイル')
 
-        result = check.template_data("ja")
+        # Check instances have no __dict__, so the methods are mocked on the
+        # class; join_platform_items comes from the mixin
+        with patch.object(Check, '_get_relationship_manager', return_value=mock_rel), \
+                patch.object(Check, 'join_platform_items', return_value='Web、モバイル'):
+            result = check.template_data("ja")
 
         expected = {
             'id': 'test-check-001',
@@ -171,7 +194,7 @@ class TestCheck(BaseModelTest):
 
         check = Check(self.sample_data)
 
-        with patch.object(check, '_get_relationship_manager',
+        with patch.object(Check, '_get_relationship_manager',
                           return_value=mock_rel):
             result = check.object_data()
 
@@ -364,6 +387,109 @@ class TestCondition:
                 summary = condition.summary("ja")
                 assert summary == "test-procを満たしている"
 
+    def nested_condition(self, check):
+        """Create an AND condition of two simple conditions and an OR condition."""
+        def simple(proc_id):
+            return {"type": "simple", "id": proc_id, "tool": "axe",
+                    "procedure": {"ja": "手順", "en": "Procedure"}}
+        condition_data = {
+            "type": "and",
+            "platform": "web",
+            "conditions": [simple("proc-1"), simple("proc-2"),
+                           {"type": "or", "conditions": [simple("proc-3"), simple("proc-4")]}]
+        }
+        CheckTool("axe", {"ja": "axe", "en": "axe"})
+        return Condition(condition_data, check)
+
+    @patch('freee_a11y_gl.models.check.Config')
+    def test_summary_memoized(self, mock_config):
+        """Test that summaries are built once per language."""
+        mock_config.get_pass_singular_text.return_value = "を満たしている"
+        mock_config.get_pass_plural_text.return_value = "を満たしている"
+        mock_config.get_separator.return_value = "、"
+        mock_config.get_conjunction.return_value = "かつ"
+        check = Check(TestCheck.sample_data)
+        condition = self.nested_condition(check)
+
+        summary = condition.summary("ja")
+        calls = mock_config.get_pass_singular_text.call_count
+        assert summary == "proc-1、proc-2を満たしているかつ(proc-3、proc-4を満たしている)"
+        assert condition.summary("ja") == summary
+        assert condition.conditions[2].summary("ja") == "proc-3、proc-4を満たしている"
+        assert mock_config.get_pass_singular_text.call_count == calls
+
+        condition.summary("en")
+        assert mock_config.get_pass_singular_text.call_count > calls
+
+    def test_condition_data_memoized(self):
+        """Test that template and object data are built once and copied at the top level."""
+        check = Check(TestCheck.sample_data)
+        condition = self.nested_condition(check)
+
+        with patch.object(Condition, '_build_template_data',
+                          wraps=condition._build_template_data) as mock_build:
+            data = condition.template_data("ja")
+            assert condition.template_data("ja") == data
+            assert mock_build.call_count == 1
+        assert [proc['id'] for proc in data['procedures']] == ["proc-1", "proc-2", "proc-3", "proc-4"]
+
+        data = condition.object_data(None, is_top=True)
+        data['target'] = "codeWeb"
+        again = condition.object_data(None, is_top=True)
+        assert 'target' not in again
+        assert again['conditions'] is data['conditions']
+        assert again['platform'] == "web"
+        assert 'platform' not in condition.object_data("web", is_top=False)
+
+    def test_condition_tree_built_once(self):
+        """Test that rendering a condition tree again builds no data until the settings change."""
+        from freee_a11y_gl.settings_manager import settings
+        check = Check(TestCheck.sample_data)
+        condition = self.nested_condition(check)
+
+        def render():
+            condition.object_data(None, is_top=True)
+            for lang in ('ja', 'en'):
+                condition.summary(lang)
+                condition.template_data(lang)
+
+        builders = {name: getattr(Condition, name)
+                    for name in ('_build_summary', '_build_template_data', '_build_object_data')}
+        with patch.object(Condition, '_build_summary', autospec=True,
+                          side_effect=builders['_build_summary']), \
+                patch.object(Condition, '_build_template_data', autospec=True,
+                             side_effect=builders['_build_template_data']), \
+                patch.object(Condition, '_build_object_data', autospec=True,
+                             side_effect=builders['_build_object_data']):
+            def counts():
+                return {name: getattr(Condition, name).call_count for name in builders}
+
+            render()
+            first = counts()
+            render()
+            assert counts() == first
+            with patch.object(settings, 'revision', settings.revision + 1):
+                render()
+            assert counts() == {name: count * 2 for name, count in first.items()}
+        assert all(first.values())
+
+    def test_cache_discarded_when_settings_change(self):
+        """Test that the data of a condition is built again after a settings change."""
+        check = Check(TestCheck.sample_data)
+        condition = self.nested_condition(check)
+        summary = condition.summary("en")
+
+        with patch('freee_a11y_gl.models.check.settings') as mock_settings, \
+                patch('freee_a11y_gl.models.check.Config') as mock_config:
+            mock_settings.revision = -1
+            mock_config.get_pass_singular_text.return_value = " passes"
+            mock_config.get_pass_plural_text.return_value = " pass"
+            mock_config.get_separator.return_value = ", "
+            mock_config.get_conjunction.side_effect = lambda lang, conjunction_type: f" {conjunction_type.upper()} "
+            changed = condition.summary("en")
+        assert changed == "proc-1, proc-2 pass AND (proc-3, proc-4 passes)"
+        assert changed != summary
+
 
 class TestCheckTool:
     """Test cases for CheckTool class."""
@@ -427,6 +553,25 @@ class TestCheckTool:
         assert CheckTool.get_by_id("test-tool") == tool
         assert CheckTool.get_by_id("nonexistent") is None
 
+    def test_examples_refer_to_check(self):
+        """Test that examples read the check fields from their check."""
+        Check._instances.clear()
+        tool = CheckTool("test-tool", {"ja": "テストツール", "en": "Test Tool"})
+        check = Check({
+            **TestCheck.sample_data,
+            "conditions": [{"type": "simple", "id": "proc-001", "tool": "test-tool",
+                            "procedure": {"ja": "手順", "en": "Procedure"}}]
+        })
+
+        example = tool.examples[0]
+        assert example.check is check
+        assert example.procedure is check.conditions[0].procedure
+        assert example.check_id == "test-check-001"
+        assert example.check_text is check.check_text
+        assert tool.get_dependency() == ["test/check.yaml"]
+        assert tool.example_template_data("en")[0]["check_text"] == "Test Check"
+        Check._instances.clear()
+
 
 class TestImplementation:
     """Test cases for Implementation class."""
@@ -503,7 +648,7 @@ class TestCheckAdditional:
         """Set up test fixtures."""
         Check._instances.clear()
         CheckTool._instances.clear()
-        from freee_a11y_gl.settings import settings
+        from freee_a11y_gl.settings_manager import settings
 
         check_tools = settings.message_catalog.check_tools
         for tool_id, names in check_tools.items():
@@ -669,3 +814,50 @@ class TestCheckAdditional:
         """Clean up after each test."""
         Check._instances.clear()
         CheckTool._instances.clear()
+
+
+class TestCheckSlots:
+    """Test that the objects of the checks have no instance dictionary."""
+
+    def setup_method(self):
+        Check._instances.clear()
+        CheckTool._instances.clear()
+        InfoRef._instances.clear()
+        for tool_id in ('nvda', 'voiceover', 'misc'):
+            CheckTool(tool_id, {'ja': tool_id, 'en': tool_id})
+
+    def teardown_method(self):
+        Check._instances.clear()
+        CheckTool._instances.clear()
+        InfoRef._instances.clear()
+
+    def test_no_instance_dict(self):
+        """Test the check, its conditions, procedures, implementations and examples."""
+        def procedure(suffix, tool):
+            return {'type': 'simple', 'id': f'00001-{suffix}', 'tool': tool,
+                    'procedure': {'ja': '手順', 'en': 'Procedure'},
+                    'YouTube': {'id': 'video', 'title': 'Video'}}
+        check = Check({
+            'id': '00001',
+            'sortKey': '000001',
+            'check': {'ja': 'チェック内容', 'en': 'Check'},
+            'severity': 'normal',
+            'target': 'code',
+            'platform': ['web', 'mobile'],
+            'src_path': 'data/yaml/checks/code/00001.yaml',
+            'conditions': [
+                {'platform': 'web', 'type': 'or',
+                 'conditions': [procedure('web1', 'nvda'), procedure('web2', 'axe')]},
+                {'platform': 'mobile', 'type': 'and',
+                 'conditions': [procedure('ios', 'voiceover'), procedure('android', 'misc')]},
+            ],
+            'implementations': [
+                {'title': {'ja': '実装', 'en': 'Implementation'},
+                 'methods': [{'platform': 'web', 'method': {'ja': '方法', 'en': 'Method'}}]},
+            ],
+        })
+        procedure = check.conditions[0].conditions[0].procedure
+        for obj in (check, check.conditions[0], procedure, procedure.youtube, check.implementations[0],
+                    check.implementations[0].methods[0], InfoRef('exp-ref-1'),
+                    CheckTool.get_by_id('nvda').examples[0]):
+            assert not hasattr(obj, '__dict__'), type(obj).__name__
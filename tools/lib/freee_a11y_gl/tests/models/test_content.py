@@ -1,6 +1,7 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from freee_a11y_gl.models.content import Category, GuidelineData
+from freee_a11y_gl.relationship_manager import RelationshipManager
 
 
 class TestGuidelineData:
@@ -41,6 +42,11 @@ class TestCategory:
     def setup_method(self):
         """Clear instances before each test."""
         Category._instances.clear()
+        RelationshipManager._instance = None
+
+    def teardown_method(self):
+        """Clean up the relationships."""
+        RelationshipManager._instance = None
 
     def test_init_basic(self):
         """Test basic Category initialization."""
@@ -99,193 +105,76 @@ class TestCategory:
         with pytest.raises(KeyError):
             category.get_name('ja')
 
-    @patch('freee_a11y_gl.models.content.uniq')
-    def test_get_dependency_basic(self, mock_uniq):
-        """Test getting dependencies with basic setup."""
-        # Setup mocks
-        mock_rel = MagicMock()
-
-        # Mock guideline with src_path
-        mock_guideline = MagicMock()
-        mock_guideline.src_path = 'guideline1.yaml'
-
-        # Mock check with src_path
-        mock_check = MagicMock()
-        mock_check.src_path = 'check1.yaml'
-
-        # Mock FAQ with src_path
-        mock_faq = MagicMock()
-        mock_faq.src_path = 'faq1.yaml'
-
-        # Setup relationship manager behavior
-        def mock_get_sorted_related_objects(obj, obj_type):
-            if obj_type == 'guideline':
-                return [mock_guideline]
-            return []
-
-        def mock_get_related_objects(obj, obj_type):
-            if obj_type == 'check':
-                return [mock_check]
-            elif obj_type == 'faq':
-                return [mock_faq]
-            return []
-
-        mock_rel.get_sorted_related_objects.side_effect = mock_get_sorted_related_objects
-        mock_rel.get_related_objects.side_effect = mock_get_related_objects
-
-        # Mock uniq to return the input list
-        mock_uniq.side_effect = lambda x: x
+    def related(self, object_type, src_path, sort_key):
+        """Create an object with a source file for relationships."""
+        obj = MagicMock()
+        obj.object_type = object_type
+        obj.id = src_path
+        obj.src_path = src_path
+        obj.sort_key = sort_key
+        return obj
 
+    def test_get_dependency_basic(self):
+        """Test getting dependencies with basic setup."""
         category = Category('test', {'ja': 'テスト', 'en': 'Test'})
-
-        with patch.object(category, '_get_relationship_manager', return_value=mock_rel):
-            dependencies = category.get_dependency()
-
-        # Verify relationship manager methods were called
-        mock_rel.get_sorted_related_objects.assert_called_once_with(category, 'guideline')
-
-        # Verify uniq was called to remove duplicates
-        mock_uniq.assert_called_once()
-
-        # Check that dependencies include expected paths
-        expected_deps = ['guideline1.yaml', 'check1.yaml', 'faq1.yaml']
-        assert dependencies == expected_deps
-
-    @patch('freee_a11y_gl.models.content.uniq')
-    def test_get_dependency_multiple_guidelines(self, mock_uniq):
-        """Test getting dependencies with multiple guidelines."""
-        mock_rel = MagicMock()
-
-        # Mock multiple guidelines
-        mock_guideline1 = MagicMock()
-        mock_guideline1.src_path = 'guideline1.yaml'
-        mock_guideline2 = MagicMock()
-        mock_guideline2.src_path = 'guideline2.yaml'
-
-        # Mock checks for each guideline
-        mock_check1 = MagicMock()
-        mock_check1.src_path = 'check1.yaml'
-        mock_check2 = MagicMock()
-        mock_check2.src_path = 'check2.yaml'
-
-        # Mock FAQs for each guideline
-        mock_faq1 = MagicMock()
-        mock_faq1.src_path = 'faq1.yaml'
-        mock_faq2 = MagicMock()
-        mock_faq2.src_path = 'faq2.yaml'
-
-        def mock_get_sorted_related_objects(obj, obj_type):
-            if obj_type == 'guideline':
-                return [mock_guideline1, mock_guideline2]
-            return []
-
-        def mock_get_related_objects(obj, obj_type):
-            if obj_type == 'check':
-                if obj == mock_guideline1:
-                    return [mock_check1]
-                elif obj == mock_guideline2:
-                    return [mock_check2]
-            elif obj_type == 'faq':
-                if obj == mock_guideline1:
-                    return [mock_faq1]
-                elif obj == mock_guideline2:
-                    return [mock_faq2]
-            return []
-
-        mock_rel.get_sorted_related_objects.side_effect = mock_get_sorted_related_objects
-        mock_rel.get_related_objects.side_effect = mock_get_related_objects
-        mock_uniq.side_effect = lambda x: x
-
+        guideline = self.related('guideline', 'guideline1.yaml', '1')
+        rel = RelationshipManager()
+        rel.associate_many([
+            (category, guideline),
+            (guideline, self.related('check', 'check1.yaml', '1')),
+            (guideline, self.related('faq', 'faq1.yaml', '1')),
+        ])
+
+        assert category.get_dependency() == ['guideline1.yaml', 'check1.yaml', 'faq1.yaml']
+
+    def test_get_dependency_multiple_guidelines(self):
+        """Test that guidelines are in sort order, each followed by its checks and FAQs."""
         category = Category('test', {'ja': 'テスト', 'en': 'Test'})
-
-        with patch.object(category, '_get_relationship_manager', return_value=mock_rel):
-            dependencies = category.get_dependency()
-
-        expected_deps = [
+        guideline1 = self.related('guideline', 'guideline1.yaml', '1')
+        guideline2 = self.related('guideline', 'guideline2.yaml', '2')
+        rel = RelationshipManager()
+        rel.associate_many([
+            (category, guideline2),
+            (category, guideline1),
+            (guideline1, self.related('check', 'check1.yaml', '1')),
+            (guideline1, self.related('faq', 'faq1.yaml', '1')),
+            (guideline2, self.related('check', 'check2.yaml', '2')),
+            (guideline2, self.related('faq', 'faq2.yaml', '2')),
+        ])
+
+        assert category.get_dependency() == [
             'guideline1.yaml', 'check1.yaml', 'faq1.yaml',
             'guideline2.yaml', 'check2.yaml', 'faq2.yaml'
         ]
-        assert dependencies == expected_deps
 
-    @patch('freee_a11y_gl.models.content.uniq')
-    def test_get_dependency_no_guidelines(self, mock_uniq):
+    def test_get_dependency_no_guidelines(self):
         """Test getting dependencies when no guidelines exist."""
-        mock_rel = MagicMock()
-        mock_rel.get_sorted_related_objects.return_value = []
-        mock_uniq.side_effect = lambda x: x
-
         category = Category('test', {'ja': 'テスト', 'en': 'Test'})
 
-        with patch.object(category, '_get_relationship_manager', return_value=mock_rel):
-            dependencies = category.get_dependency()
-
-        assert dependencies == []
-        mock_uniq.assert_called_once_with([])
+        assert category.get_dependency() == []
 
-    @patch('freee_a11y_gl.models.content.uniq')
-    def test_get_dependency_no_checks_or_faqs(self, mock_uniq):
+    def test_get_dependency_no_checks_or_faqs(self):
         """Test getting dependencies when guidelines have no checks or FAQs."""
-        mock_rel = MagicMock()
-
-        mock_guideline = MagicMock()
-        mock_guideline.src_path = 'guideline1.yaml'
-
-        def mock_get_sorted_related_objects(obj, obj_type):
-            if obj_type == 'guideline':
-                return [mock_guideline]
-            return []
-
-        def mock_get_related_objects(obj, obj_type):
-            return []  # No checks or FAQs
-
-        mock_rel.get_sorted_related_objects.side_effect = mock_get_sorted_related_objects
-        mock_rel.get_related_objects.side_effect = mock_get_related_objects
-        mock_uniq.side_effect = lambda x: x
-
         category = Category('test', {'ja': 'テスト', 'en': 'Test'})
+        RelationshipManager().associate_objects(category, self.related('guideline', 'guideline1.yaml', '1'))
 
-        with patch.object(category, '_get_relationship_manager', return_value=mock_rel):
-            dependencies = category.get_dependency()
-
-        assert dependencies == ['guideline1.yaml']
-
-    @patch('freee_a11y_gl.models.content.uniq')
-    def test_get_dependency_with_duplicates(self, mock_uniq):
-        """Test that uniq is called to remove duplicates."""
-        mock_rel = MagicMock()
-
-        mock_guideline = MagicMock()
-        mock_guideline.src_path = 'guideline1.yaml'
-
-        mock_check = MagicMock()
-        mock_check.src_path = 'check1.yaml'
-
-        def mock_get_sorted_related_objects(obj, obj_type):
-            if obj_type == 'guideline':
-                return [mock_guideline]
-            return []
-
-        def mock_get_related_objects(obj, obj_type):
-            if obj_type == 'check':
-                return [mock_check]
-            elif obj_type == 'faq':
-                return []
-            return []
-
-        mock_rel.get_sorted_related_objects.side_effect = mock_get_sorted_related_objects
-        mock_rel.get_related_objects.side_effect = mock_get_related_objects
-
-        # Mock uniq to simulate removing duplicates
-        mock_uniq.return_value = ['guideline1.yaml', 'check1.yaml']
+        assert category.get_dependency() == ['guideline1.yaml']
 
+    def test_get_dependency_with_duplicates(self):
+        """Test that source files shared by guidelines are listed once."""
         category = Category('test', {'ja': 'テスト', 'en': 'Test'})
-
-        with patch.object(category, '_get_relationship_manager', return_value=mock_rel):
-            dependencies = category.get_dependency()
-
-        # Verify uniq was called with the expected list
-        mock_uniq.assert_called_once_with(['guideline1.yaml', 'check1.yaml'])
-        assert dependencies == ['guideline1.yaml', 'check1.yaml']
+        guideline1 = self.related('guideline', 'guideline1.yaml', '1')
+        guideline2 = self.related('guideline', 'guideline2.yaml', '2')
+        check = self.related('check', 'check1.yaml', '1')
+        rel = RelationshipManager()
+        rel.associate_many([
+            (category, guideline1),
+            (category, guideline2),
+            (guideline1, check),
+            (guideline2, check),
+        ])
+
+        assert category.get_dependency() == ['guideline1.yaml', 'check1.yaml', 'guideline2.yaml']
 
     def test_list_all_empty(self):
         """Test list_all when no categories exist."""
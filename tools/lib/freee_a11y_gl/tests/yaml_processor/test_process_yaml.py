@@ -1,10 +1,21 @@
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
+
+import pytest
+
+from freee_a11y_gl.config import Config
 from freee_a11y_gl.yaml_processor.process_yaml import process_yaml_data
 
 
 class TestProcessYaml:
     """Test cases for process_yaml module."""
 
+    @pytest.fixture(autouse=True)
+    def no_cache(self):
+        """Keep the processed RST texts in memory"""
+        Config.set_cache_enabled(False)
+        yield
+        Config.set_cache_enabled(True)
+
     @patch('freee_a11y_gl.yaml_processor.process_yaml.get_version_info')
     @patch('freee_a11y_gl.yaml_processor.process_yaml.setup_instances')
     @patch('freee_a11y_gl.yaml_processor.process_yaml.info_utils')
@@ -40,7 +51,7 @@ class TestProcessYaml:
 
         # Verify calls
         mock_version.assert_called_once_with('/test/basedir')
-        mock_setup.assert_called_once_with('/test/basedir')
+        mock_setup.assert_called_once_with('/test/basedir', workers=None, use_cache=None)
         mock_info_utils.get_info_links.assert_called_once_with('/test/basedir')
         mock_check.object_data_all.assert_called_once()
 
@@ -123,7 +134,7 @@ class TestProcessYaml:
         mock_check.object_data_all.return_value = checks_data
 
         # Configure RST processor mock
-        mock_rst_processor.process_rst_text.side_effect = lambda text, links, lang: f'processed_{text}'
+        mock_rst_processor.process_rst_text.side_effect = lambda text, links, lang, cache: f'processed_{text}'
 
         # Call function
         result = process_yaml_data()
@@ -131,10 +142,10 @@ class TestProcessYaml:
         # Verify RST processing was called for each language
         assert mock_rst_processor.process_rst_text.call_count == 2
         mock_rst_processor.process_rst_text.assert_any_call(
-            'チェック1 :ref:`ref1`', info_links, 'ja'
+            'チェック1 :ref:`ref1`', info_links, 'ja', cache=ANY
         )
         mock_rst_processor.process_rst_text.assert_any_call(
-            'Check 1 :ref:`ref1`', info_links, 'en'
+            'Check 1 :ref:`ref1`', info_links, 'en', cache=ANY
         )
 
         # Verify processed text is in result
@@ -176,7 +187,7 @@ class TestProcessYaml:
 
         # Configure RST processor mock
         mock_rst_processor.process_rst_text.return_value = 'processed text'
-        mock_rst_processor.process_rst_condition.side_effect = lambda cond, links: {**cond, 'processed': True}
+        mock_rst_processor.process_rst_condition.side_effect = lambda cond, links, cache: {**cond, 'processed': True}
 
         # Call function
         result = process_yaml_data()
@@ -184,7 +195,7 @@ class TestProcessYaml:
         # Verify condition processing was called
         assert mock_rst_processor.process_rst_condition.call_count == 2
         for condition in conditions:
-            mock_rst_processor.process_rst_condition.assert_any_call(condition, info_links)
+            mock_rst_processor.process_rst_condition.assert_any_call(condition, info_links, cache=ANY)
 
         # Verify processed conditions are in result
         assert len(result['checks']['check1']['conditions']) == 2
@@ -213,7 +224,7 @@ class TestProcessYaml:
 
         # Verify None was passed to dependent functions
         mock_version.assert_called_once_with(None)
-        mock_setup.assert_called_once_with(None)
+        mock_setup.assert_called_once_with(None, workers=None, use_cache=None)
         mock_info_utils.get_info_links.assert_called_once_with(None)
 
     @patch('freee_a11y_gl.yaml_processor.process_yaml.get_version_info')
@@ -279,3 +290,39 @@ class TestProcessYaml:
         # Verify no errors and result includes the check without conditions processing
         assert 'check1' in result['checks']
         assert 'conditions' not in result['checks']['check1']
+
+    @patch('freee_a11y_gl.yaml_processor.process_yaml.get_version_info')
+    @patch('freee_a11y_gl.yaml_processor.process_yaml.setup_instances')
+    @patch('freee_a11y_gl.yaml_processor.process_yaml.info_utils')
+    @patch('freee_a11y_gl.yaml_processor.process_yaml.InfoRef')
+    @patch('freee_a11y_gl.yaml_processor.process_yaml.Check')
+    def test_process_yaml_data_rst_cache(self, mock_check, mock_info_ref, mock_info_utils,
+                                         mock_setup, mock_version, tmp_path):
+        """Test that processed RST texts are stored in the cache directory."""
+        mock_version.return_value = {
+            'checksheet_version': '1.0.0',
+            'checksheet_date': '2023-01-01'
+        }
+        mock_info_utils.get_info_links.return_value = {
+            'ref1': {'text': {'ja': 'リンク1', 'en': 'Link 1'}}
+        }
+        mock_info_ref.list_all_internal.return_value = []
+        mock_check.object_data_all.side_effect = lambda: {
+            'check1': {
+                'check': {'ja': ':ref:`ref1` 参照'},
+                'conditions': [
+                    {'type': 'simple', 'procedure': {'procedure': {'ja': ':ref:`ref1` 参照'}}}
+                ]
+            },
+            'check2': {'check': {'ja': 'チェック2'}},
+        }
+
+        first = process_yaml_data(str(tmp_path), use_cache=True)
+        cache_file = tmp_path / 'build' / '.a11y_gl_cache' / 'rst.pickle'
+        assert cache_file.exists()
+        assert first['checks']['check1']['check']['ja'] == 'リンク1参照'
+
+        with patch('freee_a11y_gl.yaml_processor.rst_processor.normalize_text') as mock_normalize:
+            second = process_yaml_data(str(tmp_path), use_cache=True)
+        mock_normalize.assert_not_called()
+        assert second == first
@@ -0,0 +1,124 @@
+"""
+Tests for the memo cache of processed RST texts.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from freee_a11y_gl.yaml_processor import rst_processor
+from freee_a11y_gl.yaml_processor.rst_cache import (
+    CACHE_FILE_NAME, RstCache, info_links_version, processor_version)
+from freee_a11y_gl.yaml_processor.rst_processor import process_rst_condition, process_rst_text
+
+INFO = {'ref1': {'text': {'ja': 'リンク1', 'en': 'Link 1'}}}
+
+
+class TestRstCache(unittest.TestCase):
+    """Test cases for RstCache"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'build', '.a11y_gl_cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_memo(self):
+        """Test that a text is processed once per language"""
+        cache = RstCache(INFO)
+        text = ':ref:`ref1` を 確認'
+        self.assertIsNone(cache.get(text, 'ja'))
+        result = process_rst_text(text, INFO, 'ja', cache)
+        self.assertEqual(result, process_rst_text(text, INFO, 'ja'))
+        self.assertEqual(cache.get(text, 'ja'), result)
+        self.assertEqual(process_rst_text(text, INFO, 'ja', cache), result)
+        self.assertEqual(process_rst_text(text, INFO, 'en', cache), 'Link 1 を 確認')
+        self.assertEqual((cache.stats.hits, cache.stats.misses, cache.stats.writes), (2, 3, 2))
+
+        cache.save()
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_condition(self):
+        """Test that the procedures of a condition share the cache"""
+        procedure = {'procedure': {'ja': ':kbd:`Tab` キーで移動', 'en': 'Press :kbd:`Tab`'}}
+        condition = {'type': 'or', 'conditions': [
+            {'type': 'simple', 'procedure': {'procedure': dict(procedure['procedure'])}},
+            {'type': 'simple', 'procedure': {'procedure': dict(procedure['procedure'])}},
+        ]}
+        cache = RstCache(INFO)
+        result = process_rst_condition(condition, INFO, cache)
+        first, second = [cond['procedure']['procedure'] for cond in result['conditions']]
+        self.assertEqual(first, {'ja': 'Tabキーで移動', 'en': 'Press Tab'})
+        self.assertEqual(second, first)
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (2, 2))
+
+    def test_persistence(self):
+        """Test that processed texts are reused by the next run"""
+        cache = RstCache(INFO, self.cache_dir)
+        process_rst_text('a :ref:`ref1`', INFO, 'en', cache)
+        process_rst_text('b :ref:`ref1`', INFO, 'en', cache)
+        cache.save()
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, CACHE_FILE_NAME)))
+
+        cache = RstCache(INFO, self.cache_dir)
+        self.assertEqual(cache.get('a :ref:`ref1`', 'en'), 'a Link 1')
+        self.assertEqual(cache.stats.hits, 1)
+
+        # Only the entries used by the run are stored again
+        cache.save()
+        cache = RstCache(INFO, self.cache_dir)
+        self.assertIsNone(cache.get('b :ref:`ref1`', 'en'))
+        self.assertEqual(cache.get('a :ref:`ref1`', 'en'), 'a Link 1')
+
+    def test_changed_info_links(self):
+        """Test that the stored texts are discarded when the info links change"""
+        cache = RstCache(INFO, self.cache_dir)
+        process_rst_text(':ref:`ref1`', INFO, 'en', cache)
+        cache.save()
+
+        info = {'ref1': {'text': {'ja': 'リンク1', 'en': 'New link'}}}
+        self.assertNotEqual(info_links_version(info), info_links_version(INFO))
+        cache = RstCache(info, self.cache_dir)
+        self.assertEqual(cache.stats.invalidated, 1)
+        self.assertEqual(process_rst_text(':ref:`ref1`', info, 'en', cache), 'New link')
+
+    def test_changed_processor(self):
+        """Test that the stored texts are discarded when the processing code changes"""
+        cache = RstCache(INFO, self.cache_dir)
+        process_rst_text(':ref:`ref1`', INFO, 'en', cache)
+        cache.save()
+        cache_file = os.path.join(self.cache_dir, CACHE_FILE_NAME)
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        with open(rst_processor.__file__, 'rb') as f:
+            self.assertEqual(cached['processor_version'], hashlib.sha256(f.read()).hexdigest())
+        self.assertEqual(cached['processor_version'], processor_version())
+
+        cached['processor_version'] = 'other'
+        with open(cache_file, 'wb') as f:
+            pickle.dump(cached, f)
+        cache = RstCache(INFO, self.cache_dir)
+        self.assertEqual(cache.stats.invalidated, 1)
+        self.assertIsNone(cache.get(':ref:`ref1`', 'en'))
+
+    def test_unusable_cache_file(self):
+        """Test that unreadable and old cache files are ignored"""
+        os.makedirs(self.cache_dir)
+        cache_file = os.path.join(self.cache_dir, CACHE_FILE_NAME)
+        with open(cache_file, 'wb') as f:
+            f.write(b'not a pickle')
+        with self.assertLogs('freee_a11y_gl', level='WARNING'):
+            self.assertIsNone(RstCache(INFO, self.cache_dir).get('x', 'en'))
+
+        with open(cache_file, 'wb') as f:
+            pickle.dump({'version': 0, 'info_version': info_links_version(INFO),
+                         'entries': {('x', 'en'): 'y'}}, f)
+        self.assertIsNone(RstCache(INFO, self.cache_dir).get('x', 'en'))
+
+
+if __name__ == '__main__':
+    unittest.main()
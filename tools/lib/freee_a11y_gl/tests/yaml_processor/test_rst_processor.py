@@ -1,8 +1,44 @@
+import json
+import random
+import re
 import time
+from pathlib import Path
+
 from freee_a11y_gl.yaml_processor.rst_processor import (
     normalize_text, process_rst_text, process_rst_condition
 )
 
+# Texts of the data set with their normalized form where it differs
+GOLDEN_FILE = Path(__file__).parent / 'data' / 'normalize_text_golden.json'
+
+
+def legacy_normalize_text(text: str) -> str:
+    """normalize_text() as it was implemented with three substitutions."""
+    fullwidth_chars = r'[\u3000-\u303F\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]'
+    halfwidth_chars = r'[\u0000-\u007F\uFF61-\uFFDC\uFFE8-\uFFEE]'
+    whitespace_no_newline = r'[ \t\f\v\r\u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f]+'
+
+    has_bullets = bool(re.search(r'^[ \t]*[*\-+][ \t]+', text, re.MULTILINE))
+    bullet_and_continuation_pattern = re.compile(r'^([ \t]*[*\-+][ \t]+.*(?:\n[ \t]+.*)*)', re.MULTILINE)
+    bullet_matches = []
+
+    def bullet_replacer(match):
+        bullet_matches.append(match.group(1))
+        return f'__BULLET_PRESERVE_{len(bullet_matches)-1}__'
+
+    text = bullet_and_continuation_pattern.sub(bullet_replacer, text)
+    text = re.sub(rf'({fullwidth_chars}){whitespace_no_newline}({fullwidth_chars})', r'\1\2', text)
+    text = re.sub(rf'({fullwidth_chars}){whitespace_no_newline}({halfwidth_chars})', r'\1\2', text)
+    text = re.sub(rf'({halfwidth_chars}){whitespace_no_newline}({fullwidth_chars})', r'\1\2', text)
+    for i, bullet_pattern_str in enumerate(bullet_matches):
+        text = text.replace(f'__BULLET_PRESERVE_{i}__', bullet_pattern_str)
+    return text.rstrip() if has_bullets else text.strip()
+
+
+def golden_entries():
+    with open(GOLDEN_FILE, encoding='utf-8') as f:
+        return json.load(f)
+
 
 class TestNormalizeText:
     """Test cases for normalize_text function.
@@ -261,6 +297,32 @@ class TestNormalizeText:
         object_increase = final_objects - initial_objects
         assert object_increase < 100  # Allow some increase but not excessive
 
+    def test_normalize_text_golden(self):
+        """Test that the texts of the data set are normalized as before."""
+        for entry in golden_entries():
+            assert normalize_text(entry['text']) == entry.get('normalized', entry['text'])
+
+    def test_normalize_text_consecutive_runs(self):
+        """Test runs of spaces separated by a single fullwidth character."""
+        # The character after a removed run is not the start of the next run
+        assert normalize_text("あ あ あ") == "ああ あ"
+        assert normalize_text("あ あ あ あ") == "ああ ああ"
+        assert normalize_text("あ a あ") == "あaあ"
+        assert normalize_text("あ  \u00a0 あ a") == "ああa"
+        # The last and the first halfwidth space of a run count as halfwidth characters
+        assert normalize_text("あ \u2003 é") == "あ é"
+        assert normalize_text("é \u2003 あ") == "é あ"
+        assert normalize_text("あ\u2003é") == "あ\u2003é"
+
+    def test_normalize_text_matches_legacy_implementation(self):
+        """Test against the former implementation on random texts."""
+        alphabet = ['あ', '、', '\u3000', 'a', '_', ' ', '\t', '\r', '\n', '\u00a0',
+                    '\u2003', 'é', '-', '*', '+', 'ｱ']
+        rng = random.Random(21)
+        for _ in range(20000):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+            assert normalize_text(text) == legacy_normalize_text(text), repr(text)
+
 
 class TestProcessRstText:
     """Test cases for process_rst_text function."""
@@ -15,8 +15,11 @@ information and generates Makefile content with:
 Classes:
     MakefileConfig: Configuration dataclass for Makefile generation
     MakefileGenerator: Main generator for Makefile content with dependencies
+
+Functions:
+    reverse_dependency_map: Map source files to the targets depending on them
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Set
 import os
 from dataclasses import dataclass
 
@@ -27,6 +30,23 @@ from freee_a11y_gl import (
 from ..content_generator_base import ContentGeneratorBase
 
 
+def reverse_dependency_map(
+        dependency_map: Dict[str, Iterable[str]]) -> Dict[str, Set[str]]:
+    """Invert a mapping of targets to their source files.
+
+    Args:
+        dependency_map: Mapping of target paths to source paths
+
+    Returns:
+        Mapping of source paths to the target paths depending on them
+    """
+    dependents: Dict[str, Set[str]] = {}
+    for target, sources in dependency_map.items():
+        for source in sources:
+            dependents.setdefault(source, set()).add(target)
+    return dependents
+
+
 @dataclass
 class MakefileConfig:
     """Configuration for Makefile generation.
@@ -59,6 +79,18 @@ class MakefileConfig:
     vars_list: Dict[str, List[str]]
 
 
+# Rules of the Makefile template that are not in the 'depends' list, rendered
+# from the 'static_rules' list: (variables naming the targets, variables
+# naming their source files)
+STATIC_TARGET_RULES = [
+    (['wcag_mapping_target', 'priority_diff_target'], ['gl_yaml', 'wcag_sc']),
+    (['axe_rules_target'], ['gl_yaml']),
+    (['all_checks_target'], ['gl_yaml', 'check_yaml', 'faq_yaml']),
+    (['miscdefs_target'], ['info_src']),
+    (['faq_index_target'], ['faq_yaml']),
+]
+
+
 class MakefileGenerator(ContentGeneratorBase):
     """Generates Makefile content with comprehensive build dependencies.
 
@@ -177,10 +209,55 @@ class MakefileGenerator(ContentGeneratorBase):
         # Combine all data
         result = {**vars_data, **self.config.makefile_vars,
                   **template_vars}
+        result['static_rules'] = self._static_rules(result)
         result['depends'] = all_dependencies
 
         return result
 
+    @staticmethod
+    def _static_rules(data: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Build the rules of STATIC_TARGET_RULES from the variables."""
+        return [{'target': ' '.join(data.get(var, '') for var in target_vars),
+                 'depends': ' '.join(data.get(var, '')
+                                     for var in source_vars)}
+                for target_vars, source_vars in STATIC_TARGET_RULES]
+
+    def get_dependency_map(self) -> Dict[str, List[str]]:
+        """Get the source files each generated file depends on.
+
+        The map contains the same targets and dependencies as the generated
+        Makefile, so that other build drivers (e.g. the watch mode) rebuild
+        exactly what make would rebuild.
+
+        Returns:
+            Dict[str, List[str]]: Mapping of target paths to source paths
+
+        Example:
+            >>> generator = MakefileGenerator('ja', config)
+            >>> deps = generator.get_dependency_map()
+            >>> changed = '/data/yaml/checks/code/0001.yaml'
+            >>> targets = [t for t, srcs in deps.items() if changed in srcs]
+        """
+        data = self.get_template_data()
+        dependency_map = {}
+        for item in data['static_rules'] + data['depends']:
+            for target in item['target'].split():
+                dependency_map[target] = item['depends'].split()
+        return dependency_map
+
+    def get_reverse_dependency_map(self) -> Dict[str, Set[str]]:
+        """Get the generated files depending on each source file.
+
+        Returns:
+            Dict[str, Set[str]]: Mapping of source paths to target paths
+
+        Example:
+            >>> dependents = generator.get_reverse_dependency_map()
+            >>> targets = dependents.get('/data/yaml/checks/code/0001.yaml',
+            ...                          set())
+        """
+        return reverse_dependency_map(self.get_dependency_map())
+
     def _prepare_base_variables(self) -> Dict[str, Any]:
         """Prepare base makefile variables."""
         vars_data = self.config.base_vars.copy()
@@ -288,14 +365,11 @@ class MakefileGenerator(ContentGeneratorBase):
             target = os.path.join(self.config.dest_dirs['faq_tags'],
                                   filename)
             if target not in tagpage_targets:
-                dependency = []
                 tagpage_targets.append(target)
-                for faq in self.relationship_manager.\
-                        get_sorted_related_objects(tag, 'faq'):
-                    dependency.extend(faq.get_dependency())
                 build_depends.append({
                     'target': target,
-                    'depends': ' '.join(dependency)
+                    'depends': ' '.join(
+                        self.relationship_manager.get_dependencies(tag))
                 })
 
         return build_depends, article_targets, tagpage_targets
@@ -318,11 +392,9 @@ class MakefileGenerator(ContentGeneratorBase):
                 info_to_gl_targets.append(target)
                 build_depends.append({
                     'target': target,
-                    'depends': ' '.join([
-                        guideline.src_path
-                        for guideline in self.relationship_manager.
-                        get_sorted_related_objects(info, 'guideline')
-                    ])
+                    'depends': ' '.join(
+                        self.relationship_manager.get_dependencies(
+                            info, 'info_to_guideline'))
                 })
 
         # Info to FAQs
@@ -336,11 +408,9 @@ class MakefileGenerator(ContentGeneratorBase):
                 info_to_faq_targets.append(target)
                 build_depends.append({
                     'target': target,
-                    'depends': ' '.join([
-                        faq.src_path
-                        for faq in self.relationship_manager.
-                        get_sorted_related_objects(info, 'faq')
-                    ])
+                    'depends': ' '.join(
+                        self.relationship_manager.get_dependencies(
+                            info, 'info_to_faq'))
                 })
 
         return build_depends, info_to_gl_targets, info_to_faq_targets
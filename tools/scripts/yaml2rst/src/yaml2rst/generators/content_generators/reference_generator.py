@@ -420,13 +420,14 @@ class AxeRulesGenerator(ContentGeneratorBase):
             >>> data = generator.get_template_data()
             >>> print(f"Generated data for axe-core v{data['version']}")
         """
+        # Listing the rules loads them, together with the metadata below
+        rules = AxeRule.list_all()
         return {
             'version': AxeRule.version,
             'major_version': AxeRule.major_version,
             'deque_url': AxeRule.deque_url,
             'timestamp': AxeRule.timestamp,
-            'rules': [rule.template_data(self.lang)
-                      for rule in AxeRule.list_all()]
+            'rules': [rule.template_data(self.lang) for rule in rules]
         }
 
     def validate_data(self, data: Dict[str, Any]) -> bool:
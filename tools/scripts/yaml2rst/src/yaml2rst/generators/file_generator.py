@@ -1,9 +1,11 @@
 """Main file generation orchestrator."""
-from typing import Dict, Any, Type
+from typing import Dict, Any, List, Type
 from dataclasses import dataclass
 from pathlib import Path
 import logging
 
+from freee_a11y_gl import tracing
+
 from ..template_manager import TemplateManager
 from .base_generator import BaseGenerator, GeneratorError
 from .mixins import ValidationMixin
@@ -47,8 +49,19 @@ class FileGenerator:
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def generate(self, config: GeneratorConfig, build_all: bool,
-                 targets: list[str]) -> None:
-        """Generate files using the specified generator configuration."""
+                 targets: list[str]) -> List[Path]:
+        """Generate files using the specified generator configuration.
+
+        Returns:
+            Paths of the files that were written
+        """
+        with tracing.span(f'yaml2rst.generate.{config.template_name}',
+                          category='yaml2rst', phase=True, lang=self.lang):
+            return self._generate(config, build_all, targets)
+
+    def _generate(self, config: GeneratorConfig, build_all: bool,
+                  targets: list[str]) -> List[Path]:
+        """Generate files in the span of the generator configuration."""
         try:
             self.logger.info(
                 f"Starting generation with config: {config}, "
@@ -71,6 +84,7 @@ class FileGenerator:
             if not config.is_single_file:
                 self._ensure_directory(output_path)
 
+            written = []
             for data in generator.generate():
                 try:
                     data['lang'] = self.lang
@@ -81,7 +95,11 @@ class FileGenerator:
                     if self._should_generate(config, build_all, targets,
                                              dest_path):
                         self.logger.info(f"Generating file: {dest_path}")
-                        template.write_rst(data, dest_path)
+                        with tracing.span(
+                                f'yaml2rst.render.{config.template_name}',
+                                category='yaml2rst'):
+                            template.write_rst(data, dest_path)
+                        written.append(dest_path)
                     else:
                         self.logger.info(f"Skipping file: {dest_path}")
 
@@ -89,6 +107,7 @@ class FileGenerator:
                     self.logger.error(f"Failed to generate file: {e}")
                     raise GeneratorError(
                         f"File generation failed: {e}") from e
+            return written
 
         except Exception as e:
             self.logger.error(f"Generation failed: {e}")
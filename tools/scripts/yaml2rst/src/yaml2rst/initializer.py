@@ -16,6 +16,7 @@ Functions:
     setup_variables: Initialize build variables for Makefile generation
     setup_templates: Initialize template management system
     parse_args: Parse command line arguments
+    parse_languages: Parse the --lang argument into language codes
     process_arguments: Process parsed arguments into settings dictionary
     export_templates: Export built-in templates to specified directory
 """
@@ -24,15 +25,19 @@ import sys
 import shutil
 import argparse
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple, Optional
 
 from . import config
 from .path import (get_dest_dirnames, get_static_dest_files, TEMPLATE_DIR,
                    TEMPLATE_FILENAMES)
 from freee_a11y_gl.source import get_src_path
-from .template_manager import TemplateManager
 from .template_config import TemplateConfig
 
+# The template engine is imported in setup_templates(), after the command
+# line is parsed
+if TYPE_CHECKING:
+    from .template_manager import TemplateManager
+
 
 class TemplateExportError(Exception):
     """Exception raised when template export operation fails."""
@@ -53,7 +58,9 @@ def setup_parameters() -> Dict[str, Any]:
         - build_all (bool): Whether to build all content or specific targets
         - targets (List[str]): List of specific files to build (if not
           build_all)
-        - lang (str): Target language code ('ja', 'en', etc.)
+        - lang (str): Target language code ('ja', 'en', etc.); the first
+          language if several languages are given
+        - languages (List[str]): Target language codes
         - basedir (str): Absolute path to the base directory containing data
 
     Example:
@@ -175,7 +182,7 @@ def setup_variables() -> Tuple[Dict[str, str], Dict[str, List[str]]]:
 
 def setup_templates(
     custom_template_dir: str = None
-) -> Dict[str, TemplateManager]:
+) -> Dict[str, 'TemplateManager']:
     """Set up template manager instances for all template files.
 
     Initializes TemplateManager instances for each template file defined
@@ -244,6 +251,8 @@ def setup_templates(
         logger = logging.getLogger(__name__)
         logger.warning(f"Failed to load template configuration: {e}")
 
+    from .template_manager import TemplateManager
+
     templates = {}
     for name, filename in TEMPLATE_FILENAMES.items():
         # Use the new template system with customizable resolution
@@ -264,11 +273,17 @@ def parse_args() -> argparse.Namespace:
         Parsed command line arguments as argparse.Namespace
 
     Supported Arguments:
-        --lang, -l: Target language code (choices from
+        --lang, -l: Target language code, a comma-separated list of codes
+                    or 'all' (codes from
                     config.get_available_languages())
         --basedir, -b: Base directory containing the data directory
         --template-dir, -t: Custom template directory path
         --export-templates: Export built-in templates and exit
+        --jobs, -j: Number of worker processes for YAML parsing
+        --no-cache: Do not use the cache of parsed source files
+        --watch, -w: Regenerate affected files when sources change
+        --trace: Write a Chrome trace of the phases of the run
+        --profile-memory: Report the memory allocated by each phase
         files: Optional list of specific files to generate (positional)
 
     Example:
@@ -287,10 +302,11 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         '--lang', '-l',
-        type=str,
-        choices=languages,
+        type=_language_list,
         default='ja',
-        help=f'the language of the output file ({" ".join(languages)})'
+        help=f'the language of the output file ({" ".join(languages)}), '
+             'a comma-separated list of languages, or "all" to generate the '
+             'files of all languages from a single load of the data'
     )
     parser.add_argument(
         '--basedir', '-b',
@@ -312,12 +328,99 @@ def parse_args() -> argparse.Namespace:
              'Uses --template-dir if specified, otherwise uses the default '
              'user template directory (~/.config/freee_a11y_gl/templates).'
     )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of worker processes used to parse and validate YAML '
+             'files (0 uses all available CPUs).'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Parse and validate all source files instead of reusing the '
+             'cache of parsed files (build/.a11y_gl_cache).'
+    )
+    parser.add_argument(
+        '--watch', '-w',
+        action='store_true',
+        help='After generating, keep the data in memory, watch the data '
+             'and template directories and regenerate the files affected '
+             'by each change until interrupted.'
+    )
+    parser.add_argument(
+        '--trace',
+        metavar='PATH',
+        default=None,
+        help='Write a trace of the phases of the run in the Chrome trace '
+             'event format to PATH and print a summary of the time spent '
+             'in each phase.'
+    )
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='Trace memory allocations and report the change and peak of '
+             'the allocated memory, the peak RSS and the top allocation '
+             'sites of each phase of the run (slows the run down).'
+    )
     parser.add_argument(
         'files',
         nargs='*',
         help='Filenames to generate (if not specified, generates all files)'
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.watch and len(parse_languages(args.lang, languages)) > 1:
+        parser.error('--watch requires a single language')
+    return args
+
+
+def parse_languages(value: str,
+                    available: Optional[List[str]] = None) -> List[str]:
+    """Parse the --lang argument into a list of language codes.
+
+    Args:
+        value: A language code, a comma-separated list of language codes, or
+            'all' for all available languages
+        available: Available language codes; defaults to
+            config.get_available_languages()
+
+    Returns:
+        Language codes in the given order, without duplicates
+
+    Raises:
+        ValueError: If a language is not available
+
+    Example:
+        >>> parse_languages('ja,en')
+        ['ja', 'en']
+        >>> parse_languages('all')
+        ['ja', 'en']
+    """
+    if available is None:
+        available = config.get_available_languages()
+    if value == 'all':
+        return list(available)
+    languages = list(dict.fromkeys(
+        lang.strip() for lang in value.split(',') if lang.strip()))
+    invalid = [lang for lang in languages if lang not in available]
+    if invalid or not languages:
+        raise ValueError(
+            f"invalid language: '{value}' "
+            f"(choose from {', '.join(available)} or all)")
+    return languages
+
+
+def _language_list(value: str) -> str:
+    """Check the --lang argument for argparse.
+
+    Raises:
+        argparse.ArgumentTypeError: If a language is not available
+    """
+    try:
+        parse_languages(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
 
 
 def process_arguments(args: argparse.Namespace) -> Dict[str, Any]:
@@ -334,10 +437,17 @@ def process_arguments(args: argparse.Namespace) -> Dict[str, Any]:
         Dictionary containing processed settings:
         - build_all (bool): True if no specific files were specified
         - targets (List[str]): List of absolute paths to target files
-        - lang (str): Target language code
+        - lang (str): Target language code (the first one if several
+          languages are given)
+        - languages (List[str]): Target language codes
         - basedir (str): Absolute path to the base directory
         - template_dir (str): Absolute path to custom template directory
                              (None if not specified)
+        - jobs (int): Number of worker processes for YAML parsing
+        - use_cache (bool): Whether to use the cache of parsed source files
+        - watch (bool): Whether to watch the sources after generating
+        - trace (str): Path of the trace file (None if not tracing)
+        - profile_memory (bool): Whether to report the memory of each phase
 
     Build Mode Logic:
         - If no files are specified in args.files, build_all is True
@@ -351,6 +461,11 @@ def process_arguments(args: argparse.Namespace) -> Dict[str, Any]:
         ...     lang='ja',
         ...     basedir='/data',
         ...     template_dir='/custom/templates',
+        ...     jobs=1,
+        ...     no_cache=False,
+        ...     watch=False,
+        ...     trace=None,
+        ...     profile_memory=False,
         ...     files=['category.rst']
         ... )
         >>> settings = process_arguments(args)
@@ -359,8 +474,14 @@ def process_arguments(args: argparse.Namespace) -> Dict[str, Any]:
             'build_all': False,
             'targets': ['/absolute/path/to/category.rst'],
             'lang': 'ja',
+            'languages': ['ja'],
             'basedir': '/absolute/path/to/data',
-            'template_dir': '/absolute/path/to/custom/templates'
+            'template_dir': '/absolute/path/to/custom/templates',
+            'jobs': 1,
+            'use_cache': True,
+            'watch': False,
+            'trace': None,
+            'profile_memory': False
         }
     """
     basedir = os.path.abspath(args.basedir)
@@ -372,12 +493,19 @@ def process_arguments(args: argparse.Namespace) -> Dict[str, Any]:
     if args.files:
         files = [os.path.abspath(f) for f in args.files]
 
+    languages = parse_languages(args.lang)
     return {
         'build_all': not args.files,
         'targets': files,
-        'lang': args.lang,
+        'lang': languages[0],
+        'languages': languages,
         'basedir': basedir,
-        'template_dir': template_dir
+        'template_dir': template_dir,
+        'jobs': args.jobs,
+        'use_cache': not args.no_cache,
+        'watch': args.watch,
+        'trace': args.trace,
+        'profile_memory': args.profile_memory
     }
 
 
@@ -0,0 +1,366 @@
+"""Watch mode for yaml2rst.
+
+This module keeps the model loaded by the initial yaml2rst run in memory,
+watches the source data and template directories, and regenerates only the
+RST files affected by each change.
+
+Affected files are determined from the dependency map of MakefileGenerator,
+i.e. the same targets and prerequisites that make uses for incfiles.mk:
+
+- Changed check, guideline and FAQ YAML files are reloaded incrementally
+  with freee_a11y_gl.reload_sources(). Every target whose dependencies
+  contain a changed file, before or after the reload, is regenerated.
+- Changed JSON files (categories, success criteria, FAQ tags, external
+  information and schemas) cannot be reloaded incrementally; the whole
+  model is reloaded and all files are regenerated.
+- Changed templates are reloaded, and the files rendered with them are
+  regenerated. Changes to templates included by other templates regenerate
+  all files.
+- incfiles.mk is regenerated whenever the dependency map changes.
+
+The directories are polled for changed modification times, so no platform
+specific file notification support is required.
+
+Classes:
+    RstWatcher: Polls source files and regenerates affected RST files
+"""
+import os
+import sys
+import time
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from freee_a11y_gl import setup_instances, clear_instances, reload_sources
+from freee_a11y_gl.source import get_src_path, DATA_DIR, YAML_DIR, JSON_DIR
+from freee_a11y_gl.yaml_validator import ValidationError
+
+from . import initializer
+from .generators.file_generator import FileGenerator, GeneratorConfig
+from .generators.content_generators import MakefileGenerator
+from .generators.content_generators.makefile_generator import (
+    reverse_dependency_map
+)
+from .path import TEMPLATE_FILENAMES
+
+# Seconds between two scans of the watched directories
+POLL_INTERVAL = 0.5
+
+# Entity directories that reload_sources() can reload incrementally
+RELOADABLE_SOURCES = ['checks', 'guidelines', 'faq']
+
+
+class RstWatcher:
+    """Regenerates the RST files affected by changed source files.
+
+    Attributes:
+        settings (Dict[str, Any]): Settings from
+            initializer.setup_parameters()
+        file_generator (FileGenerator): File generator of the initial run
+        generators (List[GeneratorConfig]): Content generator configurations
+        makefile_generator (GeneratorConfig): Makefile generator
+            configuration
+        interval (float): Seconds between two scans of the watched
+            directories
+        dependencies (Dict[str, Set[str]]): Current mapping of target paths
+            to the source paths they depend on
+        dependents (Dict[str, Set[str]]): Reverse index of dependencies,
+            mapping source paths to the target paths depending on them
+
+    Example:
+        >>> watcher = RstWatcher(settings, file_generator, generators,
+        ...                      makefile_generator)
+        >>> watcher.run()  # Regenerates files until interrupted
+    """
+
+    def __init__(self, settings: Dict[str, Any],
+                 file_generator: FileGenerator,
+                 generators: List[GeneratorConfig],
+                 makefile_generator: GeneratorConfig,
+                 interval: float = POLL_INTERVAL):
+        """Initialize the watcher for an already loaded model.
+
+        Args:
+            settings: Settings from initializer.setup_parameters()
+            file_generator: File generator of the initial run
+            generators: Content generator configurations
+            makefile_generator: Makefile generator configuration
+            interval: Seconds between two scans of the watched directories
+        """
+        self.settings = settings
+        self.file_generator = file_generator
+        self.generators = generators
+        self.makefile_generator = makefile_generator
+        self.interval = interval
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        basedir = settings['basedir']
+        self.yaml_dir = os.path.join(basedir, DATA_DIR, YAML_DIR)
+        self.json_dir = os.path.join(basedir, DATA_DIR, JSON_DIR)
+        src_path = get_src_path(basedir)
+        self.reloadable_dirs = [src_path[key] for key in RELOADABLE_SOURCES]
+
+        # Files that failed to reload are retried with the next change
+        self._pending: Set[str] = set()
+        self._needs_full_reload = False
+        self.dependencies = self.get_dependencies()
+        self._snapshot = self.scan()
+
+    @property
+    def dependencies(self) -> Dict[str, Set[str]]:
+        """Current mapping of target paths to their source paths."""
+        return self._dependencies
+
+    @dependencies.setter
+    def dependencies(self, dependencies: Dict[str, Set[str]]) -> None:
+        self._dependencies = dependencies
+        self.dependents = reverse_dependency_map(dependencies)
+
+    @property
+    def template_dirs(self) -> List[str]:
+        """Template directories in resolution order."""
+        template = next(iter(self.file_generator.templates.values()))
+        return [path for path in template.resolver.get_search_paths()
+                if os.path.isdir(path)]
+
+    def get_dependencies(self) -> Dict[str, Set[str]]:
+        """Get the dependency map of the current model.
+
+        Returns:
+            Mapping of target paths to the source paths they depend on
+        """
+        generator = MakefileGenerator(
+            self.file_generator.lang,
+            **self.makefile_generator.extra_args)
+        return {target: set(sources) for target, sources
+                in generator.get_dependency_map().items()}
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        """Get the modification time and size of all watched files.
+
+        Returns:
+            Mapping of file paths to (mtime in ns, size) tuples
+        """
+        snapshot = {}
+        roots = [(self.yaml_dir, '.yaml'), (self.json_dir, '.json')]
+        roots.extend((path, None) for path in self.template_dirs)
+        for root, suffix in roots:
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    if _is_ignored(filename, suffix):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self) -> Set[str]:
+        """Scan the watched directories for changes since the last scan.
+
+        Returns:
+            Paths of modified, added and deleted files
+        """
+        snapshot = self.scan()
+        changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                   if snapshot.get(path) != self._snapshot.get(path)}
+        self._snapshot = snapshot
+        return changed
+
+    def handle_changes(self, paths: Iterable[str]) -> List[Path]:
+        """Update the model and regenerate the files affected by changes.
+
+        Errors in changed source files are reported, and the model is left
+        unchanged until the files are changed again.
+
+        Args:
+            paths: Paths of modified, added and deleted files
+
+        Returns:
+            Paths of the regenerated files
+        """
+        paths = set(paths) | self._pending
+        self._pending = set()
+        template_paths = {path for path in paths
+                          if self._in_dirs(path, self.template_dirs)}
+        data_paths = paths - template_paths
+
+        full_rebuild = False
+        targets: Set[str] = set()
+        old_dependencies = self.dependencies
+        old_dependents = self.dependents
+        if data_paths:
+            full_reload = self._needs_full_reload or any(
+                not self._in_dirs(path, self.reloadable_dirs)
+                for path in data_paths)
+            if not self._reload(data_paths, full_reload):
+                self._pending |= template_paths
+                return []
+            self.dependencies = self.get_dependencies()
+            full_rebuild = full_reload
+            targets = _affected_targets(
+                old_dependents, self.dependents,
+                self.dependencies.keys() - old_dependencies.keys(),
+                data_paths)
+            self.logger.info(f"Targets affected by {sorted(data_paths)}: "
+                             f"{sorted(targets)}")
+
+        rebuild_configs = []
+        if template_paths:
+            rebuild_configs = self._reload_templates(template_paths)
+            if rebuild_configs is None:
+                full_rebuild = True
+
+        configs = list(self.generators)
+        if full_rebuild:
+            rebuild_configs = configs
+        if full_rebuild or self.dependencies != old_dependencies:
+            configs.append(self.makefile_generator)
+            rebuild_configs = rebuild_configs + [self.makefile_generator]
+        return self._generate(configs, rebuild_configs, targets)
+
+    def run(self) -> None:
+        """Regenerate affected files whenever sources change, until stopped."""
+        watched = [self.yaml_dir, self.json_dir] + self.template_dirs
+        print(f"Watching {', '.join(watched)} for changes "
+              f"(press Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(self.interval)
+                changed = self.poll()
+                if not changed:
+                    continue
+                start = time.perf_counter()
+                written = self.handle_changes(changed)
+                elapsed = (time.perf_counter() - start) * 1000
+                for path in written:
+                    print(f"  {path}")
+                print(f"Regenerated {len(written)} files in "
+                      f"{elapsed:.0f} ms")
+        except KeyboardInterrupt:
+            print("Stopped watching")
+
+    def _reload(self, paths: Set[str], full_reload: bool) -> bool:
+        """Reload the model for changed data files.
+
+        Returns:
+            True if the model was updated
+        """
+        if full_reload:
+            clear_instances()
+            try:
+                setup_instances(self.settings['basedir'],
+                                workers=self.settings['jobs'],
+                                use_cache=self.settings['use_cache'])
+            except SystemExit:
+                # setup_instances() reports errors and exits; keep watching
+                # and load the whole model again with the next change
+                print("Failed to load the source files, waiting for changes",
+                      file=sys.stderr)
+                self._needs_full_reload = True
+                return False
+            self._needs_full_reload = False
+            return True
+
+        try:
+            reload_sources(paths, self.settings['basedir'])
+        except (ValueError, ValidationError) as e:
+            print(f"Failed to reload changed files: {e}", file=sys.stderr)
+            self._pending = set(paths)
+            return False
+        return True
+
+    def _reload_templates(
+            self, paths: Set[str]) -> Optional[List[GeneratorConfig]]:
+        """Reload the templates and get the generators using changed ones.
+
+        Returns:
+            Configurations of the generators rendering a changed template,
+            or None if any template may include a changed template
+        """
+        names = set()
+        for path in paths:
+            for template_dir in self.template_dirs:
+                if self._in_dirs(path, [template_dir]):
+                    names.add(Path(os.path.relpath(path, template_dir))
+                              .as_posix())
+        self.file_generator.templates = initializer.setup_templates(
+            self.settings.get('template_dir'))
+
+        changed = {name for name, filename in TEMPLATE_FILENAMES.items()
+                   if filename in names}
+        if len(changed) < len(names):
+            return None
+        return [config for config in self.generators
+                if config.template_name in changed]
+
+    def _generate(self, configs: List[GeneratorConfig],
+                  rebuild_configs: List[GeneratorConfig],
+                  targets: Set[str]) -> List[Path]:
+        """Run the generators producing any of the targets.
+
+        Generators in rebuild_configs regenerate all of their files. Outside
+        of build-all mode, only files given on the command line are written.
+        """
+        written = []
+        requested = self.settings['targets']
+        for config in configs:
+            if config in rebuild_configs:
+                build_all, config_targets = True, []
+            else:
+                build_all = False
+                config_targets = [target for target in targets
+                                  if _produces(config, target)]
+                if not config_targets:
+                    continue
+            if not self.settings['build_all']:
+                if build_all:
+                    build_all, config_targets = False, requested
+                else:
+                    config_targets = [
+                        target for target in config_targets
+                        if target in requested
+                        or os.path.dirname(target) in requested]
+                    if not config_targets:
+                        continue
+            written.extend(self.file_generator.generate(
+                config, build_all, config_targets))
+        return written
+
+    @staticmethod
+    def _in_dirs(path: str, dirs: List[str]) -> bool:
+        return any(path.startswith(os.path.join(directory, ''))
+                   for directory in dirs)
+
+
+def _is_ignored(filename: str, suffix: Optional[str]) -> bool:
+    """Check whether a file is a hidden, backup or unrelated file."""
+    if filename.startswith('.') or filename.endswith('~'):
+        return True
+    return suffix is not None and not filename.endswith(suffix)
+
+
+def _produces(config: GeneratorConfig, target: str) -> bool:
+    """Check whether a generator writes a target file."""
+    if config.is_single_file:
+        return target == config.output_path
+    return os.path.dirname(target) == config.output_path
+
+
+def _affected_targets(old: Dict[str, Set[str]], new: Dict[str, Set[str]],
+                      added: Iterable[str], changed: Set[str]) -> Set[str]:
+    """Get the targets depending on changed files before or after a reload.
+
+    Args:
+        old: Reverse dependency map before the reload
+        new: Reverse dependency map after the reload
+        added: Targets which did not exist before the reload
+        changed: Changed source paths
+    """
+    targets = set(added)
+    for path in changed:
+        targets.update(old.get(path, ()))
+        targets.update(new.get(path, ()))
+    return targets
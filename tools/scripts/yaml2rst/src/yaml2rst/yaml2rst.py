@@ -30,25 +30,35 @@ Example:
 
     Generate specific files only:
     $ python -m yaml2rst --lang en category_page.rst faq_index.rst
+
+    Parse and validate YAML files with 4 worker processes:
+    $ python -m yaml2rst --lang ja --jobs 4
+
+    Regenerate affected files whenever sources change:
+    $ python -m yaml2rst --lang ja --watch
+
+    Generate the files of all languages from a single load of the data:
+    $ python -m yaml2rst --lang all
+
+    Write a trace of the phases of the run and print where the time went:
+    $ python -m yaml2rst --lang ja --trace trace.json
+
+    Report the memory allocated by each phase of the run:
+    $ python -m yaml2rst --lang ja --profile-memory
 """
 import os
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 from . import initializer
-from .generators.file_generator import FileGenerator, GeneratorConfig
-from .generators.content_generators import (
-    CategoryGenerator,
-    AllChecksGenerator, CheckExampleGenerator,
-    FaqArticleGenerator, FaqTagPageGenerator, FaqIndexGenerator,
-    FaqTagIndexGenerator, FaqArticleIndexGenerator,
-    WcagMappingGenerator, PriorityDiffGenerator, MiscDefinitionsGenerator,
-    InfoToGuidelinesGenerator, InfoToFaqsGenerator,
-    AxeRulesGenerator,
-    MakefileGenerator,
-    MakefileConfig
-)
-from freee_a11y_gl import setup_instances
+from freee_a11y_gl import memory_profile, tracing
 from freee_a11y_gl.config import Config
 
+# The generators and the data loader are imported in the functions using
+# them, after the command line is parsed, so that --help and
+# --export-templates do not load them
+if TYPE_CHECKING:
+    from .generators.file_generator import FileGenerator, GeneratorConfig
+
 
 def main() -> None:
     """Main entry point for the YAML to RST converter.
@@ -65,6 +75,8 @@ def main() -> None:
 
     The conversion process supports both full builds (all content) and
     targeted builds (specific files only) based on command line arguments.
+    If several languages are given, the data is loaded once and the files
+    of each language are generated into that language's source tree.
 
     Workflow:
         1. Configuration Setup:
@@ -94,10 +106,26 @@ def main() -> None:
     """
     # Initialize settings and templates
     settings = initializer.setup_parameters()
-    DEST_DIRS, STATIC_FILES, MAKEFILE_VARS = initializer.setup_constants(
-        settings)
+    if settings.get('trace'):
+        tracing.enable(settings['trace'])
+    if settings.get('profile_memory'):
+        memory_profile.enable()
+    try:
+        run(settings)
+    finally:
+        tracing.finish()
+        memory_profile.finish()
+
+
+def run(settings: Dict[str, Any]) -> None:
+    """Load the data and generate the files for the given settings.
+
+    Args:
+        settings: Settings from initializer.setup_parameters()
+    """
+    from freee_a11y_gl import setup_instances
+
     templates = initializer.setup_templates(settings.get('template_dir'))
-    makefile_vars, makefile_vars_list = initializer.setup_variables()
 
     # Initialize freee_a11y_gl configuration with yaml2rst profile
     # This sets up the library to work with our specific data structure
@@ -113,8 +141,46 @@ def main() -> None:
     )
 
     # Initialize core settings and load data
-    # This populates the RelationshipManager with all guideline data
-    setup_instances(settings['basedir'])
+    # This populates the RelationshipManager with all guideline data.
+    # The model is language independent and shared by all languages.
+    setup_instances(settings['basedir'], workers=settings['jobs'],
+                    use_cache=settings['use_cache'])
+
+    for lang in settings.get('languages', [settings['lang']]):
+        lang_settings = (settings if lang == settings['lang']
+                         else dict(settings, lang=lang))
+        with tracing.span('yaml2rst.language', category='yaml2rst',
+                          phase=True, lang=lang):
+            file_generator, generators, makefile_generator = \
+                generate_language(lang_settings, templates)
+
+    # Keep the model in memory and regenerate files as sources change
+    if settings.get('watch'):
+        from .watcher import RstWatcher
+        RstWatcher(settings, file_generator, generators,
+                   makefile_generator).run()
+
+
+def generate_language(
+    settings: Dict[str, Any],
+    templates: Dict[str, Any]
+) -> Tuple['FileGenerator', List['GeneratorConfig'], 'GeneratorConfig']:
+    """Generate the files of one language from the loaded model.
+
+    Args:
+        settings: Settings from initializer.setup_parameters(), with 'lang'
+            set to the language to generate
+        templates: Templates from initializer.setup_templates()
+
+    Returns:
+        Tuple of the file generator, the content generator configurations
+        and the Makefile generator configuration of the language
+    """
+    from .generators.file_generator import FileGenerator
+
+    DEST_DIRS, STATIC_FILES, MAKEFILE_VARS = initializer.setup_constants(
+        settings)
+    makefile_vars, makefile_vars_list = initializer.setup_variables()
 
     # Create output directories for generated files
     # Ensures all destination paths exist before generation begins
@@ -125,13 +191,54 @@ def main() -> None:
     # The FileGenerator orchestrates the template rendering and file writing
     file_generator = FileGenerator(templates, settings['lang'])
 
+    generators = get_generator_configs(DEST_DIRS, STATIC_FILES)
+
+    # Generate all content files
+    # Each generator processes its data and creates the appropriate RST files
+    for config in generators:
+        file_generator.generate(config, settings['build_all'],
+                                settings['targets'])
+
+    # Generate Makefile (once, outside the main loop)
+    # The Makefile contains build targets and dependencies for Sphinx
+    makefile_generator = get_makefile_generator_config(
+        DEST_DIRS, STATIC_FILES, MAKEFILE_VARS,
+        makefile_vars, makefile_vars_list)
+    file_generator.generate(makefile_generator, settings['build_all'],
+                            settings['targets'])
+    return file_generator, generators, makefile_generator
+
+
+def get_generator_configs(DEST_DIRS: Dict[str, str],
+                          STATIC_FILES: Dict[str, str]
+                          ) -> List['GeneratorConfig']:
+    """Get the configurations of all content generators.
+
+    Args:
+        DEST_DIRS: Output directories from initializer.setup_constants()
+        STATIC_FILES: Static output files from initializer.setup_constants()
+
+    Returns:
+        List of GeneratorConfig instances, in generation order
+    """
+    from .generators.file_generator import GeneratorConfig
+    from .generators.content_generators import (
+        CategoryGenerator,
+        AllChecksGenerator, CheckExampleGenerator,
+        FaqArticleGenerator, FaqTagPageGenerator, FaqIndexGenerator,
+        FaqTagIndexGenerator, FaqArticleIndexGenerator,
+        WcagMappingGenerator, PriorityDiffGenerator, MiscDefinitionsGenerator,
+        InfoToGuidelinesGenerator, InfoToFaqsGenerator,
+        AxeRulesGenerator
+    )
+
     # Configure all content generators with their templates and output paths
     # Each GeneratorConfig specifies:
     # - Generator class to instantiate
     # - Template name to use for rendering
     # - Output path for generated files
     # - Whether the generator produces a single file or multiple files
-    generators = [
+    return [
         # Guidelines and category generators
         # Generates individual category pages with associated guidelines
         GeneratorConfig(CategoryGenerator, 'category_page',
@@ -180,29 +287,44 @@ def main() -> None:
                         STATIC_FILES['axe_rules'], is_single_file=True),
     ]
 
-    # Generate all content files
-    # Each generator processes its data and creates the appropriate RST files
-    for config in generators:
-        file_generator.generate(config, settings['build_all'],
-                                settings['targets'])
 
-    # Generate Makefile (once, outside the main loop)
-    # The Makefile contains build targets and dependencies for Sphinx
+def get_makefile_generator_config(
+    DEST_DIRS: Dict[str, str],
+    STATIC_FILES: Dict[str, str],
+    MAKEFILE_VARS: Dict[str, str],
+    makefile_vars: Dict[str, str],
+    makefile_vars_list: Dict[str, List[str]]
+) -> 'GeneratorConfig':
+    """Get the configuration of the Makefile generator.
+
+    Args:
+        DEST_DIRS: Output directories from initializer.setup_constants()
+        STATIC_FILES: Static output files from initializer.setup_constants()
+        MAKEFILE_VARS: Makefile variables from initializer.setup_constants()
+        makefile_vars: Base variables from initializer.setup_variables()
+        makefile_vars_list: List variables from initializer.setup_variables()
+
+    Returns:
+        GeneratorConfig for the Makefile with its dependencies
+    """
+    from .generators.file_generator import GeneratorConfig
+    from .generators.content_generators import (
+        MakefileGenerator, MakefileConfig
+    )
+
     makefile_config = MakefileConfig(
         dest_dirs=DEST_DIRS,
         makefile_vars=MAKEFILE_VARS,
         base_vars=makefile_vars,
         vars_list=makefile_vars_list
     )
-    makefile_generator = GeneratorConfig(
+    return GeneratorConfig(
         MakefileGenerator,
         'makefile',
         STATIC_FILES['makefile'],
         is_single_file=True,
         extra_args={'config': makefile_config}
     )
-    file_generator.generate(makefile_generator, settings['build_all'],
-                            settings['targets'])
 
 
 if __name__ == "__main__":
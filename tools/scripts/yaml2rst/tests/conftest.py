@@ -48,8 +48,10 @@ def common_mock_patches():
     """Common patches used across multiple test files."""
     return {
         'config_patch': 'yaml2rst.yaml2rst.Config',
-        'setup_instances_patch': 'yaml2rst.yaml2rst.setup_instances',
-        'file_generator_patch': 'yaml2rst.yaml2rst.FileGenerator',
+        'setup_instances_patch': 'freee_a11y_gl.setup_instances',
+        'file_generator_patch': (
+            'yaml2rst.generators.file_generator.FileGenerator'
+        ),
         'makedirs_patch': 'os.makedirs',
         'category_list_patch': (
             'yaml2rst.generators.content_generators.'
@@ -107,7 +109,9 @@ def sample_settings():
         'build_all': True,
         'targets': [],
         'lang': 'ja',
-        'basedir': '/test/basedir'
+        'basedir': '/test/basedir',
+        'jobs': 1,
+        'use_cache': True
     }
 
 
@@ -184,7 +188,7 @@ def mock_freee_a11y_gl():
         mock_setup = Mock()
 
         m.setattr("yaml2rst.yaml2rst.Config", mock_config)
-        m.setattr("yaml2rst.yaml2rst.setup_instances", mock_setup)
+        m.setattr("freee_a11y_gl.setup_instances", mock_setup)
 
         yield {
             'config': mock_config,
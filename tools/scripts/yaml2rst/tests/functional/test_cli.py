@@ -11,8 +11,8 @@ class TestCLIInterface:
     """Test cases for command line interface."""
 
     @patch('yaml2rst.yaml2rst.Config')
-    @patch('yaml2rst.yaml2rst.setup_instances')
-    @patch('yaml2rst.yaml2rst.FileGenerator')
+    @patch('freee_a11y_gl.setup_instances')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
     @patch('os.makedirs')
     def test_cli_default_arguments(
         self,
@@ -32,7 +32,7 @@ class TestCLIInterface:
              patch('yaml2rst.initializer.get_static_dest_files') as \
              mock_get_static, \
              patch('freee_a11y_gl.source.get_src_path') as mock_get_src, \
-             patch('yaml2rst.initializer.TemplateManager') as \
+             patch('yaml2rst.template_manager.TemplateManager') as \
              mock_template_mgr:
 
             mock_get_dest.return_value = {
@@ -79,8 +79,8 @@ class TestCLIInterface:
             assert default_lang == 'ja'
 
     @patch('yaml2rst.yaml2rst.Config')
-    @patch('yaml2rst.yaml2rst.setup_instances')
-    @patch('yaml2rst.yaml2rst.FileGenerator')
+    @patch('freee_a11y_gl.setup_instances')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
     @patch('os.makedirs')
     def test_cli_custom_language(
         self,
@@ -99,7 +99,7 @@ class TestCLIInterface:
              patch('yaml2rst.initializer.get_static_dest_files') as \
              mock_get_static, \
              patch('freee_a11y_gl.source.get_src_path') as mock_get_src, \
-             patch('yaml2rst.initializer.TemplateManager') as \
+             patch('yaml2rst.template_manager.TemplateManager') as \
              mock_template_mgr:
 
             mock_get_dest.return_value = {
@@ -151,8 +151,8 @@ class TestCLIInterface:
             assert generator_call[1] == 'en'  # Second argument is language
 
     @patch('yaml2rst.yaml2rst.Config')
-    @patch('yaml2rst.yaml2rst.setup_instances')
-    @patch('yaml2rst.yaml2rst.FileGenerator')
+    @patch('freee_a11y_gl.setup_instances')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
     @patch('os.makedirs')
     def test_cli_custom_basedir(
         self,
@@ -173,7 +173,7 @@ class TestCLIInterface:
              patch('yaml2rst.initializer.get_static_dest_files') as \
              mock_get_static, \
              patch('freee_a11y_gl.source.get_src_path') as mock_get_src, \
-             patch('yaml2rst.initializer.TemplateManager') as \
+             patch('yaml2rst.template_manager.TemplateManager') as \
              mock_template_mgr:
 
             mock_get_dest.return_value = {
@@ -220,8 +220,8 @@ class TestCLIInterface:
             assert str(custom_basedir) in basedir
 
     @patch('yaml2rst.yaml2rst.Config')
-    @patch('yaml2rst.yaml2rst.setup_instances')
-    @patch('yaml2rst.yaml2rst.FileGenerator')
+    @patch('freee_a11y_gl.setup_instances')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
     @patch('os.makedirs')
     def test_cli_specific_files(
         self,
@@ -246,7 +246,7 @@ class TestCLIInterface:
              patch('yaml2rst.initializer.get_static_dest_files') as \
              mock_get_static, \
              patch('freee_a11y_gl.source.get_src_path') as mock_get_src, \
-             patch('yaml2rst.initializer.TemplateManager') as \
+             patch('yaml2rst.template_manager.TemplateManager') as \
              mock_template_mgr:
 
             mock_get_dest.return_value = {
@@ -406,7 +406,7 @@ class TestCLIErrorHandling:
              patch('yaml2rst.initializer.get_static_dest_files') as \
              mock_get_static, \
              patch('freee_a11y_gl.source.get_src_path') as mock_get_src, \
-             patch('yaml2rst.initializer.TemplateManager') as \
+             patch('yaml2rst.template_manager.TemplateManager') as \
              mock_template_mgr:
 
             mock_get_dest.return_value = {
@@ -445,13 +445,13 @@ class TestCLIErrorHandling:
         mock_makedirs.side_effect = OSError("Permission denied")
 
         with patch('yaml2rst.yaml2rst.Config'), \
-             patch('yaml2rst.yaml2rst.setup_instances'), \
+             patch('freee_a11y_gl.setup_instances'), \
              patch('yaml2rst.initializer.get_dest_dirnames') as \
              mock_get_dest, \
              patch('yaml2rst.initializer.get_static_dest_files') as \
              mock_get_static, \
              patch('freee_a11y_gl.source.get_src_path') as mock_get_src, \
-             patch('yaml2rst.initializer.TemplateManager') as \
+             patch('yaml2rst.template_manager.TemplateManager') as \
              mock_template_mgr:
 
             mock_get_dest.return_value = {
@@ -502,7 +502,7 @@ class TestCLIIntegration:
     """Integration tests for CLI functionality."""
 
     @patch('yaml2rst.yaml2rst.Config')
-    @patch('yaml2rst.yaml2rst.setup_instances')
+    @patch('freee_a11y_gl.setup_instances')
     @patch('freee_a11y_gl.Category.list_all')
     @patch('freee_a11y_gl.relationship_manager.RelationshipManager'
            '.get_sorted_related_objects')
@@ -537,7 +537,7 @@ class TestCLIIntegration:
              patch('yaml2rst.initializer.get_static_dest_files') as \
              mock_get_static, \
              patch('freee_a11y_gl.source.get_src_path') as mock_get_src, \
-             patch('yaml2rst.initializer.TemplateManager') as \
+             patch('yaml2rst.template_manager.TemplateManager') as \
              mock_template_mgr, \
              patch('os.makedirs'):
 
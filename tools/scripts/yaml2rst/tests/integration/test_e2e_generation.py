@@ -14,14 +14,14 @@ class TestEndToEndGeneration:
     """End-to-end tests for the complete generation process."""
 
     @patch('yaml2rst.yaml2rst.Config')
-    @patch('yaml2rst.yaml2rst.setup_instances')
+    @patch('freee_a11y_gl.setup_instances')
     @patch('freee_a11y_gl.Category.list_all')
     @patch('freee_a11y_gl.relationship_manager.RelationshipManager'
            '.get_sorted_related_objects')
     @patch('yaml2rst.initializer.get_dest_dirnames')
     @patch('yaml2rst.initializer.get_static_dest_files')
     @patch('freee_a11y_gl.source.get_src_path')
-    @patch('yaml2rst.initializer.TemplateManager')
+    @patch('yaml2rst.template_manager.TemplateManager')
     def test_complete_generation_workflow(
         self,
         mock_template_manager_class,
@@ -130,7 +130,8 @@ class TestEndToEndGeneration:
         )
 
         # Verify that setup_instances was called
-        mock_setup_instances.assert_called_once_with(str(temp_dir))
+        mock_setup_instances.assert_called_once_with(
+            str(temp_dir), workers=1, use_cache=True)
 
         # Verify that templates were loaded
         assert mock_template_manager_class.from_config.call_count > 0
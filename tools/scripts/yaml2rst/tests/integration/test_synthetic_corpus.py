@@ -0,0 +1,50 @@
+"""Integration tests for yaml2rst with a synthetic data set."""
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from freee_a11y_gl import clear_instances
+from freee_a11y_gl.synthetic_corpus import generate_corpus
+
+from yaml2rst import yaml2rst
+
+# Root of the a11y-guidelines repository, containing data/json/schemas
+REPO_ROOT = Path(__file__).resolve().parents[5]
+SCHEMA_DIR = REPO_ROOT / 'data' / 'json' / 'schemas'
+
+pytestmark = pytest.mark.skipif(
+    not SCHEMA_DIR.is_dir(), reason="JSON schemas not available")
+
+
+@pytest.fixture
+def corpus_dir(temp_dir):
+    """Generate a synthetic data set including the axe-core submodule."""
+    basedir = temp_dir / 'corpus'
+    sizes = generate_corpus(str(basedir), scale=0.5, seed=2,
+                            schema_dir=str(SCHEMA_DIR))
+    yield basedir, sizes
+    clear_instances()
+
+
+def test_generate_all(corpus_dir):
+    """Test generating all files of both languages from the data set."""
+    basedir, sizes = corpus_dir
+    argv = ['yaml2rst', '-b', str(basedir), '-l', 'all', '--no-cache']
+    with patch('sys.argv', argv):
+        yaml2rst.main()
+
+    for lang in ['ja', 'en']:
+        source = basedir / lang / 'source'
+        all_checks = (source / 'inc' / 'checks' / 'allchecks.rst').read_text(
+            encoding='utf-8')
+        assert all_checks.count('.. _check-') == sizes['checks']
+        guidelines = ''.join(path.read_text(encoding='utf-8') for path in
+                             (source / 'inc' / 'gl').glob('*.rst'))
+        assert guidelines.count('.. _gl-') == sizes['guidelines']
+        articles = list((source / 'faq' / 'articles').glob('[cdp]*.rst'))
+        assert len(articles) == sizes['faqs']
+        axe_rules = (source / 'inc' / 'misc' / 'axe-rules.rst').read_text(
+            encoding='utf-8')
+        assert 'synthetic-rule-001' in axe_rules
+        assert (source / 'inc' / 'misc' / 'defs.txt').is_file()
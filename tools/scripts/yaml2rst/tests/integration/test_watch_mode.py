@@ -0,0 +1,182 @@
+"""Integration tests for the watch mode with the real data corpus."""
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from freee_a11y_gl import setup_instances, clear_instances
+from freee_a11y_gl.config import Config
+
+from yaml2rst import initializer, yaml2rst
+from yaml2rst.generators.content_generators import AxeRulesGenerator
+from yaml2rst.generators.file_generator import FileGenerator
+from yaml2rst.path import TEMPLATE_DIR
+from yaml2rst.watcher import RstWatcher
+
+# Root of the a11y-guidelines repository, containing data/yaml and data/json
+REPO_ROOT = Path(__file__).resolve().parents[5]
+
+pytestmark = pytest.mark.skipif(
+    not (REPO_ROOT / 'data' / 'yaml').is_dir(),
+    reason="data corpus not available")
+
+
+@pytest.fixture
+def watch_env(temp_dir):
+    """Generate all files from a copy of the data and start a watcher."""
+    shutil.copytree(REPO_ROOT / 'data', temp_dir / 'data')
+    template_dir = temp_dir / 'templates'
+    (template_dir / 'faq').mkdir(parents=True)
+    shutil.copy(Path(TEMPLATE_DIR) / 'faq' / 'article.rst',
+                template_dir / 'faq' / 'article.rst')
+
+    settings = {
+        'build_all': True,
+        'targets': [],
+        'lang': 'ja',
+        'basedir': str(temp_dir),
+        'template_dir': str(template_dir),
+        'jobs': 1,
+        'use_cache': False,
+        'watch': True
+    }
+    dest_dirs, static_files, makefile_vars = initializer.setup_constants(
+        settings)
+    templates = initializer.setup_templates(settings['template_dir'])
+    base_vars, vars_list = initializer.setup_variables()
+    Config.initialize(
+        profile="yaml2rst",
+        config_override={
+            "basedir": settings['basedir'],
+            "languages": {"default": settings['lang']}
+        }
+    )
+    clear_instances()
+    setup_instances(settings['basedir'], use_cache=False)
+
+    for directory in dest_dirs.values():
+        os.makedirs(directory, exist_ok=True)
+    file_generator = FileGenerator(templates, settings['lang'])
+    # The axe-core rules need the Git submodule, which the copy lacks
+    generators = [
+        config for config in yaml2rst.get_generator_configs(dest_dirs,
+                                                            static_files)
+        if config.generator_class is not AxeRulesGenerator
+    ]
+    makefile_generator = yaml2rst.get_makefile_generator_config(
+        dest_dirs, static_files, makefile_vars, base_vars, vars_list)
+    for config in generators + [makefile_generator]:
+        file_generator.generate(config, True, [])
+
+    watcher = RstWatcher(settings, file_generator, generators,
+                         makefile_generator, interval=0)
+    yield watcher, dest_dirs, static_files
+    clear_instances()
+
+
+def edit(path, old, new):
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    assert old in content
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content.replace(old, new, 1))
+
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def expected_targets(watcher, changed):
+    """Targets depending on a changed file that the watcher can generate."""
+    generated = ({config.output_path for config in watcher.generators} |
+                 {watcher.makefile_generator.output_path})
+    return {Path(target) for target, sources in watcher.dependencies.items()
+            if changed in sources and
+            (target in generated or os.path.dirname(target) in generated)}
+
+
+class TestWatchMode:
+    """Test cases for regenerating files affected by changes."""
+
+    def test_no_changes(self, watch_env):
+        """Test that nothing is reported without changes."""
+        watcher, _, _ = watch_env
+        assert watcher.poll() == set()
+        assert watcher.handle_changes(set()) == []
+
+    def test_check_change(self, watch_env):
+        """Test that only files depending on a changed check are written."""
+        watcher, _, static_files = watch_env
+        path = os.path.join(watcher.yaml_dir, 'checks', 'design',
+                            '0001.yaml')
+        edit(path, 'ja: ', 'ja: 監視モードのテスト ')
+
+        changed = watcher.poll()
+        written = watcher.handle_changes(changed)
+
+        assert changed == {path}
+        assert set(written) == expected_targets(watcher, path)
+        assert len(written) == len(set(written))
+        assert '監視モードのテスト' in read(static_files['all_checks'])
+
+    def test_new_faq(self, watch_env):
+        """Test that an added FAQ is written together with the Makefile."""
+        watcher, dest_dirs, static_files = watch_env
+        src = os.path.join(watcher.yaml_dir, 'faq', 'd0003.yaml')
+        path = os.path.join(watcher.yaml_dir, 'faq', 'd9999.yaml')
+        shutil.copy(src, path)
+        edit(path, 'id: d0003', 'id: d9999')
+        edit(path, 'sortKey: ', 'sortKey: 9')
+
+        written = watcher.handle_changes(watcher.poll())
+
+        article = Path(dest_dirs['faq_articles']) / 'd9999.rst'
+        assert article in written
+        assert Path(static_files['makefile']) in written
+        assert 'd9999.rst' in read(static_files['makefile'])
+
+    def test_invalid_file_is_retried(self, watch_env, capsys):
+        """Test that a broken file keeps the model until it is fixed."""
+        watcher, _, static_files = watch_env
+        path = os.path.join(watcher.yaml_dir, 'checks', 'design',
+                            '0001.yaml')
+        original = read(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('id: [')
+
+        assert watcher.handle_changes(watcher.poll()) == []
+        assert 'Failed to reload changed files' in capsys.readouterr().err
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(original)
+        written = watcher.handle_changes(watcher.poll())
+        assert Path(static_files['all_checks']) in written
+
+    def test_template_change(self, watch_env):
+        """Test that a changed template regenerates the files using it."""
+        watcher, dest_dirs, _ = watch_env
+        template = os.path.join(watcher.settings['template_dir'], 'faq',
+                                'article.rst')
+        with open(template, 'a', encoding='utf-8') as f:
+            f.write('\n.. watch-mode-test\n')
+
+        written = watcher.handle_changes(watcher.poll())
+
+        assert written
+        assert all(path.parent == Path(dest_dirs['faq_articles'])
+                   for path in written)
+        assert '.. watch-mode-test' in read(written[0])
+
+    def test_json_change_regenerates_all(self, watch_env):
+        """Test that a changed JSON file reloads the model and all files."""
+        watcher, _, static_files = watch_env
+        path = os.path.join(watcher.json_dir, 'faq-tags.json')
+        os.utime(path, ns=(0, 0))
+
+        written = watcher.handle_changes(watcher.poll())
+
+        assert Path(static_files['makefile']) in written
+        assert Path(static_files['wcag21mapping']) in written
+        assert len(written) > len(watcher.dependencies) // 2
@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 from pathlib import Path
 import logging
 
+from freee_a11y_gl import tracing
 from yaml2rst.generators.file_generator import FileGenerator, GeneratorConfig
 from yaml2rst.generators.base_generator import BaseGenerator, GeneratorError
 from yaml2rst.generators.mixins import ValidationMixin
@@ -348,6 +349,34 @@ class TestFileGeneratorIntegration:
             assert isinstance(path, Path)
             assert path.suffix == '.rst'
 
+    def test_generation_spans(self, mock_templates, temp_dir):
+        """Test that generating records a span per generator and file."""
+        class TestGenerator(BaseGenerator):
+            def generate(self):
+                yield {'filename': 'test1'}
+                yield {'filename': 'test2'}
+
+        generator = FileGenerator(mock_templates, 'en')
+        config = GeneratorConfig(
+            generator_class=TestGenerator,
+            template_name='category_page',
+            output_path=str(temp_dir)
+        )
+
+        tracing.enable()
+        try:
+            generator.generate(config, build_all=True, targets=[])
+            events = tracing.get_events()
+        finally:
+            tracing.reset()
+
+        assert [event['name'] for event in events] == [
+            'yaml2rst.render.category_page',
+            'yaml2rst.render.category_page',
+            'yaml2rst.generate.category_page'
+        ]
+        assert events[-1]['args'] == {'lang': 'en'}
+
     def test_selective_generation(self, mock_templates, temp_dir):
         """Test selective file generation based on targets."""
         # Create a real generator class for testing
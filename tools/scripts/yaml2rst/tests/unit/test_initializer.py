@@ -167,7 +167,7 @@ class TestSetupVariables:
 class TestSetupTemplates:
     """Test cases for setup_templates function."""
 
-    @patch('yaml2rst.initializer.TemplateManager')
+    @patch('yaml2rst.template_manager.TemplateManager')
     @patch('yaml2rst.initializer.TEMPLATE_DIR', '/test/templates')
     @patch('yaml2rst.initializer.TEMPLATE_FILENAMES')
     def test_setup_templates_success(self, mock_template_filenames,
@@ -211,6 +211,11 @@ class TestParseArgs:
 
         assert args.lang == 'ja'
         assert args.basedir == '..'
+        assert args.jobs == 1
+        assert args.no_cache is False
+        assert args.watch is False
+        assert args.trace is None
+        assert args.profile_memory is False
         assert args.files == []
 
     @patch('yaml2rst.initializer.config.get_available_languages')
@@ -222,6 +227,11 @@ class TestParseArgs:
             'yaml2rst',
             '--lang', 'en',
             '--basedir', '/custom/basedir',
+            '--jobs', '4',
+            '--no-cache',
+            '--watch',
+            '--trace', 'trace.json',
+            '--profile-memory',
             'file1.yaml', 'file2.yaml'
         ]
 
@@ -230,6 +240,11 @@ class TestParseArgs:
 
         assert args.lang == 'en'
         assert args.basedir == '/custom/basedir'
+        assert args.jobs == 4
+        assert args.no_cache is True
+        assert args.watch is True
+        assert args.trace == 'trace.json'
+        assert args.profile_memory is True
         assert args.files == ['file1.yaml', 'file2.yaml']
 
     @patch('yaml2rst.initializer.config.get_available_languages')
@@ -243,6 +258,30 @@ class TestParseArgs:
             with pytest.raises(SystemExit):
                 initializer.parse_args()
 
+    @patch('yaml2rst.initializer.config.get_available_languages')
+    def test_parse_args_multiple_languages(self, mock_get_languages):
+        """Test parse_args with several languages."""
+        mock_get_languages.return_value = ['ja', 'en']
+
+        for value in ['all', 'ja,en']:
+            with patch('sys.argv', ['yaml2rst', '--lang', value]):
+                assert initializer.parse_args().lang == value
+
+        with patch('sys.argv', ['yaml2rst', '--lang', 'ja,fr']):
+            with pytest.raises(SystemExit):
+                initializer.parse_args()
+
+    @patch('yaml2rst.initializer.config.get_available_languages')
+    def test_parse_args_watch_multiple_languages(self, mock_get_languages,
+                                                 capsys):
+        """Test that watch mode is rejected for several languages."""
+        mock_get_languages.return_value = ['ja', 'en']
+
+        with patch('sys.argv', ['yaml2rst', '--lang', 'all', '--watch']):
+            with pytest.raises(SystemExit):
+                initializer.parse_args()
+        assert '--watch requires a single language' in capsys.readouterr().err
+
     @patch('yaml2rst.initializer.config.get_available_languages')
     def test_parse_args_help(self, mock_get_languages):
         """Test parse_args help option."""
@@ -253,6 +292,32 @@ class TestParseArgs:
                 initializer.parse_args()
 
 
+class TestParseLanguages:
+    """Test cases for parse_languages function."""
+
+    @pytest.mark.parametrize("value,expected", [
+        ('ja', ['ja']),
+        ('en,ja', ['en', 'ja']),
+        ('ja, en,ja', ['ja', 'en']),
+        ('all', ['ja', 'en']),
+    ])
+    def test_parse_languages(self, value, expected):
+        """Test parsing single, listed and all languages."""
+        assert initializer.parse_languages(value, ['ja', 'en']) == expected
+
+    @pytest.mark.parametrize("value", ['fr', 'ja,fr', ',', ''])
+    def test_parse_languages_invalid(self, value):
+        """Test that unavailable languages are rejected."""
+        with pytest.raises(ValueError, match='invalid language'):
+            initializer.parse_languages(value, ['ja', 'en'])
+
+    @patch('yaml2rst.initializer.config.get_available_languages')
+    def test_parse_languages_default_available(self, mock_get_languages):
+        """Test that the available languages come from the configuration."""
+        mock_get_languages.return_value = ['ja', 'en']
+        assert initializer.parse_languages('all') == ['ja', 'en']
+
+
 class TestProcessArguments:
     """Test cases for process_arguments function."""
 
@@ -263,6 +328,8 @@ class TestProcessArguments:
         mock_args.files = []
         mock_args.lang = 'ja'
         mock_args.template_dir = None
+        mock_args.no_cache = False
+        mock_args.watch = False
 
         with patch('os.path.abspath') as mock_abspath:
             mock_abspath.return_value = '/absolute/test/basedir'
@@ -272,8 +339,11 @@ class TestProcessArguments:
         assert result['build_all'] is True
         assert result['targets'] == []
         assert result['lang'] == 'ja'
+        assert result['languages'] == ['ja']
         assert result['basedir'] == '/absolute/test/basedir'
         assert result['template_dir'] is None
+        assert result['use_cache'] is True
+        assert result['watch'] is False
 
     def test_process_arguments_specific_files(self):
         """Test process_arguments when building specific files."""
@@ -299,6 +369,21 @@ class TestProcessArguments:
         assert result['basedir'] == '/absolute/test/basedir'
         assert result['template_dir'] is None
 
+    @patch('yaml2rst.initializer.config.get_available_languages')
+    def test_process_arguments_all_languages(self, mock_get_languages):
+        """Test process_arguments with all languages."""
+        mock_get_languages.return_value = ['ja', 'en']
+        mock_args = Mock()
+        mock_args.basedir = '/test/basedir'
+        mock_args.files = []
+        mock_args.lang = 'all'
+        mock_args.template_dir = None
+
+        result = initializer.process_arguments(mock_args)
+
+        assert result['lang'] == 'ja'
+        assert result['languages'] == ['ja', 'en']
+
     def test_process_arguments_empty_files_list(self):
         """Test process_arguments with empty files list."""
         mock_args = Mock()
@@ -324,7 +409,7 @@ class TestInitializerIntegration:
     @patch('yaml2rst.initializer.get_dest_dirnames')
     @patch('yaml2rst.initializer.get_static_dest_files')
     @patch('freee_a11y_gl.source.get_src_path')
-    @patch('yaml2rst.initializer.TemplateManager')
+    @patch('yaml2rst.template_manager.TemplateManager')
     @patch('yaml2rst.initializer.TEMPLATE_FILENAMES')
     def test_full_initialization_flow(
         self,
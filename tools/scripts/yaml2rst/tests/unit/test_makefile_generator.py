@@ -1,10 +1,29 @@
 """Tests for makefile generator module."""
+import os
+
 import pytest
+from jinja2 import Template
 from unittest.mock import Mock, patch
 
 from yaml2rst.generators.content_generators.makefile_generator import (
     MakefileGenerator, MakefileConfig
 )
+from yaml2rst.path import TEMPLATE_DIR
+
+# Template variables of the static rules of the Makefile
+STATIC_RULE_VARS = {
+    'gl_yaml': 'gl1.yaml gl2.yaml',
+    'check_yaml': 'check1.yaml',
+    'faq_yaml': 'faq1.yaml',
+    'wcag_sc': 'wcag-sc.json',
+    'info_src': 'info.json',
+    'all_checks_target': 'allchecks.rst',
+    'faq_index_target': 'index.rst tags/index.rst',
+    'wcag_mapping_target': 'wcag21-mapping.rst',
+    'priority_diff_target': 'priority-diff.rst',
+    'miscdefs_target': 'defs.txt',
+    'axe_rules_target': 'axe-rules.rst',
+}
 
 
 @pytest.fixture
@@ -261,12 +280,14 @@ class TestMakefileGenerator:
         mock_faq_tag_class.list_all.return_value = [mock_faq_tag]
 
         generator = MakefileGenerator('ja', sample_makefile_config)
-        generator.relationship_manager.get_sorted_related_objects = Mock(
-            return_value=[mock_faq])
-
-        build_depends, article_targets, tagpage_targets = (
-            generator._process_faq_targets())
-
+        with patch.object(generator.relationship_manager, 'get_dependencies',
+                          return_value=['data/yaml/faq/test_faq.yaml']
+                          ) as mock_get_dependencies:
+            build_depends, article_targets, tagpage_targets = (
+                generator._process_faq_targets())
+
+        mock_get_dependencies.assert_called_once_with(mock_faq_tag)
+        assert build_depends[1]['depends'] == 'data/yaml/faq/test_faq.yaml'
         assert len(build_depends) == 2  # One for article, one for tag page
         assert len(article_targets) == 1
         assert len(tagpage_targets) == 1
@@ -321,11 +342,10 @@ class TestMakefileGenerator:
         mock_faq_tag_class.list_all.return_value = [mock_tag1, mock_tag2]
 
         generator = MakefileGenerator('ja', sample_makefile_config)
-        generator.relationship_manager.get_sorted_related_objects = Mock(
-            return_value=[mock_faq1])
-
-        build_depends, article_targets, tagpage_targets = (
-            generator._process_faq_targets())
+        with patch.object(generator.relationship_manager, 'get_dependencies',
+                          return_value=['dep1.yaml']):
+            build_depends, article_targets, tagpage_targets = (
+                generator._process_faq_targets())
 
         # Should only have one of each due to duplicate filtering
         assert len(article_targets) == 1
@@ -566,3 +586,49 @@ class TestMakefileGenerator:
         # Should not yield anything due to validation failure
         results = list(generator.generate())
         assert len(results) == 0
+
+    def test_get_dependency_map(self, sample_makefile_config):
+        """Test that the dependency map has the targets of the Makefile."""
+        generator = MakefileGenerator('ja', sample_makefile_config)
+        generator.get_template_data = Mock(return_value={
+            **STATIC_RULE_VARS,
+            'static_rules': generator._static_rules(STATIC_RULE_VARS),
+            'depends': [
+                {'target': 'categories/image.rst',
+                 'depends': 'gl1.yaml check1.yaml'}
+            ]
+        })
+
+        dependency_map = generator.get_dependency_map()
+
+        assert dependency_map == {
+            'wcag21-mapping.rst': ['gl1.yaml', 'gl2.yaml', 'wcag-sc.json'],
+            'priority-diff.rst': ['gl1.yaml', 'gl2.yaml', 'wcag-sc.json'],
+            'axe-rules.rst': ['gl1.yaml', 'gl2.yaml'],
+            'allchecks.rst': ['gl1.yaml', 'gl2.yaml', 'check1.yaml',
+                              'faq1.yaml'],
+            'defs.txt': ['info.json'],
+            'index.rst': ['faq1.yaml'],
+            'tags/index.rst': ['faq1.yaml'],
+            'categories/image.rst': ['gl1.yaml', 'check1.yaml']
+        }
+
+    def test_dependency_map_matches_template(self, sample_makefile_config):
+        """Test that the rules of the rendered Makefile are in the map."""
+        generator = MakefileGenerator('ja', sample_makefile_config)
+        data = {**STATIC_RULE_VARS,
+                'static_rules': generator._static_rules(STATIC_RULE_VARS),
+                'depends': [{'target': 'categories/image.rst',
+                             'depends': 'gl1.yaml check1.yaml'}]}
+        generator.get_template_data = Mock(return_value=data)
+        with open(os.path.join(TEMPLATE_DIR, 'incfiles.mk'),
+                  encoding='utf-8') as f:
+            makefile = Template(f.read()).render(data)
+
+        rules = {}
+        for line in makefile.splitlines():
+            targets, sep, sources = line.partition(': ')
+            if sep and not line.startswith(('%', 'ALL_')):
+                for target in targets.split():
+                    rules[target] = sources.split()
+        assert rules == generator.get_dependency_map()
@@ -0,0 +1,239 @@
+"""Tests for the watch mode."""
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from yaml2rst.generators.content_generators import (
+    CategoryGenerator, AllChecksGenerator, MakefileGenerator
+)
+from yaml2rst.generators.file_generator import GeneratorConfig
+from yaml2rst.watcher import (
+    RstWatcher, _affected_targets, _is_ignored, _produces
+)
+
+
+@pytest.fixture
+def watcher(temp_dir):
+    """Watcher over an empty data directory with mocked generators."""
+    (temp_dir / 'data' / 'yaml' / 'checks').mkdir(parents=True)
+    (temp_dir / 'data' / 'json').mkdir(parents=True)
+    template_dir = temp_dir / 'templates'
+    (template_dir / 'checks').mkdir(parents=True)
+
+    template = Mock()
+    template.resolver.get_search_paths.return_value = [str(template_dir)]
+    file_generator = Mock()
+    file_generator.lang = 'ja'
+    file_generator.templates = {'category_page': template}
+    file_generator.generate.side_effect = (
+        lambda config, build_all, targets: [Path(t) for t in targets]
+        if not build_all else [Path(config.output_path)])
+
+    settings = {
+        'build_all': True,
+        'targets': [],
+        'basedir': str(temp_dir),
+        'template_dir': str(template_dir),
+        'jobs': 1,
+        'use_cache': True
+    }
+    generators = [
+        GeneratorConfig(CategoryGenerator, 'category_page', '/out/gl'),
+        GeneratorConfig(AllChecksGenerator, 'allchecks_text',
+                        '/out/allchecks.rst', is_single_file=True)
+    ]
+    makefile_generator = GeneratorConfig(
+        MakefileGenerator, 'makefile', '/out/incfiles.mk',
+        is_single_file=True, extra_args={'config': Mock()})
+    dependencies = {
+        '/out/gl/image.rst': {'gl1.yaml', 'check1.yaml'},
+        '/out/gl/form.rst': {'gl2.yaml'},
+        '/out/allchecks.rst': {'gl1.yaml', 'gl2.yaml', 'check1.yaml'}
+    }
+    with patch.object(RstWatcher, 'get_dependencies',
+                      return_value=dependencies):
+        watcher = RstWatcher(settings, file_generator, generators,
+                             makefile_generator, interval=0)
+    watcher.get_dependencies = Mock(return_value=dependencies)
+    return watcher
+
+
+class TestHelpers:
+    """Test cases for the module level helpers."""
+
+    @pytest.mark.parametrize("filename,suffix,expected", [
+        ('0001.yaml', '.yaml', False),
+        ('.0001.yaml.swp', '.yaml', True),
+        ('0001.yaml~', '.yaml', True),
+        ('notes.txt', '.yaml', True),
+        ('article.rst', None, False),
+    ])
+    def test_is_ignored(self, filename, suffix, expected):
+        """Test that hidden, backup and unrelated files are ignored."""
+        assert _is_ignored(filename, suffix) is expected
+
+    def test_produces(self):
+        """Test matching targets to single-file and directory generators."""
+        directory = GeneratorConfig(CategoryGenerator, 'category_page',
+                                    '/out/gl')
+        single = GeneratorConfig(AllChecksGenerator, 'allchecks_text',
+                                 '/out/allchecks.rst', is_single_file=True)
+
+        assert _produces(directory, '/out/gl/image.rst')
+        assert not _produces(directory, '/out/allchecks.rst')
+        assert _produces(single, '/out/allchecks.rst')
+        assert not _produces(single, '/out/gl/image.rst')
+
+    def test_affected_targets(self):
+        """Test that old, new and added dependencies are considered."""
+        old = {'x.yaml': {'a.rst'}, 'y.yaml': {'b.rst'}, 'z.yaml': {'c.rst'}}
+        new = {'x.yaml': {'b.rst'}, 'z.yaml': {'c.rst'}, 'w.yaml': {'d.rst'}}
+
+        assert _affected_targets(old, new, {'d.rst'}, {'x.yaml'}) == {
+            'a.rst', 'b.rst', 'd.rst'}
+
+    def test_dependents_follow_dependencies(self, watcher):
+        """Test that the reverse index is updated with the dependency map."""
+        watcher.dependencies = {'a.rst': {'x.yaml', 'y.yaml'},
+                                'b.rst': {'x.yaml'}}
+
+        assert watcher.dependents == {'x.yaml': {'a.rst', 'b.rst'},
+                                      'y.yaml': {'a.rst'}}
+
+
+class TestRstWatcher:
+    """Test cases for RstWatcher with a mocked model."""
+
+    def test_poll(self, watcher, temp_dir):
+        """Test that added, modified and deleted files are detected."""
+        path = temp_dir / 'data' / 'yaml' / 'checks' / '0001.yaml'
+        path.write_text('id: "0001"\n')
+        (temp_dir / 'data' / 'yaml' / 'checks' / '.0001.yaml.swp').touch()
+        assert watcher.poll() == {str(path)}
+        assert watcher.poll() == set()
+
+        os.utime(path, ns=(0, 0))
+        assert watcher.poll() == {str(path)}
+        path.unlink()
+        assert watcher.poll() == {str(path)}
+
+    @patch('yaml2rst.watcher.reload_sources')
+    def test_changed_source(self, mock_reload, watcher, temp_dir):
+        """Test that only targets depending on a changed file are written."""
+        path = str(temp_dir / 'data' / 'yaml' / 'checks' / 'check1.yaml')
+        watcher.dependencies = {
+            '/out/gl/image.rst': {path},
+            '/out/gl/form.rst': {'gl2.yaml'},
+            '/out/allchecks.rst': {path}
+        }
+        watcher.get_dependencies.return_value = dict(watcher.dependencies)
+
+        written = watcher.handle_changes({path})
+
+        mock_reload.assert_called_once_with({path},
+                                            watcher.settings['basedir'])
+        assert written == [Path('/out/gl/image.rst'),
+                           Path('/out/allchecks.rst')]
+
+    @patch('yaml2rst.watcher.reload_sources')
+    def test_requested_targets_only(self, mock_reload, watcher, temp_dir):
+        """Test that only files given on the command line are written."""
+        path = str(temp_dir / 'data' / 'yaml' / 'checks' / 'check1.yaml')
+        watcher.dependencies = {
+            '/out/gl/image.rst': {path},
+            '/out/allchecks.rst': {path}
+        }
+        watcher.get_dependencies.return_value = dict(watcher.dependencies)
+        watcher.settings.update(build_all=False, targets=['/out/gl'])
+
+        assert watcher.handle_changes({path}) == [Path('/out/gl/image.rst')]
+
+    @patch('yaml2rst.watcher.reload_sources',
+           side_effect=ValueError('Duplicate check ID: 0001'))
+    def test_reload_error(self, mock_reload, watcher, temp_dir, capsys):
+        """Test that failed files are reported and retried."""
+        path = str(temp_dir / 'data' / 'yaml' / 'checks' / 'check1.yaml')
+
+        assert watcher.handle_changes({path}) == []
+        assert 'Duplicate check ID: 0001' in capsys.readouterr().err
+
+        mock_reload.side_effect = None
+        other = str(temp_dir / 'data' / 'yaml' / 'checks' / 'check2.yaml')
+        watcher.handle_changes({other})
+        mock_reload.assert_called_with({path, other},
+                                       watcher.settings['basedir'])
+
+    @pytest.mark.parametrize('content', ['', 'not a mapping\n'])
+    def test_non_mapping_source(self, watcher, temp_dir, capsys, content):
+        """Test that an empty file saved in warning mode is reported."""
+        path = temp_dir / 'data' / 'yaml' / 'checks' / 'check1.yaml'
+        path.write_text(content)
+
+        with patch('freee_a11y_gl.config.Config.get_yaml_validation_mode',
+                   return_value='warning'):
+            assert watcher.handle_changes({str(path)}) == []
+        assert 'not a mapping' in capsys.readouterr().err
+        assert watcher._pending == {str(path)}
+
+    @patch('yaml2rst.watcher.setup_instances')
+    @patch('yaml2rst.watcher.clear_instances')
+    def test_json_change(self, mock_clear, mock_setup, watcher, temp_dir):
+        """Test that a JSON change reloads the model and writes all files."""
+        path = str(temp_dir / 'data' / 'json' / 'info.json')
+
+        written = watcher.handle_changes({path})
+
+        mock_clear.assert_called_once()
+        mock_setup.assert_called_once_with(
+            watcher.settings['basedir'], workers=1, use_cache=True)
+        assert written == [Path('/out/gl'), Path('/out/allchecks.rst'),
+                           Path('/out/incfiles.mk')]
+
+    @patch('yaml2rst.watcher.setup_instances', side_effect=SystemExit(1))
+    @patch('yaml2rst.watcher.clear_instances')
+    def test_failed_full_reload(self, mock_clear, mock_setup, watcher,
+                                temp_dir, capsys):
+        """Test that a failed full reload is repeated with the next change."""
+        path = str(temp_dir / 'data' / 'json' / 'info.json')
+        assert watcher.handle_changes({path}) == []
+        assert 'Failed to load' in capsys.readouterr().err
+
+        mock_setup.side_effect = None
+        with patch('yaml2rst.watcher.reload_sources') as mock_reload:
+            watcher.handle_changes(
+                {str(temp_dir / 'data' / 'yaml' / 'checks' / 'c.yaml')})
+        mock_reload.assert_not_called()
+        assert mock_setup.call_count == 2
+
+    @patch('yaml2rst.watcher.initializer.setup_templates')
+    def test_template_change(self, mock_setup_templates, watcher, temp_dir):
+        """Test that only files using a changed template are written."""
+        templates = watcher.file_generator.templates
+        mock_setup_templates.return_value = templates
+        path = str(temp_dir / 'templates' / 'gl-category.rst')
+
+        assert watcher.handle_changes({path}) == [Path('/out/gl')]
+        mock_setup_templates.assert_called_once_with(
+            watcher.settings['template_dir'])
+
+        included = str(temp_dir / 'templates' / 'checks' / 'procedure.rst')
+        assert watcher.handle_changes({included}) == [
+            Path('/out/gl'), Path('/out/allchecks.rst'),
+            Path('/out/incfiles.mk')]
+
+    @patch('yaml2rst.watcher.time.sleep')
+    def test_run(self, mock_sleep, watcher, capsys):
+        """Test that changes are handled until interrupted."""
+        watcher.poll = Mock(side_effect=[set(), {'changed.yaml'},
+                                         KeyboardInterrupt])
+        watcher.handle_changes = Mock(return_value=[Path('/out/a.rst')])
+
+        watcher.run()
+
+        watcher.handle_changes.assert_called_once_with({'changed.yaml'})
+        output = capsys.readouterr().out
+        assert '/out/a.rst' in output
+        assert 'Regenerated 1 files' in output
+        assert 'Stopped watching' in output
@@ -1,4 +1,5 @@
 """Tests for yaml2rst main module and entry point."""
+import json
 import os
 import subprocess
 import sys
@@ -6,6 +7,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from freee_a11y_gl import memory_profile, tracing
 from yaml2rst import yaml2rst
 
 
@@ -13,9 +15,9 @@ class TestMain:
     """Test cases for the main() function."""
 
     @patch('yaml2rst.yaml2rst.initializer')
-    @patch('yaml2rst.yaml2rst.setup_instances')
+    @patch('freee_a11y_gl.setup_instances')
     @patch('yaml2rst.yaml2rst.Config')
-    @patch('yaml2rst.yaml2rst.FileGenerator')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
     @patch('os.makedirs')
     def test_main_successful_execution(
         self,
@@ -66,7 +68,8 @@ class TestMain:
 
         # Verify setup_instances call
         mock_setup_instances.assert_called_once_with(
-            sample_settings['basedir'])
+            sample_settings['basedir'], workers=sample_settings['jobs'],
+            use_cache=sample_settings['use_cache'])
 
         # Verify directory creation
         assert mock_makedirs.call_count == len(sample_dest_dirs)
@@ -79,7 +82,7 @@ class TestMain:
         assert mock_file_generator.generate.call_count >= 10
 
     @patch('yaml2rst.yaml2rst.initializer')
-    @patch('yaml2rst.yaml2rst.setup_instances')
+    @patch('freee_a11y_gl.setup_instances')
     @patch('yaml2rst.yaml2rst.Config')
     def test_main_config_initialization_error(
         self,
@@ -126,7 +129,7 @@ class TestMain:
             yaml2rst.main()
 
     @patch('yaml2rst.yaml2rst.initializer')
-    @patch('yaml2rst.yaml2rst.setup_instances')
+    @patch('freee_a11y_gl.setup_instances')
     @patch('yaml2rst.yaml2rst.Config')
     @patch('os.makedirs')
     def test_main_directory_creation_error(
@@ -153,9 +156,9 @@ class TestMain:
             yaml2rst.main()
 
     @patch('yaml2rst.yaml2rst.initializer')
-    @patch('yaml2rst.yaml2rst.setup_instances')
+    @patch('freee_a11y_gl.setup_instances')
     @patch('yaml2rst.yaml2rst.Config')
-    @patch('yaml2rst.yaml2rst.FileGenerator')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
     @patch('os.makedirs')
     def test_main_file_generation_error(
         self,
@@ -205,9 +208,9 @@ class TestMain:
             yaml2rst.main()
 
     @patch('yaml2rst.yaml2rst.initializer')
-    @patch('yaml2rst.yaml2rst.setup_instances')
+    @patch('freee_a11y_gl.setup_instances')
     @patch('yaml2rst.yaml2rst.Config')
-    @patch('yaml2rst.yaml2rst.FileGenerator')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
     @patch('os.makedirs')
     def test_main_generator_configurations(
         self,
@@ -269,9 +272,9 @@ class TestMain:
                 f"{generator_classes}"
 
     @patch('yaml2rst.yaml2rst.initializer')
-    @patch('yaml2rst.yaml2rst.setup_instances')
+    @patch('freee_a11y_gl.setup_instances')
     @patch('yaml2rst.yaml2rst.Config')
-    @patch('yaml2rst.yaml2rst.FileGenerator')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
     @patch('os.makedirs')
     def test_main_makefile_generation(
         self,
@@ -322,6 +325,170 @@ class TestMain:
         assert makefile_config.is_single_file is True
         assert 'config' in makefile_config.extra_args
 
+    @patch('yaml2rst.watcher.RstWatcher')
+    @patch('yaml2rst.yaml2rst.initializer')
+    @patch('freee_a11y_gl.setup_instances')
+    @patch('yaml2rst.yaml2rst.Config')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
+    @patch('os.makedirs')
+    def test_main_watch(
+        self,
+        mock_makedirs,
+        mock_file_generator_class,
+        mock_config,
+        mock_setup_instances,
+        mock_initializer,
+        mock_watcher_class,
+        sample_settings,
+        sample_dest_dirs,
+        sample_static_files,
+        mock_templates
+    ):
+        """Test that the watcher is started after generating all files."""
+        settings = dict(sample_settings, watch=True)
+        mock_initializer.setup_parameters.return_value = settings
+        mock_initializer.setup_constants.return_value = (
+            sample_dest_dirs,
+            sample_static_files,
+            {'test_var': 'test_value'}
+        )
+        mock_initializer.setup_templates.return_value = mock_templates
+        mock_initializer.setup_variables.return_value = ({}, {})
+        mock_file_generator = Mock()
+        mock_file_generator_class.return_value = mock_file_generator
+
+        yaml2rst.main()
+
+        args = mock_watcher_class.call_args[0]
+        assert args[0] is settings
+        assert args[1] is mock_file_generator
+        assert len(args[2]) == mock_file_generator.generate.call_count - 1
+        assert args[3].generator_class.__name__ == 'MakefileGenerator'
+        mock_watcher_class.return_value.run.assert_called_once()
+
+    @patch('yaml2rst.yaml2rst.initializer')
+    @patch('freee_a11y_gl.setup_instances')
+    @patch('yaml2rst.yaml2rst.Config')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
+    @patch('os.makedirs')
+    def test_main_multiple_languages(
+        self,
+        mock_makedirs,
+        mock_file_generator_class,
+        mock_config,
+        mock_setup_instances,
+        mock_initializer,
+        sample_settings,
+        sample_dest_dirs,
+        sample_static_files,
+        mock_templates
+    ):
+        """Test that all languages are generated from one model load."""
+        settings = dict(sample_settings, languages=['ja', 'en'])
+        mock_initializer.setup_parameters.return_value = settings
+        mock_initializer.setup_constants.return_value = (
+            sample_dest_dirs,
+            sample_static_files,
+            {'test_var': 'test_value'}
+        )
+        mock_initializer.setup_templates.return_value = mock_templates
+        mock_initializer.setup_variables.return_value = ({}, {})
+
+        yaml2rst.main()
+
+        mock_setup_instances.assert_called_once()
+        mock_initializer.setup_templates.assert_called_once()
+        assert [call[0][0]['lang'] for call
+                in mock_initializer.setup_constants.call_args_list] == [
+            'ja', 'en']
+        assert mock_initializer.setup_variables.call_count == 2
+        assert [call[0] for call in mock_file_generator_class.call_args_list
+                ] == [(mock_templates, 'ja'), (mock_templates, 'en')]
+        assert mock_makedirs.call_count == 2 * len(sample_dest_dirs)
+
+    @patch('yaml2rst.yaml2rst.initializer')
+    @patch('freee_a11y_gl.setup_instances')
+    @patch('yaml2rst.yaml2rst.Config')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
+    @patch('os.makedirs')
+    def test_main_trace(
+        self,
+        mock_makedirs,
+        mock_file_generator_class,
+        mock_config,
+        mock_setup_instances,
+        mock_initializer,
+        sample_settings,
+        sample_dest_dirs,
+        sample_static_files,
+        mock_templates,
+        temp_dir,
+        capsys
+    ):
+        """Test that --trace writes a trace of the run and a summary."""
+        trace_path = os.path.join(temp_dir, 'trace.json')
+        settings = dict(sample_settings, languages=['ja', 'en'],
+                        trace=trace_path)
+        mock_initializer.setup_parameters.return_value = settings
+        mock_initializer.setup_constants.return_value = (
+            sample_dest_dirs,
+            sample_static_files,
+            {'test_var': 'test_value'}
+        )
+        mock_initializer.setup_templates.return_value = mock_templates
+        mock_initializer.setup_variables.return_value = ({}, {})
+
+        yaml2rst.main()
+
+        assert not tracing.is_enabled()
+        with open(trace_path, encoding='utf-8') as f:
+            events = json.load(f)['traceEvents']
+        assert [event['args']['lang'] for event in events
+                if event['name'] == 'yaml2rst.language'] == ['ja', 'en']
+        assert f'Trace written to {trace_path}' in capsys.readouterr().err
+
+    @patch('yaml2rst.yaml2rst.initializer')
+    @patch('freee_a11y_gl.setup_instances')
+    @patch('yaml2rst.yaml2rst.Config')
+    @patch('yaml2rst.generators.file_generator.FileGenerator')
+    @patch('os.makedirs')
+    def test_main_profile_memory(
+        self,
+        mock_makedirs,
+        mock_file_generator_class,
+        mock_config,
+        mock_setup_instances,
+        mock_initializer,
+        sample_settings,
+        sample_dest_dirs,
+        sample_static_files,
+        mock_templates,
+        capsys
+    ):
+        """Test that --profile-memory reports the memory of each language."""
+        settings = dict(sample_settings, languages=['ja', 'en'],
+                        profile_memory=True)
+        mock_initializer.setup_parameters.return_value = settings
+        mock_initializer.setup_constants.return_value = (
+            sample_dest_dirs,
+            sample_static_files,
+            {'test_var': 'test_value'}
+        )
+        mock_initializer.setup_templates.return_value = mock_templates
+        mock_initializer.setup_variables.return_value = ({}, {})
+
+        try:
+            yaml2rst.main()
+            assert not memory_profile.is_enabled()
+            assert [record['name'] for record in memory_profile.get_phases()
+                    ] == ['yaml2rst.language(lang=ja)',
+                          'yaml2rst.language(lang=en)']
+        finally:
+            memory_profile.reset()
+        report = capsys.readouterr().err
+        assert 'yaml2rst.language(lang=en)' in report
+        assert 'Peak RSS: ' in report
+
 
 class TestMainEntryPoint:
     """Test the main entry point functionality."""
@@ -428,8 +595,9 @@ class TestMainIntegration:
         mock_setup = Mock()
 
         with patch('yaml2rst.yaml2rst.Config', mock_config), \
-             patch('yaml2rst.yaml2rst.setup_instances', mock_setup), \
-             patch('yaml2rst.yaml2rst.FileGenerator') as mock_fg:
+             patch('freee_a11y_gl.setup_instances', mock_setup), \
+             patch('yaml2rst.generators.file_generator.FileGenerator'
+                   ) as mock_fg:
 
             mock_file_generator = Mock()
             mock_fg.return_value = mock_file_generator
@@ -6,6 +6,7 @@ from pathlib import Path
 from pydantic import (BaseModel, Field, model_validator, field_validator,
                       ValidationError, ValidationInfo)
 import yaml
+from freee_a11y_gl import yaml_loader
 
 logger = logging.getLogger(__name__)
 
@@ -280,7 +281,7 @@ class YAMLConfigLoader:
     def load(self, config_path: Path) -> Dict[str, Any]:
         try:
             with config_path.open('r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml_loader.safe_load(f) or {}
                 logger.debug(f"Loaded YAML config with {len(data)} keys")
                 return data
         except yaml.YAMLError as e:
@@ -4,6 +4,7 @@ import logging
 from typing import Dict, List, Any, Optional
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+from freee_a11y_gl import tracing
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +34,10 @@ class SheetsAPIClient:
         Returns:
             Dict[str, Any]: Spreadsheet information
         """
-        return self.service.spreadsheets().get(
-            spreadsheetId=self.spreadsheet_id
-        ).execute()
+        with tracing.span('sheets_api.get', category='yaml2sheet'):
+            return self.service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id
+            ).execute()
 
     def get_spreadsheet_with_ranges(self, ranges: List[str]) -> Dict[str, Any]:
         """Get spreadsheet information with specific ranges
@@ -46,11 +48,12 @@ class SheetsAPIClient:
         Returns:
             Dict[str, Any]: Spreadsheet information
         """
-        return self.service.spreadsheets().get(
-            spreadsheetId=self.spreadsheet_id,
-            ranges=ranges,
-            includeGridData=False
-        ).execute()
+        with tracing.span('sheets_api.get', category='yaml2sheet', ranges=len(ranges)):
+            return self.service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=ranges,
+                includeGridData=False
+            ).execute()
 
     def batch_update(self, requests: List[Dict]) -> Dict[str, Any]:
         """Execute batch update requests
@@ -61,10 +64,12 @@ class SheetsAPIClient:
         Returns:
             Dict[str, Any]: API response
         """
-        return self.service.spreadsheets().batchUpdate(
-            spreadsheetId=self.spreadsheet_id,
-            body={'requests': requests}
-        ).execute()
+        with tracing.span('sheets_api.batch_update', category='yaml2sheet',
+                          requests=len(requests)):
+            return self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={'requests': requests}
+            ).execute()
 
     def get_by_data_filter(self, data_filters: List[Dict]) -> Dict[str, Any]:
         """Get spreadsheet data by filter
@@ -75,7 +80,8 @@ class SheetsAPIClient:
         Returns:
             Dict[str, Any]: Filtered data
         """
-        return self.service.spreadsheets().getByDataFilter(
-            spreadsheetId=self.spreadsheet_id,
-            body={"dataFilters": data_filters}
-        ).execute()
+        with tracing.span('sheets_api.get_by_data_filter', category='yaml2sheet'):
+            return self.service.spreadsheets().getByDataFilter(
+                spreadsheetId=self.spreadsheet_id,
+                body={"dataFilters": data_filters}
+            ).execute()
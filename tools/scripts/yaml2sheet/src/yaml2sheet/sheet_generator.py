@@ -4,6 +4,7 @@ import json
 from google.oauth2.credentials import Credentials
 # Import build for backward compatibility with tests
 from googleapiclient.discovery import build
+from freee_a11y_gl import tracing
 
 from .config import TARGET_NAMES, LANGS, COLUMN_INFO, CHECK_RESULTS, FINAL_CHECK_RESULTS, COLUMNS
 from .config_loader import ApplicationConfig
@@ -440,7 +441,8 @@ class ChecklistSheetGenerator:
 
         # Process source data
         logger.info("Processing source data")
-        processed_data = self.data_processor.process_source_data(source_data['checks'])
+        with tracing.span('yaml2sheet.process_source_data', category='yaml2sheet', phase=True):
+            processed_data = self.data_processor.process_source_data(source_data['checks'])
         
         # Count total sheets to be generated for progress reporting
         total_sheets = 0
@@ -452,27 +454,31 @@ class ChecklistSheetGenerator:
 
         # Generate sheets for each language and target
         sheets_processed = 0
-        for lang in LANGS:
-            for target_id, translations in TARGET_NAMES.items():
-                if target_id in processed_data:
-                    sheets_processed += 1
-                    logger.info(f"Creating sheet {sheets_processed}/{total_sheets}: {target_id} in {lang} ({translations[lang]})")
+        with tracing.span('yaml2sheet.prepare_sheets', category='yaml2sheet', phase=True):
+            for lang in LANGS:
+                for target_id, translations in TARGET_NAMES.items():
+                    if target_id in processed_data:
+                        sheets_processed += 1
+                        logger.info(f"Creating sheet {sheets_processed}/{total_sheets}: {target_id} in {lang} ({translations[lang]})")
                     
-                    self.current_lang = lang
-                    self.current_target = target_id
-                    sheet = self.prepare_sheet_structure(
-                        target_id=target_id,
-                        target_name=translations[lang],
-                        lang=lang,
-                        checks=processed_data[target_id]
-                    )
-                    self.sheets[sheet.name] = sheet
+                        self.current_lang = lang
+                        self.current_target = target_id
+                        with tracing.span('yaml2sheet.prepare_sheet', category='yaml2sheet',
+                                          target=target_id, lang=lang):
+                            sheet = self.prepare_sheet_structure(
+                                target_id=target_id,
+                                target_name=translations[lang],
+                                lang=lang,
+                                checks=processed_data[target_id]
+                            )
+                        self.sheets[sheet.name] = sheet
         
         # Execute updates
         logger.info("All sheets prepared, executing batch update")
         self.execute_batch_update()
         logger.info("Checklist generation completed successfully")
 
+    @tracing.traced('yaml2sheet.execute_batch_update', category='yaml2sheet', phase=True)
     def execute_batch_update(self) -> None:
         """Execute batch update of spreadsheet with improved chunking for timeout prevention"""
         try:
@@ -579,6 +585,7 @@ class ChecklistSheetGenerator:
         
         logger.info(f"All sheet updates completed")
 
+    @tracing.traced('yaml2sheet.generate_batch_requests', category='yaml2sheet', phase=True)
     def generate_batch_requests(self) -> tuple[List[Dict], Dict]:
         """Generate batch update requests
         
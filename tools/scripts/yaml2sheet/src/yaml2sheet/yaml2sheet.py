@@ -2,16 +2,15 @@ import sys
 import os
 import logging
 import argparse
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pathlib import Path
-from .auth import GoogleAuthManager
-from .sheet_generator import ChecklistSheetGenerator
+from freee_a11y_gl import memory_profile, tracing
 from .config_loader import load_configuration, ApplicationConfig, create_default_config
-from googleapiclient.errors import HttpError
-from google.oauth2.credentials import Credentials
 
-from freee_a11y_gl import settings as GL
-from freee_a11y_gl.yaml_processor import process_yaml_data
+# The Google API client and the guideline data model are imported in the
+# functions using them, so that --help and --create-config do not load them
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments
@@ -61,12 +60,39 @@ def parse_args() -> argparse.Namespace:
         help='Base URL for documentation links (default: from config file)'
     )
     
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Number of worker processes used to parse and validate YAML files (0 uses all available CPUs)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Parse and validate all source files instead of reusing the cache of parsed files'
+    )
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
         help='Enable verbose logging (overrides config log level)'
     )
     
+    parser.add_argument(
+        '--trace',
+        metavar='PATH',
+        help='Write a trace of the phases of the run in the Chrome trace event format to PATH '
+             'and print a summary of the time spent in each phase'
+    )
+
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='Trace memory allocations and report the change and peak of the allocated memory, '
+             'the peak RSS and the top allocation sites of each phase (slows the run down)'
+    )
+
     return parser.parse_args()
 
 def setup_logging(level: int = logging.INFO) -> None:
@@ -82,7 +108,7 @@ def setup_logging(level: int = logging.INFO) -> None:
         force=True  # Override existing handlers
     )
 
-def get_credentials(config: ApplicationConfig) -> Optional[Credentials]:
+def get_credentials(config: ApplicationConfig) -> Optional['Credentials']:
     """Get Google API credentials
     
     Args:
@@ -91,6 +117,8 @@ def get_credentials(config: ApplicationConfig) -> Optional[Credentials]:
     Returns:
         Optional[Credentials]: Google API credentials or None if authentication fails
     """
+    from .auth import GoogleAuthManager
+
     logger = logging.getLogger(__name__)
     auth_manager = GoogleAuthManager(
         credentials_path=config.credentials_path.as_posix(),
@@ -124,10 +152,30 @@ def main() -> int:
     """
     # Set up initial logging with default level
     setup_logging()
-    logger = logging.getLogger(__name__)
     
     # Parse command line arguments
     args = parse_args()
+    if args.trace:
+        tracing.enable(args.trace)
+    if args.profile_memory:
+        memory_profile.enable()
+    try:
+        return run(args)
+    finally:
+        tracing.finish()
+        memory_profile.finish()
+
+
+def run(args: argparse.Namespace) -> int:
+    """Generate the checklist as specified by the command line arguments
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        int: Exit code (0 for success, non-zero for errors)
+    """
+    logger = logging.getLogger(__name__)
     
     # Set verbose logging if requested
     if args.verbose:
@@ -184,6 +232,11 @@ def main() -> int:
     env_type = "production" if args.production else "development"
     logger.info(f"Using {env_type} environment")
     
+    from googleapiclient.errors import HttpError
+    from freee_a11y_gl import settings as GL
+    from freee_a11y_gl.yaml_processor import process_yaml_data
+    from .sheet_generator import ChecklistSheetGenerator
+
     # Get authentication
     credentials = get_credentials(config)
     if credentials is None:
@@ -201,7 +254,7 @@ def main() -> int:
 
         # Process source YAML data
         logger.info(f"Processing YAML data from {source_path}")
-        source_data = process_yaml_data(str(source_path))
+        source_data = process_yaml_data(str(source_path), workers=args.jobs, use_cache=not args.no_cache)
         logger.info(f"Processed {len(source_data.get('checks', {}))} checks from source data")
         
     except Exception as e:
@@ -192,7 +192,7 @@ def sample_yaml_data():
 @pytest.fixture
 def mock_freee_a11y_gl(sample_yaml_data):
     """Mock freee_a11y_gl.yaml_processor.process_yaml_data function."""
-    with patch('yaml2sheet.yaml2sheet.process_yaml_data') as mock_process:
+    with patch('freee_a11y_gl.yaml_processor.process_yaml_data') as mock_process:
         mock_process.return_value = sample_yaml_data
         yield mock_process
 
@@ -200,7 +200,7 @@ def mock_freee_a11y_gl(sample_yaml_data):
 @pytest.fixture
 def mock_freee_a11y_gl_settings():
     """Mock freee_a11y_gl settings module."""
-    with patch('yaml2sheet.yaml2sheet.GL') as mock_gl:
+    with patch('freee_a11y_gl.settings') as mock_gl:
         mock_gl.get.return_value = "https://a11y-guidelines.freee.co.jp"
         mock_gl.update = Mock()
         yield mock_gl
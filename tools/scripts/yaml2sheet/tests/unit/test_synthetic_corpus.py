@@ -0,0 +1,181 @@
+"""
+Tests for generating checklists from a synthetic data set against a fake Sheets API.
+"""
+
+import itertools
+import json
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+import yaml
+
+from freee_a11y_gl import clear_instances, memory_profile, tracing
+from freee_a11y_gl.synthetic_corpus import generate_corpus
+from yaml2sheet import yaml2sheet
+from yaml2sheet.config import TARGET_NAMES
+
+# Root of the a11y-guidelines repository, containing data/json/schemas
+REPO_ROOT = Path(__file__).resolve().parents[5]
+SCHEMA_DIR = REPO_ROOT / 'data' / 'json' / 'schemas'
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not SCHEMA_DIR.is_dir(), reason="JSON schemas not available"),
+]
+
+
+class FakeRequest:
+    """Request object of the fake API, returning its result on execute()"""
+
+    def __init__(self, result):
+        self.result = result
+
+    def execute(self):
+        return self.result
+
+
+class FakeSpreadsheets:
+    """Spreadsheets resource keeping the sheets added and deleted by batch updates"""
+
+    def __init__(self):
+        # A spreadsheet always has at least one sheet
+        self.sheets = {0: 'Sheet1'}
+        self.sheet_ids = itertools.count(1000)
+        self.requests = []
+
+    def _sheet_list(self):
+        return [
+            {'properties': {'sheetId': sheet_id, 'title': title, 'index': index,
+                            'gridProperties': {'rowCount': 1000, 'columnCount': 26}},
+             'protectedRanges': []}
+            for index, (sheet_id, title) in enumerate(self.sheets.items())
+        ]
+
+    def get(self, spreadsheetId, **kwargs):
+        return FakeRequest({'spreadsheetId': spreadsheetId, 'sheets': self._sheet_list()})
+
+    def getByDataFilter(self, spreadsheetId, body):
+        return FakeRequest({'spreadsheetId': spreadsheetId, 'valueRanges': []})
+
+    def batchUpdate(self, spreadsheetId, body):
+        replies = []
+        for request in body['requests']:
+            self.requests.append(request)
+            if 'addSheet' in request:
+                sheet_id = next(self.sheet_ids)
+                title = request['addSheet']['properties']['title']
+                self.sheets[sheet_id] = title
+                replies.append({'addSheet': {'properties': {'sheetId': sheet_id, 'title': title}}})
+            elif 'deleteSheet' in request:
+                self.sheets.pop(request['deleteSheet']['sheetId'], None)
+                replies.append({})
+            elif 'title' in request.get('updateSheetProperties', {}).get('properties', {}):
+                properties = request['updateSheetProperties']['properties']
+                self.sheets[properties['sheetId']] = properties['title']
+                replies.append({})
+            else:
+                replies.append({})
+        return FakeRequest({'spreadsheetId': spreadsheetId, 'replies': replies})
+
+
+class FakeSheetsService:
+    """Fake Google Sheets API service"""
+
+    def __init__(self):
+        self.resource = FakeSpreadsheets()
+
+    def spreadsheets(self):
+        return self.resource
+
+
+@pytest.fixture
+def corpus_dir(temp_dir):
+    """Generate a synthetic data set"""
+    basedir = temp_dir / 'corpus'
+    sizes = generate_corpus(str(basedir), scale=0.5, seed=3, schema_dir=str(SCHEMA_DIR))
+    yield basedir, sizes
+    clear_instances()
+
+
+def test_generate_checklist(corpus_dir, temp_dir, sample_config_data):
+    """Test generating the checklist of a synthetic data set"""
+    basedir, sizes = corpus_dir
+    config_file = temp_dir / 'config.yaml'
+    config_file.write_text(yaml.dump(sample_config_data), encoding='utf-8')
+    service = FakeSheetsService()
+    argv = ['yaml2sheet', '-c', str(config_file), '-b', str(basedir), '--no-cache', '--init']
+
+    with patch.object(sys, 'argv', argv), \
+            patch('yaml2sheet.yaml2sheet.get_credentials', return_value=Mock()), \
+            patch('yaml2sheet.sheet_generator.build', return_value=service):
+        assert yaml2sheet.main() == 0
+
+    titles = set(service.resource.sheets.values())
+    for target_names in TARGET_NAMES.values():
+        assert set(target_names.values()) <= titles
+    rows = [request for request in service.resource.requests if 'updateCells' in request]
+    assert rows
+
+
+def test_generate_checklist_trace(corpus_dir, temp_dir, sample_config_data, capsys):
+    """Test tracing the phases of generating the checklist"""
+    basedir, _ = corpus_dir
+    config_file = temp_dir / 'config.yaml'
+    config_file.write_text(yaml.dump(sample_config_data), encoding='utf-8')
+    trace_file = temp_dir / 'trace.json'
+    argv = ['yaml2sheet', '-c', str(config_file), '-b', str(basedir), '--no-cache',
+            '--trace', str(trace_file)]
+
+    with patch.object(sys, 'argv', argv), \
+            patch('yaml2sheet.yaml2sheet.get_credentials', return_value=Mock()), \
+            patch('yaml2sheet.sheet_generator.build', return_value=FakeSheetsService()):
+        try:
+            assert yaml2sheet.main() == 0
+        finally:
+            tracing.reset()
+
+    events = json.loads(trace_file.read_text(encoding='utf-8'))['traceEvents']
+    names = {event['name'] for event in events}
+    assert {'process_yaml_data', 'setup_instances', 'process_yaml_data.rst',
+            'yaml2sheet.process_source_data', 'yaml2sheet.generate_batch_requests',
+            'yaml2sheet.execute_batch_update', 'sheets_api.get',
+            'sheets_api.batch_update'} <= names
+    sheets = [(event['args']['target'], event['args']['lang'])
+              for event in events if event['name'] == 'yaml2sheet.prepare_sheet']
+    assert len(sheets) == len(set(sheets)) > 0
+    assert all(event['args']['requests'] > 0
+               for event in events if event['name'] == 'sheets_api.batch_update')
+    assert 'sheets_api.batch_update' in capsys.readouterr().err
+
+
+def test_generate_checklist_profile_memory(temp_dir, sample_config_data, capsys):
+    """Test reporting the memory of the phases of generating the checklist"""
+    # Tracing allocations is slow, so a smaller data set is used
+    basedir = temp_dir / 'corpus'
+    generate_corpus(str(basedir), scale=0.1, seed=3, schema_dir=str(SCHEMA_DIR))
+    config_file = temp_dir / 'config.yaml'
+    config_file.write_text(yaml.dump(sample_config_data), encoding='utf-8')
+    argv = ['yaml2sheet', '-c', str(config_file), '-b', str(basedir), '--no-cache',
+            '--profile-memory']
+
+    with patch.object(sys, 'argv', argv), \
+            patch('yaml2sheet.yaml2sheet.get_credentials', return_value=Mock()), \
+            patch('yaml2sheet.sheet_generator.build', return_value=FakeSheetsService()):
+        try:
+            assert yaml2sheet.main() == 0
+            phases = memory_profile.get_phases()
+        finally:
+            memory_profile.reset()
+            clear_instances()
+
+    names = [record['name'] for record in phases]
+    assert names[:2] == ['process_yaml_data', 'setup_instances']
+    assert phases[1]['depth'] == 1
+    assert phases[0]['delta'] > 0
+    assert {'yaml2sheet.process_source_data', 'yaml2sheet.prepare_sheets',
+            'yaml2sheet.execute_batch_update', 'yaml2sheet.generate_batch_requests'} <= set(names)
+    report = capsys.readouterr().err
+    assert 'Top allocation sites of process_yaml_data:' in report
+    assert 'Peak RSS: ' in report
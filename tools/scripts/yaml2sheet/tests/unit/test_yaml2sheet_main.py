@@ -38,7 +38,11 @@ class TestParseArgs:
             assert args.production is False
             assert args.basedir == str(Path.cwd())
             assert args.url is None
+            assert args.jobs == 1
+            assert args.no_cache is False
             assert args.verbose is False
+            assert args.trace is None
+            assert args.profile_memory is False
     
     def test_parse_args_create_config(self):
         """Test --create-config argument."""
@@ -88,6 +92,34 @@ class TestParseArgs:
             args = parse_args()
             assert args.url == 'https://custom.example.com'
     
+    def test_parse_args_jobs(self):
+        """Test --jobs argument."""
+        with patch('sys.argv', ['yaml2sheet', '--jobs', '4']):
+            args = parse_args()
+            assert args.jobs == 4
+
+        with patch('sys.argv', ['yaml2sheet', '-j', '0']):
+            args = parse_args()
+            assert args.jobs == 0
+
+    def test_parse_args_no_cache(self):
+        """Test --no-cache argument."""
+        with patch('sys.argv', ['yaml2sheet', '--no-cache']):
+            args = parse_args()
+            assert args.no_cache is True
+
+    def test_parse_args_trace(self):
+        """Test --trace argument."""
+        with patch('sys.argv', ['yaml2sheet', '--trace', 'trace.json']):
+            args = parse_args()
+            assert args.trace == 'trace.json'
+
+    def test_parse_args_profile_memory(self):
+        """Test --profile-memory argument."""
+        with patch('sys.argv', ['yaml2sheet', '--profile-memory']):
+            args = parse_args()
+            assert args.profile_memory is True
+
     def test_parse_args_verbose(self):
         """Test -v/--verbose argument."""
         with patch('sys.argv', ['yaml2sheet', '-v']):
@@ -152,7 +184,7 @@ class TestSetupLogging:
 class TestGetCredentials:
     """Test credential retrieval functionality."""
     
-    @patch('yaml2sheet.yaml2sheet.GoogleAuthManager')
+    @patch('yaml2sheet.auth.GoogleAuthManager')
     def test_get_credentials_success(self, mock_auth_manager_class):
         """Test successful credential retrieval."""
         # Mock config
@@ -177,7 +209,7 @@ class TestGetCredentials:
         )
         mock_auth_manager.get_credentials.assert_called_once()
     
-    @patch('yaml2sheet.yaml2sheet.GoogleAuthManager')
+    @patch('yaml2sheet.auth.GoogleAuthManager')
     def test_get_credentials_file_not_found(self, mock_auth_manager_class):
         """Test credential retrieval with missing credentials file."""
         # Mock config
@@ -198,7 +230,7 @@ class TestGetCredentials:
         
         assert result is None
     
-    @patch('yaml2sheet.yaml2sheet.GoogleAuthManager')
+    @patch('yaml2sheet.auth.GoogleAuthManager')
     def test_get_credentials_missing_token_file(self, mock_auth_manager_class):
         """Test credential retrieval with missing token file (normal for first run)."""
         # Mock config
@@ -220,7 +252,7 @@ class TestGetCredentials:
         # Should return None but not log as error (token file missing is normal)
         assert result is None
     
-    @patch('yaml2sheet.yaml2sheet.GoogleAuthManager')
+    @patch('yaml2sheet.auth.GoogleAuthManager')
     def test_get_credentials_general_exception(self, mock_auth_manager_class):
         """Test credential retrieval with general exception."""
         # Mock config
@@ -239,7 +271,7 @@ class TestGetCredentials:
         
         assert result is None
 
-    @patch('yaml2sheet.yaml2sheet.GoogleAuthManager')
+    @patch('yaml2sheet.auth.GoogleAuthManager')
     def test_get_credentials_token_file_not_found_debug_path(self, mock_auth_manager_class):
         """Test credential retrieval with token file not found - covers debug logging path."""
         # Mock config
@@ -274,6 +306,8 @@ class TestMain:
         mock_args = Mock()
         mock_args.create_config = True
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
         
         # Mock config creation
@@ -294,6 +328,8 @@ class TestMain:
         mock_args = Mock()
         mock_args.create_config = True
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
         
         # Mock config creation failure
@@ -312,6 +348,8 @@ class TestMain:
         mock_args = Mock()
         mock_args.create_config = False
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_args.config = None
         mock_parse_args.return_value = mock_args
         
@@ -335,6 +373,8 @@ class TestMain:
         mock_args = Mock()
         mock_args.create_config = False
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_args.config = None
         mock_parse_args.return_value = mock_args
         
@@ -362,6 +402,8 @@ class TestMain:
         mock_args = Mock()
         mock_args.create_config = False
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_args.config = None
         mock_parse_args.return_value = mock_args
         
@@ -387,6 +429,8 @@ class TestMain:
         mock_args = Mock()
         mock_args.create_config = False
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_args.config = None
         mock_parse_args.return_value = mock_args
         
@@ -405,20 +449,24 @@ class TestMain:
     @patch('yaml2sheet.yaml2sheet.setup_logging')
     @patch('yaml2sheet.yaml2sheet.load_configuration')
     @patch('yaml2sheet.yaml2sheet.get_credentials')
-    @patch('yaml2sheet.yaml2sheet.process_yaml_data')
-    @patch('yaml2sheet.yaml2sheet.ChecklistSheetGenerator')
-    @patch('yaml2sheet.yaml2sheet.GL')
+    @patch('freee_a11y_gl.yaml_processor.process_yaml_data')
+    @patch('yaml2sheet.sheet_generator.ChecklistSheetGenerator')
+    @patch('freee_a11y_gl.settings')
     def test_main_successful_execution(self, mock_gl, mock_generator_class, mock_process_yaml, mock_get_creds, mock_load_config, mock_setup_logging, mock_parse_args):
         """Test successful main execution."""
         # Mock arguments
         mock_args = Mock()
         mock_args.create_config = False
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_args.config = None
         mock_args.production = False
         mock_args.basedir = '/test/basedir'
         mock_args.url = None
         mock_args.init = False
+        mock_args.jobs = 1
+        mock_args.no_cache = False
         mock_parse_args.return_value = mock_args
         
         # Mock configuration
@@ -450,7 +498,7 @@ class TestMain:
         assert result == 0
         mock_load_config.assert_called_once_with(None)
         mock_get_creds.assert_called_once_with(mock_config)
-        mock_process_yaml.assert_called_once_with('/test/basedir')
+        mock_process_yaml.assert_called_once_with('/test/basedir', workers=1, use_cache=True)
         mock_generator_class.assert_called_once_with(mock_creds, 'test_spreadsheet_id', 'test@example.com', mock_config)
         mock_generator.generate_checklist.assert_called_once_with(mock_source_data, initialize=False)
     
@@ -464,6 +512,8 @@ class TestMain:
         mock_args = Mock()
         mock_args.create_config = False
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_args.config = None
         mock_parse_args.return_value = mock_args
         
@@ -482,13 +532,15 @@ class TestMain:
     @patch('yaml2sheet.yaml2sheet.setup_logging')
     @patch('yaml2sheet.yaml2sheet.load_configuration')
     @patch('yaml2sheet.yaml2sheet.get_credentials')
-    @patch('yaml2sheet.yaml2sheet.process_yaml_data')
+    @patch('freee_a11y_gl.yaml_processor.process_yaml_data')
     def test_main_yaml_processing_failure(self, mock_process_yaml, mock_get_creds, mock_load_config, mock_setup_logging, mock_parse_args):
         """Test main function with YAML processing failure."""
         # Mock arguments
         mock_args = Mock()
         mock_args.create_config = False
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_args.config = None
         mock_args.basedir = '/test/basedir'
         mock_args.url = None
@@ -515,8 +567,8 @@ class TestMain:
     @patch('yaml2sheet.yaml2sheet.setup_logging')
     @patch('yaml2sheet.yaml2sheet.load_configuration')
     @patch('yaml2sheet.yaml2sheet.get_credentials')
-    @patch('yaml2sheet.yaml2sheet.process_yaml_data')
-    @patch('yaml2sheet.yaml2sheet.ChecklistSheetGenerator')
+    @patch('freee_a11y_gl.yaml_processor.process_yaml_data')
+    @patch('yaml2sheet.sheet_generator.ChecklistSheetGenerator')
     def test_main_google_api_error(self, mock_generator_class, mock_process_yaml, mock_get_creds, mock_load_config, mock_setup_logging, mock_parse_args):
         """Test main function with Google API error."""
         from googleapiclient.errors import HttpError
@@ -525,6 +577,8 @@ class TestMain:
         mock_args = Mock()
         mock_args.create_config = False
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_args.config = None
         mock_args.production = False
         mock_args.basedir = '/test/basedir'
@@ -570,6 +624,8 @@ class TestMain:
         mock_args = Mock()
         mock_args.create_config = True  # Use create_config to exit early
         mock_args.verbose = True
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_parse_args.return_value = mock_args
         
         with patch('yaml2sheet.yaml2sheet.create_default_config') as mock_create_config:
@@ -587,14 +643,16 @@ class TestMain:
     @patch('yaml2sheet.yaml2sheet.setup_logging')
     @patch('yaml2sheet.yaml2sheet.load_configuration')
     @patch('yaml2sheet.yaml2sheet.get_credentials')
-    @patch('yaml2sheet.yaml2sheet.process_yaml_data')
-    @patch('yaml2sheet.yaml2sheet.ChecklistSheetGenerator')
+    @patch('freee_a11y_gl.yaml_processor.process_yaml_data')
+    @patch('yaml2sheet.sheet_generator.ChecklistSheetGenerator')
     def test_main_with_init_flag(self, mock_generator_class, mock_process_yaml, mock_get_creds, mock_load_config, mock_setup_logging, mock_parse_args):
         """Test main function with --init flag."""
         # Mock arguments with init flag
         mock_args = Mock()
         mock_args.create_config = False
         mock_args.verbose = False
+        mock_args.trace = None
+        mock_args.profile_memory = False
         mock_args.config = None
         mock_args.production = False
         mock_args.basedir = '/test/basedir'
@@ -622,7 +680,7 @@ class TestMain:
         mock_generator = Mock()
         mock_generator_class.return_value = mock_generator
         
-        with patch('yaml2sheet.yaml2sheet.GL'):
+        with patch('freee_a11y_gl.settings'):
             result = main()
             
             assert result == 0
@@ -646,3 +704,18 @@ class TestMainIntegration:
                 
                 # The main function should be callable
                 assert callable(yaml2sheet.yaml2sheet.main)
+
+
+class TestDeferredImports:
+    """Test that heavy dependencies are imported after argument parsing."""
+
+    def test_cli_import_does_not_load_google_api(self):
+        """Test that importing the CLI module does not load the Google API client."""
+        import subprocess
+        result = subprocess.run(
+            [sys.executable, '-c',
+             'import sys, yaml2sheet.yaml2sheet; '
+             'print(",".join(m for m in ("googleapiclient", "google_auth_oauthlib", '
+             '"freee_a11y_gl.models", "jsonschema") if m in sys.modules))'],
+            capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ''